@@ -13,6 +13,7 @@
 #    under the License.
 
 from http import client as http_client
+import time
 from urllib import parse as urlparse
 
 from oslo_config import cfg
@@ -42,6 +43,13 @@ _LOOKUP_RETURN_FIELDS = ['uuid', 'properties', 'instance_info',
                          'driver_internal_info']
 AGENT_VALID_STATES = ['start', 'end', 'error']
 
+# NOTE: Maps frozen sets of normalized MAC addresses to a tuple of the
+# expiration time and the node lookup information (None if no node was
+# found). Successful lookups drop their entry, so in practice only ramdisks
+# retrying while their node is not ready for them are served from here.
+_LOOKUP_CACHE = {}
+_LOOKUP_CACHE_MAX_SIZE = 4096
+
 
 def config(token, node=None):
     # Skip BMC detection for out-of-band management interfaces where
@@ -127,6 +135,48 @@ def get_valid_mac_addresses(addresses, node_uuid=None):
     return valid_addresses
 
 
+def _lookup_by_addresses(context, addresses):
+    """Find the lookup information of a node by its MAC addresses.
+
+    The outcome, including not finding any node, is cached for
+    ``[api]ramdisk_lookup_cache_ttl`` seconds.
+
+    :param context: Request context.
+    :param addresses: list of normalized MAC addresses.
+    :raises: NotFound if no single node matches the addresses.
+    :returns: a :class:`Node` object with only the fields needed to check
+        and route the lookup.
+    """
+    ttl = CONF.api.ramdisk_lookup_cache_ttl
+    key = frozenset(addresses)
+    now = time.monotonic()
+    cached = _LOOKUP_CACHE.get(key) if ttl else None
+    if cached is not None and cached[0] > now:
+        node = cached[1]
+        if node is None:
+            LOG.debug('No node has been found during a recent lookup with '
+                      'addresses %s', ', '.join(addresses))
+    else:
+        try:
+            node = objects.Node.get_lookup_info_by_port_addresses(
+                context, addresses)
+        except exception.NotFound as e:
+            LOG.error('No node has been found during lookup: %s', e)
+            node = None
+        if ttl:
+            if len(_LOOKUP_CACHE) >= _LOOKUP_CACHE_MAX_SIZE:
+                for expired, (expires, _node) in list(_LOOKUP_CACHE.items()):
+                    if expires <= now:
+                        _LOOKUP_CACHE.pop(expired, None)
+                if len(_LOOKUP_CACHE) >= _LOOKUP_CACHE_MAX_SIZE:
+                    _LOOKUP_CACHE.clear()
+            _LOOKUP_CACHE[key] = (now + ttl, node)
+
+    if node is None:
+        raise exception.NotFound()
+    return node
+
+
 class LookupController(rest.RestController):
     """Controller handling node lookup for a deploy ramdisk."""
 
@@ -170,19 +220,18 @@ class LookupController(rest.RestController):
         if not valid_addresses and not node_uuid:
             raise exception.IncompleteLookup()
 
-        try:
-            if node_uuid:
+        # NOTE(dtantsur): we are reraising the same exception to make sure
+        # we don't disclose the difference between nodes that are not found
+        # at all and nodes in a wrong state by different error messages.
+        if node_uuid:
+            try:
                 node = objects.Node.get_by_uuid(
                     api.request.context, node_uuid)
-            else:
-                node = objects.Node.get_by_port_addresses(
-                    api.request.context, valid_addresses)
-        except exception.NotFound as e:
-            # NOTE(dtantsur): we are reraising the same exception to make sure
-            # we don't disclose the difference between nodes that are not found
-            # at all and nodes in a wrong state by different error messages.
-            LOG.error('No node has been found during lookup: %s', e)
-            raise exception.NotFound()
+            except exception.NotFound as e:
+                LOG.error('No node has been found during lookup: %s', e)
+                raise exception.NotFound()
+        else:
+            node = _lookup_by_addresses(api.request.context, valid_addresses)
 
         if CONF.api.restrict_lookup and not self.lookup_allowed(node):
             LOG.error('Lookup is not allowed for node %(node)s in the '
@@ -199,8 +248,17 @@ class LookupController(rest.RestController):
 
             found_node = api.request.rpcapi.get_node_with_token(
                 api.request.context, node.uuid, topic=topic)
+        elif not node_uuid:
+            # Only the lookup information has been loaded
+            found_node = objects.Node.get_by_uuid(api.request.context,
+                                                  node.uuid)
         else:
             found_node = node
+
+        if not node_uuid:
+            # NOTE: the ramdisk is not going to repeat a successful lookup,
+            # do not let the cached node information outlive it.
+            _LOOKUP_CACHE.pop(frozenset(valid_addresses), None)
         return convert_with_links(found_node)
 
 
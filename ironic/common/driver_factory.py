@@ -14,6 +14,7 @@
 #    under the License.
 
 import collections
+import importlib.metadata
 
 from oslo_concurrency import lockutils
 from oslo_log import log
@@ -37,6 +38,10 @@ def build_driver_for_task(task):
     various driver interfaces to it. They come from separate
     driver factories and are configurable via the database.
 
+    Validated compositions are cached by the hardware type and interface
+    names, so for a node whose interface fields are already set and not
+    modified, only a new `BareDriver` is created and populated.
+
     :param task: The task containing the node to build a driver for.
     :returns: A driver object for the task.
     :raises: DriverNotFound if node.driver could not be found in the
@@ -48,15 +53,64 @@ def build_driver_for_task(task):
     """
     node = task.node
 
+    key = _composition_key(node)
+    if key is not None:
+        composition = _COMPOSITIONS.get(key)
+        if composition is not None:
+            bare_driver = driver_base.BareDriver()
+            # NOTE: every task gets its own BareDriver since some code (e.g.
+            # the autodetect deploy interface) replaces interfaces on
+            # task.driver. The interface instances are shared anyway.
+            bare_driver.__dict__.update(composition)
+            return bare_driver
+
     hw_type = get_hardware_type(node.driver)
     check_and_update_node_interfaces(node, hw_type=hw_type)
 
     bare_driver = driver_base.BareDriver()
     _attach_interfaces_to_driver(bare_driver, node, hw_type)
 
+    key = _composition_key(node, ignore_changes=True)
+    if key is not None:
+        _COMPOSITIONS[key] = {iface: getattr(bare_driver, iface)
+                              for iface in _INTERFACE_LOADERS}
+
     return bare_driver
 
 
+def _composition_key(node, ignore_changes=False):
+    """Calculate the key of the driver composition of a node.
+
+    :param node: Node object
+    :param ignore_changes: whether to return a key even if the node has
+        modified interface fields, e.g. after they have been validated.
+    :returns: a tuple of the hardware type and the (field value, instance_info
+        override) pairs for all interfaces, or None if the composition cannot
+        be cached since some interfaces are missing or modified.
+    """
+    if not ignore_changes:
+        # NOTE: obj_what_changed also walks all nested objects, which is
+        # not needed for string fields.
+        changes = node._changed_fields
+        if 'driver' in changes or not changes.isdisjoint(_INTERFACE_FIELDS):
+            return None
+
+    try:
+        instance_info = node.instance_info or {}
+        names = tuple((getattr(node, field_name),
+                       instance_info.get(field_name))
+                      for field_name in _INTERFACE_FIELDS)
+    except NotImplementedError:
+        # NOTE: objects raise NotImplementedError on accessing fields that
+        # are known, but missing from an object.
+        return None
+    if any(impl_name is None for impl_name, _override in names):
+        # NOTE: defaults have to be calculated and set on the node, this is
+        # done by check_and_update_node_interfaces.
+        return None
+    return (node.driver, names)
+
+
 def _attach_interfaces_to_driver(bare_driver, node, hw_type):
     """Attach interface implementations to a bare driver object.
 
@@ -421,6 +475,7 @@ class BaseDriverFactory(object):
                 return
 
             cls._set_enabled_drivers()
+            _COMPOSITIONS.clear()
 
             cls._extension_manager = (
                 stevedore.NamedExtensionManager(
@@ -514,6 +569,7 @@ class BaseDriverFactory(object):
 
             # Mark as initialized
             cls._drivers_initialized = True
+            _COMPOSITIONS.clear()
 
             # Now warn for unsupported drivers
             if cls._enabled_driver_list:
@@ -534,22 +590,44 @@ class InterfaceFactory(BaseDriverFactory):
         if cls._enabled_driver_list:
             return
 
-        tmp_ext_mgr = stevedore.ExtensionManager(
-            cls._entrypoint_name,
-            invoke_on_load=False,  # do not create interfaces
-            on_load_failure_callback=cls._catch_driver_not_found)
-        cls_names = {v.plugin: k for (k, v) in tmp_ext_mgr.items()}
+        # NOTE: the entry points are matched using their metadata, so that
+        # the modules of all available implementations (and their vendor
+        # libraries) are not imported just to find the few default ones.
+        ep_names = {ep.value: ep.name for ep in
+                    importlib.metadata.entry_points(
+                        group=cls._entrypoint_name)}
+        cls_names = None
 
         # Fallback: calculate based on hardware type defaults
         for hw_type in hardware_types().values():
             supported = getattr(hw_type, cls._supported_driver_list_field)[0]
-            try:
-                name = cls_names[supported]
-            except KeyError:
-                raise KeyError("%s not in %s" % (supported, cls_names))
+            name = ep_names.get('%s:%s' % (supported.__module__,
+                                           supported.__qualname__))
+            if name is None:
+                # The entry point may refer to the class by another path,
+                # e.g. through a module that imports it. Load the plugins.
+                if cls_names is None:
+                    cls_names = cls._load_plugin_names()
+                try:
+                    name = cls_names[supported]
+                except KeyError:
+                    raise KeyError("%s not in %s" % (supported, cls_names))
             if name not in cls._enabled_driver_list:
                 cls._enabled_driver_list.append(name)
 
+    @classmethod
+    def _load_plugin_names(cls):
+        """Import all available implementations.
+
+        :returns: a dictionary mapping implementation classes to their
+            entry point names.
+        """
+        tmp_ext_mgr = stevedore.ExtensionManager(
+            cls._entrypoint_name,
+            invoke_on_load=False,  # do not create interfaces
+            on_load_failure_callback=cls._catch_driver_not_found)
+        return {v.plugin: k for (k, v) in tmp_ext_mgr.items()}
+
 
 def _warn_if_unsupported(ext):
     if not ext.obj.supported:
@@ -577,6 +655,15 @@ _INTERFACE_LOADERS = {
 }
 
 
+_INTERFACE_FIELDS = tuple(sorted('%s_interface' % name
+                                 for name in _INTERFACE_LOADERS))
+
+# Validated driver compositions: (hardware type, interface names) -> a dict
+# of interface type to its implementation. Cleared whenever the enabled
+# hardware types or interfaces are (re)loaded.
+_COMPOSITIONS = {}
+
+
 # TODO(dtantsur): This factory is still used explicitly in many places,
 # refactor them later to use _INTERFACE_LOADERS.
 NetworkInterfaceFactory = _INTERFACE_LOADERS['network']
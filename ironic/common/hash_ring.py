@@ -13,6 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
 import threading
 import time
 
@@ -29,8 +30,72 @@ from ironic import objects
 LOG = log.getLogger(__name__)
 
 
+class ConductorTopology(object):
+    """A snapshot of the active conductors and their hardware types.
+
+    A single snapshot is shared by all hash ring managers and RPC routing
+    helpers of a process. Its generation is incremented every time the set
+    of active conductors or the hardware types they support changes, and
+    only the hash rings of the affected hardware types are rebuilt.
+    """
+
+    def __init__(self, rows, previous=None):
+        hosts = set()
+        members = {True: collections.defaultdict(set),
+                   False: collections.defaultdict(set)}
+        for hostname, conductor_group, hardware_type in rows:
+            hosts.add(hostname)
+            if hardware_type is None:
+                continue
+            members[True]['%s:%s' % (conductor_group, hardware_type)].add(
+                hostname)
+            members[False][hardware_type].add(hostname)
+
+        self.hosts = sorted(hosts)
+        self._members = {use_groups: {key: frozenset(value)
+                                      for key, value in items.items()}
+                         for use_groups, items in members.items()}
+        self._params = (CONF.hash_partition_exponent,
+                        CONF.hash_ring_algorithm)
+
+        if previous is not None and previous._params == self._params:
+            if (previous.hosts == self.hosts
+                    and previous._members == self._members):
+                self.generation = previous.generation
+            else:
+                self.generation = previous.generation + 1
+            old_rings = previous._rings
+        else:
+            self.generation = (previous.generation + 1
+                               if previous is not None else 1)
+            old_rings = {True: {}, False: {}}
+
+        self._rings = {}
+        for use_groups, items in self._members.items():
+            rings = {}
+            for key, key_hosts in items.items():
+                ring = old_rings[use_groups].get(key)
+                if ring is None or set(ring.nodes) != key_hosts:
+                    ring = hashring.HashRing(
+                        key_hosts,
+                        partitions=2 ** CONF.hash_partition_exponent,
+                        hash_function=CONF.hash_ring_algorithm)
+                rings[key] = ring
+            self._rings[use_groups] = rings
+
+    def rings(self, use_groups):
+        """Get the hash rings.
+
+        :param use_groups: Whether the rings are keyed by
+            ``<conductor group>:<hardware type>`` or by hardware type only.
+        :returns: A dict mapping keys to hash rings.
+        """
+        return self._rings[use_groups]
+
+
 class HashRingManager(object):
     _hash_rings = (None, 0)
+    _last_topology = None
     _lock = threading.Lock()
 
     def __init__(self, use_groups=True, cache=True):
@@ -39,52 +104,53 @@ class HashRingManager(object):
 
     @property
     def ring(self):
+        return self.topology.rings(self.use_groups)
+
+    @property
+    def topology(self):
+        """The shared snapshot of the active conductors."""
         interval = CONF.hash_ring_reset_interval
         limit = time.monotonic() - interval
 
         if not self.cache:
-            return self._load_hash_rings()
+            return self._load_topology()
 
         # Hot path, no lock. Using a local variable to avoid races with code
         # changing the class variable.
-        hash_rings, updated_at = self.__class__._hash_rings
-        if (hash_rings is not None
+        topology, updated_at = self.__class__._hash_rings
+        if (topology is not None
             and (updated_at >= limit
                  or utils.is_ironic_using_sqlite())):
             # Returning the hash ring for us, if it is still valid,
             # or if we're using sqlite.
-            return hash_rings
+            return topology
 
         with self._lock:
-            hash_rings, updated_at = self.__class__._hash_rings
-            if hash_rings is None or updated_at < limit:
+            topology, updated_at = self.__class__._hash_rings
+            if topology is None or updated_at < limit:
                 LOG.debug('Rebuilding cached hash rings')
-                hash_rings = self._load_hash_rings()
-                self.__class__._hash_rings = hash_rings, time.monotonic()
-                LOG.debug('Finished rebuilding hash rings, available drivers '
-                          'are %s', ', '.join(hash_rings))
-            return hash_rings
-
-    def _load_hash_rings(self):
-        rings = {}
+                topology = self._load_topology(self.__class__._last_topology)
+                self.__class__._hash_rings = topology, time.monotonic()
+                self.__class__._last_topology = topology
+                LOG.debug('Finished rebuilding hash rings (generation %s), '
+                          'available drivers are %s', topology.generation,
+                          ', '.join(topology.rings(self.use_groups)))
+            return topology
+
+    def _load_topology(self, previous=None):
         # NOTE(TheJulia): Do not use the dbapi interface directly
         # as hash_ring code is common code with the API, and want
         # the overall flow respected.
-        d2c = objects.Conductor.get_active_hardware_type_dict(
-            context.get_admin_context(),
-            use_groups=self.use_groups)
-
-        for driver_name, hosts in d2c.items():
-            rings[driver_name] = hashring.HashRing(
-                hosts, partitions=2 ** CONF.hash_partition_exponent,
-                hash_function=CONF.hash_ring_algorithm)
-
-        return rings
+        rows = objects.Conductor.get_active_topology(
+            context.get_admin_context())
+        return ConductorTopology(rows, previous=previous)
 
     @classmethod
     def reset(cls):
         with cls._lock:
             LOG.debug('Resetting cached hash rings')
+            # NOTE: the last snapshot is kept so that the next rebuild only
+            # recreates the rings of the hardware types that have changed.
             cls._hash_rings = (None, 0)
 
     def get_ring(self, driver_name, conductor_group):
@@ -14,6 +14,7 @@ import abc
 import os
 import os.path
 import shutil
+import time
 from urllib import parse as urlparse
 
 from oslo_log import log
@@ -70,14 +71,23 @@ class LocalPublisher(AbstractPublisher):
         self.file_permission = file_permission
         self.dir_permission = dir_permission
 
+    def _public_dir(self):
+        if self.image_subdir:
+            return os.path.join(CONF.deploy.http_root, self.image_subdir)
+        else:
+            return CONF.deploy.http_root
+
+    def _url(self, file_name):
+        if self.image_subdir:
+            return os.path.join(self.root_url, self.image_subdir, file_name)
+        else:
+            return os.path.join(self.root_url, file_name)
+
     def publish(self, source_path, file_name=None):
         if not file_name:
             file_name = os.path.basename(source_path)
 
-        if self.image_subdir:
-            public_dir = os.path.join(CONF.deploy.http_root, self.image_subdir)
-        else:
-            public_dir = CONF.deploy.http_root
+        public_dir = self._public_dir()
 
         if not os.path.exists(public_dir):
             os.mkdir(public_dir, self.dir_permission)
@@ -109,16 +119,55 @@ class LocalPublisher(AbstractPublisher):
             shutil.copyfile(source_path, published_file)
             os.chmod(published_file, self.file_permission)
 
-        if self.image_subdir:
-            return os.path.join(self.root_url, self.image_subdir, file_name)
-        else:
-            return os.path.join(self.root_url, file_name)
+        return self._url(file_name)
 
     def unpublish(self, file_name):
         published_file = os.path.join(
             CONF.deploy.http_root, self.image_subdir, file_name)
         utils.unlink_without_raise(published_file)
 
+    def get_published_url(self, file_name, max_age=None):
+        """Get the URL of a previously published image.
+
+        :param file_name: File name of the published image.
+        :param max_age: Maximum age (in seconds) of the published image.
+        :return: The URL of the published image or None if the image is not
+            published or is older than max_age.
+        """
+        published_file = os.path.join(self._public_dir(), file_name)
+        try:
+            mtime = os.path.getmtime(published_file)
+        except OSError:
+            return None
+        if max_age is not None and time.time() - mtime > max_age:
+            return None
+        return self._url(file_name)
+
+    def unpublish_stale(self, prefix, max_age):
+        """Unpublish images that were published a long time ago.
+
+        :param prefix: Only images with file names starting with this prefix
+            are considered.
+        :param max_age: Age (in seconds) of images to unpublish.
+        """
+        public_dir = self._public_dir()
+        try:
+            file_names = os.listdir(public_dir)
+        except OSError:
+            return
+        threshold = time.time() - max_age
+        for file_name in file_names:
+            if not file_name.startswith(prefix):
+                continue
+            published_file = os.path.join(public_dir, file_name)
+            try:
+                if os.path.getmtime(published_file) >= threshold:
+                    continue
+            except OSError:
+                continue
+            LOG.debug('Removing stale image %s', published_file)
+            utils.unlink_without_raise(published_file)
+
 
 class SwiftPublisher(AbstractPublisher):
     """Image publisher using OpenStack Swift."""
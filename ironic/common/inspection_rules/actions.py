@@ -77,29 +77,33 @@ class ActionBase(base.Base, metaclass=abc.ABCMeta):
     def __call__(self, task, *args, **kwargs):
         """Run action on successful rule match."""
 
-    def execute_with_loop(self, task, action, inventory, plugin_data):
+    def execute_with_loop(self, task, action, inventory, plugin_data,
+                          prepared=None):
         loop_items = None
         if action.get('loop', []):
             loop_items = action['loop']
+        if prepared is None:
+            prepared = self.prepare_args(action)
 
         if isinstance(loop_items, (list, dict)):
             if isinstance(loop_items, dict):
                 loop_context = {'item': loop_items}
                 action_copy = action.copy()
                 self.execute_action(task, action_copy, inventory, plugin_data,
-                                    loop_context)
+                                    loop_context, prepared)
                 return
 
             for item in loop_items:
                 loop_context = {'item': item}
                 action_copy = action.copy()
                 self.execute_action(task, action_copy, inventory, plugin_data,
-                                    loop_context)
+                                    loop_context, prepared)
 
     def execute_action(self, task, action, inventory, plugin_data,
-                       loop_context=None):
+                       loop_context=None, prepared=None):
         processed_args = self._process_args(task, action, inventory,
-                                            plugin_data, loop_context)
+                                            plugin_data, loop_context,
+                                            prepared)
 
         return self(task, **processed_args)
 
@@ -10,6 +10,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
+import copy
 import inspect
 
 from oslo_log import log
@@ -26,6 +28,26 @@ LOG = log.getLogger(__name__)
 SENSITIVE_FIELDS = ['password', 'auth_token', 'bmc_password']
 
 
+PreparedArgs = collections.namedtuple(
+    'PreparedArgs', ['op', 'inverted', 'args', 'templates', 'optional_args'])
+"""Arguments of an operation normalized once for repeated evaluation.
+
+``templates`` is the set of argument names which contain replacement fields
+and are subject to variable interpolation.
+"""
+
+
+def _has_replacement_fields(value):
+    if isinstance(value, str):
+        return '{' in value or '}' in value
+    if isinstance(value, dict):
+        return any(_has_replacement_fields(k) or _has_replacement_fields(v)
+                   for k, v in value.items())
+    if isinstance(value, list):
+        return any(_has_replacement_fields(v) for v in value)
+    return False
+
+
 class Base(object):
 
     REQUIRES_PLUGIN_DATA = False
@@ -184,10 +206,13 @@ class Base(object):
             ]
         return value
 
-    def _process_args(self, task, operation, inventory, plugin_data,
-                      loop_context=None):
-        "Normalize and process args based on the operator."
+    def prepare_args(self, operation):
+        """Normalize the arguments of an operation for repeated evaluation.
 
+        :param operation: a condition or an action as a dictionary.
+        :raises: InspectionRuleExecutionFailure if the operation has no 'op'.
+        :returns: a PreparedArgs tuple.
+        """
         op = operation.get('op')
         if not op:
             raise exception.InspectionRuleExecutionFailure(
@@ -196,20 +221,41 @@ class Base(object):
         required_args, optional_args = self.get_validation_signature()
 
         op, invtd = utils.parse_inverted_operator(op)
+        # NOTE: normalization amends the arguments, do not modify the rule.
         dict_args = self._normalize_list_args(
             required_args=required_args, optional_args=optional_args,
-            op_args=operation.get('args', {}))
-
-        # plugin-data becomes available during inspection,
-        # we need to populate with the actual value.
+            op_args=copy.copy(operation.get('args', {})))
         if self.REQUIRES_PLUGIN_DATA:
-            dict_args['plugin_data'] = plugin_data
+            dict_args.pop('plugin_data', None)
+
+        templates = frozenset(k for k, v in dict_args.items()
+                              if _has_replacement_fields(v))
+        return PreparedArgs(op, invtd, dict_args, templates,
+                            tuple(optional_args))
+
+    def _process_args(self, task, operation, inventory, plugin_data,
+                      loop_context=None, prepared=None):
+        "Normalize and process args based on the operator."
+        if prepared is None:
+            prepared = self.prepare_args(operation)
 
         node = task.node
         formatted_args = getattr(self, 'FORMATTED_ARGS', [])
-        return {
-            k: (Base.interpolate_variables(
-                v, node, inventory, plugin_data, loop_context, op)
-                if (k in formatted_args or loop_context) else v)
-            for k, v in dict_args.items()
-        }
+        processed_args = {}
+        for k, v in prepared.args.items():
+            if k in prepared.templates and (k in formatted_args
+                                            or loop_context):
+                v = Base.interpolate_variables(
+                    v, node, inventory, plugin_data, loop_context,
+                    prepared.op)
+            elif isinstance(v, (dict, list)):
+                # Prepared arguments are reused, the operation must not be
+                # able to modify them.
+                v = copy.deepcopy(v)
+            processed_args[k] = v
+
+        # plugin-data becomes available during inspection,
+        # we need to populate with the actual value.
+        if self.REQUIRES_PLUGIN_DATA:
+            processed_args['plugin_data'] = plugin_data
+        return processed_args
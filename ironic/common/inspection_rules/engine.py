@@ -10,6 +10,10 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
+import os
+import time
+
 from oslo_log import log
 import yaml
 
@@ -26,6 +30,22 @@ from ironic import objects
 LOG = log.getLogger(__name__)
 SENSITIVE_FIELDS = ['password', 'auth_token', 'bmc_password']
 
+# Rules compiled for evaluation, the original condition or action is kept
+# for its loop settings and for logging.
+CompiledRule = collections.namedtuple(
+    'CompiledRule', ['uuid', 'priority', 'sensitive', 'conditions',
+                     'actions'])
+CompiledOperation = collections.namedtuple(
+    'CompiledOperation', ['operation', 'plugin', 'prepared'])
+
+_RulesPlan = collections.namedtuple('_RulesPlan',
+                                    ['key', 'created_at', 'rules'])
+# Evaluation plans by inspection phase.
+_PLANS = {}
+# Some databases only store modification times with a second precision, so
+# a plan is rebuilt after this many seconds even if the revision matches.
+_PLAN_MAX_AGE = 60
+
 
 def _synthetic_rule_uuid(index):
     return '00000000-0000-0000-0000-%012x' % index
@@ -87,34 +107,70 @@ def get_built_in_rules(rules_file):
     return built_in_rules
 
 
+def compile_rule(rule):
+    """Resolve the operators, actions and arguments of a rule once.
+
+    :param rule: a rule as a dict or an InspectionRule object.
+    :raises: ValueError on an unsupported operator or action.
+    :returns: a CompiledRule tuple.
+    """
+    conditions = []
+    for condition in rule.get('conditions') or []:
+        op, invtd = utils.parse_inverted_operator(condition['op'])
+        if op not in operators.OPERATORS:
+            supported_ops = ', '.join(operators.OPERATORS.keys())
+            msg = (_("Unsupported operator: '%(op)s'. Supported "
+                     "operators are: %(supported_ops)s.") % {
+                         'op': op, 'supported_ops': supported_ops})
+            raise ValueError(msg)
+        plugin = operators.get_operator(op)()
+        conditions.append(CompiledOperation(
+            condition, plugin, plugin.prepare_args(condition)))
+
+    rule_actions = []
+    for action in rule['actions']:
+        op = action['op']
+        if op not in actions.ACTIONS:
+            supported_ops = ', '.join(actions.ACTIONS.keys())
+            msg = (_("Unsupported action: '%(op)s'. Supported actions "
+                     "are: %(supported_ops)s.") % {
+                         'op': op, 'supported_ops': supported_ops})
+            raise ValueError(msg)
+        plugin = actions.get_action(op)()
+        rule_actions.append(CompiledOperation(
+            action, plugin, plugin.prepare_args(action)))
+
+    return CompiledRule(rule['uuid'], rule.get('priority', 0),
+                        rule.get('sensitive', False), tuple(conditions),
+                        tuple(rule_actions))
+
+
+def _compiled(rule):
+    if isinstance(rule, CompiledRule):
+        return rule
+    return compile_rule(rule)
+
+
 def check_conditions(task, rule, inventory, plugin_data):
     try:
-        if not rule.get('conditions', None):
-            return True
-
-        for condition in rule['conditions']:
-            op, invtd = utils.parse_inverted_operator(
-                condition['op'])
-
-            if op not in operators.OPERATORS:
-                supported_ops = ', '.join(operators.OPERATORS.keys())
-                msg = (_("Unsupported operator: '%(op)s'. Supported "
-                         "operators are: %(supported_ops)s.") % {
-                             'op': op, 'supported_ops': supported_ops})
-                raise ValueError(msg)
-
-            plugin = operators.get_operator(op)
-            if condition.get('loop', []):
-                result = plugin().check_with_loop(task, condition, inventory,
-                                                  plugin_data)
+        rule = _compiled(rule)
+        for condition in rule.conditions:
+            plugin = condition.plugin
+            operation = condition.operation
+            if operation.get('loop', []):
+                result = plugin.check_with_loop(task, operation, inventory,
+                                                plugin_data,
+                                                condition.prepared)
             else:
-                result = plugin().check_condition(task, condition, inventory,
-                                                  plugin_data)
+                result = plugin.check_condition(
+                    task, operation, inventory, plugin_data,
+                    prepared=condition.prepared)
             if not result:
                 LOG.debug("Skipping rule %(rule)s on node %(node)s: "
                           "condition check '%(op)s': '%(args)s' failed ",
-                          {'rule': rule['uuid'], 'node': task.node.uuid,
-                           'op': condition['op'], 'args': condition['args']})
+                          {'rule': rule.uuid, 'node': task.node.uuid,
+                           'op': operation['op'],
+                           'args': operation['args']})
                 return False
         return True
 
@@ -125,24 +181,24 @@ def check_conditions(task, rule, inventory, plugin_data):
 
 
 def apply_actions(task, rule, inventory, plugin_data):
+    try:
+        rule = _compiled(rule)
+    except Exception as err:
+        LOG.exception("Unexpected error applying action on node "
+                      "%(node)s: %(err)s.", {'node': task.node.uuid,
+                                             'err': err})
+        raise
 
-    for action in rule['actions']:
+    for action in rule.actions:
         try:
-            op = action['op']
-            if op not in actions.ACTIONS:
-                supported_ops = ', '.join(actions.ACTIONS.keys())
-                msg = (_("Unsupported action: '%(op)s'. Supported actions "
-                         "are: %(supported_ops)s.") % {
-                             'op': op, 'supported_ops': supported_ops})
-                raise ValueError(msg)
-
-            plugin = actions.get_action(op)
-            if action.get('loop', []):
-                plugin().execute_with_loop(task, action, inventory,
-                                           plugin_data)
+            if action.operation.get('loop', []):
+                action.plugin.execute_with_loop(task, action.operation,
+                                                inventory, plugin_data,
+                                                action.prepared)
             else:
-                plugin().execute_action(task, action, inventory,
-                                        plugin_data)
+                action.plugin.execute_action(task, action.operation,
+                                             inventory, plugin_data,
+                                             prepared=action.prepared)
         except exception.IronicException as err:
             LOG.error("Error applying action on node %(node)s: %(err)s.",
                       {'node': task.node.uuid, 'err': err})
@@ -162,15 +218,16 @@ def _check_rule(task, rule, inventory, plugin_data):
     actions, so that the same masked views are used consistently.
 
     :param task: a TaskManager instance
-    :param rule: a dict representing the inspection rule
+    :param rule: a CompiledRule or a dict representing the inspection rule
     :param inventory: hardware inventory dict
     :param plugin_data: plugin data dict
     :returns: a ``(masked_inventory, masked_plugin_data)`` tuple if conditions
               passed, or ``None`` if conditions were not met
     :raises: exception.HardwareInspectionFailure, exception.IronicException
     """
+    rule = _compiled(rule)
     mask_secrets = CONF.inspection_rules.mask_secrets
-    is_sensitive_rule = rule.get('sensitive', False)
+    is_sensitive_rule = rule.sensitive
 
     should_mask = (mask_secrets == 'always'
                    or mask_secrets == 'sensitive' and not is_sensitive_rule)
@@ -189,17 +246,64 @@ def _check_rule(task, rule, inventory, plugin_data):
     return masked_inventory, masked_plugin_data
 
 
-def apply_rules(task, inventory, plugin_data, inspection_phase):
-    """Apply inspection rules to a node."""
-    node = task.node
+def _built_in_rules_mtime(rules_file):
+    if not rules_file:
+        return None
+    try:
+        return os.stat(rules_file).st_mtime_ns
+    except OSError:
+        # Loading the rules will report the problem.
+        return None
+
 
-    all_rules = objects.InspectionRule.list(
-        context=task.context,
+def _build_plan(context, inspection_phase):
+    rules = objects.InspectionRule.list(
+        context=context,
         filters={'phase': inspection_phase})
 
     built_in_rules = get_built_in_rules(CONF.inspection_rules.built_in_rules)
-    rules = all_rules + built_in_rules
+    rules = rules + built_in_rules
+    rules.sort(key=lambda rule: rule.get('priority', 0), reverse=True)
+
+    plan = []
+    for rule in rules:
+        try:
+            plan.append(compile_rule(rule))
+        except Exception as e:
+            # Keep the rule as is, evaluating it reports the error.
+            LOG.warning("Unable to compile inspection rule %(rule)s: "
+                        "%(error)s", {'rule': rule['uuid'], 'error': e})
+            plan.append(rule)
+    return tuple(plan)
+
+
+def get_rules_plan(context, inspection_phase):
+    """Get the compiled rules to apply in an inspection phase.
 
+    Rules are compiled once and sorted by priority. The result is cached
+    until the inspection rules or the built-in rules file change.
+
+    :param context: security context.
+    :param inspection_phase: inspection phase to get the rules for.
+    :returns: a tuple of compiled rules, in the order to apply them.
+    """
+    rules_file = CONF.inspection_rules.built_in_rules
+    key = (objects.InspectionRule.get_revision(context),
+           rules_file, _built_in_rules_mtime(rules_file))
+    now = time.monotonic()
+    plan = _PLANS.get(inspection_phase)
+    if (plan is None or plan.key != key
+            or now - plan.created_at > _PLAN_MAX_AGE):
+        plan = _RulesPlan(key, now, _build_plan(context, inspection_phase))
+        _PLANS[inspection_phase] = plan
+    return plan.rules
+
+
+def apply_rules(task, inventory, plugin_data, inspection_phase):
+    """Apply inspection rules to a node."""
+    node = task.node
+
+    rules = get_rules_plan(task.context, inspection_phase)
     if not rules:
         LOG.debug("No inspection rules to apply for phase "
                   "'%(phase)s on node: %(node)s'", {
@@ -207,30 +311,31 @@ def apply_rules(task, inventory, plugin_data, inspection_phase):
                       'node': node.uuid})
         return
 
-    rules.sort(key=lambda rule: rule.get('priority', 0), reverse=True)
     LOG.debug("Applying %(count)d inspection rules to node %(node)s",
               {'count': len(rules), 'node': node.uuid})
 
     for rule in rules:
+        rule_uuid = (rule.uuid if isinstance(rule, CompiledRule)
+                     else rule['uuid'])
         try:
             result = _check_rule(task, rule, inventory, plugin_data)
             if result is None:
                 continue
             masked_inventory, masked_plugin_data = result
             LOG.info("Applying actions for rule %(rule)s to node %(node)s",
-                     {'rule': rule['uuid'], 'node': node.uuid})
+                     {'rule': rule_uuid, 'node': node.uuid})
             apply_actions(task, rule, masked_inventory, masked_plugin_data)
         except exception.HardwareInspectionFailure:
             raise
         except exception.IronicException as e:
             LOG.error(_("Error applying rule %(rule)s to node "
-                        "%(node)s: %(error)s"), {'rule': rule['uuid'],
+                        "%(node)s: %(error)s"), {'rule': rule_uuid,
                                                  'node': node.uuid,
                                                  'error': e})
             raise
         except Exception as e:
             msg = ("Failed to apply rule %(rule)s to node %(node)s: "
-                   "%(error)s" % {'rule': rule['uuid'], 'node': node.uuid,
+                   "%(error)s" % {'rule': rule_uuid, 'node': node.uuid,
                                   'error': e})
 
             LOG.exception(msg)
@@ -20,7 +20,6 @@ from oslo_log import log
 from ironic.common import exception
 from ironic.common.i18n import _
 from ironic.common.inspection_rules import base
-from ironic.common.inspection_rules import utils
 
 
 LOG = log.getLogger(__name__)
@@ -56,11 +55,14 @@ class OperatorBase(base.Base, metaclass=abc.ABCMeta):
     def __call__(self, task, *args, **kwargs):
         """Checks if condition holds for a given field."""
 
-    def check_with_loop(self, task, condition, inventory, plugin_data):
+    def check_with_loop(self, task, condition, inventory, plugin_data,
+                        prepared=None):
         loop_items = None
         if condition.get('loop', []):
             loop_items = condition['loop']
             multiple = condition.get('multiple', 'any')
+        if prepared is None:
+            prepared = self.prepare_args(condition)
 
         results = []
         if isinstance(loop_items, (list, dict)):
@@ -69,7 +71,7 @@ class OperatorBase(base.Base, metaclass=abc.ABCMeta):
                 condition_copy = condition.copy()
                 result = self.check_condition(task, condition_copy,
                                               inventory, plugin_data,
-                                              loop_context)
+                                              loop_context, prepared)
                 results.append(result)
                 if multiple in ('first', 'last'):
                     return result
@@ -80,7 +82,7 @@ class OperatorBase(base.Base, metaclass=abc.ABCMeta):
                     condition_copy = condition.copy()
                     result = self.check_condition(task, condition_copy,
                                                   inventory, plugin_data,
-                                                  loop_context)
+                                                  loop_context, prepared)
                     results.append(result)
 
                     if multiple == 'first' and result:
@@ -93,10 +95,11 @@ class OperatorBase(base.Base, metaclass=abc.ABCMeta):
             elif multiple == 'all':
                 return all(results)
             return results[0] if results else False
-        return self.check_condition(task, condition, inventory, plugin_data)
+        return self.check_condition(task, condition, inventory, plugin_data,
+                                    prepared=prepared)
 
     def check_condition(self, task, condition, inventory, plugin_data,
-                        loop_context=None):
+                        loop_context=None, prepared=None):
         """Process condition arguments and apply the check logic.
 
         :param task: TaskManger instance
@@ -104,17 +107,18 @@ class OperatorBase(base.Base, metaclass=abc.ABCMeta):
         :param inventory: Node inventory data with hardware information
         :param plugin_data: Data from inspection plugins
         :param loop_context: Current loop item when called from check_with_loop
+        :param prepared: PreparedArgs of the condition, if already known.
         :raises InspectionRuleExecutionFailure: on unacceptable field value
         :returns: True if check succeeded, otherwise False
         """
-        op, is_inverted = utils.parse_inverted_operator(
-            condition['op'])
+        if prepared is None:
+            prepared = self.prepare_args(condition)
 
         processed_args = self._process_args(task, condition, inventory,
-                                            plugin_data, loop_context)
+                                            plugin_data, loop_context,
+                                            prepared)
 
-        required_args, optional_args = self.get_validation_signature()
-        if loop_context and 'force_strings' in optional_args:
+        if loop_context and 'force_strings' in prepared.optional_args:
             # When in a loop context, variable interpolation might convert
             # numbers to strings. Setting force_strings ensures consistent
             # comparison by converting all values to strings before
@@ -122,7 +126,7 @@ class OperatorBase(base.Base, metaclass=abc.ABCMeta):
             processed_args['force_strings'] = True
 
         result = self(task, **processed_args)
-        return not result if is_inverted else result
+        return not result if prepared.inverted else result
 
 
 class SimpleOperator(OperatorBase):
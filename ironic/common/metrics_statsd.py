@@ -13,9 +13,13 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import atexit
 import contextlib
 import logging
+import os
+import random
 import socket
+import threading
 
 from oslo_config import cfg
 
@@ -26,6 +30,163 @@ LOG = logging.getLogger(__name__)
 
 CONF = cfg.CONF
 
+# Metrics waiting to be sent, by statsd (host, port)
+_AGGREGATORS = {}
+_AGGREGATORS_LOCK = threading.Lock()
+
+
+class _Aggregator(object):
+    """Metrics recorded since the last flush to a statsd backend.
+
+    Counters are summed, the last value of each gauge is kept and up to
+    ``[metrics_statsd]max_timer_samples`` values of each timer are sampled.
+    A background thread sends them every
+    ``[metrics_statsd]aggregation_interval`` seconds in packets of up to
+    ``[metrics_statsd]max_packet_size`` bytes.
+    """
+
+    def __init__(self, target):
+        self._target = target
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._gauges = {}
+        # name -> (number of values recorded, sampled values)
+        self._timers = {}
+        self._socket = None
+        self._thread = None
+        self._stop = threading.Event()
+
+    def _ensure_flusher(self):
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name='statsd-flusher', daemon=True)
+            self._thread.start()
+
+    def counter(self, name, value, sample_rate=None):
+        if sample_rate:
+            # NOTE: the counter has already been sampled by the caller,
+            # account for the values that were not recorded.
+            value = value / sample_rate
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+            self._ensure_flusher()
+
+    def gauge(self, name, value):
+        with self._lock:
+            self._gauges[name] = value
+            self._ensure_flusher()
+
+    def timer(self, name, value):
+        max_samples = CONF.metrics_statsd.max_timer_samples
+        with self._lock:
+            count, samples = self._timers.get(name, (0, []))
+            count += 1
+            if len(samples) < max_samples:
+                samples.append(value)
+            else:
+                # Reservoir sampling: every value recorded in the interval
+                # has the same chance to be sent.
+                index = random.randrange(count)
+                if index < max_samples:
+                    samples[index] = value
+            self._timers[name] = (count, samples)
+            self._ensure_flusher()
+
+    def _lines(self, counters, gauges, timers):
+        for name, value in counters.items():
+            yield '%s:%s|%s' % (name, value, StatsdMetricLogger.COUNTER_TYPE)
+        for name, value in gauges.items():
+            yield '%s:%s|%s' % (name, value, StatsdMetricLogger.GAUGE_TYPE)
+        for name, (count, samples) in timers.items():
+            suffix = ''
+            if count > len(samples):
+                suffix = '|@%s' % round(len(samples) / count, 6)
+            for value in samples:
+                yield '%s:%s|%s%s' % (name, value,
+                                      StatsdMetricLogger.TIMER_TYPE, suffix)
+
+    def _packets(self, lines):
+        max_size = CONF.metrics_statsd.max_packet_size
+        packet = b''
+        for line in lines:
+            line = line.encode()
+            if packet and len(packet) + 1 + len(line) > max_size:
+                yield packet
+                packet = b''
+            packet = packet + b'\n' + line if packet else line
+        if packet:
+            yield packet
+
+    def flush(self):
+        """Send all metrics recorded since the last flush."""
+        with self._lock:
+            counters, self._counters = self._counters, {}
+            gauges, self._gauges = self._gauges, {}
+            timers, self._timers = self._timers, {}
+        if not (counters or gauges or timers):
+            return
+
+        # NOTE: only the flusher thread (or the exit handler, once the
+        # flusher is gone) sends, so the socket is not shared.
+        if self._socket is None:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._socket.settimeout(0.0)
+        for packet in self._packets(self._lines(counters, gauges, timers)):
+            try:
+                self._socket.sendto(packet, self._target)
+            except socket.error as e:
+                LOG.warning("Failed to send metric values to host "
+                            "%(host)s, port %(port)s. Error: %(error)s",
+                            {'host': self._target[0],
+                             'port': self._target[1], 'error': e})
+
+    def _run(self):
+        while not self._stop.wait(CONF.metrics_statsd.aggregation_interval
+                                  or 1.0):
+            try:
+                self.flush()
+            except Exception:
+                LOG.exception('Unexpected error when sending metrics to '
+                              'host %(host)s, port %(port)s',
+                              {'host': self._target[0],
+                               'port': self._target[1]})
+
+    def stop(self):
+        """Stop the flusher thread and send the remaining metrics."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+
+def _get_aggregator(target):
+    with _AGGREGATORS_LOCK:
+        try:
+            return _AGGREGATORS[target]
+        except KeyError:
+            aggregator = _AGGREGATORS[target] = _Aggregator(target)
+            return aggregator
+
+
+@atexit.register
+def _stop_aggregators():
+    with _AGGREGATORS_LOCK:
+        aggregators = list(_AGGREGATORS.values())
+        _AGGREGATORS.clear()
+    for aggregator in aggregators:
+        aggregator.stop()
+
+
+def _reset_after_fork():
+    # NOTE: the flusher threads do not survive a fork, start new ones in the
+    # child process (e.g. API workers) with empty aggregators.
+    global _AGGREGATORS_LOCK
+    _AGGREGATORS_LOCK = threading.Lock()
+    _AGGREGATORS.clear()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
 
 class StatsdMetricLogger(metrics.MetricLogger):
     """Metric logger that reports data via the statsd protocol."""
@@ -81,12 +242,27 @@ class StatsdMetricLogger(metrics.MetricLogger):
     def _open_socket(self):
         return socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
 
+    def _aggregator(self):
+        """Get the aggregator for the backend, None for immediate mode."""
+        if not CONF.metrics_statsd.aggregation_interval:
+            return None
+        return _get_aggregator(self._target)
+
     def _gauge(self, name, value):
-        return self._send(name, value, self.GAUGE_TYPE)
+        aggregator = self._aggregator()
+        if aggregator is None:
+            return self._send(name, value, self.GAUGE_TYPE)
+        aggregator.gauge(name, value)
 
     def _counter(self, name, value, sample_rate=None):
-        return self._send(name, value, self.COUNTER_TYPE,
-                          sample_rate=sample_rate)
+        aggregator = self._aggregator()
+        if aggregator is None:
+            return self._send(name, value, self.COUNTER_TYPE,
+                              sample_rate=sample_rate)
+        aggregator.counter(name, value, sample_rate=sample_rate)
 
     def _timer(self, name, value):
-        return self._send(name, value, self.TIMER_TYPE)
+        aggregator = self._aggregator()
+        if aggregator is None:
+            return self._send(name, value, self.TIMER_TYPE)
+        aggregator.timer(name, value)
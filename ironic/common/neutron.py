@@ -12,6 +12,7 @@
 
 import copy
 import ipaddress
+import time
 
 import openstack
 from openstack.connection import exceptions as openstack_exc
@@ -19,7 +20,6 @@ from oslo_log import log
 import tenacity
 from tenacity import retry
 
-from ironic.api.controllers.v1 import utils as api_utils
 from ironic.common import context as ironic_context
 from ironic.common import exception
 from ironic.common.i18n import _
@@ -32,6 +32,10 @@ LOG = log.getLogger(__name__)
 
 _NEUTRON_SESSION = None
 
+# Hosts whose neutron agent was recently seen alive, with the monotonic time
+# this observation expires at. See wait_for_host_agent.
+_ALIVE_HOST_AGENTS = {}
+
 VNIC_BAREMETAL = 'baremetal'
 VNIC_SMARTNIC = 'smart-nic'
 
@@ -284,6 +288,85 @@ def _add_ip_addresses_for_ipv6_stateful(context, port, client):
         update_neutron_port(context, port.id, attrs, client=client)
 
 
+def _build_port_attrs(ironic_port, portmap, network_uuid, attrs,
+                      update_attrs):
+    """Build the attributes of the neutron port for an ironic port.
+
+    :returns: A tuple with the attributes to create the neutron port with,
+        the attributes to update it with and whether it is a Smart NIC port.
+    """
+    # Start with a clean state for each port
+    port_attrs = copy.deepcopy(attrs)
+    update_port_attrs = copy.deepcopy(update_attrs)
+
+    update_port_attrs['mac_address'] = ironic_port.address
+
+    # Stores local link information for the port
+    binding_profile = {'local_link_information':
+                       [portmap[ironic_port.uuid]]}
+
+    if ironic_port.physical_network:
+        binding_profile['physical_network'] = ironic_port.physical_network
+
+    update_port_attrs['binding:profile'] = binding_profile
+
+    if not ironic_port.pxe_enabled:
+        LOG.debug("Adding port %(port)s to network %(net)s for "
+                  "provisioning without an IP allocation.",
+                  {'port': ironic_port.uuid, 'net': network_uuid})
+        port_attrs['fixed_ips'] = []
+
+    is_smart_nic = is_smartnic_port(ironic_port)
+    if is_smart_nic:
+        link_info = binding_profile['local_link_information'][0]
+        LOG.debug('Setting hostname as host_id in case of Smart NIC, '
+                  'port %(port_id)s, hostname %(hostname)s',
+                  {'port_id': ironic_port.uuid,
+                   'hostname': link_info['hostname']})
+        update_port_attrs['binding:host_id'] = link_info['hostname']
+
+        # TODO(hamdyk): use portbindings.VNIC_SMARTNIC from neutron-lib
+        port_attrs['binding:vnic_type'] = VNIC_SMARTNIC
+
+    client_id = ironic_port.extra.get('client-id')
+    if client_id:
+        extra_dhcp_opts = port_attrs.get('extra_dhcp_opts', [])
+        extra_dhcp_opts.append(
+            {'opt_name': DHCP_CLIENT_ID, 'opt_value': client_id})
+        port_attrs['extra_dhcp_opts'] = extra_dhcp_opts
+
+    return port_attrs, update_port_attrs, is_smart_nic
+
+
+def _create_ports(client, attrs_list):
+    """Create neutron ports, with a single request where possible.
+
+    Neutron creates the ports of a bulk request all or none, so if the bulk
+    request fails, the ports are created one by one to find out which of
+    them cannot be created.
+
+    :param client: A Neutron client object.
+    :param attrs_list: List of the attributes of each port.
+    :returns: List with the created port, or the exception raised when
+        creating it, for each item of attrs_list.
+    """
+    if len(attrs_list) > 1:
+        try:
+            return list(client.create_ports(attrs_list))
+        except openstack_exc.OpenStackCloudException as e:
+            LOG.debug('Could not create %(count)d neutron ports at once, '
+                      'creating them one by one: %(exc)s',
+                      {'count': len(attrs_list), 'exc': e})
+
+    result = []
+    for attrs in attrs_list:
+        try:
+            result.append(client.create_port(**attrs))
+        except openstack_exc.OpenStackCloudException as e:
+            result.append(e)
+    return result
+
+
 def add_ports_to_network(task, network_uuid, security_groups=None):
     """Create neutron ports to boot the ramdisk.
 
@@ -346,81 +429,37 @@ def add_ports_to_network(task, network_uuid, security_groups=None):
             "No available %(enabled)s ports on node %(node)s.") %
             {'enabled': pxe_enabled, 'node': node.uuid})
 
+    # Build the attributes of all the ports first, so that they can be
+    # created with a single request and waited for together.
+    to_create = []
     for ironic_port in ports_to_create:
-        # Start with a clean state for each port
-        port_attrs = copy.deepcopy(attrs)
-        update_port_attrs = copy.deepcopy(update_attrs)
-
         # Skip ports that are missing required information for deploy.
         if not validate_port_info(node, ironic_port):
             failures.append(ironic_port.uuid)
             continue
 
-        update_port_attrs['mac_address'] = ironic_port.address
-
-        # Stores local link information for the port
-        binding_profile = {'local_link_information':
-                           [portmap[ironic_port.uuid]]}
-
-        if ironic_port.physical_network:
-            binding_profile['physical_network'] = ironic_port.physical_network
-
-        update_port_attrs['binding:profile'] = binding_profile
-
-        if not ironic_port.pxe_enabled:
-            LOG.debug("Adding port %(port)s to network %(net)s for "
-                      "provisioning without an IP allocation.",
-                      {'port': ironic_port.uuid, 'net': network_uuid})
-            port_attrs['fixed_ips'] = []
-
-        is_smart_nic = is_smartnic_port(ironic_port)
-        if is_smart_nic:
-            link_info = binding_profile['local_link_information'][0]
-            LOG.debug('Setting hostname as host_id in case of Smart NIC, '
-                      'port %(port_id)s, hostname %(hostname)s',
-                      {'port_id': ironic_port.uuid,
-                       'hostname': link_info['hostname']})
-            update_port_attrs['binding:host_id'] = link_info['hostname']
+        to_create.append((ironic_port,) + _build_port_attrs(
+            ironic_port, portmap, network_uuid, attrs, update_attrs))
 
-            # TODO(hamdyk): use portbindings.VNIC_SMARTNIC from neutron-lib
-            port_attrs['binding:vnic_type'] = VNIC_SMARTNIC
+    # Smart NIC ports are bound by the agent on their host, which is only
+    # checked once for all the ports on the same host.
+    for host_id in dict.fromkeys(item[2]['binding:host_id']
+                                 for item in to_create if item[3]):
+        wait_for_host_agent(client, host_id)
 
-        client_id = ironic_port.extra.get('client-id')
-        if client_id:
-            extra_dhcp_opts = port_attrs.get('extra_dhcp_opts', [])
-            extra_dhcp_opts.append(
-                {'opt_name': DHCP_CLIENT_ID, 'opt_value': client_id})
-            port_attrs['extra_dhcp_opts'] = extra_dhcp_opts
+    created = _create_ports(client, [item[1] for item in to_create])
 
+    to_wait = {}
+    is_neutron_iface = node.network_interface == 'neutron'
+    for (ironic_port, _attrs, update_port_attrs, is_smart_nic), port in zip(
+            to_create, created):
         try:
-            if is_smart_nic:
-                wait_for_host_agent(
-                    client, update_port_attrs['binding:host_id'])
-            port = client.create_port(**port_attrs)
+            if isinstance(port, Exception):
+                raise port
             port = update_neutron_port(task.context, port.id,
                                        update_port_attrs)
             if CONF.neutron.dhcpv6_stateful_address_count > 1:
                 _add_ip_addresses_for_ipv6_stateful(task.context, port, client)
-
-            binding_fail_fatal = False
-            is_neutron_iface = node.network_interface == 'neutron'
-
-            if is_neutron_iface:
-                binding_fail_fatal = CONF.neutron.fail_on_port_binding_failure
-
-            default_failure_behavior = is_smart_nic or binding_fail_fatal
-
-            fail_on_binding_failure = node.driver_info.get(
-                'fail_on_binding_failure', default_failure_behavior)
-
-            # NOTE(cid): Only check port status if it's a smart NIC or if we're
-            # configured to fail on binding failures. This avoids unnecessary
-            # failures when using network interfaces where binding may fail but
-            # we want to continue anyway (like in the case of flat networks).
-            if fail_on_binding_failure:
-                wait_for_port_status(
-                    client, port.id, 'ACTIVE',
-                    fail_on_binding_failure=fail_on_binding_failure)
         except openstack_exc.OpenStackCloudException as e:
             failures.append(ironic_port.uuid)
             LOG.warning("Could not create neutron port for node's "
@@ -428,9 +467,42 @@ def add_ports_to_network(task, network_uuid, security_groups=None):
                         "network %(net)s. %(exc)s",
                         {'net': network_uuid, 'node': node.uuid,
                          'ir_port': ironic_port.uuid, 'exc': e})
+            continue
+
+        binding_fail_fatal = False
+        if is_neutron_iface:
+            binding_fail_fatal = CONF.neutron.fail_on_port_binding_failure
+
+        default_failure_behavior = is_smart_nic or binding_fail_fatal
+
+        fail_on_binding_failure = node.driver_info.get(
+            'fail_on_binding_failure', default_failure_behavior)
+
+        # NOTE(cid): Only check port status if it's a smart NIC or if we're
+        # configured to fail on binding failures. This avoids unnecessary
+        # failures when using network interfaces where binding may fail but
+        # we want to continue anyway (like in the case of flat networks).
+        if fail_on_binding_failure:
+            to_wait[port.id] = ironic_port
         else:
             ports[ironic_port.uuid] = port.id
 
+    if to_wait:
+        binding_failed = wait_for_ports_status(client, list(to_wait),
+                                               'ACTIVE')
+        for port_id, ironic_port in to_wait.items():
+            if port_id in binding_failed:
+                failures.append(ironic_port.uuid)
+                LOG.warning("Could not create neutron port for node's "
+                            "%(node)s port %(ir_port)s on the neutron "
+                            "network %(net)s. Binding failed for neutron "
+                            "port %(port_id)s",
+                            {'net': network_uuid, 'node': node.uuid,
+                             'ir_port': ironic_port.uuid,
+                             'port_id': port_id})
+            else:
+                ports[ironic_port.uuid] = port_id
+
     if failures:
         if len(failures) == len(ports_to_create):
             rollback_ports(task, network_uuid)
@@ -844,6 +916,9 @@ def validate_port_info(node, port):
                     {'node': node.uuid, 'port': port.uuid})
         return False
 
+    # NOTE: importing the API utilities pulls in all API controllers, do it
+    # only when needed to keep the conductor startup fast.
+    from ironic.api.controllers.v1 import utils as api_utils
     try:
         api_utils.LOCAL_LINK_SMART_NIC_VALIDATOR(
             'local_link_connection', port.local_link_connection)
@@ -1071,6 +1146,12 @@ def wait_for_host_agent(client, host_id, target_state='up'):
             'up, down. Requested state: %(target_state)s' % {
                 'target_state': target_state})
 
+    if (target_state == 'up'
+            and _ALIVE_HOST_AGENTS.get(host_id, 0) > time.monotonic()):
+        LOG.debug('Agent on host %(host_id)s was recently seen up',
+                  {'host_id': host_id})
+        return True
+
     LOG.debug('Validating host %(host_id)s agent is %(status)s',
               {'host_id': host_id,
                'status': target_state})
@@ -1078,6 +1159,11 @@ def wait_for_host_agent(client, host_id, target_state='up'):
     LOG.debug('Agent on host %(host_id)s is %(status)s',
               {'host_id': host_id,
                'status': 'up' if is_alive else 'down'})
+    ttl = CONF.agent.neutron_agent_status_cache_ttl
+    if is_alive and ttl:
+        _ALIVE_HOST_AGENTS[host_id] = time.monotonic() + ttl
+    else:
+        _ALIVE_HOST_AGENTS.pop(host_id, None)
     if ((target_state == 'up' and is_alive)
             or (target_state == 'down' and not is_alive)):
         return True
@@ -1126,6 +1212,51 @@ def wait_for_port_status(client, port_id, status,
             'port_id': port_id, 'status': status})
 
 
+@retry(
+    retry=tenacity.retry_if_exception_type(exception.NetworkError),
+    stop=tenacity.stop_after_attempt(CONF.agent.neutron_agent_max_attempts),
+    wait=tenacity.wait_fixed(CONF.agent.neutron_agent_status_retry_interval),
+    reraise=True)
+def _poll_ports_status(client, pending, status, binding_failed):
+    LOG.debug('Validating Ports %(port_ids)s status is %(status)s',
+              {'port_ids': sorted(pending), 'status': status})
+    for port in client.ports(id=sorted(pending)):
+        if port.id not in pending:
+            continue
+        LOG.debug('Port %(port_id)s status is: %(status)s',
+                  {'port_id': port.id, 'status': port.status})
+        if port.status == status:
+            pending.discard(port.id)
+        elif port.get('binding:vif_type') == 'binding_failed':
+            LOG.error("Binding failed for neutron port %s", port.id)
+            pending.discard(port.id)
+            binding_failed.add(port.id)
+    if pending:
+        raise exception.NetworkError(
+            'Ports %(port_ids)s failed to reach status %(status)s' % {
+                'port_ids': ', '.join(sorted(pending)), 'status': status})
+
+
+def wait_for_ports_status(client, port_ids, status):
+    """Wait for the status of several ports to be the desired status
+
+    Unlike calling wait_for_port_status for each port, all the ports that
+    have not reached the status yet are fetched with a single request on
+    every attempt, and the ports are waited for concurrently.
+
+    :param client: A Neutron client object.
+    :param port_ids: A list of neutron port IDs.
+    :param status: Ports' target status, can be ACTIVE, DOWN ... etc.
+    :returns: A set with the IDs of the ports whose binding failed.
+    :raises: exception.NetworkError if the status of some ports didn't match
+        the required status after max retry attempts.
+    """
+    pending = set(port_ids)
+    binding_failed = set()
+    _poll_ports_status(client, pending, status, binding_failed)
+    return binding_failed
+
+
 class NeutronNetworkInterfaceMixin(object):
 
     def get_cleaning_network_uuid(self, task):
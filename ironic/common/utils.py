@@ -23,6 +23,7 @@ import contextlib
 import copy
 import datetime
 import errno
+import functools
 import hashlib
 import ipaddress
 import os
@@ -493,9 +494,45 @@ def validate_network_port(port, port_name="Port"):
         {'port_name': port_name, 'port': port})
 
 
+@functools.lru_cache(maxsize=64)
+def _get_template_environment(tmpl_path, strict):
+    """Get a sandboxed Jinja2 environment for rendering templates.
+
+    Compiled templates are cached by the environment, templates loaded from
+    files are compiled again when their modification time changes.
+
+    :param tmpl_path: directory with template files or None for an
+        environment used for string templates.
+    :param strict: whether undefined variables cause an error.
+    :returns: a SandboxedEnvironment instance.
+    """
+    if tmpl_path is not None:
+        loader = jinja2.FileSystemLoader(tmpl_path)
+        autoescape = jinja2.select_autoescape()
+    else:
+        loader = None
+        # NOTE: autoescaping is disabled for string templates the
+        # same way as for files without html or xml extensions.
+        autoescape = jinja2.select_autoescape(default_for_string=False)
+    return jinja2sandbox.SandboxedEnvironment(
+        loader=loader,
+        autoescape=autoescape,
+        undefined=jinja2.StrictUndefined if strict else jinja2.Undefined
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _get_string_template(template, strict):
+    """Get a compiled Jinja2 template from a string with the template."""
+    return _get_template_environment(None, strict).from_string(template)
+
+
 def render_template(template, params, is_file=True, strict=False):
     """Renders Jinja2 template file with given parameters.
 
+    Compiled templates are cached, so that every template is only parsed
+    and compiled once (or once after each modification of a template file).
+
     :param template: full path to the Jinja2 template file
     :param params: dictionary with parameters to use when rendering
     :param is_file: whether template is file or string with template itself
@@ -507,18 +544,10 @@ def render_template(template, params, is_file=True, strict=False):
     """
     if is_file:
         tmpl_path, tmpl_name = os.path.split(template)
-        loader = jinja2.FileSystemLoader(tmpl_path)
+        env = _get_template_environment(tmpl_path, strict)
+        tmpl = env.get_template(tmpl_name)
     else:
-        tmpl_name = 'template'
-        loader = jinja2.DictLoader({tmpl_name: template})
-    # NOTE(pas-ha) not using default_for_string=False as we set the name
-    # of the template above for strings too.
-    env = jinja2sandbox.SandboxedEnvironment(
-        loader=loader,
-        autoescape=jinja2.select_autoescape(),
-        undefined=jinja2.StrictUndefined if strict else jinja2.Undefined
-    )
-    tmpl = env.get_template(tmpl_name)
+        tmpl = _get_string_template(template, strict)
     return tmpl.render(params, enumerate=enumerate)
 
 
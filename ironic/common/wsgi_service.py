@@ -20,7 +20,6 @@ from oslo_log import log as logging
 from oslo_service import service
 from oslo_service import sslutils
 
-from ironic.api import app
 from ironic.common import exception
 from ironic.common.i18n import _
 from ironic.common import tls_utils
@@ -173,6 +172,10 @@ class WSGIService(BaseWSGIService):
         :param use_ssl: Wraps the socket in an SSL context if True.
         :returns: None
         """
+        # NOTE: the API application pulls in pecan and all API controllers,
+        # which processes only serving JSON RPC (e.g. ironic-conductor) do
+        # not need, so it is imported only when the API service is created.
+        from ironic.api import app
         self.app = app.VersionSelectorApplication()
         self.workers = (
             CONF.api.api_workers
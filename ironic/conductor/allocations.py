@@ -12,6 +12,7 @@
 
 """Functionality related to allocations."""
 
+import collections
 import random
 
 from oslo_config import cfg
@@ -23,13 +24,20 @@ from ironic.common.i18n import _
 from ironic.common import metrics_utils
 from ironic.common import states
 from ironic.conductor import task_manager
-from ironic import objects
+from ironic.db import api as dbapi
 
 
 CONF = cfg.CONF
 LOG = log.getLogger(__name__)
 METRICS = metrics_utils.get_metrics_logger(__name__)
 
+_CANDIDATE_FIELDS = ('id', 'uuid', 'name')
+# NOTE: a narrow projection of a node, the full node is only loaded once it is
+# locked for the allocation.
+_Candidate = collections.namedtuple('_Candidate', _CANDIDATE_FIELDS)
+# Number of candidates checked with one database query during allocation.
+_CANDIDATE_PAGE_SIZE = 50
+
 
 def do_allocate(context, allocation):
     """Process the allocation.
@@ -100,8 +108,8 @@ def _traits_match(traits, node):
     return {t.trait for t in node.traits.objects}.issuperset(traits)
 
 
-def _candidate_nodes(context, allocation):
-    """Get a list of candidate nodes for the allocation."""
+def _candidate_filters(allocation):
+    """Get the node filters matching the allocation request."""
     # NOTE(dtantsur): not checking the retired flag because it's impossible
     # (by the API contract) to have a retired node in the available state.
     filters = {'resource_class': allocation.resource_class,
@@ -115,10 +123,31 @@ def _candidate_nodes(context, allocation):
         filters['uuid_in'] = allocation.candidate_nodes
     if allocation.owner:
         filters['project'] = allocation.owner
+    if allocation.traits:
+        filters['traits'] = allocation.traits
+    return filters
 
-    nodes = objects.Node.list(context, filters=filters)
+
+def _candidate_nodes(context, allocation):
+    """Get a list of candidate nodes for the allocation.
+
+    :returns: a list of ``_Candidate`` tuples with the node ID, UUID and name.
+    """
+    filters = _candidate_filters(allocation)
+    db = dbapi.get_instance()
+    nodes = [_Candidate(*row) for row in db.get_nodeinfo_list(
+        columns=_CANDIDATE_FIELDS, filters=filters)]
 
     if not nodes:
+        # NOTE: only check which of the filters was the culprit when nothing
+        # was found, to provide a meaningful error.
+        if allocation.traits:
+            del filters['traits']
+            if db.get_nodeinfo_list(filters=filters, limit=1):
+                error = (_("no suitable nodes have the requested traits %s")
+                         % ', '.join(allocation.traits))
+                raise exception.AllocationFailed(uuid=allocation.uuid,
+                                                 error=error)
         if allocation.candidate_nodes:
             error = _("none of the requested nodes are available and match "
                       "the resource class %s") % allocation.resource_class
@@ -127,15 +156,6 @@ def _candidate_nodes(context, allocation):
                 allocation.resource_class)
         raise exception.AllocationFailed(uuid=allocation.uuid, error=error)
 
-    # TODO(dtantsur): database-level filtering?
-    if allocation.traits:
-        traits = set(allocation.traits)
-        nodes = [n for n in nodes if _traits_match(traits, n)]
-        if not nodes:
-            error = (_("no suitable nodes have the requested traits %s") %
-                     ', '.join(traits))
-            raise exception.AllocationFailed(uuid=allocation.uuid, error=error)
-
     # NOTE(dtantsur): make sure that parallel allocations do not try the nodes
     # in the same order.
     random.shuffle(nodes)
@@ -206,39 +226,62 @@ def _verify_node(node, allocation):
     reraise=True)
 def _allocate_node(context, allocation, nodes):
     """Go through the list of nodes and try to allocate one of them."""
+    # NOTE: the candidate list is already limited to the requested nodes.
+    filters = _candidate_filters(allocation)
+    filters.pop('uuid_in', None)
+    db = dbapi.get_instance()
+
     retry_nodes = []
-    for node in nodes:
-        try:
-            # NOTE(dtantsur): retries are done for all nodes above, so disable
-            # per-node retry. Also disable loading the driver, since the
-            # current conductor may not have the required hardware type or
-            # interfaces (it's picked at random).
-            with task_manager.acquire(context, node.uuid, shared=False,
-                                      retry=False, load_driver=False,
-                                      purpose='allocating') as task:
-                # NOTE(dtantsur): double-check the node details, since they
-                # could have changed before we acquired the lock.
-                if not _verify_node(task.node, allocation):
-                    continue
-
-                allocation.node_id = task.node.id
-                allocation.state = states.ACTIVE
-                # NOTE(dtantsur): the node.instance_uuid and allocation_id are
-                # updated inside of the save() call within the same
-                # transaction to avoid races. NodeAssociated can be raised if
-                # another process allocates this node first.
-                allocation.save()
-                LOG.info('Node %(node)s has been successfully reserved for '
-                         'allocation %(uuid)s',
-                         {'node': node.uuid, 'uuid': allocation.uuid})
-                return allocation
-        except exception.NodeLocked:
-            LOG.debug('Node %s is currently locked, moving to the next one',
-                      node.uuid)
-            retry_nodes.append(node)
-        except exception.NodeAssociated:
-            LOG.debug('Node %s is already associated, moving to the next one',
-                      node.uuid)
+    for offset in range(0, len(nodes), _CANDIDATE_PAGE_SIZE):
+        page = nodes[offset:offset + _CANDIDATE_PAGE_SIZE]
+        # NOTE: check which nodes of the page still match the request and
+        # which are locked with one query instead of trying to lock each of
+        # them. The page keeps the shuffled order of the candidates.
+        reservations = dict(db.get_nodeinfo_list(
+            columns=['uuid', 'reservation'],
+            filters=dict(filters, uuid_in=[node.uuid for node in page])))
+        for node in page:
+            if node.uuid not in reservations:
+                LOG.debug('Node %s no longer matches the allocation, '
+                          'skipping', node.uuid)
+                continue
+            if reservations[node.uuid]:
+                LOG.debug('Node %s is currently locked, moving to the next '
+                          'one', node.uuid)
+                retry_nodes.append(node)
+                continue
+            try:
+                # NOTE(dtantsur): retries are done for all nodes above, so
+                # disable per-node retry. Also disable loading the driver,
+                # since the current conductor may not have the required
+                # hardware type or interfaces (it's picked at random).
+                with task_manager.acquire(context, node.uuid, shared=False,
+                                          retry=False, load_driver=False,
+                                          purpose='allocating') as task:
+                    # NOTE(dtantsur): double-check the node details, since
+                    # they could have changed before we acquired the lock.
+                    if not _verify_node(task.node, allocation):
+                        continue
+
+                    allocation.node_id = task.node.id
+                    allocation.state = states.ACTIVE
+                    # NOTE(dtantsur): the node.instance_uuid and
+                    # allocation_id are updated inside of the save() call
+                    # within the same transaction to avoid races.
+                    # NodeAssociated can be raised if another process
+                    # allocates this node first.
+                    allocation.save()
+                    LOG.info('Node %(node)s has been successfully reserved '
+                             'for allocation %(uuid)s',
+                             {'node': node.uuid, 'uuid': allocation.uuid})
+                    return allocation
+            except exception.NodeLocked:
+                LOG.debug('Node %s is currently locked, moving to the next '
+                          'one', node.uuid)
+                retry_nodes.append(node)
+            except exception.NodeAssociated:
+                LOG.debug('Node %s is already associated, moving to the next '
+                          'one', node.uuid)
 
     # NOTE(dtantsur): rewrite the passed list to only contain the nodes that
     # are worth retrying. Do not include nodes that are no longer suitable.
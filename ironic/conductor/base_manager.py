@@ -281,6 +281,10 @@ class BaseConductorManager(object):
             self.del_host()
             raise
 
+        # Make the new membership visible to the routing helpers of this
+        # process without waiting for the cached topology to expire.
+        hash_ring.HashRingManager.reset()
+
         # Start periodic tasks
         self._periodic_tasks_worker = self._executor.submit(
             self._periodic_tasks.start, allow_empty=True)
@@ -290,6 +294,10 @@ class BaseConductorManager(object):
         # Correct stuck states
         self._correct_stuck_states()
 
+        # Recalculate provision deadlines of the nodes mapped to this
+        # conductor with its timeouts
+        self._update_provision_deadlines()
+
         # Start consoles if it set enabled in a greenthread.
         try:
             if start_consoles:
@@ -332,6 +340,25 @@ class BaseConductorManager(object):
                   "%(host)s. Moving to fail state.") %
                 {'state': state, 'host': self.host})
 
+    def _update_provision_deadlines(self):
+        """Apply the configured timeouts to the waiting nodes.
+
+        The deadlines are recorded with the timeouts configured when nodes
+        start waiting for a callback. Nodes may also have started waiting
+        before deadlines were recorded, e.g. before an upgrade. Only the
+        nodes mapped to this conductor are updated, using its timeouts.
+        """
+        filters = {'provision_state_in': [states.DEPLOYWAIT,
+                                          states.CLEANWAIT,
+                                          states.RESCUEWAIT,
+                                          states.SERVICEWAIT,
+                                          states.INSPECTWAIT]}
+        node_ids = [result[3] for result in
+                    self.iter_nodes(fields=['id'], filters=filters)]
+        if node_ids:
+            count = self.dbapi.update_provision_deadlines(node_ids)
+            LOG.debug('Updated the provision deadlines of %d node(s)', count)
+
     def _use_jsonrpc_port(self):
         """Determines if the JSON-RPC port can be used."""
         release_ver = versions.RELEASE_MAPPING.get(CONF.pin_release_version)
@@ -374,6 +401,8 @@ class BaseConductorManager(object):
         LOG.debug('Collecting periodic tasks')
         # collected callables
         periodic_task_callables = []
+        # metric names of the collected callables
+        periodic_task_names = []
         # list of visited classes to avoid adding the same tasks twice
         periodic_task_classes = set()
 
@@ -391,6 +420,8 @@ class BaseConductorManager(object):
                                   {'owner': obj.__class__.__name__,
                                    'member': name})
                         periodic_task_callables.append((member, args, {}))
+                        periodic_task_names.append(
+                            '%s.%s' % (obj.__class__.__name__, name))
                 periodic_task_classes.add(obj.__class__)
 
         # First, collect tasks from the conductor itself
@@ -409,8 +440,15 @@ class BaseConductorManager(object):
                         {'tasks': len(periodic_task_callables),
                          'workers': CONF.conductor.workers_pool_size})
 
+        # Report the run time of every periodic task, see
+        # conductor_periodics.instrument for the metrics.
+        instrumented_callables = [
+            (conductor_periodics.instrument(name, member), args, kwargs)
+            for name, (member, args, kwargs)
+            in zip(periodic_task_names, periodic_task_callables)]
+
         self._periodic_tasks = periodics.PeriodicWorker(
-            periodic_task_callables,
+            instrumented_callables,
             executor_factory=periodics.ExistingExecutor(self._executor))
         # This is only used in tests currently. Delete it?
         self._periodic_task_callables = periodic_task_callables
@@ -439,6 +477,7 @@ class BaseConductorManager(object):
                 # Note that rebalancing will not occur immediately, but when
                 # the periodic sync takes place.
                 self.conductor.unregister()
+                hash_ring.HashRingManager.reset()
                 LOG.info('Successfully stopped conductor with hostname '
                          '%(hostname)s.',
                          {'hostname': self.host})
@@ -454,6 +493,18 @@ class BaseConductorManager(object):
         # having work complete normally.
         self._periodic_tasks.stop()
         self._periodic_tasks.wait()
+        # Do not lose agent heartbeats and history events buffered since
+        # the last flush.
+        try:
+            utils.flush_agent_heartbeats()
+        except Exception as e:
+            LOG.warning('Failed to record pending agent heartbeats on '
+                        'shutdown: %s', e)
+        try:
+            utils.flush_node_history()
+        except Exception as e:
+            LOG.warning('Failed to record pending node history events on '
+                        'shutdown: %s', e)
         # Shutdown the reserved and normal executors.
         if self._reserved_executor is not None:
             self._reserved_executor.shutdown(wait=True)
@@ -545,7 +596,14 @@ class BaseConductorManager(object):
         :return: generator yielding tuples of requested fields
         """
         columns = ['uuid', 'driver', 'conductor_group'] + list(fields or ())
-        node_list = self.dbapi.get_nodeinfo_list(columns=columns, **kwargs)
+        if set(kwargs) <= {'filters'}:
+            # NOTE: fetch the nodes in batches while they are consumed instead
+            # of loading the whole fleet before processing the first node.
+            node_list = self.dbapi.iter_nodeinfo(columns=columns, **kwargs)
+        else:
+            # Sorting by anything but the ID is not supported when streaming
+            node_list = self.dbapi.get_nodeinfo_list(columns=columns,
+                                                     **kwargs)
         for result in node_list:
             if self._shutdown.is_set():
                 break
@@ -644,9 +702,6 @@ class BaseConductorManager(object):
                                   fsm.
 
         """
-        if isinstance(provision_state, str):
-            provision_state = {provision_state}
-
         node_iter = self.iter_nodes(filters=filters,
                                     sort_key=sort_key,
                                     sort_dir='asc')
@@ -654,33 +709,13 @@ class BaseConductorManager(object):
         workers_count = 0
         for node_uuid, driver, conductor_group in node_iter:
             try:
-                with task_manager.acquire(context, node_uuid,
-                                          purpose='node state check') as task:
-                    # Check maintenance value since it could have changed
-                    # after the filtering was done.
-                    if (desired_maintenance is not None
-                            and desired_maintenance != task.node.maintenance):
-                        continue
-
-                    if task.node.provision_state not in provision_state:
-                        continue
-
-                    target_state = (None if not keep_target_state else
-                                    task.node.target_provision_state)
-
-                    # timeout has been reached - process the event 'fail'
-                    if callback_method:
-                        task.process_event('fail',
-                                           callback=self._spawn_worker,
-                                           call_args=(callback_method, task),
-                                           err_handler=err_handler,
-                                           target_state=target_state)
-                    else:
-                        utils.node_history_record(
-                            task.node, event=last_error,
-                            error=True,
-                            event_type=states.TRANSITION)
-                        task.process_event('fail', target_state=target_state)
+                if not self._fail_node_in_state(
+                        context, node_uuid, provision_state,
+                        desired_maintenance=desired_maintenance,
+                        callback_method=callback_method,
+                        err_handler=err_handler, last_error=last_error,
+                        keep_target_state=keep_target_state):
+                    continue
             except exception.NoFreeConductorWorker:
                 break
             except (exception.NodeLocked, exception.NodeNotFound):
@@ -689,6 +724,53 @@ class BaseConductorManager(object):
             if workers_count >= CONF.conductor.periodic_max_workers:
                 break
 
+    def _fail_node_in_state(self, context, node_uuid, provision_state,
+                            desired_maintenance=None, callback_method=None,
+                            err_handler=None, last_error=None,
+                            keep_target_state=False):
+        """Fail a node if it is still in the specified state.
+
+        See :meth:`_fail_if_in_state` for the meaning of the arguments.
+
+        :param desired_maintenance: if not None, the node is skipped when
+                                    its maintenance flag has a different
+                                    value.
+        :returns: True if the node was failed, False if it was skipped.
+        :raises: NodeLocked, NodeNotFound
+        :raises: NoFreeConductorWorker if the callback cannot be spawned.
+        """
+        if isinstance(provision_state, str):
+            provision_state = {provision_state}
+
+        with task_manager.acquire(context, node_uuid,
+                                  purpose='node state check') as task:
+            # Check maintenance value since it could have changed
+            # after the filtering was done.
+            if (desired_maintenance is not None
+                    and desired_maintenance != task.node.maintenance):
+                return False
+
+            if task.node.provision_state not in provision_state:
+                return False
+
+            target_state = (None if not keep_target_state else
+                            task.node.target_provision_state)
+
+            # timeout has been reached - process the event 'fail'
+            if callback_method:
+                task.process_event('fail',
+                                   callback=self._spawn_worker,
+                                   call_args=(callback_method, task),
+                                   err_handler=err_handler,
+                                   target_state=target_state)
+            else:
+                utils.node_history_record(
+                    task.node, event=last_error,
+                    error=True,
+                    event_type=states.TRANSITION)
+                task.process_event('fail', target_state=target_state)
+        return True
+
     def _start_consoles(self, context):
         """Start consoles if set enabled.
 
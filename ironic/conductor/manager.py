@@ -115,6 +115,20 @@ class ConductorManager(base_manager.BaseConductorManager):
     def _clean_up_caches(self, context):
         image_cache.clean_up_all()
 
+    @METRICS.timer('ConductorManager._flush_agent_heartbeats')
+    @periodics.periodic(
+        spacing=CONF.conductor.agent_heartbeat_flush_interval,
+        enabled=CONF.conductor.agent_heartbeat_flush_interval > 0)
+    def _flush_agent_heartbeats(self, context):
+        utils.flush_agent_heartbeats()
+
+    @METRICS.timer('ConductorManager._flush_node_history')
+    @periodics.periodic(
+        spacing=CONF.conductor.node_history_flush_interval,
+        enabled=CONF.conductor.node_history_flush_interval > 0)
+    def _flush_node_history(self, context):
+        utils.flush_node_history()
+
     @METRICS.timer('ConductorManager.create_node')
     # No need to add these since they are subclasses of InvalidParameterValue:
     #     InterfaceNotFoundInEntrypoint
@@ -1896,29 +1910,64 @@ class ConductorManager(base_manager.BaseConductorManager):
         else:
             handle_recovery(task, power_state)
 
-    @METRICS.timer('ConductorManager._check_deploy_timeouts')
+    @METRICS.timer('ConductorManager._check_provision_deadlines')
     @periodics.periodic(
         spacing=CONF.conductor.check_provision_state_interval,
-        enabled=CONF.conductor.check_provision_state_interval > 0
-        and CONF.conductor.deploy_callback_timeout > 0)
-    def _check_deploy_timeouts(self, context):
-        """Periodically checks whether a deploy RPC call has timed out.
+        enabled=CONF.conductor.check_provision_state_interval > 0)
+    def _check_provision_deadlines(self, context):
+        """Periodically fails nodes that waited too long for a callback.
 
-        If a deploy call has timed out, the deploy failed and we clean up.
+        A provision deadline is recorded for a node when it enters a state
+        waiting for a callback (deploy, clean, rescue, service or inspect
+        wait) and is extended when the node reports progress. Nodes past
+        their deadline are found with one query, ordered by the deadline,
+        and failed. The clean up of each node runs in a worker.
 
         :param context: request context.
         """
-        callback_timeout = CONF.conductor.deploy_callback_timeout
-
+        handlers = {
+            states.DEPLOYWAIT: {
+                'callback_method': utils.cleanup_after_timeout,
+                'err_handler': utils.provisioning_error_handler},
+            states.CLEANWAIT: {
+                'callback_method': utils.cleanup_cleanwait_timeout,
+                'keep_target_state': True},
+            states.RESCUEWAIT: {
+                'callback_method': utils.cleanup_rescuewait_timeout,
+                'keep_target_state': True},
+            states.SERVICEWAIT: {
+                'callback_method': utils.cleanup_servicewait_timeout,
+                'keep_target_state': True},
+            states.INSPECTWAIT: {
+                'callback_method': utils.cleanup_inspectwait_timeout,
+                'err_handler': utils.provisioning_error_handler},
+        }
         filters = {'reserved': False,
-                   'provision_state': states.DEPLOYWAIT,
                    'maintenance': False,
-                   'provisioned_before': callback_timeout}
-        sort_key = 'provision_updated_at'
-        callback_method = utils.cleanup_after_timeout
-        err_handler = utils.provisioning_error_handler
-        self._fail_if_in_state(context, filters, states.DEPLOYWAIT,
-                               sort_key, callback_method, err_handler)
+                   'provision_deadline_passed': True}
+        node_iter = self.iter_nodes(fields=['provision_state'],
+                                    filters=filters,
+                                    sort_key='provision_deadline',
+                                    sort_dir='asc')
+        workers_count = 0
+        for node_uuid, driver, conductor_group, state in node_iter:
+            handler = handlers.get(state)
+            if handler is None:
+                # The deadline is cleared on leaving a waiting state, this
+                # is only possible if the node has been updated directly.
+                continue
+            try:
+                if not self._fail_node_in_state(context, node_uuid, state,
+                                                desired_maintenance=False,
+                                                **handler):
+                    continue
+            except exception.NoFreeConductorWorker:
+                break
+            except (exception.NodeLocked, exception.NodeNotFound):
+                continue
+            workers_count += 1
+            if workers_count >= CONF.conductor.periodic_max_workers:
+                break
 
     @METRICS.timer('ConductorManager._check_orphan_nodes')
     @periodics.periodic(
@@ -2131,73 +2180,6 @@ class ConductorManager(base_manager.BaseConductorManager):
             notify_utils.emit_console_notification(
                 task, 'console_restore', fields.NotificationStatus.ERROR)
 
-    @METRICS.timer('ConductorManager._check_cleanwait_timeouts')
-    @periodics.periodic(
-        spacing=CONF.conductor.check_provision_state_interval,
-        enabled=CONF.conductor.check_provision_state_interval > 0
-        and CONF.conductor.clean_callback_timeout > 0)
-    def _check_cleanwait_timeouts(self, context):
-        """Periodically checks for nodes being cleaned.
-
-        If a node doing cleaning is unresponsive (detected when it stops
-        heart beating), the operation should be aborted.
-
-        :param context: request context.
-        """
-        callback_timeout = CONF.conductor.clean_callback_timeout
-
-        filters = {'reserved': False,
-                   'provision_state': states.CLEANWAIT,
-                   'maintenance': False,
-                   'provisioned_before': callback_timeout}
-        self._fail_if_in_state(context, filters, states.CLEANWAIT,
-                               'provision_updated_at',
-                               keep_target_state=True,
-                               callback_method=utils.cleanup_cleanwait_timeout)
-
-    @METRICS.timer('ConductorManager._check_rescuewait_timeouts')
-    @periodics.periodic(spacing=CONF.conductor.check_rescue_state_interval,
-                        enabled=bool(CONF.conductor.rescue_callback_timeout))
-    def _check_rescuewait_timeouts(self, context):
-        """Periodically checks if rescue has timed out waiting for heartbeat.
-
-        If a rescue call has timed out, fail the rescue and clean up.
-
-        :param context: request context.
-        """
-        callback_timeout = CONF.conductor.rescue_callback_timeout
-        filters = {'reserved': False,
-                   'provision_state': states.RESCUEWAIT,
-                   'maintenance': False,
-                   'provisioned_before': callback_timeout}
-        self._fail_if_in_state(context, filters, states.RESCUEWAIT,
-                               'provision_updated_at',
-                               keep_target_state=True,
-                               callback_method=utils.cleanup_rescuewait_timeout
-                               )
-
-    @METRICS.timer('ConductorManager._check_servicewait_timeouts')
-    @periodics.periodic(
-        spacing=CONF.conductor.check_provision_state_interval,
-        enabled=CONF.conductor.check_provision_state_interval > 0
-        and CONF.conductor.service_callback_timeout > 0)
-    def _check_servicewait_timeouts(self, context):
-        """Periodically check if servicing has timed out waiting for heartbeat.
-
-        :param context: request context
-
-        """
-        callback_timeout = CONF.conductor.service_callback_timeout
-        filters = {'reserved': False,
-                   'provision_state': states.SERVICEWAIT,
-                   'maintenance': False,
-                   'provisioned_before': callback_timeout}
-        self._fail_if_in_state(
-            context, filters, states.SERVICEWAIT,
-            'provision_updated_at',
-            keep_target_state=True,
-            callback_method=utils.cleanup_servicewait_timeout)
-
     @METRICS.timer('ConductorManager._sync_local_state')
     @periodics.node_periodic(
         purpose='node take over',
@@ -3426,31 +3408,6 @@ class ConductorManager(base_manager.BaseConductorManager):
                     action='inspect', node=task.node.uuid,
                     state=task.node.provision_state)
 
-    @METRICS.timer('ConductorManager._check_inspect_wait_timeouts')
-    @periodics.periodic(
-        spacing=CONF.conductor.check_provision_state_interval,
-        enabled=CONF.conductor.check_provision_state_interval > 0
-        and CONF.conductor.inspect_wait_timeout > 0)
-    def _check_inspect_wait_timeouts(self, context):
-        """Periodically checks inspect_wait_timeout and fails upon reaching it.
-
-        :param context: request context
-
-        """
-        callback_timeout = CONF.conductor.inspect_wait_timeout
-
-        filters = {'reserved': False,
-                   'maintenance': False,
-                   'provision_state': states.INSPECTWAIT,
-                   'inspection_started_before': callback_timeout}
-        sort_key = 'inspection_started_at'
-        last_error = _("timeout reached while inspecting the node")
-        self._fail_if_in_state(context, filters, states.INSPECTWAIT,
-                               sort_key,
-                               callback_method=utils.cleanup_inspectwait_timeout,
-                               err_handler=utils.provisioning_error_handler,
-                               last_error=last_error)
-
     @METRICS.timer('ConductorManager.set_target_raid_config')
     @messaging.expected_exceptions(exception.NodeLocked,
                                    exception.UnsupportedDriverExtension,
@@ -4149,36 +4106,25 @@ class ConductorManager(base_manager.BaseConductorManager):
     def _manage_node_history(self, context):
         """Periodic task to keep the node history tidy."""
         max_batch = CONF.conductor.node_history_cleanup_batch_count
-        # NOTE(TheJulia): Asks the db for the list. Presently just gets
-        # the node id and the count. If we incorporate by date constraint
-        # or handling, then it will need to be something like the method
-        # needs to identify the explicit ID values to delete, and then
-        # the deletion process needs to erase in logical chunks.
+        # NOTE: The database picks the history records which exceed the
+        # configured maximum. One more record than permitted in a batch is
+        # requested to know if work is left over for the next run.
         entries_to_clean = self.dbapi.query_node_history_records_for_purge(
-            conductor_id=self.conductor.id)
-        count = 0
-        for node_id in entries_to_clean:
-            if count < max_batch:
-                # If we have not hit our total limit, proceed
-                if entries_to_clean[node_id]:
-                    # if we have work to do on this node, proceed.
-                    self.dbapi.bulk_delete_node_history_records(
-                        entries_to_clean[node_id])
-            else:
-                LOG.warning('While cleaning up node history records, '
-                            'we reached the maximum number of records '
-                            'permitted in a single batch. If this error '
-                            'is repeated, consider tuning node history '
-                            'configuration options to be more aggressive '
-                            'by increasing frequency and lowering the '
-                            'number of entries to be deleted to not '
-                            'negatively impact performance.')
-                break
-            count = count + len(entries_to_clean[node_id])
-            # Yield to other threads, since we also don't want to be
-            # looping tightly deleting rows as that will negatively
-            # impact DB access if done in excess.
-            time.sleep(0)
+            conductor_id=self.conductor.id, limit=max_batch + 1)
+        entries = [entry for node_entries in entries_to_clean.values()
+                   for entry in node_entries]
+        if len(entries) > max_batch:
+            LOG.warning('While cleaning up node history records, '
+                        'we reached the maximum number of records '
+                        'permitted in a single batch. If this error '
+                        'is repeated, consider tuning node history '
+                        'configuration options to be more aggressive '
+                        'by increasing frequency and lowering the '
+                        'number of entries to be deleted to not '
+                        'negatively impact performance.')
+            entries = entries[:max_batch]
+        if entries:
+            self.dbapi.bulk_delete_node_history_records(entries)
 
     def _concurrent_action_limit(self, action):
         """Check Concurrency limits and block operations if needed.
@@ -4197,11 +4143,10 @@ class ConductorManager(base_manager.BaseConductorManager):
             conductor_group = CONF.conductor.conductor_group
 
         if action == 'provisioning':
-            node_count = self.dbapi.count_nodes_in_provision_state(
-                [states.DEPLOYING, states.DEPLOYWAIT],
-                conductor_group=conductor_group
-            )
-            if node_count >= CONF.conductor.max_concurrent_deploy:
+            if not utils.reserve_action_slot(
+                    (states.DEPLOYING, states.DEPLOYWAIT),
+                    CONF.conductor.max_concurrent_deploy,
+                    conductor_group=conductor_group):
                 raise exception.ConcurrentActionLimit(
                     task_type=action)
 
@@ -4210,11 +4155,10 @@ class ConductorManager(base_manager.BaseConductorManager):
             # which is super transitory, *but* you can get a node into
             # the state. So in order to guard against a DoS attack, we
             # need to check even the super transitory node state.
-            node_count = self.dbapi.count_nodes_in_provision_state(
-                [states.DELETING, states.CLEANING, states.CLEANWAIT],
-                conductor_group=conductor_group
-            )
-            if node_count >= CONF.conductor.max_concurrent_clean:
+            if not utils.reserve_action_slot(
+                    (states.DELETING, states.CLEANING, states.CLEANWAIT),
+                    CONF.conductor.max_concurrent_clean,
+                    conductor_group=conductor_group):
                 raise exception.ConcurrentActionLimit(
                     task_type=action)
 
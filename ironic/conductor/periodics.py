@@ -101,6 +101,51 @@ def periodic(spacing, enabled=True, **kwargs):
     return decorator
 
 
+def instrument(name, func):
+    """Wrap a periodic task to report how its runs go.
+
+    Sends the following metrics for every run:
+
+    * ``<name>.RunTime`` (timer) - how long the run took;
+    * ``<name>.StartDelay`` (timer) - how late the run started compared to
+      its schedule, for example because the previous run overran the
+      spacing of the task or no worker was free;
+    * ``<name>.Overrun`` (counter) - sent when the run took longer than the
+      spacing of the task.
+
+    :param name: the metric name prefix, e.g. ``ConductorManager._sync``.
+    :param func: a periodic task callable.
+    :returns: a periodic task callable with the same periodic attributes.
+    """
+    last_started = None
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        nonlocal last_started
+        spacing = getattr(func, '_periodic_spacing', None) or 0
+        started = time.monotonic()
+        if last_started is not None:
+            delay = max(0, started - last_started - spacing)
+            METRICS.send_timer('%s.StartDelay' % name, delay * 1000)
+        last_started = started
+        try:
+            return func(*args, **kwargs)
+        finally:
+            runtime = time.monotonic() - started
+            METRICS.send_timer('%s.RunTime' % name, runtime * 1000)
+            if spacing and runtime > spacing:
+                METRICS.send_counter('%s.Overrun' % name, 1)
+
+    return wrapper
+
+
+def _report_nodes(name, scanned, acted, locked):
+    """Report how many nodes an iteration of a node periodic went through."""
+    METRICS.send_gauge('%s.NodesScanned' % name, scanned)
+    METRICS.send_gauge('%s.NodesActedOn' % name, acted)
+    METRICS.send_gauge('%s.NodesLocked' % name, locked)
+
+
 class Stop(Exception):
     """A signal to stop the current iteration of a periodic task."""
 
@@ -148,6 +193,12 @@ def node_periodic(purpose, spacing, enabled=True, filters=None,
     :param node_count_metric_name: A string value to identify a metric
         representing the count of matching nodes to be recorded upon the
         completion of the periodic.
+
+    On every iteration, the ``<class>.<function>.NodesScanned``,
+    ``<class>.<function>.NodesActedOn`` and ``<class>.<function>.NodesLocked``
+    gauges report how many nodes were fetched, how many were processed (not
+    counting the ones for which the function returned ``False``) and how many
+    were skipped because they were locked.
     """
     node_type = collections.namedtuple(
         'Node',
@@ -174,6 +225,7 @@ def node_periodic(purpose, spacing, enabled=True, filters=None,
             interface_type = (getattr(self, 'interface_type', None)
                               if isinstance(self, driver_base.BaseInterface)
                               else None)
+            metric_name = '%s.%s' % (type(self).__name__, func.__name__)
 
             if callable(limit):
                 local_limit = limit()
@@ -181,6 +233,8 @@ def node_periodic(purpose, spacing, enabled=True, filters=None,
                 local_limit = limit
             assert local_limit is None or local_limit > 0
             node_count = 0
+            acted_count = 0
+            locked_count = 0
             nodes = manager.iter_nodes(filters=filters,
                                        fields=predicate_extra_fields)
             for (node_uuid, *other) in nodes:
@@ -216,6 +270,8 @@ def node_periodic(purpose, spacing, enabled=True, filters=None,
                                 continue
 
                         result = func(self, task, *args, **kwargs)
+                        if result is None or result:
+                            acted_count += 1
                 except exception.NodeNotFound:
                     LOG.info("During %(action)s, node %(node)s was not found "
                              "and presumed deleted by another process.",
@@ -224,6 +280,7 @@ def node_periodic(purpose, spacing, enabled=True, filters=None,
                     LOG.info("During %(action)s, node %(node)s was already "
                              "locked by another process. Skip.",
                              {'node': node_uuid, 'action': purpose})
+                    locked_count += 1
                 except Stop:
                     break
                 finally:
@@ -234,7 +291,11 @@ def node_periodic(purpose, spacing, enabled=True, filters=None,
                         and (result is None or result)):
                     local_limit -= 1
                     if not local_limit:
+                        _report_nodes(metric_name, node_count, acted_count,
+                                      locked_count)
                         return
+            _report_nodes(metric_name, node_count, acted_count,
+                          locked_count)
             if node_count_metric_name:
                 # Send post-run metrics.
                 METRICS.send_gauge(
@@ -30,14 +30,11 @@ from ironic.common.json_rpc import client as json_rpc
 from ironic.common import release_mappings as versions
 from ironic.common import rpc
 from ironic.conf import CONF
-from ironic.db import api as dbapi
 from ironic.objects import base as objects_base
 
 
 LOG = log.getLogger(__name__)
 
-DBAPI = dbapi.get_instance()
-
 
 class LocalContext:
     """Context to make calls to a local conductor."""
@@ -277,9 +274,14 @@ class ConductorAPI(object):
 
     def get_random_topic(self):
         """Get an RPC topic for a random conductor service."""
-        conductors = DBAPI.get_online_conductors()
+        hosts = self.ring_manager.topology.hosts
+        if not hosts:
+            # NOTE: a conductor may have just come up, do not wait for the
+            # cached topology to expire.
+            hash_ring.HashRingManager.reset()
+            hosts = self.ring_manager.topology.hosts
         try:
-            hostname = random.choice(conductors)
+            hostname = random.choice(hosts)
         except IndexError:
             # There are no conductors - return 503 Service Unavailable
             raise exception.TemporaryFailure()
@@ -298,10 +300,10 @@ class ConductorAPI(object):
 
         """
         # NOTE(jroll) we want to be able to route this to any conductor,
-        # regardless of groupings. We use a fresh, uncached hash ring that
-        # does not take groups into account.
-        local_ring_manager = hash_ring.HashRingManager(use_groups=False,
-                                                       cache=False)
+        # regardless of groupings. We use a hash ring that does not take
+        # groups into account. It shares the cached conductor topology, an
+        # unknown driver causes the topology to be reloaded.
+        local_ring_manager = hash_ring.HashRingManager(use_groups=False)
         try:
             ring = local_ring_manager.get_ring(driver_name, '')
         except exception.TemporaryFailure:
@@ -113,6 +113,7 @@ import tenacity
 from ironic.common import driver_factory
 from ironic.common import exception
 from ironic.common.i18n import _
+from ironic.common import metrics_utils
 from ironic.common import state_machine
 from ironic.common import states
 from ironic.common.trait_based_networking.loader import tbn_config_file_traits
@@ -122,6 +123,8 @@ from ironic.objects import fields
 
 LOG = logging.getLogger(__name__)
 
+METRICS = metrics_utils.get_metrics_logger(__name__)
+
 CONF = cfg.CONF
 
 
@@ -355,6 +358,9 @@ class TaskManager(object):
             CONF.conductor.node_locked_retry_interval * \
             CONF.conductor.node_locked_retry_attempts
 
+        lock_timer = timeutils.StopWatch().start()
+        attempts = 0
+
         # NodeLocked exceptions can be annoying. Let's try to alleviate
         # some of that pain by retrying our lock attempts.
         @tenacity.retry(
@@ -364,6 +370,8 @@ class TaskManager(object):
                 CONF.conductor.node_locked_retry_interval),
             reraise=True)
         def reserve_node():
+            nonlocal attempts
+            attempts += 1
             if self._debug_timer.elapsed() > max_lock_time:
                 LOG.warning('We have exceeded the normal maximum time window '
                             'to complete a node lock attempting to reserve '
@@ -379,7 +387,19 @@ class TaskManager(object):
                        'time': self._debug_timer.elapsed()})
             self._debug_timer.restart()
 
-        reserve_node()
+        try:
+            reserve_node()
+        except exception.NodeLocked:
+            METRICS.send_counter('TaskManager.LockFailed', 1)
+            raise
+        finally:
+            # NOTE: the wait includes the failed attempts and the intervals
+            # between them, a lock acquired on the first attempt only waits
+            # for the database.
+            METRICS.send_timer('TaskManager.LockWait',
+                               lock_timer.elapsed() * 1000)
+            if attempts > 1:
+                METRICS.send_counter('TaskManager.LockRetries', attempts - 1)
 
     def upgrade_lock(self, purpose=None, retry=None):
         """Upgrade a shared lock to an exclusive lock.
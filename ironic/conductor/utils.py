@@ -18,10 +18,12 @@ from enum import Enum
 import functools
 import os
 import secrets
+import threading
 import time
 
 from oslo_config import cfg
 from oslo_context import context as oslo_context
+from oslo_db import exception as db_exception
 from oslo_log import log
 from oslo_service import loopingcall
 from oslo_utils import secretutils
@@ -41,6 +43,7 @@ from ironic.common import states
 from ironic.common import utils
 from ironic.conductor import notification_utils as notify_utils
 from ironic.conductor import task_manager
+from ironic.db import api as dbapi
 from ironic.drivers.modules import deploy_utils
 from ironic.objects import fields
 from ironic.objects import node_history
@@ -1407,6 +1410,89 @@ def remove_agent_url(node):
     node.del_driver_internal_info('agent_url')
 
 
+_PENDING_AGENT_HEARTBEATS = {}
+_PENDING_AGENT_HEARTBEATS_LOCK = threading.Lock()
+
+
+def record_agent_heartbeat(node):
+    """Record the time of an agent heartbeat without saving the node.
+
+    Unless ``[conductor]agent_heartbeat_flush_interval`` is 0, the time is
+    kept in memory and written to the database together with other nodes'
+    heartbeats by :func:`flush_agent_heartbeats`.
+
+    :param node: A Node object.
+    """
+    now = timeutils.utcnow()
+    if CONF.conductor.agent_heartbeat_flush_interval <= 0:
+        dbapi.get_instance().update_agent_heartbeats({node.id: now})
+        return
+    with _PENDING_AGENT_HEARTBEATS_LOCK:
+        _PENDING_AGENT_HEARTBEATS[node.id] = now
+
+
+def flush_agent_heartbeats():
+    """Write all pending agent heartbeat times to the database."""
+    with _PENDING_AGENT_HEARTBEATS_LOCK:
+        if not _PENDING_AGENT_HEARTBEATS:
+            return
+        pending = dict(_PENDING_AGENT_HEARTBEATS)
+        _PENDING_AGENT_HEARTBEATS.clear()
+    LOG.debug('Recording agent heartbeats for %d node(s)', len(pending))
+    try:
+        dbapi.get_instance().update_agent_heartbeats(pending)
+    except Exception:
+        # Put the heartbeats back unless newer ones arrived meanwhile.
+        with _PENDING_AGENT_HEARTBEATS_LOCK:
+            for node_id, heartbeat in pending.items():
+                _PENDING_AGENT_HEARTBEATS.setdefault(node_id, heartbeat)
+        raise
+
+
+# Number of nodes in the provision states of a concurrency limited action,
+# keyed by the states and the conductor group the limit applies to. Values
+# are lists of the count and the monotonic time it has to be refreshed at.
+_ACTION_COUNTS = {}
+_ACTION_COUNTS_LOCK = threading.Lock()
+
+
+def reserve_action_slot(action_states, limit, conductor_group=None):
+    """Reserve a slot for a node starting a concurrency limited action.
+
+    Counting the nodes in the action's states takes a query over the nodes
+    table, so the count may be cached for
+    ``[conductor]action_count_cache_ttl`` seconds and incremented for every
+    slot reserved meanwhile. The cached count is only trusted while at least
+    half of the slots are free, so the nodes are counted again before the
+    limit can be reached, and a request is never rejected based on a cached
+    count.
+
+    :param action_states: A tuple of the provision states of the action.
+    :param limit: The maximum number of nodes in these states.
+    :param conductor_group: The conductor group to count the nodes in, or
+        None to count all nodes.
+    :returns: True if a slot was reserved, False if the limit is reached.
+    """
+    key = (action_states, conductor_group)
+    ttl = CONF.conductor.action_count_cache_ttl
+    if ttl > 0:
+        with _ACTION_COUNTS_LOCK:
+            cached = _ACTION_COUNTS.get(key)
+            if (cached is not None and cached[1] > time.monotonic()
+                    and cached[0] < limit - limit // 2):
+                cached[0] += 1
+                return True
+
+    count = dbapi.get_instance().count_nodes_in_provision_state(
+        list(action_states), conductor_group=conductor_group)
+    reserved = count < limit
+    if ttl > 0:
+        with _ACTION_COUNTS_LOCK:
+            _ACTION_COUNTS[key] = [count + int(reserved),
+                                   time.monotonic() + ttl]
+    return reserved
+
+
 def _get_node_next_steps(task, step_type, skip_current_step=True):
     """Get the task's node's next steps.
 
@@ -1958,7 +2044,7 @@ def node_history_record(node, conductor=None, event=None,
         # NOTE(TheJulia): DB API automatically adds in a uuid.
         # TODO(TheJulia): At some point, we should allow custom severity.
 
-        node_history.NodeHistory(
+        history = node_history.NodeHistory(
             node_id=node.id,
             conductor=CONF.host,
             user=actual_user,
@@ -1969,7 +2055,56 @@ def node_history_record(node, conductor=None, event=None,
             state=node.provision_state,
             target_provision_state=node.target_provision_state,
             duration_seconds=duration
-            ).create()
+            )
+        if CONF.conductor.node_history_flush_interval > 0:
+            _buffer_node_history(history)
+        else:
+            history.create()
+
+
+_PENDING_NODE_HISTORY = []
+_PENDING_NODE_HISTORY_LOCK = threading.Lock()
+# Buffered events are written by the caller once there are this many of
+# them, to keep the buffer bounded between periodic flushes.
+_NODE_HISTORY_BUFFER_SIZE = 1000
+
+
+def _buffer_node_history(history):
+    # NOTE: the time of the event, not of the flush, is what pruning and
+    # the API sort on.
+    history.created_at = timeutils.utcnow()
+    values = history.do_version_changes_for_db()
+    with _PENDING_NODE_HISTORY_LOCK:
+        _PENDING_NODE_HISTORY.append(values)
+        full = len(_PENDING_NODE_HISTORY) >= _NODE_HISTORY_BUFFER_SIZE
+    if full:
+        flush_node_history()
+
+
+def flush_node_history():
+    """Write all buffered node history events to the database."""
+    with _PENDING_NODE_HISTORY_LOCK:
+        if not _PENDING_NODE_HISTORY:
+            return
+        pending = list(_PENDING_NODE_HISTORY)
+        _PENDING_NODE_HISTORY.clear()
+    LOG.debug('Recording %d node history event(s)', len(pending))
+    db = dbapi.get_instance()
+    try:
+        db.create_node_history_records(pending)
+    except db_exception.DBReferenceError:
+        # A node was deleted since its events were buffered, record the
+        # events one by one to only drop the ones of the deleted nodes.
+        for values in pending:
+            try:
+                db.create_node_history_records([values])
+            except db_exception.DBReferenceError:
+                LOG.debug('Dropping history event of deleted node %s',
+                          values.get('node_id'))
+    except Exception:
+        with _PENDING_NODE_HISTORY_LOCK:
+            _PENDING_NODE_HISTORY[:0] = pending
+        raise
 
 
 def update_image_type(context, node):
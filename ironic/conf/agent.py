@@ -153,6 +153,15 @@ opts = [
                default=10,
                help=_('Wait time in seconds between attempts for validating '
                       'Neutron agent status.')),
+    cfg.IntOpt('neutron_agent_status_cache_ttl',
+               default=10,
+               min=0,
+               mutable=True,
+               help=_('For how long (in seconds) a Neutron agent seen alive '
+                      'on a host is assumed to still be alive, so that '
+                      'binding several ports on the same host does not '
+                      'validate the agent status for every port. A value '
+                      'of 0 disables the cache.')),
     cfg.BoolOpt('require_tls',
                 default=True,
                 mutable=True,
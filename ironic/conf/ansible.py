@@ -140,6 +140,46 @@ opts = [
                       "'ansible_python_interpreter' option in node's "
                       "'driver_info' field. "
                       "By default, ansible uses /usr/bin/python")),
+    cfg.FloatOpt('batch_window',
+                 default=0,
+                 min=0,
+                 mutable=True,
+                 help=_("For how long (in seconds) to wait for other nodes "
+                        "running the same playbook with the same arguments "
+                        "before starting ansible-playbook, so that they are "
+                        "all handled by a single ansible-playbook run. "
+                        "This avoids paying for starting Ansible, setting "
+                        "up SSH connections and gathering facts for every "
+                        "node when many nodes are deployed or cleaned at "
+                        "once. The default of 0 runs ansible-playbook for "
+                        "each node separately.")),
+    cfg.IntOpt('batch_max_nodes',
+               default=20,
+               min=1,
+               mutable=True,
+               help=_("Maximum number of nodes handled by a single "
+                      "ansible-playbook run when [ansible]batch_window "
+                      "is set.")),
+    cfg.IntOpt('control_persist',
+               default=0,
+               min=0,
+               mutable=True,
+               help=_("For how long (in seconds) SSH connections to the "
+                      "nodes are kept open after ansible-playbook "
+                      "finishes, so that the next playbook run for the "
+                      "same node does not have to set them up again. "
+                      "The default of 0 leaves the SSH arguments to the "
+                      "Ansible configuration.")),
+    cfg.IntOpt('fact_cache_timeout',
+               default=0,
+               min=0,
+               mutable=True,
+               help=_("For how long (in seconds) facts gathered from the "
+                      "nodes are cached between ansible-playbook runs, so "
+                      "that consecutive steps on the same node do not "
+                      "gather them again. Facts are cached in files in "
+                      "the [DEFAULT]tempdir directory. The default of 0 "
+                      "disables fact caching.")),
 ]
 
 
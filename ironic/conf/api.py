@@ -95,6 +95,17 @@ opts = [
                default=300,
                mutable=True,
                help=_('Maximum interval (in seconds) for agent heartbeats.')),
+    cfg.IntOpt('ramdisk_lookup_cache_ttl',
+               default=5,
+               min=0,
+               mutable=True,
+               help=_('For how long (in seconds) the outcome of resolving '
+                      'MAC addresses to a node is cached by each API worker '
+                      'when ramdisks look up their node. Ramdisks repeat '
+                      'the lookup until their node is in a state where it '
+                      'is allowed, so this limits the database load while '
+                      'many nodes are booting. A value of 0 disables the '
+                      'cache.')),
     cfg.StrOpt(
         'network_data_schema',
         default='$pybasedir/api/controllers/v1/network-data-schema.json',
@@ -63,6 +63,11 @@ opts = [
     cfg.IntOpt('check_rescue_state_interval',
                default=60,
                min=1,
+               deprecated_for_removal=True,
+               deprecated_reason=_('Rescue timeouts are checked together '
+                                   'with all other provision timeouts every '
+                                   '[conductor]check_provision_state_interval '
+                                   'seconds.'),
                help=_('Interval (seconds) between checks of rescue '
                       'timeouts.')),
     cfg.IntOpt('check_allocations_interval',
@@ -74,6 +79,15 @@ opts = [
                default=3600, min=0,
                help=_('Interval between cleaning up image caches, in seconds. '
                       'Set to 0 to disable periodic clean-up.')),
+    cfg.IntOpt('agent_heartbeat_flush_interval',
+               default=10, min=0,
+               help=_('Interval in seconds at which agent heartbeat times '
+                      'are written to the database in a single batch. '
+                      'Heartbeats that do not change the agent URL or '
+                      'version only update the last heartbeat time of the '
+                      'node, which is coalesced in memory until the next '
+                      'flush. Set to 0 to record every heartbeat time '
+                      'immediately.')),
     cfg.BoolOpt('clear_image_cache_on_deploy_failure',
                 default=False,
                 mutable=True,
@@ -396,12 +410,21 @@ opts = [
                mutable=False,
                help=_('The target number of node history records to purge '
                       'from the database when performing clean-up. '
-                      'Deletes are performed by node, and a node with excess '
-                      'records for a node will still be deleted. '
+                      'The oldest excess records are deleted first, any '
+                      'remaining ones are left for the next clean-up. '
                       'Operators who find node history building up may wish '
                       'to lower this threshold and decrease the time between '
                       'cleanup operations using the '
                       '``node_history_cleanup_interval`` setting.')),
+    cfg.IntOpt('node_history_flush_interval',
+               min=0,
+               default=0,
+               mutable=False,
+               help=_('Interval in seconds at which buffered node history '
+                      'events are written to the database in a single '
+                      'batch. Events are not visible in the API until they '
+                      'are written. The default, 0, writes every event '
+                      'immediately.')),
     cfg.IntOpt('node_history_minimum_days',
                min=0,
                default=0,
@@ -512,6 +535,23 @@ opts = [
                        'independent concurrency limits. When False '
                        '(the default), the limits apply to all nodes '
                        'across the entire Ironic deployment.')),
+    cfg.IntOpt('action_count_cache_ttl',
+               default=5,
+               min=0,
+               mutable=True,
+               help=_('For how long (in seconds) each conductor may cache '
+                      'the number of nodes counted against the '
+                      'max_concurrent_deploy and max_concurrent_clean '
+                      'limits. Requests accepted meanwhile are added to the '
+                      'cached number, which is only used while at least '
+                      'half of the limit is free; closer to the limit the '
+                      'nodes are counted on every request. The cache is '
+                      'kept by each conductor process and does not include '
+                      'requests accepted by the others, so with N '
+                      'conductors up to N times half of the limit may be '
+                      'accepted within this time, overshooting the limit '
+                      'when N is larger than 2. Set to 0 to count the nodes '
+                      'on every request.')),
     cfg.BoolOpt('poweroff_in_cleanfail',
                 default=False,
                 help=_('If True power off nodes in the ``clean failed`` '
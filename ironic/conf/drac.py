@@ -50,8 +50,22 @@ opts = [
                default=300,
                min=1,
                help=_('Maximum time (in seconds) to wait for RAID job to '
-                      'complete'))
-
+                      'complete')),
+    cfg.IntOpt('job_status_max_interval',
+               min=0,
+               mutable=True,
+               help=_('Maximum interval (in seconds) between checks of the '
+                      'iDRAC job queue while the RAID jobs of a node keep '
+                      'running without any progress. The interval starts '
+                      'at the interval of the periodic task checking the '
+                      'jobs and doubles every time the jobs are found '
+                      'unchanged, up to this value. Since many iDRAC jobs '
+                      'report no progress until they finish, a large value '
+                      'delays noticing finished jobs. Defaults to twice '
+                      'query_raid_config_job_status_interval, so that at '
+                      'most every other run of the periodic task is '
+                      'skipped. Set to 0 to check the jobs on every run of '
+                      'the periodic task.')),
 ]
 
 
@@ -91,6 +91,30 @@ statsd_opts = [
                 default=8125,
                 help=_('Port for the agent ramdisk to use with the statsd '
                        'backend.')),
+    cfg.FloatOpt('aggregation_interval',
+                 default=1.0,
+                 min=0,
+                 help=_('Interval (in seconds) at which metrics are sent to '
+                        'the statsd backend. Within an interval, counters '
+                        'are summed, the last value of each gauge is kept '
+                        'and timer values are sampled, and everything is '
+                        'sent in as few packets as possible. Set to 0 to '
+                        'send every metric value in its own packet as soon '
+                        'as it is recorded.')),
+    cfg.IntOpt('max_packet_size',
+               default=1432,
+               min=512,
+               max=65507,
+               help=_('Maximum size (in bytes) of a packet with aggregated '
+                      'metrics. The default fits into the MTU of an '
+                      'Ethernet network.')),
+    cfg.IntOpt('max_timer_samples',
+               default=100,
+               min=1,
+               help=_('Maximum number of values of a timer sent per '
+                      'aggregation interval. When a timer is recorded more '
+                      'often, a random sample of its values is sent with '
+                      'the corresponding sample rate.')),
 ]
 
 
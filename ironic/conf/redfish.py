@@ -101,6 +101,29 @@ opts = [
                       'or as the octal number ``0o644`` in Python. '
                       'This setting must be set to the octal number '
                       'representation, meaning starting with ``0o``.')),
+    cfg.BoolOpt('shared_deploy_iso',
+                default=False,
+                mutable=True,
+                help=_('Build deploy and rescue ISO images once per kernel, '
+                       'ramdisk, bootloader, boot mode and kernel parameters '
+                       'and share them between nodes instead of building an '
+                       'ISO for every node. Only used for nodes with '
+                       '``config_via_removable`` enabled, since the '
+                       'node-specific parameters are passed to the ramdisk '
+                       'through the virtual USB or floppy image, and only '
+                       'when images are served by the local HTTP server. '
+                       'Nodes with custom network data always get their own '
+                       'ISO.')),
+    cfg.IntOpt('shared_deploy_iso_ttl',
+               min=1,
+               default=60,
+               mutable=True,
+               help=_('Time (in minutes) after which a shared deploy or '
+                      'rescue ISO image is built again, so that changes to '
+                      'the kernel or ramdisk behind the same URL are picked '
+                      'up. Shared ISO images older than twice that are '
+                      'removed. '
+                      'Applies only when `shared_deploy_iso` is enabled.')),
     cfg.IntOpt('firmware_update_status_interval',
                min=0,
                default=60,
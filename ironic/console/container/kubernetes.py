@@ -16,7 +16,6 @@ Kubernetes pod console container provider.
 """
 import json
 import re
-import time
 import yaml
 
 from oslo_concurrency import processutils
@@ -29,9 +28,6 @@ from ironic.console.container import base
 
 LOG = logging.getLogger(__name__)
 
-# How often to check pod status
-POD_READY_POLL_INTERVAL = 2
-
 
 class KubernetesConsoleContainer(base.BaseConsoleContainer):
     """Console container provider which uses kubernetes pods."""
@@ -155,49 +151,26 @@ class KubernetesConsoleContainer(base.BaseConsoleContainer):
             )
 
     def _wait_for_pod_ready(self, pod_name, namespace):
-        end_time = time.time() + CONF.vnc.kubernetes_pod_timeout
-        while time.time() < end_time:
-            try:
-                out, _ = utils.execute(
-                    "kubectl",
-                    "get",
-                    "pod",
-                    pod_name,
-                    "-n",
-                    namespace,
-                    "-o",
-                    "json",
-                )
-                pod_status = json.loads(out)
-                if (
-                    "status" in pod_status
-                    and "conditions" in pod_status["status"]
-                ):
-                    for condition in pod_status["status"]["conditions"]:
-                        if (
-                            condition["type"] == "Ready"
-                            and condition["status"] == "True"
-                        ):
-                            LOG.debug("Pod %s is ready.", pod_name)
-                            return
-            except (
-                processutils.ProcessExecutionError,
-                json.JSONDecodeError,
-            ) as e:
-                LOG.warning(
-                    "Could not get pod status for %s: %s", pod_name, e
-                )
-
-            time.sleep(POD_READY_POLL_INTERVAL)
-
-        msg = (
-            f"Pod {pod_name} did not become ready in "
-            f"{CONF.vnc.kubernetes_pod_timeout}s"
-        )
-
-        raise exception.ConsoleContainerError(
-            provider="kubernetes", reason=msg
-        )
+        # kubectl wait watches the pod rather than polling its status, so
+        # it returns as soon as the pod becomes ready.
+        timeout = CONF.vnc.kubernetes_pod_timeout
+        try:
+            utils.execute(
+                "kubectl",
+                "wait",
+                f"pod/{pod_name}",
+                "-n",
+                namespace,
+                "--for=condition=Ready",
+                f"--timeout={timeout}s",
+            )
+        except processutils.ProcessExecutionError as e:
+            LOG.warning("Could not wait for pod %s: %s", pod_name, e)
+            msg = f"Pod {pod_name} did not become ready in {timeout}s"
+            raise exception.ConsoleContainerError(
+                provider="kubernetes", reason=msg
+            )
+        LOG.debug("Pod %s is ready.", pod_name)
 
     def _get_resources_from_yaml(self, rendered, kind=None):
         """Extracts Kubernetes resources from a YAML manifest.
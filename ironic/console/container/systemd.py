@@ -17,6 +17,7 @@ Systemd Quadlet console container provider.
 import json
 import os
 import re
+import threading
 
 from oslo_concurrency import processutils
 from oslo_log import log as logging
@@ -45,6 +46,12 @@ class SystemdConsoleContainer(base.BaseConsoleContainer):
 
     def __init__(self):
 
+        # Coalesces concurrent daemon-reload calls, see _reload
+        self._reload_cond = threading.Condition()
+        self._reload_requests = 0
+        self._reloaded = 0
+        self._reloading = False
+
         # confirm podman and systemctl are available
         try:
             utils.execute('systemctl', '--version')
@@ -119,8 +126,34 @@ class SystemdConsoleContainer(base.BaseConsoleContainer):
     def _reload(self):
         """Call systemctl --user daemon-reload
 
+        Concurrent calls are coalesced. A call returns once a reload which
+        started after the call was made has completed, so every unit file
+        written before calling this method is picked up, while a single
+        reload serves all the calls made during the previous one.
+
         :raises: ConsoleContainerError
         """
+        with self._reload_cond:
+            self._reload_requests += 1
+            requested = self._reload_requests
+            while self._reloaded < requested:
+                if self._reloading:
+                    self._reload_cond.wait()
+                    continue
+                self._reloading = True
+                batch = self._reload_requests
+                self._reload_cond.release()
+                try:
+                    self._daemon_reload()
+                finally:
+                    self._reload_cond.acquire()
+                    self._reloading = False
+                    self._reload_cond.notify_all()
+                # Not reached if the reload failed, in which case one of the
+                # waiting calls runs another reload.
+                self._reloaded = batch
+
+    def _daemon_reload(self):
         try:
             utils.execute('systemctl', '--user', 'daemon-reload')
         except processutils.ProcessExecutionError as e:
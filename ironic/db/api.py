@@ -79,6 +79,11 @@ class Connection(object, metaclass=abc.ABCMeta):
                         :provisioned_before:
                             nodes with provision_updated_at field before this
                             interval in seconds
+                        :provision_deadline_passed:
+                            nodes waiting for a callback whose provision
+                            deadline has passed
+                        :traits: list of traits, all of which the node
+                            must have
                         :uuid: uuid of node
                         :uuid_in: uuid of node (multiple possibilities)
                         :with_power_state: True | False
@@ -91,6 +96,22 @@ class Connection(object, metaclass=abc.ABCMeta):
         :returns: A list of tuples of the specified columns.
         """
 
+    @abc.abstractmethod
+    def iter_nodeinfo(self, columns=None, filters=None, batch_size=1000):
+        """Iterate over specific columns for matching nodes.
+
+        Unlike :meth:`get_nodeinfo_list`, nodes are fetched in batches
+        ordered by their ID as the caller consumes them, so the whole result
+        set is never held in memory and nothing more is fetched once the
+        caller stops iterating.
+
+        :param columns: List of column names to return.
+                        Defaults to 'id' column when columns == None.
+        :param filters: Filters to apply, see :meth:`get_nodeinfo_list`.
+        :param batch_size: Number of nodes to fetch at once.
+        :returns: A generator of tuples of the specified columns.
+        """
+
     @abc.abstractmethod
     def get_node_list(self, filters=None, limit=None, marker=None,
                       sort_key=None, sort_dir=None, fields=None):
@@ -108,6 +129,8 @@ class Connection(object, metaclass=abc.ABCMeta):
                             nodes with provision_updated_at field before this
                             interval in seconds
                         :shard: nodes with the given shard
+                        :traits: list of traits, all of which the node
+                            must have
         :param limit: Maximum number of nodes to return.
         :param marker: the last item of the previous page; we return the next
                        result set.
@@ -372,6 +395,28 @@ class Connection(object, metaclass=abc.ABCMeta):
         :param port_id: The id or MAC of a port.
         """
 
+    @abc.abstractmethod
+    def reconcile_node_ports(self, node_id, ports_to_create=(),
+                             ports_to_update=None, ports_to_delete=()):
+        """Create, update and delete ports of a node in one transaction.
+
+        If a port with one of the new addresses is created concurrently, the
+        transaction is rolled back and the changes are applied again with the
+        ports created one at a time.
+
+        :param node_id: The id of a node.
+        :param ports_to_create: A list of dictionaries with the values of the
+            ports to create. Ports whose address is already used by another
+            port are not created.
+        :param ports_to_update: A dictionary mapping the ids of ports of the
+            node to the values to update them with.
+        :param ports_to_delete: A list of ids of ports of the node to delete.
+        :returns: A list of the addresses of the ports that were not created
+            because they are already used.
+        :raises: NodeNotFound if the node is not found.
+        :raises: InvalidParameterValue if an update tries to change the UUID.
+        """
+
     @abc.abstractmethod
     def get_portgroup_by_id(self, portgroup_id):
         """Return a network portgroup representation.
@@ -655,6 +700,16 @@ class Connection(object, metaclass=abc.ABCMeta):
                      hardware-type-b: set([host2, host3])}
         """
 
+    @abc.abstractmethod
+    def get_active_conductor_topology(self):
+        """Retrieve the registered and active conductors with hardware types.
+
+        :returns: A list of (hostname, conductor_group, hardware_type)
+                  tuples, one per active conductor and hardware type it
+                  supports. Conductors without hardware types are
+                  returned once with hardware_type set to None.
+        """
+
     @abc.abstractmethod
     def get_offline_conductors(self, field='hostname'):
         """Get a list conductors that are offline (dead).
@@ -711,17 +766,45 @@ class Connection(object, metaclass=abc.ABCMeta):
         :param conductor_id: Database ID of conductor to unregister for.
         """
 
+    @abc.abstractmethod
+    def update_provision_deadlines(self, node_ids):
+        """Recalculate the provision deadlines of waiting nodes.
+
+        The deadlines of nodes in a state waiting for a callback are
+        calculated again from the currently configured timeouts, e.g. after
+        the timeouts were changed, or for nodes that entered the state
+        before provision deadlines were recorded. Deadlines of states with
+        the timeout disabled are removed.
+
+        :param node_ids: A list of node IDs to update, nodes not waiting
+            for a callback are ignored.
+        :returns: The number of updated nodes.
+        """
+
     @abc.abstractmethod
     def touch_node_provisioning(self, node_id):
         """Mark the node's provisioning as running.
 
         Mark the node's provisioning as running by updating its
-        'provision_updated_at' property.
+        'provision_updated_at' property. The provision deadline of a node
+        waiting for a callback is moved accordingly.
 
         :param node_id: The id of a node.
         :raises: NodeNotFound
         """
 
+    @abc.abstractmethod
+    def update_agent_heartbeats(self, heartbeats):
+        """Record the last agent heartbeat time for several nodes.
+
+        Only the dedicated ``agent_last_heartbeat`` column is updated, the
+        rest of the node record (including ``updated_at``) is left intact.
+        Nodes that no longer exist are silently skipped.
+
+        :param heartbeats: A dict mapping node IDs to the datetime of the
+                           last heartbeat received from their agent.
+        """
+
     @abc.abstractmethod
     def set_node_tags(self, node_id, tags):
         """Replace all of the node tags with specified list of tags.
@@ -785,10 +868,12 @@ class Connection(object, metaclass=abc.ABCMeta):
         """
 
     @abc.abstractmethod
-    def get_node_by_port_addresses(self, addresses):
+    def get_node_by_port_addresses(self, addresses, fields=None):
         """Find a node by any matching port address.
 
         :param addresses: list of port addresses (e.g. MACs).
+        :param fields: list of node columns to load, defaults to the
+            whole node including its traits and tags.
         :returns: Node object.
         :raises: NodeNotFound if none or several nodes are found.
         """
@@ -1554,6 +1639,13 @@ class Connection(object, metaclass=abc.ABCMeta):
         :param values: Dict of values.
         """
 
+    @abc.abstractmethod
+    def create_node_history_records(self, records):
+        """Create several history records in a single batch.
+
+        :param records: List of dicts of values, one per history record.
+        """
+
     @abc.abstractmethod
     def destroy_node_history_by_uuid(self, history_uuid):
         """Destroy a history record.
@@ -1606,17 +1698,23 @@ class Connection(object, metaclass=abc.ABCMeta):
         """
 
     @abc.abstractmethod
-    def query_node_history_records_for_purge(self, conductor_id):
+    def query_node_history_records_for_purge(self, conductor_id, limit=None):
         """Utility method to identify nodes to clean history records for.
 
+        The records exceeding ``[conductor]node_history_max_entries`` per
+        node are selected by the database, oldest first.
+
         :param conductor_id: Id value for the conductor to perform this
                              query on behalf of.
+        :param limit: Maximum number of records to return. Defaults to
+                      no limit.
         :returns: A dictionary with key values of node database ID values
-                  and a list of values associated with the node.
+                  and a list of history record IDs to remove for the node.
+                  Nodes without records to remove are not included.
         """
 
     @abc.abstractmethod
-    def bulk_delete_node_history_records(self, node_id, limit):
+    def bulk_delete_node_history_records(self, entries):
         """Utility method to bulk delete node history entries.
 
         :param entries: A list of node history entry id's to be
@@ -1795,6 +1893,16 @@ class Connection(object, metaclass=abc.ABCMeta):
         :returns: A list of inspection rules.
         """
 
+    @abc.abstractmethod
+    def get_inspection_rules_revision(self):
+        """Return a value which changes whenever inspection rules change.
+
+        The revision is derived from the number of rules, the highest ID
+        and the latest creation and update times.
+
+        :returns: a tuple.
+        """
+
     @abc.abstractmethod
     def destroy_inspection_rule(self, inspection_rule_id):
         """Destroy an inspection rule.
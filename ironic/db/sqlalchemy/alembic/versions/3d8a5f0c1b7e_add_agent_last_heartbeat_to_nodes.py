@@ -0,0 +1,31 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""add agent_last_heartbeat to nodes
+
+Revision ID: 3d8a5f0c1b7e
+Revises: 9fb44677ef15
+Create Date: 2026-10-18 10:12:41.418332
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '3d8a5f0c1b7e'
+down_revision = '9fb44677ef15'
+
+
+def upgrade():
+    op.add_column('nodes', sa.Column('agent_last_heartbeat', sa.DateTime(),
+                                     nullable=True))
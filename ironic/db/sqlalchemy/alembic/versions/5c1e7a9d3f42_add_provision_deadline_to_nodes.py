@@ -0,0 +1,33 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""add provision_deadline to nodes
+
+Revision ID: 5c1e7a9d3f42
+Revises: 3d8a5f0c1b7e
+Create Date: 2026-10-18 23:24:05.731642
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '5c1e7a9d3f42'
+down_revision = '3d8a5f0c1b7e'
+
+
+def upgrade():
+    op.add_column('nodes', sa.Column('provision_deadline', sa.DateTime(),
+                                     nullable=True))
+    op.create_index('provision_deadline_idx', 'nodes',
+                    ['provision_deadline'], unique=False)
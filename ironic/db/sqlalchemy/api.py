@@ -36,6 +36,7 @@ from osprofiler import sqlalchemy as osp_sqlalchemy
 import sqlalchemy as sa
 from sqlalchemy import or_
 from sqlalchemy.exc import NoResultFound, MultipleResultsFound
+from sqlalchemy.orm import lazyload
 from sqlalchemy.orm import Load
 from sqlalchemy.orm import selectinload
 from sqlalchemy import sql
@@ -436,6 +437,49 @@ def _filter_active_conductors(query, interval=None):
     return query
 
 
+# Number of node IDs per query when updating the provision deadlines.
+_PROVISION_DEADLINES_CHUNK_SIZE = 500
+
+# States waiting for a callback and the options with their timeouts
+_PROVISION_WAIT_STATES = {
+    states.DEPLOYWAIT: 'deploy_callback_timeout',
+    states.CLEANWAIT: 'clean_callback_timeout',
+    states.RESCUEWAIT: 'rescue_callback_timeout',
+    states.SERVICEWAIT: 'service_callback_timeout',
+    states.INSPECTWAIT: 'inspect_wait_timeout',
+}
+
+
+def _provision_timeouts():
+    """Get the timeouts of the states waiting for a callback.
+
+    :returns: A dict mapping provision states to timeouts in seconds. States
+        with the timeout disabled are not included.
+    """
+    timeouts = {state: getattr(CONF.conductor, option)
+                for state, option in _PROVISION_WAIT_STATES.items()}
+    return {state: timeout for state, timeout in timeouts.items() if timeout}
+
+
+def _provision_deadline(provision_state, provision_updated_at,
+                        inspection_started_at):
+    """Calculate the provision deadline of a node.
+
+    Inspection times out relative to its start, other states relative to
+    the last provisioning update.
+    """
+    timeout = _provision_timeouts().get(provision_state)
+    if not timeout:
+        return None
+    if provision_state == states.INSPECTWAIT:
+        start = inspection_started_at
+    else:
+        start = provision_updated_at
+    if start is None:
+        return None
+    return start + datetime.timedelta(seconds=timeout)
+
+
 def _zip_matching(a, b, key):
     """Zip two unsorted lists, yielding matching items or None.
 
@@ -491,7 +535,7 @@ class Connection(api.Connection):
     _NODE_FILTERS = ({'chassis_uuid', 'reserved_by_any_of',
                       'provisioned_before', 'inspection_started_before',
                       'description_contains', 'project', 'include_children',
-                      'parent_node'}
+                      'parent_node', 'traits', 'provision_deadline_passed'}
                      | _NODE_QUERY_FIELDS
                      | set(_NODE_IN_QUERY_FIELDS)
                      | set(_NODE_NON_NULL_FILTERS))
@@ -551,6 +595,9 @@ class Connection(api.Connection):
                      - (datetime.timedelta(
                          seconds=filters['inspection_started_before'])))
             query = query.filter(models.Node.inspection_started_at < limit)
+        if filters.get('provision_deadline_passed'):
+            query = query.filter(
+                models.Node.provision_deadline < timeutils.utcnow())
         if 'description_contains' in filters:
             keyword = filters['description_contains']
             if keyword is not None:
@@ -560,6 +607,17 @@ class Connection(api.Connection):
             project = filters['project']
             query = query.filter((models.Node.owner == project)
                                  | (models.Node.lessee == project))
+        if filters.get('traits'):
+            # NOTE: a node matches if it has *all* of the requested traits.
+            # (node_id, trait) is the primary key of node_traits, so counting
+            # the matching rows per node is enough.
+            traits = set(filters['traits'])
+            with_traits = (
+                sa.select(models.NodeTrait.node_id)
+                .where(models.NodeTrait.trait.in_(traits))
+                .group_by(models.NodeTrait.node_id)
+                .having(sa.func.count(models.NodeTrait.trait) == len(traits)))
+            query = query.filter(models.Node.id.in_(with_traits))
         # Determine parent/child node handling
         if not filters.get('include_children', False):
             if 'parent_node' in filters:
@@ -646,6 +704,35 @@ class Connection(api.Connection):
                                sort_key, sort_dir, query,
                                return_base_tuple=True)
 
+    def iter_nodeinfo(self, columns=None, filters=None, batch_size=1000):
+        if columns is None:
+            columns = ['id']
+        select_columns = [getattr(models.Node, c) for c in columns]
+        if 'id' in columns:
+            id_index = columns.index('id')
+        else:
+            select_columns.append(models.Node.id)
+            id_index = len(columns)
+        query = self._add_nodes_filters(sa.select(*select_columns), filters)
+        query = query.order_by(models.Node.id).limit(batch_size)
+
+        # NOTE: callers lock and update nodes while iterating, so use keyset
+        # pagination with a short transaction per batch rather than keeping
+        # a server-side cursor (and its connection and transaction) open for
+        # the whole iteration.
+        last_id = None
+        while True:
+            batch_query = query
+            if last_id is not None:
+                batch_query = batch_query.where(models.Node.id > last_id)
+            with _session_for_read() as session:
+                res = session.execute(batch_query).fetchall()
+            for row in res:
+                yield tuple(row[:len(columns)])
+            if len(res) < batch_size:
+                return
+            last_id = res[-1][id_index]
+
     def get_node_list(self, filters=None, limit=None, marker=None,
                       sort_key=None, sort_dir=None, fields=None):
         if not fields:
@@ -686,6 +773,11 @@ class Connection(api.Connection):
             # with SQLAlchemy.
             traits_found = True
             use_columns.remove('traits')
+        if ('driver_internal_info' in use_columns
+                and 'agent_last_heartbeat' not in use_columns):
+            # NOTE: the object layer merges the agent heartbeat column into
+            # driver_internal_info, so it has to be loaded with it.
+            use_columns.append('agent_last_heartbeat')
         # Generate the column object list so SQLAlchemy only fulfills
         # the requested columns.
         use_columns = [getattr(models.Node, c) for c in use_columns]
@@ -821,6 +913,10 @@ class Connection(api.Connection):
             values['power_state'] = states.NOSTATE
         if 'provision_state' not in values:
             values['provision_state'] = states.ENROLL
+        if 'provision_deadline' not in values:
+            values['provision_deadline'] = _provision_deadline(
+                values['provision_state'], values.get('provision_updated_at'),
+                values.get('inspection_started_at'))
 
         # TODO(zhenguo): Support creating node with tags
         if 'tags' in values:
@@ -1044,6 +1140,10 @@ class Connection(api.Connection):
                        or ref.provision_state == states.INSPECTWAIT)
                       and values['provision_state'] == states.INSPECTFAIL):
                     values['inspection_started_at'] = None
+                values['provision_deadline'] = _provision_deadline(
+                    values['provision_state'], values['provision_updated_at'],
+                    values.get('inspection_started_at',
+                               ref.inspection_started_at))
 
             ref.update(values)
 
@@ -1203,6 +1303,71 @@ class Connection(api.Connection):
             if count == 0:
                 raise exception.PortNotFound(port=port_id)
 
+    @wrap_sqlite_retry
+    @oslo_db_api.retry_on_deadlock
+    def reconcile_node_ports(self, node_id, ports_to_create=(),
+                             ports_to_update=None, ports_to_delete=()):
+        ports_to_update = ports_to_update or {}
+        if any('uuid' in values for values in ports_to_update.values()):
+            msg = _("Cannot overwrite UUID for an existing Port.")
+            raise exception.InvalidParameterValue(err=msg)
+
+        try:
+            return self._reconcile_node_ports(node_id, ports_to_create,
+                                              ports_to_update,
+                                              ports_to_delete)
+        except db_exc.DBDuplicateEntry as exc:
+            if not ports_to_create or 'address' not in exc.columns:
+                raise
+            # NOTE: another port with one of the addresses was created after
+            # they were checked, the transaction has been rolled back. Apply
+            # the changes again, creating the ports one by one.
+            LOG.debug('A port with one of the new addresses of node '
+                      '%s has been created concurrently, creating the ports '
+                      'one by one', node_id)
+
+        used = set(self._reconcile_node_ports(node_id, (), ports_to_update,
+                                              ports_to_delete))
+        for values in ports_to_create:
+            try:
+                self.create_port(dict(values))
+            except exception.MACAlreadyExists:
+                used.add(values['address'])
+        return sorted(used)
+
+    def _reconcile_node_ports(self, node_id, ports_to_create,
+                              ports_to_update, ports_to_delete):
+        used = set()
+        with _session_for_write() as session:
+            self._check_node_exists(session, node_id)
+            if ports_to_delete:
+                (session.query(models.Port)
+                 .filter(models.Port.node_id == node_id,
+                         models.Port.id.in_(ports_to_delete))
+                 .delete(synchronize_session=False))
+            if ports_to_update:
+                session.bulk_update_mappings(
+                    models.Port,
+                    [dict(values, id=port_id)
+                     for port_id, values in ports_to_update.items()])
+            if ports_to_create:
+                addresses = [values['address'] for values in ports_to_create]
+                used = set(session.scalars(
+                    sa.select(models.Port.address)
+                    .where(models.Port.address.in_(addresses))))
+                new_ports = []
+                for values in ports_to_create:
+                    if values['address'] in used:
+                        continue
+                    port = models.Port()
+                    port.update(values)
+                    if not port.uuid:
+                        port.uuid = uuidutils.generate_uuid()
+                    new_ports.append(port)
+                session.add_all(new_ports)
+            session.flush()
+        return sorted(used)
+
     def get_portgroup_by_id(self, portgroup_id, project=None):
         try:
             with _session_for_read() as session:
@@ -1593,6 +1758,19 @@ class Connection(api.Connection):
                 d2c[key].add(cdr_row['hostname'])
         return d2c
 
+    def get_active_conductor_topology(self):
+        with _session_for_read() as session:
+            query = (session.query(models.Conductor.hostname,
+                                   models.Conductor.conductor_group,
+                                   models.ConductorHardwareInterfaces
+                                   .hardware_type)
+                     .outerjoin(models.ConductorHardwareInterfaces,
+                                models.ConductorHardwareInterfaces
+                                .conductor_id == models.Conductor.id)
+                     .distinct())
+            query = _filter_active_conductors(query)
+            return [tuple(row) for row in query]
+
     def get_offline_conductors(self, field='hostname'):
         with _session_for_read() as session:
             field = getattr(models.Conductor, field)
@@ -1661,13 +1839,76 @@ class Connection(api.Connection):
     @wrap_sqlite_retry
     @oslo_db_api.retry_on_deadlock
     def touch_node_provisioning(self, node_id):
+        now = timeutils.utcnow()
+        values = {'provision_updated_at': now}
+        # NOTE: inspection times out relative to its start, so only the
+        # deadlines of the other waiting states are extended.
+        extended = {state: now + datetime.timedelta(seconds=timeout)
+                    for state, timeout in _provision_timeouts().items()
+                    if state != states.INSPECTWAIT}
+        if extended:
+            values['provision_deadline'] = sa.case(
+                extended, value=models.Node.provision_state,
+                else_=models.Node.provision_deadline)
         with _session_for_write() as session:
             query = session.query(models.Node)
             query = add_identity_filter(query, node_id)
-            count = query.update({'provision_updated_at': timeutils.utcnow()})
+            count = query.update(values, synchronize_session=False)
             if count == 0:
                 raise exception.NodeNotFound(node=node_id)
 
+    @wrap_sqlite_retry
+    @oslo_db_api.retry_on_deadlock
+    def update_provision_deadlines(self, node_ids):
+        params = []
+        with _session_for_write() as session:
+            for offset in range(0, len(node_ids),
+                                _PROVISION_DEADLINES_CHUNK_SIZE):
+                chunk = node_ids[
+                    offset:offset + _PROVISION_DEADLINES_CHUNK_SIZE]
+                query = (sa.select(models.Node.id,
+                                   models.Node.provision_state,
+                                   models.Node.provision_updated_at,
+                                   models.Node.inspection_started_at,
+                                   models.Node.provision_deadline)
+                         .where(models.Node.id.in_(chunk))
+                         .where(models.Node.provision_state.in_(
+                             list(_PROVISION_WAIT_STATES))))
+                for node_id, state, updated_at, started_at, current in (
+                        session.execute(query)):
+                    deadline = _provision_deadline(state, updated_at,
+                                                   started_at)
+                    if deadline != current:
+                        params.append({'_node_id': node_id,
+                                       '_deadline': deadline})
+            if params:
+                table = models.Node.__table__
+                # NOTE: updated_at is explicitly set to itself to avoid the
+                # ORM onupdate hook, this is not a modification of the node.
+                update = (sa.update(table)
+                          .where(table.c.id == sa.bindparam('_node_id'))
+                          .values(provision_deadline=sa.bindparam('_deadline'),
+                                  updated_at=table.c.updated_at))
+                session.connection().execute(update, params)
+        return len(params)
+
+    @wrap_sqlite_retry
+    @oslo_db_api.retry_on_deadlock
+    def update_agent_heartbeats(self, heartbeats):
+        if not heartbeats:
+            return
+        table = models.Node.__table__
+        # NOTE: updated_at is explicitly set to itself to avoid the ORM
+        # onupdate hook, agent liveness is not a modification of the node.
+        query = (sa.update(table)
+                 .where(table.c.id == sa.bindparam('_node_id'))
+                 .values(agent_last_heartbeat=sa.bindparam('_heartbeat'),
+                         updated_at=table.c.updated_at))
+        params = [{'_node_id': node_id, '_heartbeat': heartbeat}
+                  for node_id, heartbeat in heartbeats.items()]
+        with _session_for_write() as session:
+            session.connection().execute(query, params)
+
     def _check_node_exists(self, session, node_id):
         if not session.query(models.Node).where(
                 models.Node.id == node_id).scalar():
@@ -1733,8 +1974,18 @@ class Connection(api.Connection):
                 node_id=node_id, tag=tag)
             return session.query(q.exists()).scalar()
 
-    def get_node_by_port_addresses(self, addresses):
-        q = _get_node_select()
+    def get_node_by_port_addresses(self, addresses, fields=None):
+        if fields:
+            # NOTE: only load the requested columns, the lookup is often
+            # repeated by ramdisks waiting for their node and does not need
+            # the whole node (or its traits and tags).
+            columns = [getattr(models.Node, f) for f in fields]
+            q = sa.select(models.Node).options(
+                Load(models.Node).load_only(*columns),
+                lazyload(models.Node.traits),
+                lazyload(models.Node.tags))
+        else:
+            q = _get_node_select()
         q = q.distinct().join(models.Port)
         q = q.filter(models.Port.address.in_(addresses))
 
@@ -3087,6 +3338,20 @@ class Connection(api.Connection):
                 raise exception.NodeHistoryAlreadyExists(uuid=values['uuid'])
         return history
 
+    @wrap_sqlite_retry
+    @oslo_db_api.retry_on_deadlock
+    def create_node_history_records(self, records):
+        if not records:
+            return
+        params = []
+        for values in records:
+            values = dict(values)
+            values.setdefault('uuid', uuidutils.generate_uuid())
+            values.setdefault('created_at', timeutils.utcnow())
+            params.append(values)
+        with _session_for_write() as session:
+            session.execute(sa.insert(models.NodeHistory), params)
+
     @oslo_db_api.retry_on_deadlock
     def destroy_node_history_by_uuid(self, history_uuid):
         with _session_for_write() as session:
@@ -3128,63 +3393,46 @@ class Connection(api.Connection):
         return _paginate_query(models.NodeHistory, limit, marker,
                                sort_key, sort_dir, query)
 
-    def query_node_history_records_for_purge(self, conductor_id):
+    def query_node_history_records_for_purge(self, conductor_id, limit=None):
         min_days = CONF.conductor.node_history_minimum_days
         max_num = CONF.conductor.node_history_max_entries
 
+        # First, figure out our nodes.
+        nodes = sa.select(models.Node.id).where(
+            models.Node.conductor_affinity == conductor_id)
+
+        # Number the records of each node starting from the most recent one,
+        # so that everything numbered past the maximum is to be removed.
+        row_number = sa.func.row_number().over(
+            partition_by=models.NodeHistory.node_id,
+            order_by=(models.NodeHistory.created_at.desc(),
+                      models.NodeHistory.id.desc())).label('row_number')
+        ranked = sa.select(
+            models.NodeHistory.node_id,
+            models.NodeHistory.id,
+            models.NodeHistory.created_at,
+            row_number,
+        ).where(models.NodeHistory.node_id.in_(nodes))
+
+        # Filter by minimum days
+        if min_days > 0:
+            before = datetime.datetime.now() - datetime.timedelta(
+                days=min_days)
+            ranked = ranked.where(models.NodeHistory.created_at < before)
+
+        ranked = ranked.subquery()
+        # Order in an ascending order as older is always first.
+        query = sa.select(ranked.c.node_id, ranked.c.id).where(
+            ranked.c.row_number > max_num
+        ).order_by(ranked.c.node_id, ranked.c.created_at, ranked.c.id)
+        if limit is not None:
+            query = query.limit(limit)
+
+        result_set = {}
         with _session_for_read() as session:
-            # First, figure out our nodes.
-            nodes = session.query(
-                models.Node.id,
-            ).filter(
-                models.Node.conductor_affinity == conductor_id
-            )
-
-            # Build our query to get the node_id and record id.
-            query = session.query(
-                models.NodeHistory.node_id,
-                models.NodeHistory.id,
-            )
-
-            # Filter by the nodes
-            query = query.filter(
-                models.NodeHistory.node_id.in_(nodes)
-            ).order_by(
-                # Order in an ascending order as older is always first.
-                models.NodeHistory.created_at.asc()
-            )
-
-            # Filter by minimum days
-            if min_days > 0:
-                before = datetime.datetime.now() - datetime.timedelta(
-                    days=min_days)
-                query = query.filter(
-                    models.NodeHistory.created_at < before
-                )
-
-            # Build our result set
-            result_set = {}
-            for entry in query.all():
-                if entry[0] not in result_set:
-                    result_set[entry[0]] = []
-                result_set[entry[0]].append(entry[1])
-
-            final_set = {}
-            # Generate our final set of entries which should be removed
-            # by accounting for the number of permitted entries.
-            for entry in result_set:
-                final_set[entry] = []
-                set_len = len(result_set[entry])
-                # Any count <= the maximum number is okay
-                if set_len > max_num:
-                    # figure out how many entries need to be removed
-                    num_to_remove = set_len - max_num
-                    for i in range(0, num_to_remove):
-                        final_set[entry].append(result_set[entry][i])
-                        # remove the entries at the end of the list
-                        # which will be the more recent items as we
-                        # ordered ascending originally.
-            return final_set
+            for node_id, history_id in session.execute(query):
+                result_set.setdefault(node_id, []).append(history_id)
+        return result_set
 
     @wrap_sqlite_retry
     def bulk_delete_node_history_records(self, entries):
@@ -3493,6 +3741,15 @@ class Connection(api.Connection):
         return _paginate_query(models.InspectionRule, limit, marker,
                                sort_key, sort_dir, query)
 
+    def get_inspection_rules_revision(self):
+        query = sa.select(
+            sa.func.count(models.InspectionRule.id),
+            sa.func.max(models.InspectionRule.id),
+            sa.func.max(models.InspectionRule.created_at),
+            sa.func.max(models.InspectionRule.updated_at))
+        with _session_for_read() as session:
+            return tuple(session.execute(query).one())
+
     def destroy_inspection_rule(self, inspection_rule_id):
         with _session_for_write() as session:
             count = session.query(models.InspectionRule).filter_by(
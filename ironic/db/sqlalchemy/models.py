@@ -179,6 +179,7 @@ class NodeBase(Base):
         Index('resource_class_idx', 'resource_class'),
         Index('shard_idx', 'shard'),
         Index('parent_node_idx', 'parent_node'),
+        Index('provision_deadline_idx', 'provision_deadline'),
         table_args())
     id = Column(Integer, primary_key=True)
     uuid = Column(String(36))
@@ -265,6 +266,14 @@ class NodeBase(Base):
     disable_power_off = Column(Boolean, nullable=True, default=False,
                                server_default=false())
     health = Column(String(32), nullable=True)
+    # NOTE: agent liveness is tracked outside of driver_internal_info so
+    # that heartbeats do not rewrite the whole JSON blob. It is merged back
+    # into driver_internal_info by the Node object when loaded.
+    agent_last_heartbeat = Column(DateTime, nullable=True)
+    # NOTE: the time at which a node waiting for a callback (e.g. in
+    # deploy wait) times out, maintained by the database API so that all
+    # timed out nodes can be found with one indexed range scan.
+    provision_deadline = Column(DateTime, nullable=True)
 
 
 class Node(NodeBase):
@@ -658,6 +658,29 @@ class HeartbeatMixin(object):
                        'state': task.node.provision_state})
             return
 
+        node = task.node
+        agent_info = {'agent_url': callback_url,
+                      'agent_version': agent_version}
+        if agent_verify_ca:
+            agent_info['agent_verify_ca'] = agent_verify_ca
+        if agent_status:
+            agent_info['agent_status'] = agent_status
+        if agent_status_message:
+            agent_info['agent_status_message'] = agent_status_message
+        agent_info_changed = any(
+            node.driver_internal_info.get(key) != value
+            for key, value in agent_info.items())
+        record_only = node.provision_state in _HEARTBEAT_RECORD_ONLY
+
+        # NOTE: a heartbeat that only proves the agent is alive does not
+        # need an exclusive lock nor a rewrite of driver_internal_info, its
+        # time is written to the database in batches.
+        if record_only and not agent_info_changed:
+            manager_utils.record_agent_heartbeat(node)
+            LOG.debug('Heartbeat from %(node)s recorded to identify the '
+                      'node as on-line.', {'node': node.uuid})
+            return
+
         try:
             task.upgrade_lock(retry=False)
         except exception.NodeLocked:
@@ -673,20 +696,16 @@ class HeartbeatMixin(object):
         node = task.node
         LOG.debug('Heartbeat from node %s in state %s (target state %s)',
                   node.uuid, node.provision_state, node.target_provision_state)
-        node.set_driver_internal_info('agent_url', callback_url)
-        node.set_driver_internal_info('agent_version', agent_version)
-        # Record the last heartbeat event time
-        node.timestamp_driver_internal_info('agent_last_heartbeat')
-        if agent_verify_ca:
-            node.set_driver_internal_info('agent_verify_ca', agent_verify_ca)
-        if agent_status:
-            node.set_driver_internal_info('agent_status', agent_status)
-        if agent_status_message:
-            node.set_driver_internal_info('agent_status_message',
-                                          agent_status_message)
-        node.save()
+        if agent_info_changed:
+            for key, value in agent_info.items():
+                node.set_driver_internal_info(key, value)
+            # Record the last heartbeat event time
+            node.timestamp_driver_internal_info('agent_last_heartbeat')
+            node.save()
+        else:
+            manager_utils.record_agent_heartbeat(node)
 
-        if node.provision_state in _HEARTBEAT_RECORD_ONLY:
+        if record_only:
             # We shouldn't take any additional action. The agent will
             # silently continue to heartbeat to ironic until user initiated
             # state change occurs causing it to match a state below.
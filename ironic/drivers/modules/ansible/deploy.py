@@ -42,6 +42,7 @@ from ironic.conductor import utils as manager_utils
 from ironic.conf import CONF
 from ironic.drivers import base
 from ironic.drivers.modules import agent_base
+from ironic.drivers.modules.ansible import executor
 from ironic.drivers.modules import deploy_utils
 
 
@@ -129,43 +130,65 @@ def _prepare_extra_vars(host_list, variables=None):
 
 
 def _run_playbook(node, name, extra_vars, key, tags=None, notags=None):
-    """Execute ansible-playbook."""
+    """Execute ansible-playbook.
+
+    When ``[ansible]batch_window`` is set, the run is combined with runs of
+    the same playbook with the same arguments for other nodes.
+    """
     root = _get_playbooks_path(node)
     playbook = os.path.join(root, name)
     inventory = os.path.join(root, 'inventory')
-    ironic_vars = {'ironic': extra_vars}
     python_interpreter = _get_python_interpreter(node)
-    if python_interpreter:
-        ironic_vars['ansible_python_interpreter'] = python_interpreter
-    args = [CONF.ansible.ansible_playbook_script, playbook,
-            '-i', inventory,
-            '-e', json.dumps(ironic_vars),
-            ]
-
-    if CONF.ansible.config_file_path:
-        env = ['env', 'ANSIBLE_CONFIG=%s' % CONF.ansible.config_file_path]
-        args = env + args
-
-    if tags:
-        args.append('--tags=%s' % ','.join(tags))
-
-    if notags:
-        args.append('--skip-tags=%s' % ','.join(notags))
-
-    if key:
-        args.append('--private-key=%s' % key)
-
-    verbosity = CONF.ansible.verbosity
-    if verbosity is None and CONF.debug:
-        verbosity = 4
-    if verbosity:
-        args.append('-' + 'v' * verbosity)
-
-    if CONF.ansible.ansible_extra_args:
-        args.extend(shlex.split(CONF.ansible.ansible_extra_args))
+    batched = bool(CONF.ansible.batch_window)
+
+    def execute(extra_vars):
+        ironic_vars = {'ironic': extra_vars}
+        if python_interpreter:
+            ironic_vars['ansible_python_interpreter'] = python_interpreter
+        args = [CONF.ansible.ansible_playbook_script, playbook,
+                '-i', inventory,
+                '-e', json.dumps(ironic_vars),
+                ]
+
+        env = []
+        if CONF.ansible.config_file_path:
+            env.append('ANSIBLE_CONFIG=%s' % CONF.ansible.config_file_path)
+        env.extend('%s=%s' % item for item in
+                   sorted(executor.environment(batched=batched).items()))
+        if env:
+            args = ['env'] + env + args
+
+        if tags:
+            args.append('--tags=%s' % ','.join(tags))
+
+        if notags:
+            args.append('--skip-tags=%s' % ','.join(notags))
+
+        if key:
+            args.append('--private-key=%s' % key)
+
+        verbosity = CONF.ansible.verbosity
+        if verbosity is None and CONF.debug:
+            verbosity = 4
+        if verbosity:
+            args.append('-' + 'v' * verbosity)
+
+        if CONF.ansible.ansible_extra_args:
+            args.extend(shlex.split(CONF.ansible.ansible_extra_args))
+
+        return utils.execute(*args)
+
+    if batched:
+        variables = {k: v for k, v in extra_vars.items() if k != 'nodes'}
+        batch_key = (playbook, inventory, key, tuple(tags or ()),
+                     tuple(notags or ()), python_interpreter,
+                     json.dumps(variables, sort_keys=True))
+        return executor.run(batch_key, extra_vars.get('nodes', []),
+                            lambda nodes: execute(dict(variables,
+                                                       nodes=nodes)))
 
     try:
-        out, err = utils.execute(*args)
+        out, err = execute(extra_vars)
         return out, err
     except processutils.ProcessExecutionError as e:
         raise exception.InstanceDeployFailure(reason=e)
@@ -0,0 +1,178 @@
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Batching of ansible-playbook runs for several nodes
+
+Every ansible-playbook run pays for starting Ansible, setting up SSH
+connections and gathering facts. When ``[ansible]batch_window`` is set, runs
+of the same playbook with the same arguments that start within the window
+are combined into a single run with all their nodes in the inventory, and
+the per-host results are mapped back to each node.
+"""
+
+import json
+import os
+import threading
+
+from oslo_concurrency import processutils
+from oslo_log import log
+
+from ironic.common import exception
+from ironic.common.i18n import _
+from ironic.conf import CONF
+
+
+LOG = log.getLogger(__name__)
+
+# Batches still accepting nodes, by batch key
+_BATCHES = {}
+_BATCHES_LOCK = threading.Lock()
+
+
+class _Batch(object):
+    """Nodes handled by a single ansible-playbook run."""
+
+    def __init__(self):
+        self.nodes = []
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.output = None
+        self.failures = {}
+
+
+def _fact_cache_dir():
+    return os.path.join(CONF.tempdir, 'ironic-ansible-facts')
+
+
+def environment(batched=False):
+    """Get the environment variables for running ansible-playbook.
+
+    :param batched: Whether the run is for a batch of nodes.
+    :returns: a dictionary of environment variables.
+    """
+    env = {}
+    if batched:
+        # The results for each host are read from the JSON output
+        env['ANSIBLE_STDOUT_CALLBACK'] = 'json'
+    if CONF.ansible.control_persist:
+        env['ANSIBLE_SSH_ARGS'] = (
+            '-C -o ControlMaster=auto -o ControlPersist=%ds'
+            % CONF.ansible.control_persist)
+    if CONF.ansible.fact_cache_timeout:
+        env.update({
+            'ANSIBLE_GATHERING': 'smart',
+            'ANSIBLE_CACHE_PLUGIN': 'jsonfile',
+            'ANSIBLE_CACHE_PLUGIN_CONNECTION': _fact_cache_dir(),
+            'ANSIBLE_CACHE_PLUGIN_TIMEOUT':
+                str(CONF.ansible.fact_cache_timeout),
+        })
+    return env
+
+
+def _host_failures(output, names):
+    """Find the nodes that failed in the JSON output of ansible-playbook.
+
+    :param output: standard output of ansible-playbook using the JSON
+        callback.
+    :param names: names of the nodes in the inventory.
+    :returns: a dictionary mapping the names of the failed nodes to error
+        messages, or None if the output cannot be parsed.
+    """
+    try:
+        result = json.loads(output)
+        stats = result['stats']
+    except (TypeError, ValueError, KeyError):
+        return None
+
+    messages = {}
+    for play in result.get('plays', ()):
+        for task in play.get('tasks', ()):
+            task_name = task.get('task', {}).get('name')
+            for host, host_result in task.get('hosts', {}).items():
+                if (host_result.get('failed')
+                        or host_result.get('unreachable')):
+                    messages[host] = _('Task "%(task)s" failed: %(msg)s') % {
+                        'task': task_name, 'msg': host_result.get('msg')}
+
+    failures = {}
+    for name in names:
+        host_stats = stats.get(name)
+        if (not host_stats or host_stats.get('failures')
+                or host_stats.get('unreachable')):
+            failures[name] = messages.get(
+                name, _('Ansible did not complete the playbook on the node'))
+    return failures
+
+
+def _execute(batch, execute):
+    names = [node['name'] for node in batch.nodes]
+    LOG.debug('Running ansible-playbook for nodes %s', ', '.join(names))
+    try:
+        try:
+            batch.output = execute(batch.nodes)
+        except processutils.ProcessExecutionError as e:
+            batch.output = (e.stdout, e.stderr)
+            batch.failures = (_host_failures(e.stdout, names)
+                              or dict.fromkeys(names, str(e)))
+    except Exception as e:
+        LOG.exception('Unexpected error running ansible-playbook for '
+                      'nodes %s', ', '.join(names))
+        batch.failures = dict.fromkeys(names, str(e))
+    finally:
+        batch.done.set()
+
+
+def run(key, nodes, execute):
+    """Run a playbook for nodes together with other nodes.
+
+    The first caller for a key waits for ``[ansible]batch_window`` seconds,
+    or until ``[ansible]batch_max_nodes`` nodes have joined, and then runs
+    the playbook for all nodes of the batch. The other callers wait for
+    this run to finish.
+
+    :param key: a hashable identifying the playbook and all of its
+        arguments except for the nodes.
+    :param nodes: a list of node dictionaries, as in the ``nodes`` variable
+        of the playbooks.
+    :param execute: a callable running the playbook for a list of node
+        dictionaries and returning a tuple (stdout, stderr), or raising
+        ProcessExecutionError.
+    :raises: InstanceDeployFailure if the playbook failed for any of the
+        nodes.
+    :returns: a tuple (stdout, stderr) of the run.
+    """
+    with _BATCHES_LOCK:
+        batch = _BATCHES.get(key)
+        leader = batch is None
+        if leader:
+            batch = _BATCHES[key] = _Batch()
+        batch.nodes.extend(nodes)
+        if len(batch.nodes) >= CONF.ansible.batch_max_nodes:
+            del _BATCHES[key]
+            batch.full.set()
+
+    if leader:
+        batch.full.wait(CONF.ansible.batch_window)
+        with _BATCHES_LOCK:
+            if _BATCHES.get(key) is batch:
+                del _BATCHES[key]
+        _execute(batch, execute)
+    else:
+        batch.done.wait()
+
+    for node in nodes:
+        failure = batch.failures.get(node['name'])
+        if failure is not None:
+            raise exception.InstanceDeployFailure(reason=failure)
+    return batch.output
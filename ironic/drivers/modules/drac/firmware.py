@@ -20,7 +20,7 @@ interface when running on iDRAC hardware.
 
 from oslo_log import log as logging
 
-from ironic.drivers.modules.redfish import utils as redfish_utils
+from ironic.drivers.modules.drac import utils as drac_utils
 
 LOG = logging.getLogger(__name__)
 
@@ -28,10 +28,10 @@ LOG = logging.getLogger(__name__)
 def check_scheduled_idrac_job(task, current_update):
     """Check Dell iDRAC for a scheduled Lifecycle Controller job.
 
-    Queries the Dell OEM job collection to check whether a scheduled
-    (unfinished) LC job matching the task monitor JID exists.  This
-    distinguishes a successfully staged firmware update from a failed
-    download where no job was created.
+    Looks up the job matching the task monitor JID in the iDRAC job queue
+    to check whether it is scheduled (unfinished). This distinguishes a
+    successfully staged firmware update from a failed download where no
+    job was created.
 
     :param task: a TaskManager instance
     :param current_update: the current firmware update being processed
@@ -40,56 +40,28 @@ def check_scheduled_idrac_job(task, current_update):
         available
     """
     node = task.node
-    task_monitor_uri = current_update.get('task_monitor', '')
-    jid = (task_monitor_uri.rsplit('/', 1)[-1]
-           if task_monitor_uri else '')
+    jid = drac_utils.job_id_from_task_monitor(
+        current_update.get('task_monitor', ''))
 
     if not jid:
         return None
 
     try:
-        system = redfish_utils.get_system(node)
+        job = drac_utils.get_jobs(task, [jid]).get(jid)
     except Exception as e:
-        LOG.warning('Cannot get system for Dell OEM job check on '
-                    'node %(node)s: %(error)s. Falling back to '
-                    'assuming firmware staging succeeded.',
+        LOG.warning('Failed to query Dell iDRAC job queue for node '
+                    '%(node)s: %(error)s. Falling back to assuming '
+                    'firmware staging succeeded.',
                     {'node': node.uuid, 'error': e})
         return None
 
-    if not system.managers:
-        return None
-
-    for manager in system.managers:
-        try:
-            manager_oem = manager.get_oem_extension('Dell')
-        except Exception as e:
-            LOG.warning('Dell OEM extension not found on iDRAC node '
-                        '%(node)s: %(error)s. Falling back to '
-                        'assuming firmware staging succeeded.',
-                        {'node': node.uuid, 'error': e})
-            return None
-
-        try:
-            unfinished = (
-                manager_oem.job_collection.get_unfinished_jobs())
-            if jid in unfinished:
-                LOG.info(
-                    'Dell iDRAC: found scheduled LC job %(jid)s '
-                    'for node %(node)s, firmware staging succeeded.',
-                    {'jid': jid, 'node': node.uuid})
-                return True
-            LOG.warning(
-                'Dell iDRAC: LC job %(jid)s not found among '
+    if job is not None and not job.is_finished:
+        LOG.info('Dell iDRAC: found scheduled LC job %(jid)s '
+                 'for node %(node)s, firmware staging succeeded.',
+                 {'jid': jid, 'node': node.uuid})
+        return True
+    LOG.warning('Dell iDRAC: LC job %(jid)s not found among '
                 'unfinished jobs for node %(node)s. The firmware '
                 'download or staging likely failed.',
                 {'jid': jid, 'node': node.uuid})
-            return False
-        except Exception as e:
-            LOG.warning(
-                'Failed to query Dell iDRAC job collection for '
-                'node %(node)s: %(error)s. Falling back to '
-                'assuming firmware staging succeeded.',
-                {'node': node.uuid, 'error': e})
-            return None
-
-    return None
+    return False
@@ -441,9 +441,10 @@ class DracRedfishRAID(redfish_raid.RedfishRAID):
         purpose='checking async RAID tasks',
         spacing=CONF.drac.query_raid_config_job_status_interval,
         filters={'reserved': False, 'maintenance': False},
-        predicate_extra_fields=['driver_internal_info'],
+        predicate_extra_fields=['driver_internal_info', 'driver_info'],
         predicate=lambda n: (
             n.driver_internal_info.get('raid_task_monitor_uris')
+            and drac_utils.job_check_due(n)
         ),
     )
     def _query_raid_tasks_status(self, task, manager, context):
@@ -451,16 +452,50 @@ class DracRedfishRAID(redfish_raid.RedfishRAID):
         self._check_raid_tasks_status(
             task, task.node.driver_internal_info.get('raid_task_monitor_uris'))
 
+    @staticmethod
+    def _get_raid_jobs(task, task_mon_uris):
+        """Get the iDRAC jobs of RAID tasks from the job queue
+
+        :returns: a dictionary mapping job identifiers to DellJob objects,
+            empty if the job queue cannot be read.
+        """
+        job_ids = [drac_utils.job_id_from_task_monitor(uri)
+                   for uri in task_mon_uris]
+        try:
+            return drac_utils.get_jobs(task, job_ids)
+        except (exception.RedfishError, sushy.exceptions.SushyError) as e:
+            LOG.debug('Cannot read the iDRAC job queue of node %(node)s, '
+                      'checking RAID tasks one by one. Error: %(error)s',
+                      {'node': task.node.uuid, 'error': e})
+            return {}
+
     def _check_raid_tasks_status(self, task, task_mon_uris):
         """Checks RAID tasks for completion
 
+        The tasks are looked up in the iDRAC job queue with a single request,
+        only tasks missing from it are checked through their task monitors.
+        The node is only locked once at least one of the tasks finished.
+
         If at least one of the jobs failed, then all step failed.
         If some tasks are still running, they are checked in next period.
         """
         node = task.node
         completed_task_mon_uris = []
         failed_msgs = []
+        jobs = self._get_raid_jobs(task, task_mon_uris)
         for task_mon_uri in task_mon_uris:
+            job = jobs.get(drac_utils.job_id_from_task_monitor(task_mon_uri))
+            if job is not None:
+                if job.is_finished:
+                    completed_task_mon_uris.append(task_mon_uri)
+                    if job.is_failed:
+                        failed_msgs.append(
+                            (_("Task %(task_mon_uri)s. "
+                               "Message: '%(message)s'.")
+                             % {'task_mon_uri': task_mon_uri,
+                                'message': job.message or ''}))
+                continue
+
             task_mon = redfish_utils.get_task_monitor(node, task_mon_uri)
             if not task_mon.is_processing:
                 raid_task = task_mon.get_task()
@@ -476,6 +511,10 @@ class DracRedfishRAID(redfish_raid.RedfishRAID):
                             % {'task_mon_uri': task_mon_uri,
                                'message': ', '.join(messages)}))
 
+        if not completed_task_mon_uris:
+            # Nothing to update until one of the tasks finishes
+            return
+
         task.upgrade_lock()
         if failed_msgs:
             error_msg = (_("Failed RAID configuration tasks: %(messages)s")
@@ -12,15 +12,29 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import collections
+import threading
+import time
+
 from oslo_log import log
 import sushy
 
 from ironic.common import exception
 from ironic.common.i18n import _
+from ironic.conf import CONF
 from ironic.drivers.modules.redfish import utils as redfish_utils
 
 LOG = log.getLogger(__name__)
 
+# Last known state of the iDRAC job queues, by BMC address, the least
+# recently used first
+_JOB_QUEUES = collections.OrderedDict()
+_JOB_QUEUES_LOCK = threading.Lock()
+
+# For how long (in seconds) a job queue that has been read is reused for
+# other nodes behind the same BMC.
+_JOB_QUEUE_MAX_AGE = 5
+
 
 def execute_oem_manager_method(
         task, process_name, lambda_oem_func):
@@ -109,3 +123,141 @@ def execute_oem_manager_method(
                       'unknown'}))
         LOG.error(error_msg)
         raise exception.RedfishError(error=error_msg)
+
+
+class _JobQueue(object):
+    """Last known state of the job queue of an iDRAC."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.collection = None
+        self.jobs = {}
+        self.fetched_at = None
+        self.progress = {}
+        self.next_check = 0
+        self.used_at = None
+
+
+def _bmc_address(node):
+    return node.driver_info.get('redfish_address') or node.uuid
+
+
+def _max_check_interval():
+    max_interval = CONF.drac.job_status_max_interval
+    if max_interval is None:
+        max_interval = 2 * CONF.drac.query_raid_config_job_status_interval
+    return max_interval
+
+
+def _get_job_queue(node):
+    now = time.monotonic()
+    # NOTE: keep the job queues for longer than the longest interval between
+    # two checks, so that the back off of the jobs still being checked is
+    # not lost.
+    idle_time = 2 * _max_check_interval() + _JOB_QUEUE_MAX_AGE
+    address = _bmc_address(node)
+    with _JOB_QUEUES_LOCK:
+        # Forget the job queues of the BMCs that are no longer checked
+        while _JOB_QUEUES:
+            oldest_address, oldest = next(iter(_JOB_QUEUES.items()))
+            if now - oldest.used_at <= idle_time:
+                break
+            del _JOB_QUEUES[oldest_address]
+
+        queue = _JOB_QUEUES.get(address)
+        if queue is None:
+            queue = _JOB_QUEUES[address] = _JobQueue()
+        else:
+            _JOB_QUEUES.move_to_end(address)
+        queue.used_at = now
+        return queue
+
+
+def _get_job_collection(task):
+    system = redfish_utils.get_system(task.node)
+    if not system.managers:
+        raise exception.RedfishError(
+            error=_("System %(system)s has no managers") %
+            {'system': system.uuid if system.uuid else system.identity})
+    return system.managers[0].get_oem_extension('Dell').job_collection
+
+
+def _update_next_check(queue, job_ids, previous_fetch):
+    """Back off while none of the jobs makes any progress."""
+    progress = {job_id: (job.job_state, job.percent_complete)
+                for job_id, job in queue.jobs.items() if job_id in job_ids}
+    changed = any(queue.progress.get(job_id) != progress.get(job_id)
+                  for job_id in job_ids)
+    queue.progress.update(progress)
+    # Forget the jobs that are no longer in the job queue
+    for job_id in set(queue.progress) - set(queue.jobs):
+        del queue.progress[job_id]
+
+    if changed or previous_fetch is None:
+        interval = 0
+    else:
+        interval = min(2 * (queue.fetched_at - previous_fetch),
+                       _max_check_interval())
+    # Leave some leeway for the periodic task not running exactly on time
+    queue.next_check = queue.fetched_at + 0.9 * interval
+
+
+def get_jobs(task, job_ids):
+    """Get the state of iDRAC jobs of a node from the job queue of its BMC.
+
+    The job queue is read with a single request for all jobs, which is
+    shared by the nodes behind the same BMC for a few seconds. Every read
+    also updates when :func:`job_check_due` considers the jobs due for the
+    next check: while none of the jobs makes any progress, the interval
+    doubles up to ``[drac]job_status_max_interval`` (by default twice the
+    interval of the RAID status periodic task).
+
+    :param task: a TaskManager instance.
+    :param job_ids: identifiers of the jobs to look for.
+    :returns: a dictionary mapping the identifiers of the jobs found in the
+        job queue to DellJob objects.
+    :raises: RedfishError or SushyError if the job queue cannot be read.
+    """
+    queue = _get_job_queue(task.node)
+    with queue.lock:
+        now = time.monotonic()
+        if (queue.fetched_at is None
+                or now - queue.fetched_at > _JOB_QUEUE_MAX_AGE
+                or not set(job_ids).issubset(queue.jobs)):
+            if queue.collection is None:
+                queue.collection = _get_job_collection(task)
+            try:
+                jobs = queue.collection.get_jobs()
+            except Exception:
+                # Look up the job collection again next time, e.g. in case
+                # the iDRAC has been reset
+                queue.collection = None
+                raise
+            queue.jobs = {job.identity: job for job in jobs}
+            previous_fetch, queue.fetched_at = queue.fetched_at, now
+            _update_next_check(queue, job_ids, previous_fetch)
+
+        return {job_id: queue.jobs[job_id] for job_id in job_ids
+                if job_id in queue.jobs}
+
+
+def job_check_due(node):
+    """Check whether the iDRAC jobs of a node are due for a check.
+
+    :param node: a node object or a named tuple with the ``uuid`` and
+        ``driver_info`` fields of the node.
+    :returns: False if the jobs were checked recently and have not made any
+        progress for a while, otherwise True.
+    """
+    with _JOB_QUEUES_LOCK:
+        queue = _JOB_QUEUES.get(_bmc_address(node))
+    return queue is None or time.monotonic() >= queue.next_check
+
+
+def job_id_from_task_monitor(task_monitor_uri):
+    """Get the iDRAC job identifier from a task monitor URI.
+
+    iDRAC task monitors are named after the job they monitor, for example
+    ``/redfish/v1/TaskService/TaskMonitors/JID_123456789012``.
+    """
+    return task_monitor_uri.rsplit('/', 1)[-1] if task_monitor_uri else ''
@@ -17,12 +17,14 @@ import base64
 import collections
 import functools
 import gzip
+import hashlib
 import json
 import os
 import shutil
 import tempfile
 from urllib import parse as urlparse
 
+from oslo_concurrency import lockutils
 from oslo_log import log
 from oslo_utils import uuidutils
 
@@ -540,6 +542,128 @@ def _prepare_iso_image(task, kernel_href, ramdisk_href,
     return image_url
 
 
+SHARED_ISO_PREFIX = 'shared-boot-'
+
+
+def _shared_iso_digest(kernel_href, ramdisk_href, bootloader_href,
+                       boot_mode, kernel_params, inject_files):
+    """Calculate the digest identifying a shared ISO.
+
+    :returns: a hex SHA256 digest of everything the ISO is built from,
+        including the contents of the injected files.
+    """
+    digest = hashlib.sha256()
+    for value in (kernel_href, ramdisk_href, bootloader_href, boot_mode,
+                  kernel_params):
+        digest.update(str(value).encode('utf-8') + b'\0')
+    for source, target in sorted(inject_files.items(),
+                                 key=lambda item: item[1]):
+        if isinstance(source, bytes):
+            content = source
+        else:
+            with open(source, 'rb') as fp:
+                content = fp.read()
+        digest.update(target.encode('utf-8') + b'\0')
+        digest.update(hashlib.sha256(content).digest())
+    return digest.hexdigest()
+
+
+def _prepare_shared_iso_image(task, kernel_href, ramdisk_href,
+                              bootloader_href=None, inject_files=None):
+    """Prepare an ISO that is shared between nodes.
+
+    The ISO only contains the kernel parameters that are not specific to
+    the node, the rest of the parameters has to be passed to the ramdisk
+    separately, e.g. via a virtual USB or floppy image. The ISO is built
+    once per set of inputs and published via the local HTTP server.
+
+    :param task: a TaskManager instance containing the node to act on.
+    :param kernel_href: URL or Glance UUID of the kernel to use
+    :param ramdisk_href: URL or Glance UUID of the ramdisk to use
+    :param bootloader_href: URL or Glance UUID of the EFI bootloader
+         image to use when creating UEFI bootable ISO
+    :param inject_files: Mapping of local source file paths to their location
+        on the final ISO image. Must not contain node-specific files.
+    :returns: bootable ISO HTTP URL or None if a shared ISO cannot be used
+        for this node.
+    :raises: ImageCreationFailed, if creating ISO image failed.
+    """
+    node = task.node
+    img_handler = ImageHandler(node.driver)
+    publisher = img_handler._publisher
+    protocol = node.driver_internal_info.get('vmedia_transport_protocol')
+    if (not isinstance(publisher, image_publisher.LocalPublisher)
+            or (protocol and protocol.upper() in ('NFS', 'CIFS', 'SMB'))):
+        LOG.debug('Cannot use a shared ISO for node %s since images are '
+                  'not published by the local HTTP server', node.uuid)
+        return None
+
+    inject_files = inject_files or {}
+    boot_mode = boot_mode_utils.get_boot_mode(node)
+    kernel_params = driver_utils.get_kernel_append_params(
+        node, default=img_handler.kernel_params)
+    digest = _shared_iso_digest(kernel_href, ramdisk_href, bootloader_href,
+                                boot_mode, kernel_params, inject_files)
+    iso_object_name = '%s%s.iso' % (SHARED_ISO_PREFIX, digest)
+    max_age = CONF.redfish.shared_deploy_iso_ttl * 60
+
+    node_http_url = node.driver_info.get("external_http_url")
+    if node_http_url:
+        publisher.root_url = node_http_url
+
+    # NOTE: nodes booting the same ISO wait for the first one to build it.
+    with lockutils.lock(iso_object_name, do_log=False):
+        image_url = publisher.get_published_url(iso_object_name,
+                                                max_age=max_age)
+        if image_url:
+            LOG.debug('Using shared ISO %(name)s for node %(node)s',
+                      {'name': iso_object_name, 'node': node.uuid})
+            return image_url
+
+        # Only the parameter telling the ramdisk to look for the removable
+        # device with the rest of the configuration.
+        kernel_cmd_line = _prepare_kernel_cmd_line(
+            node, img_handler.kernel_params, False, digest[:32], None,
+            {'boot_method': 'vmedia'})
+
+        LOG.debug("Trying to create shared %(boot_mode)s ISO image "
+                  "%(name)s with kernel %(kernel_href)s, ramdisk "
+                  "%(ramdisk_href)s, bootloader %(bootloader_href)s and "
+                  "kernel cmd line %(kernel_cmd_line)s",
+                  {'name': iso_object_name,
+                   'boot_mode': boot_mode,
+                   'kernel_href': kernel_href,
+                   'ramdisk_href': ramdisk_href,
+                   'bootloader_href': bootloader_href,
+                   'kernel_cmd_line': str(kernel_cmd_line)})
+
+        with tempfile.TemporaryDirectory(dir=CONF.tempdir) as boot_file_dir:
+            boot_iso_tmp_file = os.path.join(boot_file_dir, 'boot.iso')
+            images.create_boot_iso(
+                task.context, boot_iso_tmp_file,
+                kernel_href, ramdisk_href,
+                esp_image_href=bootloader_href,
+                kernel_cmd_line=kernel_cmd_line,
+                boot_mode=boot_mode,
+                inject_files=inject_files,
+                publisher_id=digest[:32])
+            # NOTE: remove the outdated ISO first, so that it is replaced
+            # instead of being overwritten while BMCs may be reading it.
+            publisher.unpublish(iso_object_name)
+            image_url = publisher.publish(boot_iso_tmp_file,
+                                          iso_object_name)
+
+    # NOTE: an ISO may have been handed out right before it became too old
+    # to be reused, give the BMCs enough time to boot from it.
+    publisher.unpublish_stale(SHARED_ISO_PREFIX, 2 * max_age)
+
+    LOG.debug("Created shared ISO %(name)s for node %(node)s, exposed as "
+              "URL %(url)s", {'node': node.uuid, 'name': iso_object_name,
+                              'url': image_url})
+
+    return image_url
+
+
 def _prepare_kernel_cmd_line(node: Node,
                              ih_kernel_params: str,
                              is_ramdisk_boot: bool,
@@ -613,7 +737,7 @@ cafile = /%s
 """ % _TLS_REMOTE_FILE
 
 
-def prepare_deploy_iso(task, params, mode, d_info):
+def prepare_deploy_iso(task, params, mode, d_info, shared=False):
     """Prepare deploy or rescue ISO image
 
     Build bootable ISO out of
@@ -631,6 +755,9 @@ def prepare_deploy_iso(task, params, mode, d_info):
         mapping to be passed to kernel command line.
     :param mode: either 'deploy' or 'rescue'.
     :param d_info: Deployment information of the node
+    :param shared: whether the parameters are also passed to the ramdisk via
+        a removable device, so that an ISO shared with other nodes can be
+        used if possible.
     :returns: bootable ISO HTTP URL.
     :raises: MissingParameterValue, if any of the required parameters are
         missing.
@@ -686,6 +813,14 @@ def prepare_deploy_iso(task, params, mode, d_info):
             inject_files[network_data] = (
                 'openstack/latest/network_data.json'
             )
+            shared = False
+
+    if shared and not iso_href:
+        image_url = _prepare_shared_iso_image(
+            task, kernel_href, ramdisk_href, bootloader_href=bootloader_href,
+            inject_files=inject_files)
+        if image_url:
+            return image_url
 
     return prepare_iso_image(inject_files=inject_files)
 
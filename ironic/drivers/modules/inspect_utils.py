@@ -13,7 +13,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import contextlib
 from http import client as http_client
+import itertools
 import json
 import socket
 import typing
@@ -29,6 +31,7 @@ from ironic.common import states
 from ironic.common import swift
 from ironic.common import utils
 from ironic.conf import CONF
+from ironic.drivers.modules.inspector.hooks import base as hooks_base
 from ironic.drivers.modules import ipmitool
 from ironic import objects
 from ironic.objects import node_inventory
@@ -294,10 +297,9 @@ def _lookup_by_bmc(context, bmc_addresses, mac_addresses, known_node=None):
     # NOTE(dtantsur): the same BMC hostname can be used by several nodes,
     # e.g. in case of Redfish. Find all suitable nodes first.
     nodes_by_bmc = set()
-    for candidate in objects.Node.list(
-            context,
-            filters={'provision_state': states.INSPECTWAIT},
-            fields=['uuid', 'driver_internal_info']):
+    for candidate in objects.Node.list_projections(
+            context, ['uuid', 'driver_internal_info'],
+            filters={'provision_state': states.INSPECTWAIT}):
         # This field has to be populated on inspection start
         for addr in candidate.driver_internal_info.get(
                 LOOKUP_CACHE_FIELD) or ():
@@ -626,7 +628,17 @@ def _run_post_hooks(task, inventory, plugin_data, hooks):
     :param hooks: List of hooks to execute.
     :returns: nothing.
     """
-    for hook in hooks:
-        LOG.debug('Running inspection hook %(hook)s for node %(node)s',
-                  {'hook': hook.name, 'node': task.node.uuid})
-        hook.obj.__call__(task, inventory, plugin_data)
+    # NOTE: consecutive hooks that only access ports through the pending
+    # port changes have their changes written to the database at once. A
+    # failing hook fails the inspection and discards the port changes of the
+    # whole group, the ports are created again on the next inspection.
+    for uses_port_changes, group in itertools.groupby(
+            hooks, key=lambda hook: getattr(hook.obj, 'uses_port_changes',
+                                            False)):
+        with (hooks_base.port_changes(task) if uses_port_changes
+              else contextlib.nullcontext()):
+            for hook in group:
+                LOG.debug('Running inspection hook %(hook)s for node '
+                          '%(node)s', {'hook': hook.name,
+                                       'node': task.node.uuid})
+                hook.obj.__call__(task, inventory, plugin_data)
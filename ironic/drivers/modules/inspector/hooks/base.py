@@ -14,9 +14,16 @@
 """Base code for inspection hooks support."""
 
 import abc
+import contextlib
+import weakref
 
 from oslo_config import cfg
 from oslo_log import log
+from oslo_utils import uuidutils
+
+from ironic.common import exception
+from ironic.common import utils
+from ironic import objects
 
 
 CONF = cfg.CONF
@@ -32,6 +39,13 @@ class InspectionHook(metaclass=abc.ABCMeta):  # pragma: no cover
     The items here should be entry point names, not classes.
     """
 
+    uses_port_changes = False
+    """Whether the hook only accesses ports through :func:`port_changes`.
+
+    The port changes of consecutive hooks with this flag set are written to
+    the database together once all of them have run.
+    """
+
     def preprocess(self, task, inventory, plugin_data):
         """Hook to run before the main inspection data processing.
 
@@ -58,3 +72,115 @@ class InspectionHook(metaclass=abc.ABCMeta):  # pragma: no cover
                             the hook.
         :returns: nothing.
         """
+
+
+class PortChanges(object):
+    """Pending changes to the ports of a node being inspected.
+
+    The ports of the node are loaded once. The changes made to them and the
+    ports created or deleted through this object are written to the database
+    in one transaction by :meth:`apply`.
+    """
+
+    def __init__(self, task):
+        self._task = task
+        self._load()
+
+    def _load(self):
+        self._ports = {
+            port.address: port
+            for port in objects.Port.list_by_node_id(self._task.context,
+                                                     self._task.node.id)}
+        self._created = set()
+        self._deleted = []
+
+    def get(self, address):
+        """Return the port with the given MAC address or None."""
+        return self._ports.get(utils.normalize_mac(address))
+
+    def list(self):
+        """Return all ports of the node."""
+        return list(self._ports.values())
+
+    def create(self, **fields):
+        """Add a new port to the node.
+
+        :param fields: fields of the new port.
+        :raises: MACAlreadyExists if the node already has a port with this
+            address.
+        :returns: the new Port object.
+        """
+        fields.setdefault('uuid', uuidutils.generate_uuid())
+        fields.setdefault('physical_network', None)
+        for name in ('extra', 'local_link_connection', 'internal_info'):
+            fields.setdefault(name, {})
+        port = objects.Port(self._task.context, node_id=self._task.node.id,
+                            **fields)
+        if port.address in self._ports:
+            raise exception.MACAlreadyExists(mac=port.address)
+        self._ports[port.address] = port
+        self._created.add(port.address)
+        return port
+
+    def destroy(self, port):
+        """Delete a port of the node."""
+        del self._ports[port.address]
+        if port.address in self._created:
+            self._created.remove(port.address)
+        else:
+            self._deleted.append(port)
+
+    def apply(self):
+        """Write the pending changes to the database."""
+        create = [port for address, port in self._ports.items()
+                  if address in self._created]
+        update = [port for address, port in self._ports.items()
+                  if address not in self._created and port.obj_what_changed()]
+        if not (create or update or self._deleted):
+            return
+
+        node_uuid = self._task.node.uuid
+        used = objects.Port.reconcile_node_ports(
+            self._task.context, self._task.node.id, create=create,
+            update=update, destroy=self._deleted)
+        for address in used:
+            LOG.info("Port already exists for MAC address %(address)s, not "
+                     "creating it for node %(node)s",
+                     {'address': address, 'node': node_uuid})
+        LOG.debug('Created %(created)d, updated %(updated)d and deleted '
+                  '%(deleted)d ports of node %(node)s',
+                  {'created': len(create) - len(used),
+                   'updated': len(update), 'deleted': len(self._deleted),
+                   'node': node_uuid})
+        # NOTE: reload the ports, the created ones do not have an ID yet.
+        self._task.ports = None
+        self._load()
+
+
+_PORT_CHANGES = weakref.WeakKeyDictionary()
+
+
+@contextlib.contextmanager
+def port_changes(task):
+    """Provide the pending changes to the ports of the node of a task.
+
+    The changes are written to the database when the outermost
+    ``port_changes`` block for the task exits without an exception, so
+    nested blocks, e.g. in consecutive hooks, share the same changes. If
+    the block exits with an exception, all pending changes are discarded,
+    including the ones made before the failure.
+
+    :param task: A TaskManager instance.
+    :returns: a PortChanges object.
+    """
+    changes = _PORT_CHANGES.get(task)
+    if changes is not None:
+        yield changes
+        return
+
+    changes = _PORT_CHANGES[task] = PortChanges(task)
+    try:
+        yield changes
+        changes.apply()
+    finally:
+        del _PORT_CHANGES[task]
@@ -17,10 +17,8 @@ from construct import core
 import netaddr
 from oslo_log import log as logging
 
-from ironic.common import exception
 from ironic.drivers.modules.inspector.hooks import base
 from ironic.drivers.modules.inspector import lldp_tlvs as tlv
-import ironic.objects.port as ironic_port
 
 
 LOG = logging.getLogger(__name__)
@@ -33,6 +31,7 @@ class LocalLinkConnectionHook(base.InspectionHook):
     """Hook to process mandatory LLDP packet fields"""
 
     dependencies = ['validate-interfaces']
+    uses_port_changes = True
 
     def _get_local_link_patch(self, lldp_data, port, node_uuid):
         local_link_connection = {}
@@ -50,7 +49,7 @@ class LocalLinkConnectionHook(base.InspectionHook):
             item = value = None
             if tlv_type == tlv.LLDP_TLV_PORT_ID:
                 try:
-                    port_id = tlv.PortId.parse(data)
+                    port_id = tlv.parse(tlv.PortId, data)
                 except (core.MappingError, netaddr.AddrFormatError) as e:
                     LOG.warning('TLV parse error for Port ID for node %s: %s',
                                 node_uuid, e)
@@ -60,7 +59,7 @@ class LocalLinkConnectionHook(base.InspectionHook):
                 value = port_id.value.value if port_id.value else None
             elif tlv_type == tlv.LLDP_TLV_CHASSIS_ID:
                 try:
-                    chassis_id = tlv.ChassisId.parse(data)
+                    chassis_id = tlv.parse(tlv.ChassisId, data)
                 except (core.MappingError, netaddr.AddrFormatError) as e:
                     LOG.warning('TLV parse error for Chassis ID for node %s: '
                                 '%s', node_uuid, e)
@@ -72,7 +71,7 @@ class LocalLinkConnectionHook(base.InspectionHook):
                     value = chassis_id.value.value
             elif tlv_type == tlv.LLDP_TLV_SYS_NAME:
                 try:
-                    switch_info = tlv.SysName.parse(data)
+                    switch_info = tlv.parse(tlv.SysName, data)
                 except (core.MappingError, netaddr.AddrFormatError) as e:
                     LOG.warning('TLV parse error for Sys Name for node %s: '
                                 '%s', node_uuid, e)
@@ -87,17 +86,9 @@ class LocalLinkConnectionHook(base.InspectionHook):
                 continue
             local_link_connection[item] = value
 
-        try:
-            LOG.debug('Updating port %s for node %s', port.address, node_uuid)
-            for item in local_link_connection:
-                port.set_local_link_connection(item,
-                                               local_link_connection[item])
-            port.save()
-        except exception.IronicException as e:
-            LOG.warning('Failed to update port %(uuid)s for node %(node)s. '
-                        'Error: %(error)s', {'uuid': port.id,
-                                             'node': node_uuid,
-                                             'error': e})
+        LOG.debug('Updating port %s for node %s', port.address, node_uuid)
+        for item in local_link_connection:
+            port.set_local_link_connection(item, local_link_connection[item])
 
     def __call__(self, task, inventory, plugin_data):
         """Process LLDP data and patch Ironic port local link connection.
@@ -110,27 +101,27 @@ class LocalLinkConnectionHook(base.InspectionHook):
         """
         lldp_raw = plugin_data.get('lldp_raw') or {}
 
-        for iface in inventory['interfaces']:
-            # The all_interfaces field in plugin_data is provided by the
-            # validate-interfaces hook, so it is a dependency for this hook (?)
-            if iface['name'] not in plugin_data.get('all_interfaces'):
-                continue
-
-            mac_address = iface['mac_address']
-            try:
-                port = ironic_port.Port.get_by_address(task.context,
-                                                       mac_address)
-            except exception.PortNotFound:
-                LOG.debug('Skipping LLDP processing for interface %s of node '
-                          '%s: matching port not found in Ironic.',
-                          mac_address, task.node.uuid)
-                continue
-
-            lldp_data = lldp_raw.get(iface['name']) or iface.get('lldp')
-            if lldp_data is None:
-                LOG.warning('No LLDP data found for interface %s of node %s',
-                            mac_address, task.node.uuid)
-                continue
-
-            # Parse raw lldp data
-            self._get_local_link_patch(lldp_data, port, task.node.uuid)
+        with base.port_changes(task) as ports:
+            for iface in inventory['interfaces']:
+                # The all_interfaces field in plugin_data is provided by the
+                # validate-interfaces hook, so it is a dependency for this
+                # hook (?)
+                if iface['name'] not in plugin_data.get('all_interfaces'):
+                    continue
+
+                mac_address = iface['mac_address']
+                port = ports.get(mac_address)
+                if port is None:
+                    LOG.debug('Skipping LLDP processing for interface %s of '
+                              'node %s: matching port not found in Ironic.',
+                              mac_address, task.node.uuid)
+                    continue
+
+                lldp_data = lldp_raw.get(iface['name']) or iface.get('lldp')
+                if lldp_data is None:
+                    LOG.warning('No LLDP data found for interface %s of node '
+                                '%s', mac_address, task.node.uuid)
+                    continue
+
+                # Parse raw lldp data
+                self._get_local_link_patch(lldp_data, port, task.node.uuid)
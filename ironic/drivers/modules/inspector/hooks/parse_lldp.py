@@ -14,6 +14,10 @@
 """LLDP Processing Hook for basic TLVs"""
 
 import binascii
+import collections
+import copy
+import hashlib
+import threading
 
 from oslo_log import log as logging
 
@@ -23,6 +27,19 @@ from ironic.drivers.modules.inspector import lldp_parsers
 
 LOG = logging.getLogger(__name__)
 
+# Parsed TLVs by the digest of the raw TLVs. Switches send the same LLDPDUs
+# every time a node is inspected, so this saves parsing them again.
+_PARSED_TLVS = collections.OrderedDict()
+_PARSED_TLVS_LOCK = threading.Lock()
+_PARSED_TLVS_MAX = 4096
+
+
+def _tlvs_digest(tlvs):
+    digest = hashlib.sha256()
+    for tlv_type, tlv_value in tlvs:
+        digest.update(('%s:%s;' % (tlv_type, tlv_value)).encode())
+    return digest.digest()
+
 
 class ParseLLDPHook(base.InspectionHook):
     """Process LLDP packet fields and store them in plugin_data['parsed_lldp']
@@ -41,18 +58,32 @@ class ParseLLDPHook(base.InspectionHook):
         :returns: Dictionary of name/value pairs. The LLDP user-friendly
                   names, e.g. "switch_port_id" are the keys.
         """
+        key = _tlvs_digest(tlvs)
+        with _PARSED_TLVS_LOCK:
+            cached = _PARSED_TLVS.get(key)
+            if cached is not None:
+                _PARSED_TLVS.move_to_end(key)
+        if cached is not None:
+            LOG.debug("Using previously parsed LLDP TLVs. Node: %s",
+                      node_uuid)
+            return copy.deepcopy(cached)
+
         # Generate name/value pairs for each TLV supported by this plugin.
         parser = lldp_parsers.LLDPBasicMgmtParser(node_uuid)
+        # Only cache the result if all TLVs could be handled, so that
+        # problems with the data are reported for every node.
+        cacheable = True
 
         for tlv_type, tlv_value in tlvs:
             try:
-                data = bytearray(binascii.a2b_hex(tlv_value))
+                data = memoryview(binascii.a2b_hex(tlv_value))
             except TypeError as e:
                 LOG.warning(
                     'TLV value for TLV type %(tlv_type)d is not in correct '
                     'format, value must be in hexadecimal: %(msg)s. Node: '
                     '%(node)s', {'tlv_type': tlv_type, 'msg': e,
                                  'node': node_uuid})
+                cacheable = False
                 continue
 
             try:
@@ -62,6 +93,7 @@ class ParseLLDPHook(base.InspectionHook):
                             "can't be decoded: %(exc)s",
                             {'tlv_type': tlv_type, 'exc': e,
                              'node': node_uuid})
+                cacheable = False
                 continue
 
             if parsed_tlv:
@@ -69,6 +101,13 @@ class ParseLLDPHook(base.InspectionHook):
             else:
                 LOG.debug("LLDP TLV type %d not handled. Node: %s", tlv_type,
                           node_uuid)
+                cacheable = False
+
+        if cacheable:
+            with _PARSED_TLVS_LOCK:
+                _PARSED_TLVS[key] = copy.deepcopy(parser.nv_dict)
+                while len(_PARSED_TLVS) > _PARSED_TLVS_MAX:
+                    _PARSED_TLVS.popitem(last=False)
         return parser.nv_dict
 
     def __call__(self, task, inventory, plugin_data):
@@ -19,7 +19,6 @@ from oslo_config import cfg
 from oslo_log import log as logging
 
 from ironic.drivers.modules.inspector.hooks import base
-from ironic import objects
 
 CONF = cfg.CONF
 LOG = logging.getLogger(__name__)
@@ -33,6 +32,7 @@ class PhysicalNetworkHook(base.InspectionHook):
     """
 
     dependencies = ['validate-interfaces']
+    uses_port_changes = True
 
     def get_physical_network(self, interface):
         """Return a physical network to apply to an ironic port.
@@ -67,33 +67,29 @@ class PhysicalNetworkHook(base.InspectionHook):
     def __call__(self, task, inventory, plugin_data):
         """Process inspection data and patch the port's physical network."""
 
-        node_ports = objects.Port.list_by_node_id(task.context, task.node.id)
-        ports_dict = {p.address: p for p in node_ports}
-
-        for interface in inventory['interfaces']:
-            if interface['name'] not in plugin_data['all_interfaces']:
-                continue
-
-            mac_address = interface['mac_address']
-            port = ports_dict.get(mac_address)
-            if not port:
-                LOG.debug("Skipping physical network processing for interface "
-                          "%s on node %s - matching port not found in Ironic.",
-                          mac_address, task.node.uuid)
-                continue
-
-            # Determine the physical network for this port, using the interface
-            # IPs and CIDR map configuration.
-            phys_network = self.get_physical_network(interface)
-            if phys_network is None:
-                LOG.debug("Skipping physical network processing for interface "
-                          "%s on node %s - no physical network mapping.",
-                          mac_address,
-                          task.node.uuid)
-                continue
-
-            if getattr(port, 'physical_network', '') != phys_network:
-                port.physical_network = phys_network
-                port.save()
-                LOG.debug('Updated physical_network of port %s to %s',
-                          port.uuid, port.physical_network)
+        with base.port_changes(task) as ports:
+            for interface in inventory['interfaces']:
+                if interface['name'] not in plugin_data['all_interfaces']:
+                    continue
+
+                mac_address = interface['mac_address']
+                port = ports.get(mac_address)
+                if not port:
+                    LOG.debug("Skipping physical network processing for "
+                              "interface %s on node %s - matching port not "
+                              "found in Ironic.", mac_address, task.node.uuid)
+                    continue
+
+                # Determine the physical network for this port, using the
+                # interface IPs and CIDR map configuration.
+                phys_network = self.get_physical_network(interface)
+                if phys_network is None:
+                    LOG.debug("Skipping physical network processing for "
+                              "interface %s on node %s - no physical network "
+                              "mapping.", mac_address, task.node.uuid)
+                    continue
+
+                if getattr(port, 'physical_network', '') != phys_network:
+                    port.physical_network = phys_network
+                    LOG.debug('Updated physical_network of port %s to %s',
+                              port.uuid, port.physical_network)
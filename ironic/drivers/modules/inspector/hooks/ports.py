@@ -17,7 +17,6 @@ from ironic.common import exception
 from ironic.common import utils as common_utils
 from ironic.conf import CONF
 from ironic.drivers.modules.inspector.hooks import base
-from ironic import objects
 
 LOG = logging.getLogger(__name__)
 
@@ -26,34 +25,37 @@ class PortsHook(base.InspectionHook):
     """Hook to create ironic ports."""
 
     dependencies = ['validate-interfaces']
+    uses_port_changes = True
 
     def __call__(self, task, inventory, plugin_data):
-        if CONF.inspector.add_ports != 'disabled':
-            add_ports(task, plugin_data['valid_interfaces'])
+        with base.port_changes(task):
+            if CONF.inspector.add_ports != 'disabled':
+                add_ports(task, plugin_data['valid_interfaces'])
 
-        update_ports(task, plugin_data['all_interfaces'], plugin_data['macs'])
+            update_ports(task, plugin_data['all_interfaces'],
+                         plugin_data['macs'])
 
 
 def add_ports(task, interfaces):
     """Add ports for all previously validated interfaces."""
-    for iface in interfaces.values():
-        mac = iface['mac_address']
-        extra = {}
-        if iface.get('client_id'):
-            extra['client-id'] = iface['client_id']
-        port_dict = {'address': mac, 'node_id': task.node.id,
-                     'pxe_enabled': iface['pxe_enabled'], 'extra': extra}
-        port = objects.Port(task.context, **port_dict)
-        try:
-            port.create()
-            LOG.info("Port created for MAC address %(address)s for "
-                     "node %(node)s%(pxe)s",
-                     {'address': mac, 'node': task.node.uuid,
-                      'pxe': ' (PXE booting)' if iface['pxe_enabled'] else ''})
-        except exception.MACAlreadyExists:
-            LOG.info("Port already exists for MAC address %(address)s "
-                     "for node %(node)s",
-                     {'address': mac, 'node': task.node.uuid})
+    with base.port_changes(task) as ports:
+        for iface in interfaces.values():
+            mac = iface['mac_address']
+            extra = {}
+            if iface.get('client_id'):
+                extra['client-id'] = iface['client_id']
+            try:
+                ports.create(address=mac, pxe_enabled=iface['pxe_enabled'],
+                             extra=extra)
+                LOG.info("Port created for MAC address %(address)s for "
+                         "node %(node)s%(pxe)s",
+                         {'address': mac, 'node': task.node.uuid,
+                          'pxe': (' (PXE booting)' if iface['pxe_enabled']
+                                  else '')})
+            except exception.MACAlreadyExists:
+                LOG.info("Port already exists for MAC address %(address)s "
+                         "for node %(node)s",
+                         {'address': mac, 'node': task.node.uuid})
 
 
 def update_ports(task, all_interfaces, valid_macs):
@@ -82,34 +84,34 @@ def update_ports(task, all_interfaces, valid_macs):
             'client_id')
         for iface in all_interfaces.values()}
 
-    for port in objects.Port.list_by_node_id(task.context, task.node.id):
-        if expected_macs and port.address not in expected_macs:
-            expected_str = ', '.join(sorted(expected_macs))
-            LOG.info("Deleting port %(port)s of node %(node)s as its MAC "
-                     "%(mac)s is not in the expected MAC list [%(expected)s]",
-                     {'port': port.uuid, 'mac': port.address,
-                      'node': task.node.uuid, 'expected': expected_str})
-            port.destroy()
-            continue
-
-        if CONF.inspector.update_pxe_enabled:
-            pxe_enabled = port.address in pxe_macs
-            if pxe_enabled != port.pxe_enabled:
-                LOG.debug("Changing pxe_enabled=%(val)s on port %(port)s "
-                          "of node %(node)s to match the inventory",
-                          {'port': port.address, 'val': pxe_enabled,
-                           'node': task.node.uuid})
-                port.pxe_enabled = pxe_enabled
-                port.save()
-
-        new_client_id = client_ids.get(port.address)
-        current_client_id = port.extra.get('client-id')
-        # some sources can't find client_id, so ignore if not found
-        if new_client_id and new_client_id != current_client_id:
-            LOG.debug("Changing client-id from %(current)s to "
-                      "%(new)s on port %(port)s of node %(node)s",
-                      {'port': port.address, 'current': current_client_id,
-                       'new': new_client_id, 'node': task.node.uuid})
-            port.extra['client-id'] = new_client_id
-            port._changed_fields.add('extra')
-            port.save()
+    with base.port_changes(task) as ports:
+        for port in ports.list():
+            if expected_macs and port.address not in expected_macs:
+                expected_str = ', '.join(sorted(expected_macs))
+                LOG.info("Deleting port %(port)s of node %(node)s as its MAC "
+                         "%(mac)s is not in the expected MAC list "
+                         "[%(expected)s]",
+                         {'port': port.uuid, 'mac': port.address,
+                          'node': task.node.uuid, 'expected': expected_str})
+                ports.destroy(port)
+                continue
+
+            if CONF.inspector.update_pxe_enabled:
+                pxe_enabled = port.address in pxe_macs
+                if pxe_enabled != port.pxe_enabled:
+                    LOG.debug("Changing pxe_enabled=%(val)s on port %(port)s "
+                              "of node %(node)s to match the inventory",
+                              {'port': port.address, 'val': pxe_enabled,
+                               'node': task.node.uuid})
+                    port.pxe_enabled = pxe_enabled
+
+            new_client_id = client_ids.get(port.address)
+            current_client_id = port.extra.get('client-id')
+            # some sources can't find client_id, so ignore if not found
+            if new_client_id and new_client_id != current_client_id:
+                LOG.debug("Changing client-id from %(current)s to "
+                          "%(new)s on port %(port)s of node %(node)s",
+                          {'port': port.address, 'current': current_client_id,
+                           'new': new_client_id, 'node': task.node.uuid})
+                port.extra['client-id'] = new_client_id
+                port._changed_fields.add('extra')
@@ -74,8 +74,13 @@ class LLDPParser(object):
 
     It is valid to have a function handler of None, this is for TLVs that
     are not mapped to a name/value pair (e.g.LLDP_TLV_TTL).
+
+    Parser maps are built once per class, so the handler functions are
+    stored unbound and called with the parser instance as first argument.
     """
 
+    parser_map = {}
+
     def __init__(self, node_uuid, nv=None):
         """Create LLDPParser
 
@@ -84,7 +89,6 @@ class LLDPParser(object):
         """
         self.nv_dict = nv or {}
         self.node_uuid = node_uuid
-        self.parser_map = {}
 
     def set_value(self, name, value):
         """Set name value pair in dictionary
@@ -154,24 +158,23 @@ class LLDPParser(object):
         # Some constructs require a length validation to ensure that the
         # proper number of bytes have been provided, for example when a
         # BitStruct is used.
-        if check_len and (tlv_parser.sizeof() != len(data)):
+        if check_len and (tlv.sizeof(tlv_parser) != len(data)):
             LOG.warning("Invalid data for %(name)s expected len %(expect)d, "
                         "got %(actual)d. Node: %(node)s",
-                        {'name': name, 'expect': tlv_parser.sizeof(),
+                        {'name': name, 'expect': tlv.sizeof(tlv_parser),
                          'actual': len(data), 'node': self.node_uuid})
             return False
 
-        # Use the construct parser to parse the TLV so that its individual
-        # fields can be accessed
+        # Parse the TLV so that its individual fields can be accessed
         try:
-            struct = tlv_parser.parse(data)
+            struct = tlv.parse(tlv_parser, data)
         except (core.ConstructError, netaddr.AddrFormatError) as e:
             LOG.warning("TLV parse error: %s. Node: %s", e, self.node_uuid)
             return False
 
         # Call functions with parsed structure
         try:
-            func(struct, name, data)
+            func(self, struct, name, data)
         except ValueError as e:
             LOG.warning("TLV value error: %s. Node: %s", e, self.node_uuid)
             return False
@@ -197,34 +200,6 @@ class LLDPBasicMgmtParser(LLDPParser):
     This class will also handle 802.1Q and 802.3 OUI TLVs.
     """
 
-    def __init__(self, nv=None):
-        super(LLDPBasicMgmtParser, self).__init__(nv)
-
-        self.parser_map = {
-            tlv.LLDP_TLV_CHASSIS_ID:
-                (self.add_nested_value, tlv.ChassisId, LLDP_CHASSIS_ID_NM,
-                 False),
-            tlv.LLDP_TLV_PORT_ID:
-                (self.add_nested_value, tlv.PortId, LLDP_PORT_ID_NM, False),
-            tlv.LLDP_TLV_TTL: (None, None, None, False),
-            tlv.LLDP_TLV_PORT_DESCRIPTION:
-                (self.add_single_value, tlv.PortDesc, LLDP_PORT_DESC_NM,
-                 False),
-            tlv.LLDP_TLV_SYS_NAME:
-                (self.add_single_value, tlv.SysName, LLDP_SYS_NAME_NM, False),
-            tlv.LLDP_TLV_SYS_DESCRIPTION:
-                (self.add_single_value, tlv.SysDesc, LLDP_SYS_DESC_NM, False),
-            tlv.LLDP_TLV_SYS_CAPABILITIES:
-                (self.add_capabilities, tlv.SysCapabilities,
-                 LLDP_SWITCH_CAP_NM, True),
-            tlv.LLDP_TLV_MGMT_ADDRESS:
-                (self.add_mgmt_address, tlv.MgmtAddress,
-                 LLDP_MGMT_ADDRESSES_NM, False),
-            tlv.LLDP_TLV_ORG_SPECIFIC:
-                (self.handle_org_specific_tlv, tlv.OrgSpecific, None, False),
-            tlv.LLDP_TLV_END_LLDPPDU: (None, None, None, False)
-        }
-
     def add_mgmt_address(self, struct, name, data):
         """Handle LLDP_TLV_MGMT_ADDRESS
 
@@ -266,51 +241,52 @@ class LLDPBasicMgmtParser(LLDPParser):
         """
         oui = binascii.hexlify(struct.oui).decode()
         subtype = struct.subtype
-        oui_data = data[4:]
-
-        if oui == tlv.LLDP_802dot1_OUI:
-            parser = LLDPdot1Parser(self.node_uuid, self.nv_dict)
-            if parser.parse_tlv(subtype, oui_data):
-                LOG.debug("Handled 802.1 subtype %d", subtype)
-            else:
-                LOG.debug("Subtype %d not found for 802.1", subtype)
-        elif oui == tlv.LLDP_802dot3_OUI:
-            parser = LLDPdot3Parser(self.node_uuid, self.nv_dict)
-            if parser.parse_tlv(subtype, oui_data):
-                LOG.debug("Handled 802.3 subtype %d", subtype)
-            else:
-                LOG.debug("Subtype %d not found for 802.3", subtype)
-        else:
+
+        try:
+            standard, parser_cls = _OUI_PARSERS[oui]
+        except KeyError:
             LOG.warning("Organizationally Unique ID %s not recognized for "
                         "node %s", oui, self.node_uuid)
+            return
+
+        parser = parser_cls(self.node_uuid, self.nv_dict)
+        if parser.parse_tlv(subtype, data[4:]):
+            LOG.debug("Handled %s subtype %d", standard, subtype)
+        else:
+            LOG.debug("Subtype %d not found for %s", subtype, standard)
+
+    parser_map = {
+        tlv.LLDP_TLV_CHASSIS_ID:
+            (LLDPParser.add_nested_value, tlv.ChassisId, LLDP_CHASSIS_ID_NM,
+             False),
+        tlv.LLDP_TLV_PORT_ID:
+            (LLDPParser.add_nested_value, tlv.PortId, LLDP_PORT_ID_NM,
+             False),
+        tlv.LLDP_TLV_TTL: (None, None, None, False),
+        tlv.LLDP_TLV_PORT_DESCRIPTION:
+            (LLDPParser.add_single_value, tlv.PortDesc, LLDP_PORT_DESC_NM,
+             False),
+        tlv.LLDP_TLV_SYS_NAME:
+            (LLDPParser.add_single_value, tlv.SysName, LLDP_SYS_NAME_NM,
+             False),
+        tlv.LLDP_TLV_SYS_DESCRIPTION:
+            (LLDPParser.add_single_value, tlv.SysDesc, LLDP_SYS_DESC_NM,
+             False),
+        tlv.LLDP_TLV_SYS_CAPABILITIES:
+            (add_capabilities, tlv.SysCapabilities, LLDP_SWITCH_CAP_NM,
+             True),
+        tlv.LLDP_TLV_MGMT_ADDRESS:
+            (add_mgmt_address, tlv.MgmtAddress, LLDP_MGMT_ADDRESSES_NM,
+             False),
+        tlv.LLDP_TLV_ORG_SPECIFIC:
+            (handle_org_specific_tlv, tlv.OrgSpecific, None, False),
+        tlv.LLDP_TLV_END_LLDPPDU: (None, None, None, False)
+    }
 
 
 class LLDPdot1Parser(LLDPParser):
     """Class to handle parsing of 802.1Q TLVs"""
 
-    def __init__(self, node_uuid, nv=None):
-        super(LLDPdot1Parser, self).__init__(node_uuid, nv)
-
-        self.parser_map = {
-            tlv.dot1_PORT_VLANID:
-                (self.add_single_value, tlv.Dot1_UntaggedVlanId,
-                 LLDP_PORT_VLANID_NM, False),
-            tlv.dot1_PORT_PROTOCOL_VLANID:
-                (self.add_dot1_port_protocol_vlan, tlv.Dot1_PortProtocolVlan,
-                 LLDP_PORT_PROT_NM, True),
-            tlv.dot1_VLAN_NAME:
-                (self.add_dot1_vlans, tlv.Dot1_VlanName, None, False),
-            tlv.dot1_PROTOCOL_IDENTITY:
-                (self.add_dot1_protocol_identities, tlv.Dot1_ProtocolIdentity,
-                 LLDP_PROTOCOL_IDENTITIES_NM, False),
-            tlv.dot1_MANAGEMENT_VID:
-                (self.add_single_value, tlv.Dot1_MgmtVlanId,
-                 LLDP_PORT_MGMT_VLANID_NM, False),
-            tlv.dot1_LINK_AGGREGATION:
-                (self.add_dot1_link_aggregation, tlv.Dot1_LinkAggregationId,
-                 LLDP_PORT_LINK_AGG_NM, True)
-        }
-
     def add_dot1_port_protocol_vlan(self, struct, name, data):
         """Handle dot1_PORT_PROTOCOL_VLANID"""
         self.set_value(LLDP_PORT_PROT_VLAN_ENABLED_NM, struct.flags.enabled)
@@ -338,27 +314,30 @@ class LLDPdot1Parser(LLDPParser):
         self.append_value(LLDP_PROTOCOL_IDENTITIES_NM,
                           binascii.b2a_hex(struct.protocol).decode())
 
+    parser_map = {
+        tlv.dot1_PORT_VLANID:
+            (LLDPParser.add_single_value, tlv.Dot1_UntaggedVlanId,
+             LLDP_PORT_VLANID_NM, False),
+        tlv.dot1_PORT_PROTOCOL_VLANID:
+            (add_dot1_port_protocol_vlan, tlv.Dot1_PortProtocolVlan,
+             LLDP_PORT_PROT_NM, True),
+        tlv.dot1_VLAN_NAME:
+            (add_dot1_vlans, tlv.Dot1_VlanName, None, False),
+        tlv.dot1_PROTOCOL_IDENTITY:
+            (add_dot1_protocol_identities, tlv.Dot1_ProtocolIdentity,
+             LLDP_PROTOCOL_IDENTITIES_NM, False),
+        tlv.dot1_MANAGEMENT_VID:
+            (LLDPParser.add_single_value, tlv.Dot1_MgmtVlanId,
+             LLDP_PORT_MGMT_VLANID_NM, False),
+        tlv.dot1_LINK_AGGREGATION:
+            (LLDPParser.add_dot1_link_aggregation, tlv.Dot1_LinkAggregationId,
+             LLDP_PORT_LINK_AGG_NM, True)
+    }
+
 
 class LLDPdot3Parser(LLDPParser):
     """Class to handle parsing of 802.3 TLVs"""
 
-    def __init__(self, node_uuid, nv=None):
-        super(LLDPdot3Parser, self).__init__(node_uuid, nv)
-
-        # Note that 802.3 link Aggregation has been deprecated and moved to
-        # 802.1 spec, but it is in the same format. Use the same function as
-        # dot1 handler.
-        self.parser_map = {
-            tlv.dot3_MACPHY_CONFIG_STATUS:
-                (self.add_dot3_macphy_config, tlv.Dot3_MACPhy_Config_Status,
-                 LLDP_PORT_MAC_PHY_NM, True),
-            tlv.dot3_LINK_AGGREGATION:
-                (self.add_dot1_link_aggregation, tlv.Dot1_LinkAggregationId,
-                 LLDP_PORT_LINK_AGG_NM, True),
-            tlv.dot3_MTU:
-                (self.add_single_value, tlv.Dot3_MTU, LLDP_MTU_NM, False)
-        }
-
     def add_dot3_macphy_config(self, struct, name, data):
         """Handle dot3_MACPHY_CONFIG_STATUS"""
 
@@ -374,3 +353,24 @@ class LLDPdot3Parser(LLDPParser):
         self.set_value(LLDP_PORT_CAPABILITIES_NM,
                        tlv.get_autoneg_cap(struct.pmd_autoneg))
         self.set_value(LLDP_PORT_MAU_TYPE_NM, mau_type)
+
+    # Note that 802.3 link Aggregation has been deprecated and moved to
+    # 802.1 spec, but it is in the same format. Use the same function as
+    # dot1 handler.
+    parser_map = {
+        tlv.dot3_MACPHY_CONFIG_STATUS:
+            (add_dot3_macphy_config, tlv.Dot3_MACPhy_Config_Status,
+             LLDP_PORT_MAC_PHY_NM, True),
+        tlv.dot3_LINK_AGGREGATION:
+            (LLDPParser.add_dot1_link_aggregation, tlv.Dot1_LinkAggregationId,
+             LLDP_PORT_LINK_AGG_NM, True),
+        tlv.dot3_MTU:
+            (LLDPParser.add_single_value, tlv.Dot3_MTU, LLDP_MTU_NM, False)
+    }
+
+
+# Parsers for the Organizationally Unique ID TLVs, by hexlified OUI
+_OUI_PARSERS = {
+    tlv.LLDP_802dot1_OUI: ('802.1', LLDPdot1Parser),
+    tlv.LLDP_802dot3_OUI: ('802.3', LLDPdot3Parser),
+}
@@ -366,3 +366,135 @@ OPER_MAU_TYPES = {
 }
 
 Dot3_MTU = core.Struct('value' / core.Int16ub)
+
+
+#
+# Decoders for the most common TLVs. Construct builds a lot of intermediate
+# objects for every field it parses, which adds up when inspecting many
+# nodes with many interfaces each. These decoders read the fields straight
+# from a memoryview of the TLV value and produce the same structure the
+# construct definitions would. They return None for anything unusual
+# (unknown subtypes, short or undecodable data), in which case the construct
+# definition is used, so that error handling stays in one place.
+#
+
+def _enum_strings(mapping):
+    return {value: core.EnumIntegerString.new(value, name)
+            for name, value in mapping}
+
+
+_CHASSIS_ID_SUBTYPES = _enum_strings(CHASSIS_ID_MAPPING)
+_PORT_ID_SUBTYPES = _enum_strings(PORT_ID_MAPPING)
+
+
+def _decode_string(view):
+    try:
+        return str(view, 'utf8')
+    except UnicodeDecodeError:
+        return None
+
+
+def _id_decoder(subtypes, mac_subtype):
+    # Only the IANA address subtype is not a MAC address or a string
+    string_subtypes = frozenset(
+        value for value, name in subtypes.items()
+        if value != mac_subtype and name != 'IANA_address')
+
+    def decode(view):
+        if not view:
+            return None
+        subtype = view[0]
+        if subtype == mac_subtype:
+            if len(view) < 7:
+                return None
+            value = bytes(view[1:7]).hex(':')
+        elif subtype in string_subtypes:
+            value = _decode_string(view[1:])
+            if value is None:
+                return None
+        else:
+            return None
+        return core.Container(subtype=subtypes[subtype],
+                              value=core.Container(value=value))
+
+    return decode
+
+
+def _decode_greedy_string(view):
+    value = _decode_string(view)
+    if value is None:
+        return None
+    return core.Container(value=value)
+
+
+def _decode_int16(view):
+    if len(view) < 2:
+        return None
+    return core.Container(value=int.from_bytes(view[:2], 'big'))
+
+
+def _decode_org_specific(view):
+    if len(view) < 4:
+        return None
+    return core.Container(oui=bytes(view[:3]), subtype=view[3])
+
+
+def _decode_vlan_name(view):
+    if len(view) < 3 or len(view) < 3 + view[2]:
+        return None
+    name_len = view[2]
+    vlan_name = _decode_string(bytes(view[3:3 + name_len]).rstrip(b'\x00'))
+    if vlan_name is None:
+        return None
+    return core.Container(vlanid=int.from_bytes(view[:2], 'big'),
+                          name_len=name_len, vlan_name=vlan_name)
+
+
+def _decode_link_aggregation(view):
+    if len(view) < 5:
+        return None
+    status = core.Container(enabled=bool(view[0] & 0x02),
+                            supported=bool(view[0] & 0x01))
+    return core.Container(status=status,
+                          portid=int.from_bytes(view[1:5], 'big'))
+
+
+_FAST_DECODERS = {
+    ChassisId: _id_decoder(_CHASSIS_ID_SUBTYPES, 4),
+    PortId: _id_decoder(_PORT_ID_SUBTYPES, 3),
+    PortDesc: _decode_greedy_string,
+    SysName: _decode_greedy_string,
+    SysDesc: _decode_greedy_string,
+    OrgSpecific: _decode_org_specific,
+    Dot1_UntaggedVlanId: _decode_int16,
+    Dot1_MgmtVlanId: _decode_int16,
+    Dot1_VlanName: _decode_vlan_name,
+    Dot1_LinkAggregationId: _decode_link_aggregation,
+    Dot3_MTU: _decode_int16,
+}
+
+
+def parse(definition, data):
+    """Parse a TLV value using a construct definition
+
+    Uses a decoder working directly on the bytes for the most common TLVs,
+    falling back to the construct definition for the rest.
+
+    :param: definition - construct definition of the TLV
+    :param: data - raw TLV value
+    :returns: the parsed structure
+    :raises: construct.core.ConstructError or netaddr.AddrFormatError if
+             the value cannot be parsed
+    """
+    decoder = _FAST_DECODERS.get(definition)
+    if decoder is not None:
+        struct = decoder(memoryview(data))
+        if struct is not None:
+            return struct
+    return definition.parse(data)
+
+
+@functools.lru_cache(maxsize=None)
+def sizeof(definition):
+    """Return the (cached) size of a fixed size construct definition"""
+    return definition.sizeof()
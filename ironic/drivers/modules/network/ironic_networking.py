@@ -827,6 +827,26 @@ class IronicNetworking(base.NetworkInterface):
         """
         return None
 
+    def _apply_switch_port_changes(self, task, changes):
+        """Apply the switch port changes for the node's ports in one call.
+
+        :param task: A TaskManager instance.
+        :param changes: List of tuples of a Port object and the change of
+            its switch port, as accepted by
+            :func:`ironic.networking.api.update_ports`.
+        :raises: InvalidParameterValue if a change is invalid.
+        :raises: NetworkError if the networking service call fails.
+        :returns: List of tuples of a Port object and the error message for
+            the changes which could not be applied.
+        """
+        if not changes:
+            return []
+        results = networking_api.update_ports(
+            task.context, [change for _port, change in changes])
+        return [(port, result.get('error'))
+                for (port, _change), result in zip(changes, results)
+                if result.get('status') == 'failed']
+
     def _add_tenant_networks(self, task):
         """Add tenant networks to a node.
 
@@ -841,7 +861,9 @@ class IronicNetworking(base.NetworkInterface):
 
         # Resolve the idle network configuration (if any)
         idle_config = self._get_switch_port_config(task, network.IDLE_NETWORK)
+        idle_vlan = idle_config.native_vlan if idle_config else None
 
+        changes = []
         for port in task.ports:
             switchport = port.extra.get('switchport') if port.extra else None
             link_info = port.local_link_connection
@@ -864,32 +886,46 @@ class IronicNetworking(base.NetworkInterface):
                 )
                 continue
 
-            try:
-                idle_vlan = (idle_config.native_vlan
-                             if idle_config else None)
-                networking_api.update_port(
-                    task.context,
-                    link_info.get('switch_id'),
-                    link_info.get('port_id'),
-                    self._get_port_description(port),
-                    config.mode,
-                    config.native_vlan,
-                    allowed_vlans=config.allowed_vlans,
-                    lag_name=None,
-                    default_vlan=idle_vlan,
-                )
-            except (exception.InvalidParameterValue,
-                    exception.NetworkError) as exc:
-                LOG.error(
-                    "Failed to update port %(port)s for tenant network: "
-                    "%(err)s",
-                    {'port': port.uuid, 'err': exc}
-                )
-                raise exception.NetworkError(
-                    _("Failed to configure tenant network for port "
-                      "%(port)s: %(err)s")
-                    % {'port': port.uuid, 'err': exc}
-                )
+            changes.append((port, {
+                'action': 'update',
+                'switch_id': link_info.get('switch_id'),
+                'port_name': link_info.get('port_id'),
+                'description': self._get_port_description(port),
+                'mode': config.mode,
+                'native_vlan': config.native_vlan,
+                'allowed_vlans': config.allowed_vlans,
+                'lag_name': None,
+                'default_vlan': idle_vlan,
+            }))
+
+        try:
+            failed = self._apply_switch_port_changes(task, changes)
+        except (exception.InvalidParameterValue,
+                exception.NetworkError) as exc:
+            LOG.error(
+                "Failed to update ports of node %(node)s for tenant "
+                "network: %(err)s",
+                {'node': task.node.uuid, 'err': exc}
+            )
+            raise exception.NetworkError(
+                _("Failed to configure tenant network for node "
+                  "%(node)s: %(err)s")
+                % {'node': task.node.uuid, 'err': exc}
+            )
+
+        for port, error in failed:
+            LOG.error(
+                "Failed to update port %(port)s for tenant network: "
+                "%(err)s",
+                {'port': port.uuid, 'err': error}
+            )
+        if failed:
+            port, error = failed[0]
+            raise exception.NetworkError(
+                _("Failed to configure tenant network for port "
+                  "%(port)s: %(err)s")
+                % {'port': port.uuid, 'err': error}
+            )
 
     def _remove_tenant_networks(self, task):
         """Remove tenant networks from a node.
@@ -907,8 +943,9 @@ class IronicNetworking(base.NetworkInterface):
 
         # Resolve the idle network configuration (if any)
         idle_config = self._get_switch_port_config(task, network.IDLE_NETWORK)
+        idle_vlan = idle_config.native_vlan if idle_config else None
 
-        errors = []
+        changes = []
         for port in task.ports:
             switchport = port.extra.get('switchport') if port.extra else None
             link_info = port.local_link_connection
@@ -931,25 +968,29 @@ class IronicNetworking(base.NetworkInterface):
                 )
                 continue
 
-            try:
-                idle_vlan = (idle_config.native_vlan
-                             if idle_config else None)
-                networking_api.reset_port(
-                    task.context,
-                    link_info.get('switch_id'),
-                    link_info.get('port_id'),
-                    config.native_vlan,
-                    allowed_vlans=config.allowed_vlans,
-                    default_vlan=idle_vlan
-                )
-            except (exception.InvalidParameterValue,
-                    exception.NetworkError) as exc:
-                # Accumulate errors to ensure that we attempt to reset each
-                # port regardless of if any single port had an error.
-                message = (f"Failed to reset tenant network for "
-                           f"port {port.uuid}: {exc}")
-                LOG.error(message)
-                errors.append(message)
+            changes.append((port, {
+                'action': 'reset',
+                'switch_id': link_info.get('switch_id'),
+                'port_name': link_info.get('port_id'),
+                'native_vlan': config.native_vlan,
+                'allowed_vlans': config.allowed_vlans,
+                'default_vlan': idle_vlan,
+            }))
+
+        # Errors are accumulated for every port, the networking service
+        # attempts to reset each port regardless of errors on the others.
+        try:
+            failed = self._apply_switch_port_changes(task, changes)
+        except (exception.InvalidParameterValue,
+                exception.NetworkError) as exc:
+            failed = [(port, exc) for port, _change in changes]
+
+        errors = []
+        for port, error in failed:
+            message = (f"Failed to reset tenant network for "
+                       f"port {port.uuid}: {error}")
+            LOG.error(message)
+            errors.append(message)
 
         if len(errors) > 0:
             raise exception.NetworkError(
@@ -975,11 +1016,13 @@ class IronicNetworking(base.NetworkInterface):
 
         # Resolve the idle network configuration (if any)
         idle_config = self._get_switch_port_config(task, network.IDLE_NETWORK)
+        idle_vlan = idle_config.native_vlan if idle_config else None
 
         # Get the config for the network type. It may be
         # overridden by the port's switchport configuration.
         global_config = self._get_switch_port_config(task, network_type)
 
+        changes = []
         for port in task.ports:
             # If the local_link_connection info is missing, skip the port
             link_info = port.local_link_connection
@@ -1008,46 +1051,57 @@ class IronicNetworking(base.NetworkInterface):
                 )
                 continue
 
-            try:
-                idle_vlan = (idle_config.native_vlan
-                             if idle_config else None)
-                networking_api.update_port(
-                    task.context,
-                    link_info.get('switch_id'),
-                    link_info.get('port_id'),
-                    self._get_port_description(port),
-                    config.mode,
-                    config.native_vlan,
-                    allowed_vlans=config.allowed_vlans,
-                    lag_name=None,
-                    default_vlan=idle_vlan
-                )
-                LOG.debug(
-                    "Configured %(network_type)s network for port %(port)s: "
-                    "switch_id=%(switch_id)s, port_name=%(port_name)s, "
-                    "config=%(config)s",
-                    {
-                        'network_type': network_type,
-                        'port': port.uuid,
-                        'switch_id': link_info.get('switch_id'),
-                        'port_name': link_info.get('port_id'),
-                        'config': config,
-                    }
-                )
-            except (exception.InvalidParameterValue,
-                    exception.NetworkError) as exc:
-                LOG.error(
-                    "Failed to configure %(network_type)s network for port "
-                    "%(port)s: %(err)s",
-                    {'network_type': network_type, 'port': port.uuid,
-                     'err': exc}
-                )
-                raise exception.NetworkError(
-                    _("Failed to configure %(network_type)s network for port "
-                      "%(port)s: %(err)s")
-                    % {'network_type': network_type, 'port': port.uuid,
-                       'err': exc}
-                )
+            changes.append((port, {
+                'action': 'update',
+                'switch_id': link_info.get('switch_id'),
+                'port_name': link_info.get('port_id'),
+                'description': self._get_port_description(port),
+                'mode': config.mode,
+                'native_vlan': config.native_vlan,
+                'allowed_vlans': config.allowed_vlans,
+                'lag_name': None,
+                'default_vlan': idle_vlan,
+            }))
+
+        try:
+            failed = self._apply_switch_port_changes(task, changes)
+        except (exception.InvalidParameterValue,
+                exception.NetworkError) as exc:
+            LOG.error(
+                "Failed to configure %(network_type)s network for node "
+                "%(node)s: %(err)s",
+                {'network_type': network_type, 'node': task.node.uuid,
+                 'err': exc}
+            )
+            raise exception.NetworkError(
+                _("Failed to configure %(network_type)s network for node "
+                  "%(node)s: %(err)s")
+                % {'network_type': network_type, 'node': task.node.uuid,
+                   'err': exc}
+            )
+
+        for port, error in failed:
+            LOG.error(
+                "Failed to configure %(network_type)s network for port "
+                "%(port)s: %(err)s",
+                {'network_type': network_type, 'port': port.uuid,
+                 'err': error}
+            )
+        if failed:
+            port, error = failed[0]
+            raise exception.NetworkError(
+                _("Failed to configure %(network_type)s network for port "
+                  "%(port)s: %(err)s")
+                % {'network_type': network_type, 'port': port.uuid,
+                   'err': error}
+            )
+
+        LOG.debug(
+            "Configured %(network_type)s network for %(count)d port(s) of "
+            "node %(node)s",
+            {'network_type': network_type, 'count': len(changes),
+             'node': task.node.uuid}
+        )
 
     def _remove_network(self, task, network_type):
         """Remove a network from a node.
@@ -1068,12 +1122,13 @@ class IronicNetworking(base.NetworkInterface):
 
         # Resolve the idle network configuration (if any)
         idle_config = self._get_switch_port_config(task, network.IDLE_NETWORK)
+        idle_vlan = idle_config.native_vlan if idle_config else None
 
         # Get the config for the network type. It may be
         # overridden by the port's switchport configuration.
         global_config = self._get_switch_port_config(task, network_type)
 
-        errors = []
+        changes = []
         for port in task.ports:
             # Get the switch and port info from the port's
             # local_link_connection
@@ -1103,37 +1158,29 @@ class IronicNetworking(base.NetworkInterface):
                 )
                 continue
 
-            try:
-                idle_vlan = (idle_config.native_vlan
-                             if idle_config else None)
-                networking_api.reset_port(
-                    task.context,
-                    link_info.get('switch_id'),
-                    link_info.get('port_id'),
-                    config.native_vlan,
-                    allowed_vlans=config.allowed_vlans,
-                    default_vlan=idle_vlan
-                )
-                LOG.debug(
-                    "Reset %(network_type)s network for port %(port)s: "
-                    "switch_id=%(switch_id)s, port_name=%(port_name)s, "
-                    "config=%(config)s",
-                    {
-                        'network_type': network_type,
-                        'port': port.uuid,
-                        'switch_id': link_info.get('switch_id'),
-                        'port_name': link_info.get('port_id'),
-                        'config': config,
-                    }
-                )
-            except (exception.InvalidParameterValue,
-                    exception.NetworkError) as exc:
-                # Accumulate errors to ensure that we attempt to reset each
-                # port regardless of if any single port had an error.
-                message = (f"Failed to reset {network_type} network for "
-                           f"port {port.uuid}: {exc}")
-                LOG.error(message)
-                errors.append(message)
+            changes.append((port, {
+                'action': 'reset',
+                'switch_id': link_info.get('switch_id'),
+                'port_name': link_info.get('port_id'),
+                'native_vlan': config.native_vlan,
+                'allowed_vlans': config.allowed_vlans,
+                'default_vlan': idle_vlan,
+            }))
+
+        # Errors are accumulated for every port, the networking service
+        # attempts to reset each port regardless of errors on the others.
+        try:
+            failed = self._apply_switch_port_changes(task, changes)
+        except (exception.InvalidParameterValue,
+                exception.NetworkError) as exc:
+            failed = [(port, exc) for port, _change in changes]
+
+        errors = []
+        for port, error in failed:
+            message = (f"Failed to reset {network_type} network for "
+                       f"port {port.uuid}: {error}")
+            LOG.error(message)
+            errors.append(message)
 
         if len(errors) > 0:
             raise exception.NetworkError(
@@ -1048,6 +1048,7 @@ class RedfishVirtualMediaBoot(base.BootInterface):
         ramdisk_params['boot_method'] = 'vmedia'
 
         config_via_removable = d_info.get('config_via_removable')
+        config_inserted = False
         if config_via_removable:
 
             removable = _has_vmedia_device(
@@ -1061,6 +1062,7 @@ class RedfishVirtualMediaBoot(base.BootInterface):
 
                 _eject_vmedia(task, managers, removable)
                 _insert_vmedia(task, managers, floppy_ref, removable)
+                config_inserted = True
 
                 LOG.info('Inserted virtual %(type)s device with configuration'
                          ' for node %(node)s',
@@ -1084,8 +1086,11 @@ class RedfishVirtualMediaBoot(base.BootInterface):
             'vmedia_transport_protocol', selected_protocol)
         task.node.save()
 
-        iso_ref = image_utils.prepare_deploy_iso(task, ramdisk_params,
-                                                 mode, d_info)
+        # NOTE: with the configuration on a removable device, the ISO does
+        # not have to contain anything node-specific and can be shared.
+        iso_ref = image_utils.prepare_deploy_iso(
+            task, ramdisk_params, mode, d_info,
+            shared=config_inserted and CONF.redfish.shared_deploy_iso)
 
         username = None
         password = None
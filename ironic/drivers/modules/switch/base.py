@@ -18,6 +18,7 @@ to provide vendor-specific network switch management functionality.
 """
 
 import abc
+import contextlib
 
 from oslo_log import log
 
@@ -209,6 +210,21 @@ class SwitchDriverBase(object, metaclass=abc.ABCMeta):
         :raises: SwitchDriverException on configuration failures.
         """
 
+    @contextlib.contextmanager
+    def port_session(self, switch_id):
+        """Apply several port changes on a switch together.
+
+        The networking service applies all the port changes of a batch which
+        target the same switch within this context. Drivers which can reuse
+        a connection to the switch, or save its configuration once for all
+        the changes, should override it. By default every change is applied
+        on its own.
+
+        :param switch_id: Identifier for the switch.
+        :raises: SwitchDriverException if the changes cannot be committed.
+        """
+        yield
+
     def is_switch_configured(self, switch_id):
         """Check if this driver is configured to manage the specified switch.
 
@@ -11,6 +11,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import contextlib
+
 from ironic.drivers.modules.switch.base import BaseTranslator
 from ironic.drivers.modules.switch.base import SwitchDriverBase
 from ironic.drivers.modules.switch.base import SwitchDriverException
@@ -57,6 +59,8 @@ class GenericSwitchDriver(SwitchDriverBase):
             raise ImportError("networking_generic_switch not imported")
 
         self._devices = devices.get_devices()
+        # Switch devices looked up for the open port sessions
+        self._session_switches = {}
 
         if self._devices:
             LOG.info('Devices have been loaded: %s',
@@ -114,6 +118,10 @@ class GenericSwitchDriver(SwitchDriverBase):
         """
         self._validate_switch_id(switch_id)
 
+        switch = self._session_switches.get(switch_id)
+        if switch is not None:
+            return switch
+
         switch = device_utils.get_switch_device(
             self._devices, switch_info=switch_id,
             ngs_mac_address=switch_id)
@@ -122,6 +130,22 @@ class GenericSwitchDriver(SwitchDriverBase):
             raise SwitchNotFound(switch_id)
         return switch
 
+    @contextlib.contextmanager
+    def port_session(self, switch_id):
+        """Apply several port changes on a switch together.
+
+        The switch device is looked up once for all the changes of the
+        session instead of for every change.
+
+        :param switch_id: Identifier for the switch.
+        :raises: SwitchNotFound if the specified switch does not exist.
+        """
+        self._session_switches[switch_id] = self._get_switch(switch_id)
+        try:
+            yield
+        finally:
+            self._session_switches.pop(switch_id, None)
+
     @staticmethod
     def _validate_port_mode(mode, allowed_vlans):
         """Validate port mode and required parameters.
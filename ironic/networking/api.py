@@ -109,6 +109,25 @@ def reset_port(
     )
 
 
+def update_ports(context, port_changes):
+    """Apply a batch of network switch port changes.
+
+    This is a convenience function that other parts of Ironic can use
+    to configure many switch ports with a single call. The changes are
+    grouped by switch by the networking service.
+
+    :param context: request context.
+    :param port_changes: List of dictionaries, each with an ``action`` of
+        ``update`` or ``reset`` and the arguments of :func:`update_port` or
+        :func:`reset_port` respectively.
+    :raises: InvalidParameterValue if validation fails.
+    :raises: NetworkError if the network operation fails.
+    :returns: List with the resulting port configuration of each change.
+    """
+    api = get_networking_api()
+    return api.update_ports(context, port_changes)
+
+
 def update_lag(
     context,
     switch_ids,
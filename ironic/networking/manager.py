@@ -108,6 +108,65 @@ def validate_vlan_configuration(
     return decorator
 
 
+def _validate_port_settings(mode, native_vlan, allowed_vlans):
+    """Validate the mode and VLANs requested for a switch port.
+
+    :param mode: Port mode (e.g., 'access', 'trunk').
+    :param native_vlan: VLAN ID to be set on the port.
+    :param allowed_vlans: Allowed VLAN IDs, or None.
+    :raises: InvalidParameterValue if validation fails.
+    """
+    # Validate mode
+    valid_modes = ["access", "trunk"]
+    if mode not in valid_modes:
+        raise exception.InvalidParameterValue(
+            _("mode must be one of: %s") % ", ".join(valid_modes)
+        )
+
+    # Validate VLAN ID
+    if (
+        not isinstance(native_vlan, int)
+        or native_vlan < 1
+        or native_vlan > 4094
+    ):
+        raise exception.InvalidParameterValue(
+            _("native_vlan must be an integer between 1 and 4094")
+        )
+
+    # Validate allowed_vlans if provided
+    if allowed_vlans is not None:
+        if not isinstance(allowed_vlans, (list, tuple)):
+            raise exception.InvalidParameterValue(
+                _("allowed_vlans must be a list or tuple")
+            )
+        for vlan in allowed_vlans:
+            if not isinstance(vlan, int) or vlan < 1 or vlan > 4094:
+                raise exception.InvalidParameterValue(
+                    _(
+                        "Each VLAN in allowed_vlans must be an integer "
+                        "between 1 and 4094"
+                    )
+                )
+
+
+# Arguments accepted for each action of NetworkingManager.update_ports
+_PORT_CHANGE_ARGS = {
+    "update": ("switch_id", "port_name", "description", "mode",
+               "native_vlan", "allowed_vlans", "default_vlan", "lag_name"),
+    "reset": ("switch_id", "port_name", "native_vlan", "allowed_vlans",
+              "default_vlan"),
+}
+
+
+def _failed_port_change(kwargs, error):
+    return {
+        "switch_id": kwargs["switch_id"],
+        "port_name": kwargs["port_name"],
+        "status": "failed",
+        "error": str(error),
+    }
+
+
 def _get_switch_config_filename():
     return CONF.ironic_networking.driver_config_dir + "/switches.conf"
 
@@ -116,7 +175,7 @@ class NetworkingManager(object):
     """Ironic Networking service manager."""
 
     # NOTE(alegacy): This must be in sync with rpcapi.NetworkingAPI's.
-    RPC_API_VERSION = "1.0"
+    RPC_API_VERSION = "1.1"
 
     target = messaging.Target(version=RPC_API_VERSION)
 
@@ -146,6 +205,9 @@ class NetworkingManager(object):
         # Initialize switch driver factory (will be set properly in init_host)
         self._switch_driver_factory = None
 
+        # Switch driver resolved for each switch ID, see _get_switch_driver
+        self._switch_drivers = {}
+
     def prepare_host(self):
         """Prepare host for networking service initialization.
 
@@ -171,6 +233,7 @@ class NetworkingManager(object):
         self._switch_driver_factory = (
             driver_factory.get_switch_driver_factory()
         )
+        self._switch_drivers = {}
         available_drivers = self._switch_driver_factory.names
         if not available_drivers:
             LOG.error("No switch drivers loaded")
@@ -214,13 +277,18 @@ class NetworkingManager(object):
         This method finds the correct driver for a switch by checking each
         available driver to see if it is configured to handle the switch.
         If multiple drivers can handle the same switch, the first one found
-        is used.
+        is used. The driver found is cached for the switch, since the switch
+        configuration is only loaded when the service starts.
 
         :param switch_id: Identifier of the switch.
         :returns: Switch driver instance.
         :raises: NetworkError if no drivers are available.
         :raises: SwitchNotFound if no driver supports the switch.
         """
+        driver = self._switch_drivers.get(switch_id)
+        if driver is not None:
+            return driver
+
         available_drivers = self._switch_driver_factory.names
         if not available_drivers:
             raise exception.NetworkError(
@@ -242,6 +310,7 @@ class NetworkingManager(object):
                         driver_name,
                         switch_id,
                     )
+                    self._switch_drivers[switch_id] = driver
                     return driver
 
             except exception.DriverNotFound:
@@ -359,37 +428,7 @@ class NetworkingManager(object):
             {"switch": switch_id, "port": port_name},
         )
 
-        # Validate mode
-        valid_modes = ["access", "trunk"]
-        if mode not in valid_modes:
-            raise exception.InvalidParameterValue(
-                _("mode must be one of: %s") % ", ".join(valid_modes)
-            )
-
-        # Validate VLAN ID
-        if (
-            not isinstance(native_vlan, int)
-            or native_vlan < 1
-            or native_vlan > 4094
-        ):
-            raise exception.InvalidParameterValue(
-                _("native_vlan must be an integer between 1 and 4094")
-            )
-
-        # Validate allowed_vlans if provided
-        if allowed_vlans is not None:
-            if not isinstance(allowed_vlans, (list, tuple)):
-                raise exception.InvalidParameterValue(
-                    _("allowed_vlans must be a list or tuple")
-                )
-            for vlan in allowed_vlans:
-                if not isinstance(vlan, int) or vlan < 1 or vlan > 4094:
-                    raise exception.InvalidParameterValue(
-                        _(
-                            "Each VLAN in allowed_vlans must be an integer "
-                            "between 1 and 4094"
-                        )
-                    )
+        _validate_port_settings(mode, native_vlan, allowed_vlans)
 
         try:
             return self._update_port_impl(
@@ -515,6 +554,122 @@ class NetworkingManager(object):
                 _("Failed to reset network port: %s") % e
             ) from e
 
+    def _validate_port_change(self, change):
+        """Validate a change of a batch passed to update_ports.
+
+        :param change: Dictionary describing the change.
+        :raises: InvalidParameterValue if validation fails.
+        :raises: SwitchNotFound if no driver supports the switch.
+        :returns: Tuple of the action and the arguments of its
+            implementation.
+        """
+        if not isinstance(change, dict):
+            raise exception.InvalidParameterValue(
+                _("Each port change must be a dictionary")
+            )
+        kwargs = dict(change)
+        action = kwargs.pop("action", None)
+        allowed = _PORT_CHANGE_ARGS.get(action)
+        if allowed is None:
+            raise exception.InvalidParameterValue(
+                _("Port change action must be one of: %s")
+                % ", ".join(_PORT_CHANGE_ARGS)
+            )
+        unexpected = set(kwargs) - set(allowed)
+        missing = {"switch_id", "port_name"} - set(kwargs)
+        if unexpected or missing:
+            raise exception.InvalidParameterValue(
+                _("Invalid arguments for port change %(action)s: "
+                  "unexpected %(unexpected)s, missing %(missing)s")
+                % {"action": action, "unexpected": sorted(unexpected),
+                   "missing": sorted(missing)}
+            )
+
+        # Resolve the driver first so an unknown switch fails the batch
+        driver = self._get_switch_driver(kwargs["switch_id"])
+        if action == "update":
+            _validate_port_settings(kwargs.get("mode"),
+                                    kwargs.get("native_vlan"),
+                                    kwargs.get("allowed_vlans"))
+            switch_config.validate_vlan_configuration(
+                [kwargs["native_vlan"]] + list(kwargs.get("allowed_vlans")
+                                               or []),
+                driver,
+                kwargs["switch_id"],
+                "update_ports",
+            )
+            kwargs.setdefault("description", None)
+        else:
+            kwargs.setdefault("native_vlan", None)
+        return action, kwargs
+
+    @METRICS.timer("NetworkingManager.update_ports")
+    @messaging.expected_exceptions(
+        exception.InvalidParameterValue,
+        exception.NetworkError,
+        exception.SwitchNotFound,
+    )
+    def update_ports(self, context, port_changes):
+        """Apply a batch of switch port changes.
+
+        All changes are validated before any is applied. The changes are
+        then grouped by switch, and the changes of each switch are applied
+        within a single session of its driver, see
+        :meth:`SwitchDriverBase.port_session`.
+
+        :param context: request context.
+        :param port_changes: List of dictionaries, each with an ``action``
+            of ``update`` or ``reset`` and the arguments of the
+            ``update_port`` or ``reset_port`` call respectively.
+        :raises: InvalidParameterValue if a change is invalid.
+        :raises: SwitchNotFound if no driver supports a switch.
+        :raises: NetworkError if no switch drivers are available.
+        :returns: List with the resulting port configuration of each change,
+            in the order of ``port_changes``. Changes which could not be
+            applied have a ``status`` of ``failed`` and an ``error``.
+        """
+        LOG.debug("RPC update_ports called for %d port(s)",
+                  len(port_changes))
+
+        changes = [self._validate_port_change(change)
+                   for change in port_changes]
+        by_switch = {}
+        for index, (action, kwargs) in enumerate(changes):
+            by_switch.setdefault(kwargs["switch_id"], []).append(index)
+
+        results = [None] * len(changes)
+        for switch_id, indexes in by_switch.items():
+            driver = self._get_switch_driver(switch_id)
+            try:
+                with driver.port_session(switch_id):
+                    for index in indexes:
+                        results[index] = self._apply_port_change(
+                            *changes[index])
+            except Exception as e:
+                LOG.exception(
+                    "Failed to apply port changes on switch %(switch)s",
+                    {"switch": switch_id},
+                )
+                for index in indexes:
+                    if (results[index] is None
+                            or results[index]["status"] != "failed"):
+                        results[index] = _failed_port_change(
+                            changes[index][1], e)
+        return results
+
+    def _apply_port_change(self, action, kwargs):
+        impl = (self._update_port_impl if action == "update"
+                else self._reset_port_impl)
+        try:
+            return impl(**kwargs)
+        except Exception as e:
+            LOG.exception(
+                "Failed to %(action)s port %(port)s on switch %(switch)s",
+                {"action": action, "port": kwargs["port_name"],
+                 "switch": kwargs["switch_id"]},
+            )
+            return _failed_port_change(kwargs, e)
+
     @METRICS.timer("NetworkingManager.update_lag")
     @messaging.expected_exceptions(
         exception.InvalidParameterValue,
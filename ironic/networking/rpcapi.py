@@ -36,10 +36,11 @@ class NetworkingAPI(object):
     API version history:
 
     |    1.0 - Initial version.
+    |    1.1 - Added update_ports.
     """
 
     # NOTE(alegacy): This must be in sync with manager.NetworkingManager's.
-    RPC_API_VERSION = "1.0"
+    RPC_API_VERSION = "1.1"
 
     def __init__(self, topic=None):
         super(NetworkingAPI, self).__init__()
@@ -175,6 +176,52 @@ class NetworkingAPI(object):
             default_vlan=default_vlan,
         )
 
+    def update_ports(self, context, port_changes, topic=None):
+        """Apply a batch of port changes, grouped by switch.
+
+        If the networking service is pinned to a version without
+        ``update_ports``, the changes are sent one by one instead.
+
+        :param context: request context.
+        :param port_changes: List of dictionaries, each with an ``action``
+            of ``update`` or ``reset`` and the arguments of the
+            ``update_port`` or ``reset_port`` call respectively.
+        :param topic: RPC topic. Defaults to self.topic.
+        :raises: InvalidParameterValue if validation fails.
+        :raises: NetworkError if the network operation fails.
+        :returns: List with the resulting port configuration of each change.
+            Changes which could not be applied have a ``status`` of
+            ``failed`` and an ``error``.
+        """
+        if self.client is not None and not self.client.can_send_version(
+                "1.1"):
+            return [self._apply_port_change(context, change, topic)
+                    for change in port_changes]
+        cctxt = self._prepare_call(topic=topic, version="1.1")
+        return cctxt.call(context, "update_ports", port_changes=port_changes)
+
+    def _apply_port_change(self, context, change, topic):
+        """Send a single change of an update_ports batch."""
+        kwargs = dict(change)
+        action = kwargs.pop("action", None)
+        if action == "update":
+            call = self.update_port
+        elif action == "reset":
+            call = self.reset_port
+        else:
+            raise exception.InvalidParameterValue(
+                _("Port change action must be one of: update, reset")
+            )
+        try:
+            return call(context, topic=topic, **kwargs)
+        except exception.NetworkError as e:
+            return {
+                "switch_id": kwargs.get("switch_id"),
+                "port_name": kwargs.get("port_name"),
+                "status": "failed",
+                "error": str(e),
+            }
+
     def get_switches(self, context, topic=None):
         """Get information about all configured switches.
 
@@ -14,6 +14,10 @@
 
 """Ironic common internal object model"""
 
+import collections
+import datetime
+import functools
+
 from oslo_log import log
 from oslo_utils import versionutils
 from oslo_versionedobjects import base as object_base
@@ -47,6 +51,65 @@ def max_version(versions):
     return versions[ind]
 
 
+class Projection(object):
+    """A read-only view of some fields of an object.
+
+    Projections are built straight from database rows for read-only bulk
+    listings, without the cost of creating versioned objects. Anything that
+    modifies the data must use the versioned objects instead.
+    """
+
+    __slots__ = ()
+
+    # The object fields of the projected attributes
+    fields = {}
+
+    def __getitem__(self, name):
+        if isinstance(name, str):
+            return getattr(self, name)
+        return super(Projection, self).__getitem__(name)
+
+    def get(self, name, default=None):
+        return getattr(self, name, default)
+
+    def obj_attr_is_set(self, name):
+        return name in self.fields
+
+    def as_dict(self):
+        """Return the projection represented as a dict."""
+        return {name: getattr(self, name) for name in self.fields}
+
+
+# NOTE: the field names may come from API requests (``?fields=``), keep the
+# number of generated classes bounded.
+@functools.lru_cache(maxsize=128)
+def _projection_type(obj_cls, names):
+    name = '%sProjection' % obj_cls.obj_name()
+    base = collections.namedtuple(name, names)
+    return type(name, (Projection, base),
+                {'__slots__': (),
+                 'fields': {n: obj_cls.fields[n] for n in names}})
+
+
+def _to_utc(value):
+    # NOTE: the same as the coercion of oslo.versionedobjects DateTimeField
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=datetime.timezone.utc)
+    return value
+
+
+def _empty_dict(value):
+    return {} if value is None else value
+
+
+def _projection_normalizer(field):
+    """Return the conversion a field applies to database values, if any."""
+    if isinstance(field, object_fields.DateTimeField):
+        return _to_utc
+    if isinstance(field, object_fields.FlexibleDictField) and field.nullable:
+        return _empty_dict
+
+
 class IronicObjectRegistry(object_base.VersionedObjectRegistry):
     def registration_hook(self, cls, index):
         # NOTE(jroll): blatantly stolen from nova
@@ -317,6 +380,45 @@ class IronicObject(object_base.VersionedObject):
         return [cls._from_db_object(context, cls(), db_obj, fields=fields)
                 for db_obj in db_objects]
 
+    @classmethod
+    def _projections_from_db_rows(cls, context, rows, columns):
+        """Returns read-only projections of database rows.
+
+        Unlike :meth:`_from_db_object_list`, no versioned objects are created
+        for rows of the current object version, values are only converted
+        where the database representation differs from the field one.
+
+        :param cls: the VersionedObject class of the desired object
+        :param context: security context
+        :param rows: an iterable of tuples of column values
+        :param columns: the names of the columns in the rows. Must include
+                        ``version``, the others are projected fields.
+        :returns: A list of :class:`Projection` instances
+        """
+        names = tuple(c for c in columns if c != 'version')
+        projection = _projection_type(cls, names)
+        version_index = columns.index('version')
+        indexes = [columns.index(n) for n in names]
+        normalizers = [(i, _projection_normalizer(cls.fields[n]))
+                       for i, n in enumerate(names)]
+        normalizers = [(i, f) for i, f in normalizers if f is not None]
+
+        result = []
+        for row in rows:
+            if row[version_index] != cls.VERSION:
+                # Let the object do the version checks and conversions
+                obj = cls._from_db_object(context, cls(),
+                                          dict(zip(columns, row)),
+                                          fields=names)
+                result.append(projection._make(
+                    getattr(obj, n) for n in names))
+                continue
+            values = [row[i] for i in indexes]
+            for i, normalize in normalizers:
+                values[i] = normalize(values[i])
+            result.append(projection._make(values))
+        return result
+
     def do_version_changes_for_db(self):
         """Change the object to the version needed for the database.
 
@@ -190,6 +190,18 @@ class Conductor(base.IronicObject, object_base.VersionedObjectDictCompat):
         return dict(
             cls.dbapi.get_active_hardware_type_dict(use_groups=use_groups))
 
+    @classmethod
+    def get_active_topology(cls, context):
+        """Get the active conductors and the hardware types they support.
+
+        :param cls: the :class:`Conductor`
+        :param context: Security context
+        :returns: A list of (hostname, conductor_group, hardware_type)
+                  tuples. hardware_type is None for conductors that do not
+                  support any hardware types.
+        """
+        return cls.dbapi.get_active_conductor_topology()
+
     @classmethod
     @base.remotable
     def list_hardware_type_interfaces_dict(cls, context, names):
@@ -134,6 +134,15 @@ class InspectionRule(base.IronicObject, object_base.VersionedObjectDictCompat):
             filters=filters)
         return cls._from_db_object_list(context, db_rules)
 
+    @classmethod
+    def get_revision(cls, context):
+        """Return a value which changes whenever inspection rules change.
+
+        :param context: security context.
+        :returns: an opaque, comparable revision of the inspection rules.
+        """
+        return cls.dbapi.get_inspection_rules_revision()
+
     @object_base.remotable
     def refresh(self, context=None):
         """Loads updates for this inspection rule.
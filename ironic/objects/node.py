@@ -238,6 +238,8 @@ class Node(base.IronicObject, object_base.VersionedObjectDictCompat):
     def _set_from_db_object(self, context, db_object, fields=None):
         use_fields = set(fields or self.fields) - {'traits'}
         super(Node, self)._set_from_db_object(context, db_object, use_fields)
+        if 'driver_internal_info' in use_fields:
+            self._merge_agent_last_heartbeat(db_object)
         if not fields or 'traits' in fields:
             self.traits = object_base.obj_make_list(
                 context, objects.TraitList(context),
@@ -245,6 +247,41 @@ class Node(base.IronicObject, object_base.VersionedObjectDictCompat):
                 fields=['trait', 'version'])
             self.traits.obj_reset_changes()
 
+    def _merge_agent_last_heartbeat(self, db_object):
+        """Expose the agent liveness column through driver_internal_info.
+
+        Agent heartbeats are stored in a dedicated column which is updated in
+        batches, while ``driver_internal_info['agent_last_heartbeat']`` is only
+        written when other agent details change. Use the most recent of the
+        two, so that readers keep using ``driver_internal_info``.
+        """
+        merged = self._merged_driver_internal_info(
+            self.driver_internal_info, db_object.get('agent_last_heartbeat'))
+        if merged is not self.driver_internal_info:
+            self.driver_internal_info = merged
+
+    @staticmethod
+    def _merged_driver_internal_info(driver_internal_info, heartbeat):
+        """Return driver_internal_info with the most recent agent heartbeat.
+
+        The passed dictionary is returned unchanged if it already contains the
+        most recent heartbeat, otherwise an updated copy is returned.
+        """
+        if not heartbeat or driver_internal_info is None:
+            return driver_internal_info
+        recorded = driver_internal_info.get('agent_last_heartbeat')
+        if recorded:
+            try:
+                recorded = timeutils.normalize_time(
+                    timeutils.parse_isotime(recorded))
+            except ValueError:
+                recorded = None
+            if recorded is not None and recorded >= heartbeat:
+                return driver_internal_info
+        # NOTE: copy to avoid changing the dict owned by the DB model
+        return dict(driver_internal_info,
+                    agent_last_heartbeat=heartbeat.isoformat())
+
     @classmethod
     @object_base.remotable
     def get(cls, context, node_id):
@@ -337,14 +374,7 @@ class Node(base.IronicObject, object_base.VersionedObjectDictCompat):
         :returns: a list of :class:`Node` object.
         """
         if fields:
-            # All requests must include version, updated_at, created_at
-            # owner, and lessee to support access controls and database
-            # version model updates. Driver and conductor_group are required
-            # for conductor mapping.
-            target_fields = ['id'] + fields[:] + ['version', 'updated_at',
-                                                  'created_at', 'owner',
-                                                  'lessee', 'driver',
-                                                  'conductor_group']
+            target_fields = cls._get_list_fields(fields)
         else:
             target_fields = None
 
@@ -354,6 +384,53 @@ class Node(base.IronicObject, object_base.VersionedObjectDictCompat):
                                            fields=target_fields)
         return cls._from_db_object_list(context, db_nodes, target_fields)
 
+    @staticmethod
+    def _get_list_fields(fields):
+        # All requests must include version, updated_at, created_at
+        # owner, and lessee to support access controls and database
+        # version model updates. Driver and conductor_group are required
+        # for conductor mapping.
+        return ['id'] + fields[:] + ['version', 'updated_at', 'created_at',
+                                     'owner', 'lessee', 'driver',
+                                     'conductor_group']
+
+    @classmethod
+    def list_projections(cls, context, fields, limit=None, marker=None,
+                         sort_key=None, sort_dir=None, filters=None):
+        """Return a list of read-only node projections.
+
+        This is a cheaper alternative to :meth:`list` with ``fields`` for
+        read-only listings, the projections cannot be saved or passed over
+        RPC.
+
+        :param cls: the :class:`Node`
+        :param context: Security context.
+        :param fields: Requested fields to be returned, the same mandatory
+                       fields as for :meth:`list` are automatically included.
+                       The ``traits`` field is not supported.
+        :param limit: maximum number of resources to return in a single result.
+        :param marker: pagination marker for large data sets.
+        :param sort_key: column to sort results by.
+        :param sort_dir: direction to sort. "asc" or "desc".
+        :param filters: Filters to apply.
+        :returns: a list of :class:`ironic.objects.base.Projection` objects.
+        """
+        columns = list(dict.fromkeys(cls._get_list_fields(fields)))
+        with_heartbeat = 'driver_internal_info' in columns
+        db_columns = (columns + ['agent_last_heartbeat'] if with_heartbeat
+                      else columns)
+        rows = cls.dbapi.get_nodeinfo_list(columns=db_columns, filters=filters,
+                                           limit=limit, marker=marker,
+                                           sort_key=sort_key,
+                                           sort_dir=sort_dir)
+        if with_heartbeat:
+            index = columns.index('driver_internal_info')
+            rows = [row[:index]
+                    + (cls._merged_driver_internal_info(row[index], row[-1]),)
+                    + row[index + 1:-1]
+                    for row in rows]
+        return cls._projections_from_db_rows(context, rows, columns)
+
     # NOTE(TheJulia): The choice to not make this a remotable method is
     # explicit in that locks are intended only for a conductor. If we choose
     # to change this, we need reconsider the locking model.
@@ -529,6 +606,29 @@ class Node(base.IronicObject, object_base.VersionedObjectDictCompat):
         node = cls._from_db_object(context, cls(), db_node)
         return node
 
+    # NOTE: The lookup information is only used by the API to decide whether
+    # a ramdisk lookup is allowed and which conductor to send it to, so this
+    # is deliberately not a remotable method.
+    LOOKUP_FIELDS = ['id', 'uuid', 'version', 'driver', 'conductor_group',
+                     'provision_state', 'driver_info']
+
+    @classmethod
+    def get_lookup_info_by_port_addresses(cls, context, addresses):
+        """Get the lookup information of a node by associated port addresses.
+
+        Only the fields in ``LOOKUP_FIELDS`` are loaded.
+
+        :param cls: the :class:`Node`
+        :param context: Security context.
+        :param addresses: A list of port addresses.
+        :raises: NodeNotFound if the node is not found.
+        :returns: a :class:`Node` object.
+        """
+        db_node = cls.dbapi.get_node_by_port_addresses(
+            addresses, fields=cls.LOOKUP_FIELDS)
+        return cls._from_db_object(context, cls(), db_node,
+                                   fields=cls.LOOKUP_FIELDS)
+
     def get_interface(self, iface):
         iface_name = '%s_interface' % iface
         impl_name = self.instance_info.get(iface_name,
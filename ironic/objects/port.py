@@ -391,6 +391,35 @@ class Port(base.IronicObject, object_base.VersionedObjectDictCompat):
                                                        filters=filters)
         return cls._from_db_object_list(context, db_ports)
 
+    @classmethod
+    def reconcile_node_ports(cls, context, node_id, create=(), update=(),
+                             destroy=()):
+        """Create, update and delete ports of a node in one transaction.
+
+        Unlike :meth:`create`, the created ports are not reloaded from the
+        database, so their ``id`` is not set.
+
+        :param context: Security context.
+        :param node_id: the ID of the node.
+        :param create: a list of new :class:`Port` objects to create.
+        :param update: a list of :class:`Port` objects of the node with
+            changes to save.
+        :param destroy: a list of :class:`Port` objects of the node to delete.
+        :returns: a list of the MAC addresses of the ports that were not
+            created because other ports already use them.
+        """
+        for port in create:
+            if not port.obj_attr_is_set('uuid') or not port.uuid:
+                port.uuid = uuidutils.generate_uuid()
+        used = cls.dbapi.reconcile_node_ports(
+            node_id,
+            [port.do_version_changes_for_db() for port in create],
+            {port.id: port.do_version_changes_for_db() for port in update},
+            [port.id for port in destroy])
+        for port in list(create) + list(update) + list(destroy):
+            port.obj_reset_changes()
+        return used
+
     @object_base.remotable
     def create(self, context=None):
         """Create a Port record in the DB.
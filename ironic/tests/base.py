@@ -41,10 +41,15 @@ from ironic.common import config as ironic_config
 from ironic.common import context as ironic_context
 from ironic.common import driver_factory
 from ironic.common import hash_ring
+from ironic.common.inspection_rules import engine as ir_engine
+from ironic.common import neutron
 from ironic.common import rpc
 from ironic.common import utils
+from ironic.conductor import utils as conductor_utils
 from ironic.conf import CONF
 from ironic.drivers import base as drivers_base
+from ironic.drivers.modules.drac import utils as drac_utils
+from ironic.drivers.modules.inspector.hooks import parse_lldp
 from ironic.objects import base as objects_base
 from ironic.tests.unit import policy_fixture
 
@@ -161,6 +166,15 @@ class TestCase(oslo_test_base.BaseTestCase):
 
         self.addCleanup(self._clear_attrs)
         self.addCleanup(hash_ring.HashRingManager().reset)
+        self.addCleanup(conductor_utils._PENDING_AGENT_HEARTBEATS.clear)
+        self.addCleanup(conductor_utils._PENDING_NODE_HISTORY.clear)
+        self.addCleanup(conductor_utils._ACTION_COUNTS.clear)
+        self.addCleanup(ir_engine._PLANS.clear)
+        self.addCleanup(neutron._ALIVE_HOST_AGENTS.clear)
+        self.addCleanup(parse_lldp._PARSED_TLVS.clear)
+        self.addCleanup(drac_utils._JOB_QUEUES.clear)
+        self.addCleanup(utils._get_template_environment.cache_clear)
+        self.addCleanup(utils._get_string_template.cache_clear)
         self.useFixture(fixtures.EnvironmentVariable('http_proxy'))
         self.policy = self.useFixture(policy_fixture.PolicyFixture())
         self.useFixture(WarningsFixture())
@@ -171,6 +185,7 @@ class TestCase(oslo_test_base.BaseTestCase):
         driver_factory.HardwareTypesFactory._extension_manager = None
         for factory in driver_factory._INTERFACE_LOADERS.values():
             factory._extension_manager = None
+        driver_factory._COMPOSITIONS.clear()
 
         rpc.set_global_manager(None)
 
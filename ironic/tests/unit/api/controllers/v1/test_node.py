@@ -149,6 +149,23 @@ class TestListNodes(test_api_base.BaseApiTest):
         self.assertNotIn('service_steps', data['nodes'][0])
         self.assertNotIn('disable_power_off', data['nodes'][0])
 
+    @mock.patch.object(objects.Node, 'list', autospec=True)
+    def test_get_all_with_fields_uses_projections(self, mock_list):
+        node = obj_utils.create_test_node(self.context,
+                                          chassis_id=self.chassis.id,
+                                          provision_state='available')
+        data = self.get_json(
+            '/nodes?fields=uuid,provision_state,maintenance,driver_info',
+            headers={api_base.Version.string: str(api_v1.max_version())})
+        self.assertEqual([{'uuid': node.uuid,
+                           'provision_state': 'available',
+                           'maintenance': False,
+                           'driver_info': {'foo': 'bar',
+                                           'fake_password': '******'},
+                           'links': mock.ANY}],
+                         data['nodes'])
+        self.assertFalse(mock_list.called)
+
     @mock.patch.object(policy, 'check', autospec=True)
     @mock.patch.object(policy, 'check_policy', autospec=True)
     def test_one_field_specific_santization(self, mock_check_policy,
@@ -231,6 +248,36 @@ class TestListNodes(test_api_base.BaseApiTest):
         # requested, ensuring no information leak.
         self.assertNotIn('owner', data['nodes'][0])
 
+    @mock.patch.object(policy, 'check', autospec=True)
+    @mock.patch.object(policy, 'check_policy', autospec=True)
+    def test_field_sanitization_policy_memoized(self, mock_check_policy,
+                                                mock_check):
+        for i, owner in enumerate(['owner1', 'owner1', 'owner2']):
+            obj_utils.create_test_node(self.context,
+                                       uuid=uuidutils.generate_uuid(),
+                                       name='node%d' % i,
+                                       owner=owner,
+                                       last_error='meow',
+                                       reservation='fake-conductor')
+        mock_check_policy.return_value = False
+        mock_check.side_effect = (
+            lambda rule, target, creds: target.get('node.owner') == 'owner1')
+
+        data = self.get_json(
+            '/nodes?fields=uuid,owner,last_error,reservation',
+            headers={api_base.Version.string: str(api_v1.max_version())})
+
+        by_owner = {}
+        for node in data['nodes']:
+            by_owner.setdefault(node['owner'], []).append(node['last_error'])
+        self.assertEqual(['meow', 'meow'], by_owner['owner1'])
+        self.assertEqual(1, len(by_owner['owner2']))
+        self.assertIn('Redacted', by_owner['owner2'][0])
+        # One decision per rule and owner, not per node
+        checked = [c.args[0] for c in mock_check.call_args_list]
+        self.assertEqual(2, checked.count('baremetal:node:get:last_error'))
+        self.assertEqual(2, checked.count('baremetal:node:get:reservation'))
+
     @mock.patch.object(policy, 'check', autospec=True)
     @mock.patch.object(policy, 'check_policy', autospec=True)
     def test_field_redaction_get_one_owner_not_in_fields(
@@ -30,6 +30,7 @@ from ironic.common import exception
 from ironic.common import states
 from ironic.conductor import rpcapi
 from ironic.drivers.modules import inspect_utils
+from ironic import objects
 from ironic.tests.unit.api import base as test_api_base
 from ironic.tests.unit.objects import utils as obj_utils
 
@@ -42,6 +43,7 @@ class TestLookup(test_api_base.BaseApiTest):
 
     def setUp(self):
         super(TestLookup, self).setUp()
+        self.addCleanup(ramdisk._LOOKUP_CACHE.clear)
         self.node = obj_utils.create_test_node(self.context,
                                                uuid=uuidutils.generate_uuid(),
                                                provision_state='deploying')
@@ -316,6 +318,59 @@ class TestLookup(test_api_base.BaseApiTest):
                 )
                 self.assertEqual(http_client.NOT_FOUND, response.status_int)
 
+    def _lookup_twice(self, expect_errors=True):
+        results = []
+        for _i in range(2):
+            results.append(self.get_json(
+                '/lookup?addresses=%s' % ','.join(self.addresses),
+                headers={api_base.Version.string: str(api_v1.max_version())},
+                expect_errors=expect_errors))
+        return results
+
+    @mock.patch.object(objects.Node, 'get_lookup_info_by_port_addresses',
+                       autospec=True)
+    def test_not_found_cached(self, mock_lookup):
+        mock_lookup.side_effect = exception.NodeNotFound(node='meow')
+        for response in self._lookup_twice():
+            self.assertEqual(http_client.NOT_FOUND, response.status_int)
+        mock_lookup.assert_called_once_with(mock.ANY, self.addresses)
+
+    @mock.patch.object(objects.Node, 'get_lookup_info_by_port_addresses',
+                       autospec=True)
+    def test_not_found_cache_disabled(self, mock_lookup):
+        CONF.set_override('ramdisk_lookup_cache_ttl', 0, 'api')
+        mock_lookup.side_effect = exception.NodeNotFound(node='meow')
+        for response in self._lookup_twice():
+            self.assertEqual(http_client.NOT_FOUND, response.status_int)
+        self.assertEqual(2, mock_lookup.call_count)
+        self.assertEqual({}, ramdisk._LOOKUP_CACHE)
+
+    def test_restrict_lookup_by_addresses_cached(self):
+        obj_utils.create_test_port(self.context,
+                                   node_id=self.node2.id,
+                                   address=self.addresses[1])
+        with mock.patch.object(
+                objects.Node, 'get_lookup_info_by_port_addresses',
+                autospec=True,
+                side_effect=objects.Node.get_lookup_info_by_port_addresses
+        ) as mock_lookup:
+            for response in self._lookup_twice():
+                self.assertEqual(http_client.NOT_FOUND, response.status_int)
+        mock_lookup.assert_called_once_with(mock.ANY, self.addresses)
+        self.assertFalse(self.mock_get_conductor_for.called)
+        self.assertFalse(self.mock_get_node_with_token.called)
+
+    def test_found_by_addresses_not_cached(self):
+        self._set_secret_mock(self.node, 'some-value')
+        obj_utils.create_test_port(self.context,
+                                   node_id=self.node.id,
+                                   address=self.addresses[1])
+        for data in self._lookup_twice(expect_errors=False):
+            self.assertEqual(self.node.uuid, data['node']['uuid'])
+        self.assertEqual(2, self.mock_get_node_with_token.call_count)
+        self.assertEqual({}, ramdisk._LOOKUP_CACHE)
+
+
 @mock.patch.object(rpcapi.ConductorAPI, 'get_topic_for',
                    lambda *n: 'test-topic')
 class TestHeartbeat(test_api_base.BaseApiTest):
@@ -325,6 +325,25 @@ class DefaultInterfaceTestCase(db_base.DbTestCase):
         iface = driver_factory.default_interface(self.driver, 'power')
         self.assertEqual('agent', iface)
 
+    @mock.patch.object(driver_factory.stevedore, 'ExtensionManager',
+                       autospec=True)
+    def test_calculated_fallback_without_loading(self, mock_ext_mgr):
+        self.config(default_power_interface=None)
+        self.config(enabled_power_interfaces=[])
+        iface = driver_factory.default_interface(self.driver, 'power')
+        self.assertEqual('agent', iface)
+        mock_ext_mgr.assert_not_called()
+
+    @mock.patch.object(driver_factory.importlib.metadata, 'entry_points',
+                       autospec=True, return_value=[])
+    def test_calculated_fallback_loading(self, mock_eps):
+        self.config(default_power_interface=None)
+        self.config(enabled_power_interfaces=[])
+        iface = driver_factory.default_interface(self.driver, 'power')
+        self.assertEqual('agent', iface)
+        mock_eps.assert_called_once_with(
+            group='ironic.hardware.interfaces.power')
+
     def test_calculated_no_answer_drivername(self):
         # manual-management instance (of entry-point driver named 'foo')
         # supports no power interfaces
@@ -537,6 +556,63 @@ class HardwareTypeLoadTestCase(db_base.DbTestCase):
                 getattr(task.driver, 'network').__class__.__name__,
                 'NeutronNetwork')
 
+    @mock.patch.object(driver_factory, 'get_interface', autospec=True,
+                       side_effect=driver_factory.get_interface)
+    def test_build_driver_for_task_cached(self, mock_get_interface):
+        node = obj_utils.create_test_node(self.context, driver='fake-hardware',
+                                          **self.node_kwargs)
+        with task_manager.acquire(self.context, node.id) as task:
+            driver1 = task.driver
+        self.assertEqual(2 * len(drivers_base.ALL_INTERFACES),
+                         mock_get_interface.call_count)
+        mock_get_interface.reset_mock()
+
+        with task_manager.acquire(self.context, node.id) as task:
+            driver2 = task.driver
+        mock_get_interface.assert_not_called()
+        self.assertIsNot(driver1, driver2)
+        for iface in drivers_base.ALL_INTERFACES:
+            self.assertIs(getattr(driver1, iface), getattr(driver2, iface))
+
+        # Replacing an interface on one driver does not affect others
+        driver2.deploy = None
+        with task_manager.acquire(self.context, node.id) as task:
+            self.assertIsNotNone(task.driver.deploy)
+
+    @mock.patch.object(driver_factory, 'check_and_update_node_interfaces',
+                       autospec=True,
+                       side_effect=driver_factory.check_and_update_node_interfaces)
+    def test_build_driver_for_task_cached_dirty(self, mock_check):
+        self.config(enabled_raid_interfaces=['fake', 'no-raid'])
+        node = obj_utils.create_test_node(self.context, driver='fake-hardware',
+                                          **self.node_kwargs)
+        with task_manager.acquire(self.context, node.id) as task:
+            driver_factory.build_driver_for_task(task)
+            mock_check.assert_called_once_with(task.node, hw_type=mock.ANY)
+            mock_check.reset_mock()
+
+            task.node.raid_interface = 'no-raid'
+            driver = driver_factory.build_driver_for_task(task)
+            mock_check.assert_called_once_with(task.node, hw_type=mock.ANY)
+            self.assertIsInstance(driver.raid, noop.NoRAID)
+
+            task.node.raid_interface = 'foobar'
+            self.assertRaises(exception.InterfaceNotFoundInEntrypoint,
+                              driver_factory.build_driver_for_task, task)
+
+    def test_build_driver_for_task_cache_cleared_on_reload(self):
+        node = obj_utils.create_test_node(self.context, driver='fake-hardware',
+                                          **self.node_kwargs)
+        with task_manager.acquire(self.context, node.id):
+            self.assertTrue(driver_factory._COMPOSITIONS)
+
+        self.config(enabled_power_interfaces=['ipmitool'])
+        driver_factory._INTERFACE_LOADERS['power']._extension_manager = None
+        driver_factory._INTERFACE_LOADERS['power']()
+        self.assertFalse(driver_factory._COMPOSITIONS)
+        self.assertRaises(exception.InterfaceNotFoundInEntrypoint,
+                          task_manager.acquire, self.context, node.id)
+
     def test_no_storage_interface(self):
         node = obj_utils.get_test_node(self.context)
         self.assertTrue(driver_factory.check_and_update_node_interfaces(node))
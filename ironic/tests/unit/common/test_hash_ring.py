@@ -193,6 +193,51 @@ class HashRingManagerTestCase(db_base.DbTestCase):
         self.assertEqual((None, 0), hash_ring.HashRingManager._hash_rings)
 
 
+    def test_topology_generation(self):
+        key = ':hardware-type' if self.use_groups else 'hardware-type'
+        self.register_conductors()
+        topology = self.ring_manager.topology
+        self.assertEqual(['host1', 'host2', 'host3', 'host4', 'host5'],
+                         topology.hosts)
+
+        # Reloading an unchanged topology keeps the generation and rings
+        hash_ring.HashRingManager.reset()
+        unchanged = self.ring_manager.topology
+        self.assertIsNot(topology, unchanged)
+        self.assertEqual(topology.generation, unchanged.generation)
+        self.assertIs(topology.rings(self.use_groups)[key],
+                      unchanged.rings(self.use_groups)[key])
+
+        c6 = self.dbapi.register_conductor({
+            'hostname': 'host6',
+            'drivers': ['driver1'],
+        })
+        self.dbapi.register_conductor_hardware_interfaces(
+            c6.id,
+            [{'hardware_type': 'other-type', 'interface_type': 'deploy',
+              'interface_name': 'direct', 'default': True}])
+        hash_ring.HashRingManager.reset()
+        changed = self.ring_manager.topology
+        self.assertEqual(topology.generation + 1, changed.generation)
+        self.assertIn('host6', changed.hosts)
+        rings = changed.rings(self.use_groups)
+        # Only the ring of the new hardware type is built
+        self.assertIs(unchanged.rings(self.use_groups)[key], rings[key])
+        new_key = ':other-type' if self.use_groups else 'other-type'
+        self.assertEqual(['host6'], list(rings[new_key].nodes))
+
+    def test_topology_conductor_without_hardware_types(self):
+        self.dbapi.register_conductor({'hostname': 'host1', 'drivers': []})
+        topology = self.ring_manager.topology
+        self.assertEqual(['host1'], topology.hosts)
+        self.assertEqual({}, topology.rings(self.use_groups))
+
+    def test_topology_shared(self):
+        self.register_conductors()
+        other = hash_ring.HashRingManager(use_groups=not self.use_groups)
+        self.assertIs(self.ring_manager.topology, other.topology)
+
+
 class HashRingManagerWithGroupsTestCase(HashRingManagerTestCase):
 
     use_groups = True
@@ -12,6 +12,7 @@
 
 import os
 import shutil
+import time
 from unittest import mock
 
 from ironic.common import exception
@@ -183,6 +184,38 @@ class LocalPublisherTestCase(db_base.DbTestCase):
         mock_unlink.assert_called_once_with(expected_file)
 
 
+    @mock.patch.object(os.path, 'getmtime', autospec=True)
+    def test_get_published_url(self, mock_getmtime):
+        mock_getmtime.return_value = time.time() - 100
+        self.assertEqual('http://localhost/redfish/boot.iso',
+                         self.publisher.get_published_url('boot.iso'))
+        self.assertEqual(
+            'http://localhost/redfish/boot.iso',
+            self.publisher.get_published_url('boot.iso', max_age=200))
+        self.assertIsNone(
+            self.publisher.get_published_url('boot.iso', max_age=50))
+        mock_getmtime.assert_called_with('/httpboot/redfish/boot.iso')
+
+        mock_getmtime.side_effect = FileNotFoundError
+        self.assertIsNone(self.publisher.get_published_url('boot.iso'))
+
+    @mock.patch.object(utils, 'unlink_without_raise', autospec=True)
+    @mock.patch.object(os.path, 'getmtime', autospec=True)
+    @mock.patch.object(os, 'listdir', autospec=True)
+    def test_unpublish_stale(self, mock_listdir, mock_getmtime, mock_unlink):
+        mock_listdir.return_value = ['shared-old.iso', 'shared-new.iso',
+                                     'boot-old.iso']
+        now = time.time()
+        mock_getmtime.side_effect = lambda path: (
+            now - 10 if 'new' in path else now - 1000)
+
+        self.publisher.unpublish_stale('shared-', 100)
+
+        mock_listdir.assert_called_once_with('/httpboot/redfish')
+        mock_unlink.assert_called_once_with(
+            '/httpboot/redfish/shared-old.iso')
+
+
 class NFSPublisherTestCase(db_base.DbTestCase):
 
     def setUp(self):
@@ -226,6 +226,102 @@ class TestApplyRules(TestInspectionRules):
         self.assertEqual(1, mock_apply_actions.call_count)
 
 
+class TestRulesPlan(TestInspectionRules):
+
+    def test_rules_plan_compiled_and_sorted(self):
+        high = obj_utils.create_test_inspection_rule(
+            self.context, priority=50)
+        plan = engine.get_rules_plan(self.context, 'main')
+        self.assertEqual(4, len(plan))
+        self.assertEqual(high.uuid, plan[0].uuid)
+        self.assertIsInstance(plan[0], engine.CompiledRule)
+        condition = plan[0].conditions[0]
+        self.assertIsInstance(condition.plugin,
+                              inspection_rules.operators.IsTrueOperator)
+        self.assertEqual({'value': '{node.auto_discovered}'},
+                         condition.prepared.args)
+        self.assertEqual({'value'}, condition.prepared.templates)
+        action = plan[0].actions[0]
+        self.assertIsInstance(action.plugin,
+                              inspection_rules.actions.SetAttributeAction)
+        self.assertEqual({'path': '/driver', 'value': 'idrac'},
+                         action.prepared.args)
+        self.assertEqual(set(), action.prepared.templates)
+
+    @mock.patch('ironic.objects.InspectionRule.list', autospec=True)
+    def test_rules_plan_cached(self, mock_list):
+        mock_list.return_value = [self.rule1]
+        plan = engine.get_rules_plan(self.context, 'main')
+        self.assertIs(plan, engine.get_rules_plan(self.context, 'main'))
+        mock_list.assert_called_once_with(context=self.context,
+                                          filters={'phase': 'main'})
+
+    def test_rules_plan_invalidated_on_change(self):
+        plan = engine.get_rules_plan(self.context, 'main')
+        self.assertEqual(3, len(plan))
+
+        new_rule = obj_utils.create_test_inspection_rule(self.context)
+        plan = engine.get_rules_plan(self.context, 'main')
+        self.assertEqual(4, len(plan))
+
+        new_rule.priority = 10
+        new_rule.save()
+        plan = engine.get_rules_plan(self.context, 'main')
+        self.assertEqual(new_rule.uuid, plan[0].uuid)
+
+        new_rule.destroy()
+        plan = engine.get_rules_plan(self.context, 'main')
+        self.assertEqual(3, len(plan))
+
+    @mock.patch.object(engine.time, 'monotonic', autospec=True)
+    @mock.patch('ironic.objects.InspectionRule.list', autospec=True)
+    def test_rules_plan_expires(self, mock_list, mock_time):
+        mock_list.return_value = [self.rule1]
+        mock_time.return_value = 100
+        engine.get_rules_plan(self.context, 'main')
+        mock_time.return_value = 100 + engine._PLAN_MAX_AGE
+        engine.get_rules_plan(self.context, 'main')
+        self.assertEqual(1, mock_list.call_count)
+        mock_time.return_value = 101 + engine._PLAN_MAX_AGE
+        engine.get_rules_plan(self.context, 'main')
+        self.assertEqual(2, mock_list.call_count)
+
+    @mock.patch.object(engine, 'get_built_in_rules', autospec=True)
+    @mock.patch('ironic.objects.InspectionRule.list', autospec=True)
+    def test_rules_plan_keeps_invalid_rule(self, mock_list, mock_built_in):
+        invalid = {'uuid': 'rule-1', 'conditions': [],
+                   'actions': [{'op': 'do-magic', 'args': {}}]}
+        mock_list.return_value = []
+        mock_built_in.return_value = [invalid]
+        self.assertEqual((invalid,),
+                         engine.get_rules_plan(self.context, 'main'))
+
+        with task_manager.acquire(self.context, self.node.uuid) as task:
+            self.assertRaisesRegex(exception.IronicException,
+                                   'Unsupported action',
+                                   engine.apply_rules, task, self.inventory,
+                                   self.plugin_data, 'main')
+
+    @mock.patch('ironic.objects.InspectionRule.list', autospec=True)
+    def test_apply_rules_twice_does_not_share_values(self, mock_list):
+        mock_list.return_value = [{
+            'uuid': 'rule-1', 'conditions': [],
+            'actions': [{'op': 'set-plugin-data',
+                         'args': {'path': 'extra',
+                                  'value': {'tags': ['a']}}}]}]
+
+        with task_manager.acquire(self.context, self.node.uuid) as task:
+            first = {}
+            engine.apply_rules(task, self.inventory, first, 'main')
+            first['extra']['tags'].append('b')
+            second = {}
+            engine.apply_rules(task, self.inventory, second, 'main')
+
+        self.assertEqual({'extra': {'tags': ['a', 'b']}}, first)
+        self.assertEqual({'extra': {'tags': ['a']}}, second)
+        self.assertEqual(1, mock_list.call_count)
+
+
 class TestCheckRule(TestInspectionRules):
 
     @mock.patch.object(engine, 'check_conditions', autospec=True)
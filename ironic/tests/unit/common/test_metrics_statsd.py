@@ -16,7 +16,6 @@
 import socket
 from unittest import mock
 
-
 from ironic.common import metrics_statsd
 from ironic.tests import base
 
@@ -29,6 +28,7 @@ def connect(family=None, type=None, proto=None):
 class TestStatsdMetricLogger(base.TestCase):
     def setUp(self):
         super(TestStatsdMetricLogger, self).setUp()
+        self.config(aggregation_interval=0, group='metrics_statsd')
         self.ml = metrics_statsd.StatsdMetricLogger('prefix', '.', 'test-host',
                                                     4321)
 
@@ -102,3 +102,122 @@ class TestStatsdMetricLogger(base.TestCase):
             b'part1.part2:5|type@0.5',
             ('test-host', 4321))
         mock_socket.close.assert_called_once_with()
+
+
+class TestStatsdAggregation(base.TestCase):
+    def setUp(self):
+        super(TestStatsdAggregation, self).setUp()
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.addCleanup(self.listener.close)
+        self.listener.bind(('127.0.0.1', 0))
+        self.listener.settimeout(5)
+        self.port = self.listener.getsockname()[1]
+        # Only flush explicitly unless a test needs the flusher thread
+        self.config(aggregation_interval=60, group='metrics_statsd')
+        self.addCleanup(metrics_statsd._stop_aggregators)
+        self.ml = metrics_statsd.StatsdMetricLogger('prefix', '.',
+                                                    '127.0.0.1', self.port)
+
+    def _flush(self):
+        metrics_statsd._get_aggregator(('127.0.0.1', self.port)).flush()
+
+    def _receive(self):
+        packets = []
+        self.listener.settimeout(0.2)
+        try:
+            while True:
+                packets.append(self.listener.recv(65535))
+        except socket.timeout:
+            pass
+        return packets
+
+    def test_aggregated(self):
+        self.ml.send_counter('counter', 1)
+        self.ml.send_counter('counter', 2)
+        self.ml.send_gauge('gauge', 10)
+        self.ml.send_gauge('gauge', 42)
+        self.ml.send_timer('timer', 5)
+        self.ml.send_timer('timer', 7)
+        self._flush()
+
+        packets = self._receive()
+        self.assertEqual(1, len(packets))
+        self.assertEqual(
+            ['counter:3|c', 'gauge:42|g', 'timer:5|ms', 'timer:7|ms'],
+            packets[0].decode().split('\n'))
+
+        # Nothing is sent until new metrics are recorded
+        self._flush()
+        self.assertEqual([], self._receive())
+
+    def test_counter_sample_rate(self):
+        self.ml._counter('counter', 1, sample_rate=0.5)
+        self.ml._counter('counter', 1)
+        self._flush()
+        self.assertEqual([b'counter:3.0|c'], self._receive())
+
+    def test_timer_sampled(self):
+        self.config(max_timer_samples=2, group='metrics_statsd')
+        for value in range(8):
+            self.ml.send_timer('timer', value)
+        self._flush()
+
+        lines = self._receive()[0].decode().split('\n')
+        self.assertEqual(2, len(lines))
+        for line in lines:
+            self.assertRegex(line, r'^timer:[0-7]\|ms\|@0\.25$')
+
+    def test_packet_size(self):
+        self.config(max_packet_size=512, group='metrics_statsd')
+        for index in range(100):
+            self.ml.send_gauge('gauge%02d' % index, index)
+        self._flush()
+
+        packets = self._receive()
+        self.assertGreater(len(packets), 1)
+        lines = []
+        for packet in packets:
+            self.assertLessEqual(len(packet), 512)
+            lines.extend(packet.decode().split('\n'))
+        self.assertEqual(['gauge%02d:%d|g' % (index, index)
+                          for index in range(100)], lines)
+
+    def test_shared_by_loggers(self):
+        other = metrics_statsd.StatsdMetricLogger('other', '.', '127.0.0.1',
+                                                  self.port)
+        self.ml.send_counter(self.ml.get_metric_name('counter'), 1)
+        other.send_counter(other.get_metric_name('counter'), 1)
+        self._flush()
+        self.assertEqual([b'prefix.counter:1|c\nother.counter:1|c'],
+                         self._receive())
+
+    def test_flusher_thread(self):
+        self.config(aggregation_interval=0.01, group='metrics_statsd')
+        self.ml.send_counter('counter', 1)
+        self.listener.settimeout(5)
+        self.assertEqual(b'counter:1|c', self.listener.recv(65535))
+        self.assertTrue(metrics_statsd._get_aggregator(
+            ('127.0.0.1', self.port))._thread.is_alive())
+
+    def test_stop_sends_remaining(self):
+        self.ml.send_gauge('gauge', 1)
+        metrics_statsd._stop_aggregators()
+        self.assertEqual([b'gauge:1|g'], self._receive())
+        self.assertEqual({}, metrics_statsd._AGGREGATORS)
+
+    @mock.patch.object(metrics_statsd.LOG, 'warning', autospec=True)
+    def test_send_error(self, mock_warning):
+        self.ml.send_gauge('gauge', 1)
+        aggregator = metrics_statsd._get_aggregator(('127.0.0.1', self.port))
+        aggregator._socket = mock.Mock()
+        aggregator._socket.sendto.side_effect = socket.error('boom')
+        aggregator.flush()
+        self.assertTrue(mock_warning.called)
+
+    @mock.patch.object(metrics_statsd.StatsdMetricLogger, '_send',
+                       autospec=True)
+    def test_immediate(self, mock_send):
+        self.config(aggregation_interval=0, group='metrics_statsd')
+        self.ml.send_timer('timer', 5)
+        mock_send.assert_called_once_with(self.ml, 'timer', 5, 'ms')
+        self.assertEqual({}, metrics_statsd._AGGREGATORS)
@@ -220,6 +220,13 @@ class TestNeutronNetworkActions(db_base.DbTestCase):
 
         self.client_mock.get_subnet.return_value = stubs.FakeNeutronSubnet(
             **self.subnet_data['subnet'])
+        self.client_mock.ports.side_effect = self._list_active_ports
+
+    def _list_active_ports(self, **filters):
+        if 'id' not in filters:
+            return mock.DEFAULT
+        return [stubs.FakeNeutronPort(id=port_id, status='ACTIVE')
+                for port_id in filters['id']]
 
     @mock.patch.object(neutron, 'update_neutron_port', autospec=True)
     def _test_add_ports_to_network(self, update_mock, is_client_id,
@@ -273,8 +280,8 @@ class TestNeutronNetworkActions(db_base.DbTestCase):
                 id='132f871f-eaec-4fed-9475-0d54465e0f01',
                 mac_address=port2.address,
                 fixed_ips=[])
-            self.client_mock.create_port.side_effect = [self.neutron_port,
-                                                        neutron_port2]
+            self.client_mock.create_ports.return_value = [self.neutron_port,
+                                                          neutron_port2]
             update_mock.side_effect = [self.neutron_port, neutron_port2]
             expected = {port.uuid: self.neutron_port.id,
                         port2.uuid: neutron_port2.id}
@@ -292,14 +299,14 @@ class TestNeutronNetworkActions(db_base.DbTestCase):
                 task, self.network_uuid, security_groups=security_groups)
             self.assertEqual(expected, ports)
             if add_all_ports or boot_not_pxe:
-                create_calls = [mock.call(**expected_create_attrs),
-                                mock.call(**expected_create_attrs2)]
                 update_calls = [
                     mock.call(self.context, self.neutron_port['id'],
                               expected_update_attrs),
                     mock.call(self.context, neutron_port2['id'],
                               expected_update_attrs2)]
-                self.client_mock.create_port.assert_has_calls(create_calls)
+                self.client_mock.create_ports.assert_called_once_with(
+                    [expected_create_attrs, expected_create_attrs2])
+                self.client_mock.create_port.assert_not_called()
                 update_mock.assert_has_calls(update_calls)
             else:
                 self.client_mock.create_port.assert_called_once_with(
@@ -523,11 +530,15 @@ class TestNeutronNetworkActions(db_base.DbTestCase):
             address='52:54:55:cf:2d:32',
             extra={'vif_port_id': uuidutils.generate_uuid()}
         )
+        self.client_mock.create_ports.side_effect = (
+            openstack_exc.OpenStackCloudException)
         self.client_mock.create_port.side_effect = [
             self.neutron_port, openstack_exc.OpenStackCloudException]
         update_mock.return_value = self.neutron_port
         with task_manager.acquire(self.context, self.node.uuid) as task:
             neutron.add_ports_to_network(task, self.network_uuid)
+            self.client_mock.create_ports.assert_called_once_with(mock.ANY)
+            self.assertEqual(2, self.client_mock.create_port.call_count)
             self.assertIn("Could not create neutron port for node's",
                           log_mock.warning.call_args_list[0][0][0])
             self.assertIn("Some errors were encountered when updating",
@@ -1092,7 +1103,7 @@ class TestNeutronNetworkActions(db_base.DbTestCase):
 
     @mock.patch.object(neutron, 'update_neutron_port', autospec=True)
     @mock.patch.object(neutron, 'wait_for_host_agent', autospec=True)
-    @mock.patch.object(neutron, 'wait_for_port_status', autospec=True)
+    @mock.patch.object(neutron, 'wait_for_ports_status', autospec=True)
     def test_add_smartnic_port_to_network(
             self, wait_port_mock, wait_agent_mock, update_mock):
         # Ports will be created only if pxe_enabled is True
@@ -1130,6 +1141,7 @@ class TestNeutronNetworkActions(db_base.DbTestCase):
         # Ensure we can create ports
         self.client_mock.create_port.return_value = self.neutron_port
         update_mock.return_value = self.neutron_port
+        wait_port_mock.return_value = set()
         expected = {port.uuid: self.neutron_port.id}
         with task_manager.acquire(self.context, self.node.uuid) as task:
             ports = neutron.add_ports_to_network(task, self.network_uuid)
@@ -1141,8 +1153,7 @@ class TestNeutronNetworkActions(db_base.DbTestCase):
             wait_agent_mock.assert_called_once_with(
                 self.client_mock, 'hostname')
             wait_port_mock.assert_called_once_with(
-                self.client_mock, self.neutron_port.id, 'ACTIVE',
-                fail_on_binding_failure=True)
+                self.client_mock, [self.neutron_port.id], 'ACTIVE')
 
     @mock.patch.object(neutron, 'is_smartnic_port', autospec=True)
     @mock.patch.object(neutron, 'wait_for_host_agent', autospec=True)
@@ -1161,6 +1172,92 @@ class TestNeutronNetworkActions(db_base.DbTestCase):
         wait_agent_mock.assert_called_once_with(self.client_mock, 'hostname')
 
 
+@mock.patch.object(time, 'sleep', autospec=True)
+class TestNeutronBulkPortBinding(db_base.DbTestCase):
+
+    def setUp(self):
+        super(TestNeutronBulkPortBinding, self).setUp()
+        self.config(add_all_ports=True, fail_on_port_binding_failure=True,
+                    group='neutron')
+        self.node = object_utils.create_test_node(
+            self.context, network_interface='neutron')
+        self.ports = [
+            object_utils.create_test_port(
+                self.context, node_id=self.node.id,
+                uuid=uuidutils.generate_uuid(),
+                address='52:54:00:cf:2d:%02x' % i)
+            for i in range(3)]
+        self.network_uuid = uuidutils.generate_uuid()
+        self.client = stubs.StubNeutronClient(polls_until_active=3)
+        patcher = mock.patch.object(neutron, 'get_client', autospec=True,
+                                    return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_add_ports_to_network(self, sleep_mock):
+        with task_manager.acquire(self.context, self.node.uuid) as task:
+            ports = neutron.add_ports_to_network(task, self.network_uuid)
+
+        self.assertEqual({p.uuid for p in self.ports}, set(ports))
+        # One request creates all the ports, and every status poll covers
+        # all the ports which are not active yet.
+        self.assertEqual(1, self.client.calls['create_ports'])
+        self.assertEqual(0, self.client.calls['create_port'])
+        self.assertEqual(3, self.client.calls['update_port'])
+        self.assertEqual(3, self.client.calls['ports'])
+
+    def test_add_ports_to_network_binding_failed(self, sleep_mock):
+        self.client.binding_failed_macs.add(self.ports[1].address)
+        with task_manager.acquire(self.context, self.node.uuid) as task:
+            ports = neutron.add_ports_to_network(task, self.network_uuid)
+
+        self.assertEqual({self.ports[0].uuid, self.ports[2].uuid},
+                         set(ports))
+        self.assertEqual(3, self.client.calls['ports'])
+
+    def test_add_smartnic_ports_to_network(self, sleep_mock):
+        for port in self.ports:
+            port.is_smartnic = True
+            port.local_link_connection = dict(port.local_link_connection,
+                                              hostname='host1')
+            port.save()
+        self.client.agents_alive['host1'] = True
+        with task_manager.acquire(self.context, self.node.uuid) as task:
+            ports = neutron.add_ports_to_network(task, self.network_uuid)
+
+        self.assertEqual(3, len(ports))
+        self.assertEqual(1, self.client.calls['agents'])
+
+    def test_wait_for_ports_status_max_retry(self, sleep_mock):
+        port = self.client.create_port(mac_address='52:54:00:cf:2d:ff')
+        self.client.polls_until_active = 10
+        with mock.patch.object(neutron._poll_ports_status.retry, 'stop',
+                               tenacity.stop_after_attempt(3)):
+            self.assertRaisesRegex(exception.NetworkError, port.id,
+                                   neutron.wait_for_ports_status,
+                                   self.client, [port.id], 'ACTIVE')
+        self.assertEqual(3, self.client.calls['ports'])
+
+    def test_wait_for_host_agent_cached(self, sleep_mock):
+        self.client.agents_alive['host1'] = True
+        self.assertTrue(neutron.wait_for_host_agent(self.client, 'host1'))
+        self.assertTrue(neutron.wait_for_host_agent(self.client, 'host1'))
+        self.assertEqual(1, self.client.calls['agents'])
+
+        # An agent seen down is validated again
+        self.client.agents_alive['host1'] = False
+        self.assertTrue(neutron.wait_for_host_agent(self.client, 'host1',
+                                                    target_state='down'))
+        self.assertNotIn('host1', neutron._ALIVE_HOST_AGENTS)
+
+    def test_wait_for_host_agent_cache_disabled(self, sleep_mock):
+        self.config(neutron_agent_status_cache_ttl=0, group='agent')
+        self.client.agents_alive['host1'] = True
+        self.assertTrue(neutron.wait_for_host_agent(self.client, 'host1'))
+        self.assertTrue(neutron.wait_for_host_agent(self.client, 'host1'))
+        self.assertEqual(2, self.client.calls['agents'])
+
+
 @mock.patch.object(neutron, 'get_client', autospec=True)
 class TestValidateNetwork(base.TestCase):
     def setUp(self):
@@ -585,6 +585,56 @@ class JinjaTemplatingTestCase(base.TestCase):
                                                self.params))
         jinja_fsl_mock.assert_called_once_with('/path/to')
 
+    @mock.patch('ironic.common.utils.jinja2.FileSystemLoader', autospec=True)
+    def test_render_file_cached(self, jinja_fsl_mock):
+        path = '/path/to/template.j2'
+        loader = jinja2.DictLoader({'template.j2': self.template})
+        jinja_fsl_mock.return_value = loader
+        for _i in range(3):
+            self.assertEqual(self.expected,
+                             utils.render_template(path, self.params))
+        jinja_fsl_mock.assert_called_once_with('/path/to')
+
+        # The template is reloaded when the source changes
+        loader.mapping['template.j2'] = '{{ bar }}'
+        self.assertEqual('ham', utils.render_template(path, self.params))
+        # A separate environment is used for strict rendering
+        self.assertRaises(jinja2.exceptions.UndefinedError,
+                          utils.render_template, path, {}, strict=True)
+        self.assertEqual('', utils.render_template(path, {}))
+
+    def test_render_file_modified(self):
+        tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tempdir)
+        path = os.path.join(tempdir, 'template.j2')
+        with open(path, 'w') as fp:
+            fp.write(self.template)
+        self.assertEqual(self.expected,
+                         utils.render_template(path, self.params))
+
+        with open(path, 'w') as fp:
+            fp.write('{{ bar }}')
+        # Make sure the modification time changes
+        mtime = os.path.getmtime(path) + 10
+        os.utime(path, (mtime, mtime))
+        self.assertEqual('ham', utils.render_template(path, self.params))
+
+    @mock.patch.object(jinja2.sandbox.SandboxedEnvironment, 'from_string',
+                       autospec=True,
+                       side_effect=jinja2.sandbox.SandboxedEnvironment
+                       .from_string)
+    def test_render_string_cached(self, mock_from_string):
+        for _i in range(3):
+            self.assertEqual(self.expected,
+                             utils.render_template(self.template,
+                                                   self.params,
+                                                   is_file=False))
+        self.assertEqual(1, mock_from_string.call_count)
+        self.assertRaises(jinja2.exceptions.UndefinedError,
+                          utils.render_template, self.template, {},
+                          is_file=False, strict=True)
+        self.assertEqual(2, mock_from_string.call_count)
+
     def test_render_bogus_string(self):
         """Jinja explicitly blocks access access to .__ delimited items."""
         self.assertRaises(jinja2.exceptions.SecurityError,
@@ -21,6 +21,7 @@ from ironic.common import exception
 from ironic.conductor import allocations
 from ironic.conductor import manager
 from ironic.conductor import task_manager
+from ironic.db import api as dbapi
 from ironic import objects
 from ironic.tests.unit.conductor import mgr_utils
 from ironic.tests.unit.db import base as db_base
@@ -377,23 +378,76 @@ class DoAllocateTestCase(db_base.DbTestCase):
         # All nodes are filtered out on the database level.
         self.assertFalse(mock_acquire.called)
 
+    @mock.patch.object(task_manager, 'acquire', autospec=True,
+                       side_effect=task_manager.acquire)
+    def test_nodes_filtered_out_traits(self, mock_acquire):
+        # Only one of the requested traits
+        node = obj_utils.create_test_node(self.context,
+                                          uuid=uuidutils.generate_uuid(),
+                                          resource_class='x-large',
+                                          power_state='power off',
+                                          provision_state='available')
+        db_utils.create_test_node_traits(['tr1', 'tr3'], node_id=node.id)
+        # No traits at all
+        obj_utils.create_test_node(self.context,
+                                   uuid=uuidutils.generate_uuid(),
+                                   resource_class='x-large',
+                                   power_state='power off',
+                                   provision_state='available')
+
+        allocation = obj_utils.create_test_allocation(self.context,
+                                                      resource_class='x-large',
+                                                      traits=['tr1', 'tr2'])
+        allocations.do_allocate(self.context, allocation)
+        self.assertIn('no suitable nodes have the requested traits',
+                      allocation['last_error'])
+        self.assertEqual('error', allocation['state'])
+
+        # All nodes are filtered out on the database level.
+        self.assertFalse(mock_acquire.called)
+
     @mock.patch.object(task_manager, 'acquire', autospec=True,
                        side_effect=task_manager.acquire)
     def test_nodes_locked(self, mock_acquire):
+        self.config(node_locked_retry_attempts=2, group='conductor')
+        obj_utils.create_test_node(self.context,
+                                   uuid=uuidutils.generate_uuid(),
+                                   maintenance=False,
+                                   resource_class='x-large',
+                                   power_state='power off',
+                                   provision_state='available',
+                                   reservation='example.com')
+        obj_utils.create_test_node(self.context,
+                                   uuid=uuidutils.generate_uuid(),
+                                   resource_class='x-large',
+                                   power_state='power off',
+                                   provision_state='available',
+                                   reservation='example.com')
+
+        allocation = obj_utils.create_test_allocation(self.context,
+                                                      resource_class='x-large')
+        allocations.do_allocate(self.context, allocation)
+        self.assertIn('could not reserve any of 2', allocation['last_error'])
+        self.assertEqual('error', allocation['state'])
+
+        # Locked nodes are skipped without trying to lock them.
+        self.assertFalse(mock_acquire.called)
+
+    @mock.patch.object(task_manager, 'acquire', autospec=True)
+    def test_nodes_locked_concurrently(self, mock_acquire):
         self.config(node_locked_retry_attempts=2, group='conductor')
         node1 = obj_utils.create_test_node(self.context,
                                            uuid=uuidutils.generate_uuid(),
-                                           maintenance=False,
                                            resource_class='x-large',
                                            power_state='power off',
-                                           provision_state='available',
-                                           reservation='example.com')
+                                           provision_state='available')
         node2 = obj_utils.create_test_node(self.context,
                                            uuid=uuidutils.generate_uuid(),
                                            resource_class='x-large',
                                            power_state='power off',
-                                           provision_state='available',
-                                           reservation='example.com')
+                                           provision_state='available')
+        mock_acquire.side_effect = exception.NodeLocked(node='fake',
+                                                        host='fake')
 
         allocation = obj_utils.create_test_allocation(self.context,
                                                       resource_class='x-large')
@@ -410,6 +464,102 @@ class DoAllocateTestCase(db_base.DbTestCase):
             self.assertEqual(set(nodes[offset:offset + 2]),
                              {node1.uuid, node2.uuid})
 
+    @mock.patch.object(allocations, '_CANDIDATE_PAGE_SIZE', 2)
+    @mock.patch.object(task_manager, 'acquire', autospec=True,
+                       side_effect=task_manager.acquire)
+    def test_nodes_checked_in_pages(self, mock_acquire):
+        nodes = [obj_utils.create_test_node(self.context,
+                                            uuid=uuidutils.generate_uuid(),
+                                            resource_class='x-large',
+                                            power_state='power off',
+                                            provision_state='available',
+                                            reservation='example.com')
+                 for _ in range(4)]
+        node = obj_utils.create_test_node(self.context,
+                                          uuid=uuidutils.generate_uuid(),
+                                          resource_class='x-large',
+                                          power_state='power off',
+                                          provision_state='available')
+        candidates = [allocations._Candidate(n.id, n.uuid, n.name)
+                      for n in nodes + [node]]
+        allocation = obj_utils.create_test_allocation(self.context,
+                                                      resource_class='x-large')
+
+        with mock.patch.object(dbapi.IMPL, 'get_nodeinfo_list',
+                               autospec=True,
+                               side_effect=dbapi.IMPL.get_nodeinfo_list
+                               ) as mock_get:
+            allocations._allocate_node(self.context, allocation, candidates)
+
+        self.assertEqual(node.id, allocation.node_id)
+        mock_acquire.assert_called_once_with(
+            self.context, node.uuid, shared=False, retry=False,
+            load_driver=False, purpose='allocating')
+        # One query per page of candidates, in the order of the candidates.
+        pages = [call[1]['filters']['uuid_in']
+                 for call in mock_get.call_args_list]
+        self.assertEqual([[n.uuid for n in nodes[:2]],
+                          [n.uuid for n in nodes[2:]],
+                          [node.uuid]], pages)
+
+    def test_parallel_allocations_same_candidates(self):
+        nodes = [obj_utils.create_test_node(self.context,
+                                            uuid=uuidutils.generate_uuid(),
+                                            resource_class='x-large',
+                                            power_state='power off',
+                                            provision_state='available')
+                 for _ in range(3)]
+        alloc1 = obj_utils.create_test_allocation(self.context,
+                                                  resource_class='x-large')
+        alloc2 = obj_utils.create_test_allocation(
+            self.context, uuid=uuidutils.generate_uuid(),
+            name='another', resource_class='x-large')
+
+        # Both allocations fetched the same candidates in the same order
+        # before any of them reserved a node.
+        with mock.patch.object(allocations.random, 'shuffle', autospec=True):
+            candidates1 = allocations._candidate_nodes(self.context, alloc1)
+            candidates2 = allocations._candidate_nodes(self.context, alloc2)
+        self.assertEqual(candidates1, candidates2)
+        self.assertEqual([node.id for node in nodes],
+                         [node.id for node in candidates1])
+
+        with mock.patch.object(task_manager, 'acquire', autospec=True,
+                               side_effect=task_manager.acquire) as mock_acq:
+            allocations._allocate_node(self.context, alloc1, candidates1)
+            allocations._allocate_node(self.context, alloc2, candidates2)
+
+        self.assertEqual(nodes[0].id, alloc1.node_id)
+        self.assertEqual(nodes[1].id, alloc2.node_id)
+        # The node allocated by the first allocation is not locked again.
+        self.assertEqual([nodes[0].uuid, nodes[1].uuid],
+                         [call[0][1] for call in mock_acq.call_args_list])
+
+    def test_nodes_partially_locked(self):
+        obj_utils.create_test_node(self.context,
+                                   uuid=uuidutils.generate_uuid(),
+                                   resource_class='x-large',
+                                   power_state='power off',
+                                   provision_state='available',
+                                   reservation='example.com')
+        node = obj_utils.create_test_node(self.context,
+                                          uuid=uuidutils.generate_uuid(),
+                                          resource_class='x-large',
+                                          power_state='power off',
+                                          provision_state='available')
+
+        allocation = obj_utils.create_test_allocation(self.context,
+                                                      resource_class='x-large')
+        allocations.do_allocate(self.context, allocation)
+        self.assertIsNone(allocation['last_error'])
+        self.assertEqual('active', allocation['state'])
+        self.assertEqual(node.id, allocation['node_id'])
+
+        node = objects.Node.get_by_uuid(self.context, node['uuid'])
+        self.assertEqual(allocation['uuid'], node['instance_uuid'])
+        # The reservation is released after the allocation.
+        self.assertIsNone(node['reservation'])
+
     @mock.patch.object(task_manager, 'acquire', autospec=True)
     def test_nodes_changed_after_lock(self, mock_acquire):
         nodes = [obj_utils.create_test_node(self.context,
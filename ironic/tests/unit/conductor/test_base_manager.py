@@ -30,6 +30,7 @@ from ironic.common import utils as common_utils
 from ironic.conductor import base_manager
 from ironic.conductor import manager
 from ironic.conductor import notification_utils
+from ironic.conductor import periodics as conductor_periodics
 from ironic.conductor import task_manager
 from ironic.db import api as dbapi
 from ironic.drivers import fake_hardware
@@ -126,6 +127,8 @@ class StartStopTestCase(mgr_utils.ServiceSetUpMixin, db_base.DbTestCase):
                                                     self.hostname)
             self.assertEqual(restart_names, res['drivers'])
 
+    @mock.patch.object(conductor_periodics, 'instrument', autospec=True,
+                       side_effect=lambda name, func: func)
     @mock.patch.object(base_manager.BaseConductorManager,
                        '_register_and_validate_hardware_interfaces',
                        autospec=True)
@@ -133,7 +136,8 @@ class StartStopTestCase(mgr_utils.ServiceSetUpMixin, db_base.DbTestCase):
     @mock.patch.object(driver_factory, 'hardware_types', autospec=True)
     def test_start_registers_driver_specific_tasks(self,
                                                    mock_hw_types, mock_ifaces,
-                                                   mock_reg_hw_ifaces):
+                                                   mock_reg_hw_ifaces,
+                                                   mock_instrument):
         class TestHwType(generic.GenericHardware):
             @property
             def supported_management_interfaces(self):
@@ -181,6 +185,13 @@ class StartStopTestCase(mgr_utils.ServiceSetUpMixin, db_base.DbTestCase):
         self.assertTrue(periodics.is_periodic(hw_type.task))
         self.assertNotIn(hw_type.task, tasks)
 
+        # every periodic task reports its runs
+        mock_instrument.assert_has_calls(
+            [mock.call('TestInterface.iface', iface1.iface),
+             mock.call('TestInterface2.iface', iface2.iface)],
+            any_order=True)
+        self.assertEqual(len(tasks), mock_instrument.call_count)
+
     @mock.patch.object(driver_factory.HardwareTypesFactory, '__init__',
                        autospec=True)
     def test_start_fails_on_missing_driver(self, mock_df):
@@ -258,6 +269,26 @@ class StartStopTestCase(mgr_utils.ServiceSetUpMixin, db_base.DbTestCase):
             self.assertEqual(state[1], node.provision_state,
                              'Test failed when recovering from %s' % state[0])
 
+    @mock.patch.object(base_manager.BaseConductorManager,
+                       '_mapped_to_this_conductor', autospec=True)
+    def test_start_update_provision_deadlines(self, mock_mapped):
+        CONF.set_override('deploy_callback_timeout', 100, 'conductor')
+        nodes = [obj_utils.create_test_node(self.context, uuid=uuid.uuid4(),
+                                            driver='fake-hardware',
+                                            provision_state=states.DEPLOYWAIT)
+                 for _ in range(2)]
+        for node in nodes:
+            self.dbapi.update_node(node.id, {'provision_deadline': None})
+        mock_mapped.side_effect = (
+            lambda self, node_uuid, *args: node_uuid == nodes[0].uuid)
+
+        self._start_service()
+        # Only the nodes mapped to this conductor are updated
+        self.assertIsNotNone(
+            self.dbapi.get_node_by_id(nodes[0].id).provision_deadline)
+        self.assertIsNone(
+            self.dbapi.get_node_by_id(nodes[1].id).provision_deadline)
+
     @mock.patch.object(base_manager.BaseConductorManager, '_spawn_worker',
                        autospec=True)
     @mock.patch.object(base_manager, 'LOG', autospec=True)
@@ -2411,7 +2411,7 @@ class CheckTimeoutsTestCase(mgr_utils.ServiceSetUpMixin, db_base.DbTestCase):
             target_provision_state=states.ACTIVE,
             provision_updated_at=datetime.datetime(2000, 1, 1, 0, 0))
 
-        self.service._check_deploy_timeouts(self.context)
+        self.service._check_provision_deadlines(self.context)
         node.refresh()
         self.assertEqual(states.DEPLOYFAIL, node.provision_state)
         self.assertEqual(states.ACTIVE, node.target_provision_state)
@@ -2434,7 +2434,7 @@ class CheckTimeoutsTestCase(mgr_utils.ServiceSetUpMixin, db_base.DbTestCase):
                 'cleaning_reboot': manual,
                 'clean_step_index': 0})
 
-        self.service._check_cleanwait_timeouts(self.context)
+        self.service._check_provision_deadlines(self.context)
         node.refresh()
         self.assertEqual(states.CLEANFAIL, node.provision_state)
         self.assertEqual(tgt_prov_state, node.target_provision_state)
@@ -2473,7 +2473,7 @@ class CheckTimeoutsTestCase(mgr_utils.ServiceSetUpMixin, db_base.DbTestCase):
             target_provision_state=tgt_prov_state,
             provision_updated_at=datetime.datetime(2000, 1, 1, 0, 0))
 
-        self.service._check_rescuewait_timeouts(self.context)
+        self.service._check_provision_deadlines(self.context)
         node.refresh()
         self.assertEqual(states.RESCUEFAIL, node.provision_state)
         self.assertEqual(tgt_prov_state, node.target_provision_state)
@@ -2497,7 +2497,7 @@ class CheckTimeoutsTestCase(mgr_utils.ServiceSetUpMixin, db_base.DbTestCase):
             target_provision_state=tgt_prov_state,
             provision_updated_at=datetime.datetime(2000, 1, 1, 0, 0))
 
-        self.service._check_servicewait_timeouts(self.context)
+        self.service._check_provision_deadlines(self.context)
         node.refresh()
         self.assertEqual(states.SERVICEFAIL, node.provision_state)
         self.assertEqual(tgt_prov_state, node.target_provision_state)
@@ -4370,7 +4370,7 @@ class MiscTestCase(mgr_utils.ServiceSetUpMixin, mgr_utils.CommonMixIn,
                        autospec=True)
     @mock.patch.object(manager.ConductorManager, '_mapped_to_this_conductor',
                        autospec=True)
-    @mock.patch.object(dbapi.IMPL, 'get_nodeinfo_list', autospec=True)
+    @mock.patch.object(dbapi.IMPL, 'iter_nodeinfo', autospec=True)
     def test_iter_nodes(self, mock_nodeinfo_list, mock_mapped,
                         mock_fail_if_state):
         self._start_service()
@@ -4404,7 +4404,7 @@ class MiscTestCase(mgr_utils.ServiceSetUpMixin, mgr_utils.CommonMixIn,
                                     last_error=mock.ANY)]
         mock_fail_if_state.assert_has_calls(expected_calls)
 
-    @mock.patch.object(dbapi.IMPL, 'get_nodeinfo_list', autospec=True)
+    @mock.patch.object(dbapi.IMPL, 'iter_nodeinfo', autospec=True)
     def test_iter_nodes_shutdown(self, mock_nodeinfo_list):
         self._start_service()
         self.columns = ['uuid', 'driver', 'conductor_group', 'id']
@@ -5266,7 +5266,7 @@ class SensorsTestCase(mgr_utils.ServiceSetUpMixin, db_base.DbTestCase):
                        autospec=True)
     @mock.patch.object(manager.ConductorManager, '_mapped_to_this_conductor',
                        autospec=True)
-    @mock.patch.object(dbapi.IMPL, 'get_nodeinfo_list', autospec=True)
+    @mock.patch.object(dbapi.IMPL, 'iter_nodeinfo', autospec=True)
     def test___send_sensor_data(self, get_nodeinfo_list_mock,
                                 _mapped_to_this_conductor_mock,
                                 mock_spawn):
@@ -5289,7 +5289,7 @@ class SensorsTestCase(mgr_utils.ServiceSetUpMixin, db_base.DbTestCase):
                        autospec=True)
     @mock.patch.object(manager.ConductorManager, '_mapped_to_this_conductor',
                        autospec=True)
-    @mock.patch.object(dbapi.IMPL, 'get_nodeinfo_list', autospec=True)
+    @mock.patch.object(dbapi.IMPL, 'iter_nodeinfo', autospec=True)
     def test___send_sensor_data_disabled(
             self, get_nodeinfo_list_mock,
             _mapped_to_this_conductor_mock,
@@ -5324,7 +5324,7 @@ class SensorsTestCase(mgr_utils.ServiceSetUpMixin, db_base.DbTestCase):
                 autospec=True)
     @mock.patch.object(manager.ConductorManager, '_mapped_to_this_conductor',
                        autospec=True)
-    @mock.patch.object(dbapi.IMPL, 'get_nodeinfo_list', autospec=True)
+    @mock.patch.object(dbapi.IMPL, 'iter_nodeinfo', autospec=True)
     def test___send_sensor_data_multiple_workers(
             self, get_nodeinfo_list_mock, _mapped_to_this_conductor_mock,
             mock_spawn):
@@ -5354,7 +5354,7 @@ class SensorsTestCase(mgr_utils.ServiceSetUpMixin, db_base.DbTestCase):
                 autospec=True)
     @mock.patch.object(manager.ConductorManager, '_mapped_to_this_conductor',
                        autospec=True)
-    @mock.patch.object(dbapi.IMPL, 'get_nodeinfo_list', autospec=True)
+    @mock.patch.object(dbapi.IMPL, 'iter_nodeinfo', autospec=True)
     def test___send_sensor_data_one_worker(
             self, get_nodeinfo_list_mock, _mapped_to_this_conductor_mock,
             mock_spawn):
@@ -6431,7 +6431,7 @@ class ManagerDoSyncPowerStateTestCase(db_base.DbTestCase):
 @mock.patch.object(task_manager, 'acquire', autospec=True)
 @mock.patch.object(manager.ConductorManager, '_mapped_to_this_conductor',
                    autospec=True)
-@mock.patch.object(dbapi.IMPL, 'get_nodeinfo_list', autospec=True)
+@mock.patch.object(dbapi.IMPL, 'iter_nodeinfo', autospec=True)
 class ManagerSyncPowerStatesTestCase(mgr_utils.CommonMixIn,
                                      db_base.DbTestCase):
     def setUp(self):
@@ -6727,7 +6727,7 @@ class ManagerSyncPowerStatesTestCase(mgr_utils.CommonMixIn,
 @mock.patch.object(task_manager, 'acquire', autospec=True)
 @mock.patch.object(manager.ConductorManager, '_mapped_to_this_conductor',
                    autospec=True)
-@mock.patch.object(dbapi.IMPL, 'get_nodeinfo_list', autospec=True)
+@mock.patch.object(dbapi.IMPL, 'iter_nodeinfo', autospec=True)
 class ManagerPowerRecoveryTestCase(mgr_utils.CommonMixIn,
                                    db_base.DbTestCase):
     def setUp(self):
@@ -6896,13 +6896,14 @@ class ManagerPowerRecoveryTestCase(mgr_utils.CommonMixIn,
 @mock.patch.object(manager.ConductorManager, '_mapped_to_this_conductor',
                    autospec=True)
 @mock.patch.object(dbapi.IMPL, 'get_nodeinfo_list', autospec=True)
-class ManagerCheckDeployTimeoutsTestCase(mgr_utils.CommonMixIn,
-                                         db_base.DbTestCase):
+class ManagerCheckProvisionDeadlinesTestCase(mgr_utils.CommonMixIn,
+                                             db_base.DbTestCase):
     def setUp(self):
-        super(ManagerCheckDeployTimeoutsTestCase, self).setUp()
-        self.config(deploy_callback_timeout=300, group='conductor')
+        super(ManagerCheckProvisionDeadlinesTestCase, self).setUp()
         self.service = manager.ConductorManager('hostname', 'test-topic')
         self.service.dbapi = self.dbapi
+        self.service._executor = futurist.SynchronousExecutor()
+        self.service._reserved_executor = None
 
         self.node = self._create_node(provision_state=states.DEPLOYWAIT,
                                       target_provision_state=states.ACTIVE)
@@ -6913,20 +6914,26 @@ class ManagerCheckDeployTimeoutsTestCase(mgr_utils.CommonMixIn,
         self.task2 = self._create_task(node=self.node2)
 
         self.filters = {'reserved': False, 'maintenance': False,
-                        'provisioned_before': 300,
-                        'provision_state': states.DEPLOYWAIT}
-        self.columns = ['uuid', 'driver', 'conductor_group']
+                        'provision_deadline_passed': True}
+        self.columns = ['uuid', 'driver', 'conductor_group',
+                        'provision_state']
+        self.deploy_fail_call = mock.call(
+            'fail',
+            callback=self.service._spawn_worker,
+            call_args=(conductor_utils.cleanup_after_timeout, self.task),
+            err_handler=conductor_utils.provisioning_error_handler,
+            target_state=None)
 
     def _assert_get_nodeinfo_args(self, get_nodeinfo_mock):
         get_nodeinfo_mock.assert_called_once_with(
             columns=self.columns, filters=self.filters,
-            sort_key='provision_updated_at', sort_dir='asc')
+            sort_key='provision_deadline', sort_dir='asc')
 
     def test_not_mapped(self, get_nodeinfo_mock, mapped_mock, acquire_mock):
         get_nodeinfo_mock.return_value = self._get_nodeinfo_list_response()
         mapped_mock.return_value = False
 
-        self.service._check_deploy_timeouts(self.context)
+        self.service._check_provision_deadlines(self.context)
 
         self._assert_get_nodeinfo_args(get_nodeinfo_mock)
         mapped_mock.assert_called_once_with(self.service,
@@ -6934,64 +6941,94 @@ class ManagerCheckDeployTimeoutsTestCase(mgr_utils.CommonMixIn,
                                             self.node.conductor_group)
         self.assertFalse(acquire_mock.called)
 
-    def test_timeout(self, get_nodeinfo_mock, mapped_mock, acquire_mock):
+    def test_deploy_timeout(self, get_nodeinfo_mock, mapped_mock,
+                            acquire_mock):
         get_nodeinfo_mock.return_value = self._get_nodeinfo_list_response()
         mapped_mock.return_value = True
         acquire_mock.side_effect = self._get_acquire_side_effect(self.task)
 
-        self.service._check_deploy_timeouts(self.context)
+        self.service._check_provision_deadlines(self.context)
 
         self._assert_get_nodeinfo_args(get_nodeinfo_mock)
-        mapped_mock.assert_called_once_with(self.service,
-                                            self.node.uuid, self.node.driver,
-                                            self.node.conductor_group)
         acquire_mock.assert_called_once_with(self.context, self.node.uuid,
                                              purpose=mock.ANY)
-        self.task.process_event.assert_called_with(
+        self.task.process_event.assert_called_once_with(
+            *self.deploy_fail_call.args, **self.deploy_fail_call.kwargs)
+
+    def test_cleanwait_timeout(self, get_nodeinfo_mock, mapped_mock,
+                               acquire_mock):
+        self.node.provision_state = states.CLEANWAIT
+        self.node.target_provision_state = states.AVAILABLE
+        get_nodeinfo_mock.return_value = self._get_nodeinfo_list_response()
+        mapped_mock.return_value = True
+        acquire_mock.side_effect = self._get_acquire_side_effect(self.task)
+
+        self.service._check_provision_deadlines(self.context)
+
+        self.task.process_event.assert_called_once_with(
             'fail',
             callback=self.service._spawn_worker,
-            call_args=(conductor_utils.cleanup_after_timeout, self.task),
+            call_args=(conductor_utils.cleanup_cleanwait_timeout, self.task),
+            err_handler=None,
+            target_state=states.AVAILABLE)
+
+    def test_inspectwait_timeout(self, get_nodeinfo_mock, mapped_mock,
+                                 acquire_mock):
+        self.node.provision_state = states.INSPECTWAIT
+        self.node.target_provision_state = states.MANAGEABLE
+        get_nodeinfo_mock.return_value = self._get_nodeinfo_list_response()
+        mapped_mock.return_value = True
+        acquire_mock.side_effect = self._get_acquire_side_effect(self.task)
+
+        self.service._check_provision_deadlines(self.context)
+
+        self.task.process_event.assert_called_once_with(
+            'fail',
+            callback=self.service._spawn_worker,
+            call_args=(conductor_utils.cleanup_inspectwait_timeout,
+                       self.task),
             err_handler=conductor_utils.provisioning_error_handler,
             target_state=None)
 
+    def test_not_waiting_state(self, get_nodeinfo_mock, mapped_mock,
+                               acquire_mock):
+        self.node.provision_state = states.ACTIVE
+        get_nodeinfo_mock.return_value = self._get_nodeinfo_list_response()
+        mapped_mock.return_value = True
+
+        self.service._check_provision_deadlines(self.context)
+
+        self.assertFalse(acquire_mock.called)
+
     def test_acquire_node_disappears(self, get_nodeinfo_mock, mapped_mock,
                                      acquire_mock):
-        get_nodeinfo_mock.return_value = self._get_nodeinfo_list_response()
+        get_nodeinfo_mock.return_value = (
+            self._get_nodeinfo_list_response([self.node, self.node2]))
         mapped_mock.return_value = True
-        acquire_mock.side_effect = exception.NodeNotFound(node='fake')
+        acquire_mock.side_effect = self._get_acquire_side_effect(
+            [exception.NodeNotFound(node='fake'), self.task2])
 
-        # Exception eaten
-        self.service._check_deploy_timeouts(self.context)
+        # Exception eaten, the next node is processed
+        self.service._check_provision_deadlines(self.context)
 
-        self._assert_get_nodeinfo_args(get_nodeinfo_mock)
-        mapped_mock.assert_called_once_with(self.service,
-                                            self.node.uuid,
-                                            self.node.driver,
-                                            self.node.conductor_group)
-        acquire_mock.assert_called_once_with(self.context,
-                                             self.node.uuid,
-                                             purpose=mock.ANY)
-        self.assertFalse(self.task.spawn_after.called)
+        self.assertEqual(2, acquire_mock.call_count)
+        self.assertFalse(self.task.process_event.called)
+        self.assertTrue(self.task2.process_event.called)
 
     def test_acquire_node_locked(self, get_nodeinfo_mock, mapped_mock,
                                  acquire_mock):
-        get_nodeinfo_mock.return_value = self._get_nodeinfo_list_response()
+        get_nodeinfo_mock.return_value = (
+            self._get_nodeinfo_list_response([self.node, self.node2]))
         mapped_mock.return_value = True
-        acquire_mock.side_effect = exception.NodeLocked(node='fake',
-                                                        host='fake')
+        acquire_mock.side_effect = self._get_acquire_side_effect(
+            [exception.NodeLocked(node='fake', host='fake'), self.task2])
 
-        # Exception eaten
-        self.service._check_deploy_timeouts(self.context)
+        # Exception eaten, the next node is processed
+        self.service._check_provision_deadlines(self.context)
 
-        self._assert_get_nodeinfo_args(get_nodeinfo_mock)
-        mapped_mock.assert_called_once_with(self.service,
-                                            self.node.uuid,
-                                            self.node.driver,
-                                            self.node.conductor_group)
-        acquire_mock.assert_called_once_with(self.context,
-                                             self.node.uuid,
-                                             purpose=mock.ANY)
-        self.assertFalse(self.task.spawn_after.called)
+        self.assertEqual(2, acquire_mock.call_count)
+        self.assertFalse(self.task.process_event.called)
+        self.assertTrue(self.task2.process_event.called)
 
     def test_no_deploywait_after_lock(self, get_nodeinfo_mock, mapped_mock,
                                       acquire_mock):
@@ -7002,17 +7039,12 @@ class ManagerCheckDeployTimeoutsTestCase(mgr_utils.CommonMixIn,
         mapped_mock.return_value = True
         acquire_mock.side_effect = self._get_acquire_side_effect(task)
 
-        self.service._check_deploy_timeouts(self.context)
+        self.service._check_provision_deadlines(self.context)
 
-        self._assert_get_nodeinfo_args(get_nodeinfo_mock)
-        mapped_mock.assert_called_once_with(self.service,
-                                            self.node.uuid,
-                                            self.node.driver,
-                                            self.node.conductor_group)
         acquire_mock.assert_called_once_with(self.context,
                                              self.node.uuid,
                                              purpose=mock.ANY)
-        self.assertFalse(task.spawn_after.called)
+        self.assertFalse(task.process_event.called)
 
     def test_maintenance_after_lock(self, get_nodeinfo_mock, mapped_mock,
                                     acquire_mock):
@@ -7027,25 +7059,17 @@ class ManagerCheckDeployTimeoutsTestCase(mgr_utils.CommonMixIn,
         acquire_mock.side_effect = (
             self._get_acquire_side_effect([task, self.task2]))
 
-        self.service._check_deploy_timeouts(self.context)
+        self.service._check_provision_deadlines(self.context)
 
-        self._assert_get_nodeinfo_args(get_nodeinfo_mock)
-        self.assertEqual([mock.call(self.service,
-                                    self.node.uuid, task.node.driver,
-                                    task.node.conductor_group),
-                          mock.call(self.service,
-                                    self.node2.uuid, self.node2.driver,
-                                    self.node2.conductor_group)],
-                         mapped_mock.call_args_list)
         self.assertEqual([mock.call(self.context, self.node.uuid,
                                     purpose=mock.ANY),
                           mock.call(self.context, self.node2.uuid,
                                     purpose=mock.ANY)],
                          acquire_mock.call_args_list)
         # First node skipped
-        self.assertFalse(task.spawn_after.called)
-        # Second node spawned
-        self.task2.process_event.assert_called_with(
+        self.assertFalse(task.process_event.called)
+        # Second node failed
+        self.task2.process_event.assert_called_once_with(
             'fail',
             callback=self.service._spawn_worker,
             call_args=(conductor_utils.cleanup_after_timeout, self.task2),
@@ -7061,9 +7085,8 @@ class ManagerCheckDeployTimeoutsTestCase(mgr_utils.CommonMixIn,
             [(self.task, exception.NoFreeConductorWorker()), self.task2])
 
         # Exception should be nuked
-        self.service._check_deploy_timeouts(self.context)
+        self.service._check_provision_deadlines(self.context)
 
-        self._assert_get_nodeinfo_args(get_nodeinfo_mock)
         # mapped should be only called for the first node as we should
         # have exited the loop early due to NoFreeConductorWorker
         mapped_mock.assert_called_once_with(self.service,
@@ -7073,12 +7096,8 @@ class ManagerCheckDeployTimeoutsTestCase(mgr_utils.CommonMixIn,
         acquire_mock.assert_called_once_with(self.context,
                                              self.node.uuid,
                                              purpose=mock.ANY)
-        self.task.process_event.assert_called_with(
-            'fail',
-            callback=self.service._spawn_worker,
-            call_args=(conductor_utils.cleanup_after_timeout, self.task),
-            err_handler=conductor_utils.provisioning_error_handler,
-            target_state=None)
+        self.task.process_event.assert_called_once_with(
+            *self.deploy_fail_call.args, **self.deploy_fail_call.kwargs)
 
     def test_exiting_with_other_exception(self, get_nodeinfo_mock,
                                           mapped_mock, acquire_mock):
@@ -7090,10 +7109,9 @@ class ManagerCheckDeployTimeoutsTestCase(mgr_utils.CommonMixIn,
 
         # Should re-raise
         self.assertRaises(exception.IronicException,
-                          self.service._check_deploy_timeouts,
+                          self.service._check_provision_deadlines,
                           self.context)
 
-        self._assert_get_nodeinfo_args(get_nodeinfo_mock)
         # mapped should be only called for the first node as we should
         # have exited the loop early due to unknown exception
         mapped_mock.assert_called_once_with(self.service,
@@ -7102,12 +7120,8 @@ class ManagerCheckDeployTimeoutsTestCase(mgr_utils.CommonMixIn,
         acquire_mock.assert_called_once_with(self.context,
                                              self.node.uuid,
                                              purpose=mock.ANY)
-        self.task.process_event.assert_called_with(
-            'fail',
-            callback=self.service._spawn_worker,
-            call_args=(conductor_utils.cleanup_after_timeout, self.task),
-            err_handler=conductor_utils.provisioning_error_handler,
-            target_state=None)
+        self.task.process_event.assert_called_once_with(
+            *self.deploy_fail_call.args, **self.deploy_fail_call.kwargs)
 
     def test_worker_limit(self, get_nodeinfo_mock, mapped_mock, acquire_mock):
         self.config(periodic_max_workers=2, group='conductor')
@@ -7121,7 +7135,7 @@ class ManagerCheckDeployTimeoutsTestCase(mgr_utils.CommonMixIn,
         acquire_mock.side_effect = (
             self._get_acquire_side_effect([self.task] * 3))
 
-        self.service._check_deploy_timeouts(self.context)
+        self.service._check_provision_deadlines(self.context)
 
         # Should only have ran 2.
         self.assertEqual([mock.call(self.service,
@@ -7131,13 +7145,7 @@ class ManagerCheckDeployTimeoutsTestCase(mgr_utils.CommonMixIn,
         self.assertEqual([mock.call(self.context, self.node.uuid,
                                     purpose=mock.ANY)] * 2,
                          acquire_mock.call_args_list)
-        process_event_call = mock.call(
-            'fail',
-            callback=self.service._spawn_worker,
-            call_args=(conductor_utils.cleanup_after_timeout, self.task),
-            err_handler=conductor_utils.provisioning_error_handler,
-            target_state=None)
-        self.assertEqual([process_event_call] * 2,
+        self.assertEqual([self.deploy_fail_call] * 2,
                          self.task.process_event.call_args_list)
 
 
@@ -7598,7 +7606,7 @@ class GetStepsForAutomatedCleaningTestCase(mgr_utils.ServiceSetUpMixin,
 @mock.patch.object(task_manager, 'acquire', autospec=True)
 @mock.patch.object(manager.ConductorManager, '_mapped_to_this_conductor',
                    autospec=True)
-@mock.patch.object(dbapi.IMPL, 'get_nodeinfo_list', autospec=True)
+@mock.patch.object(dbapi.IMPL, 'iter_nodeinfo', autospec=True)
 class ManagerSyncLocalStateTestCase(mgr_utils.CommonMixIn, db_base.DbTestCase):
 
     def setUp(self):
@@ -7782,7 +7790,7 @@ class NodeInspectHardware(mgr_utils.ServiceSetUpMixin, db_base.DbTestCase):
             provision_updated_at=datetime.datetime(2000, 1, 1, 0, 0),
             inspection_started_at=datetime.datetime(2000, 1, 1, 0, 0))
 
-        self.service._check_inspect_wait_timeouts(self.context)
+        self.service._check_provision_deadlines(self.context)
         node.refresh()
         self.assertEqual(states.INSPECTFAIL, node.provision_state)
         self.assertEqual(states.MANAGEABLE, node.target_provision_state)
@@ -7848,255 +7856,6 @@ class NodeInspectHardware(mgr_utils.ServiceSetUpMixin, db_base.DbTestCase):
         self._test_inspect_hardware_validate_fail(mock_validate)
 
 
-@mock.patch.object(conductor_utils, 'node_history_record',
-                   mock.Mock(spec=conductor_utils.node_history_record))
-@mock.patch.object(task_manager, 'acquire', autospec=True)
-@mock.patch.object(manager.ConductorManager, '_mapped_to_this_conductor',
-                   autospec=True)
-@mock.patch.object(dbapi.IMPL, 'get_nodeinfo_list', autospec=True)
-class ManagerCheckInspectWaitTimeoutsTestCase(mgr_utils.CommonMixIn,
-                                              db_base.DbTestCase):
-    def setUp(self):
-        super(ManagerCheckInspectWaitTimeoutsTestCase, self).setUp()
-        self.config(inspect_wait_timeout=300, group='conductor')
-        self.service = manager.ConductorManager('hostname', 'test-topic')
-        self.service.dbapi = self.dbapi
-
-        self.node = self._create_node(provision_state=states.INSPECTWAIT,
-                                      target_provision_state=states.MANAGEABLE)
-        self.task = self._create_task(node=self.node)
-
-        self.node2 = self._create_node(
-            provision_state=states.INSPECTWAIT,
-            target_provision_state=states.MANAGEABLE)
-        self.task2 = self._create_task(node=self.node2)
-
-        self.filters = {'reserved': False,
-                        'maintenance': False,
-                        'inspection_started_before': 300,
-                        'provision_state': states.INSPECTWAIT}
-        self.columns = ['uuid', 'driver', 'conductor_group']
-
-    def _assert_get_nodeinfo_args(self, get_nodeinfo_mock):
-        get_nodeinfo_mock.assert_called_once_with(
-            sort_dir='asc', columns=self.columns, filters=self.filters,
-            sort_key='inspection_started_at')
-
-    def test__check_inspect_timeouts_not_mapped(self, get_nodeinfo_mock,
-                                                mapped_mock, acquire_mock):
-        get_nodeinfo_mock.return_value = self._get_nodeinfo_list_response()
-        mapped_mock.return_value = False
-
-        self.service._check_inspect_wait_timeouts(self.context)
-
-        self._assert_get_nodeinfo_args(get_nodeinfo_mock)
-        mapped_mock.assert_called_once_with(self.service,
-                                            self.node.uuid, self.node.driver,
-                                            self.node.conductor_group)
-        self.assertFalse(acquire_mock.called)
-
-    def test__check_inspect_timeout(self, get_nodeinfo_mock,
-                                    mapped_mock, acquire_mock):
-        get_nodeinfo_mock.return_value = self._get_nodeinfo_list_response()
-        mapped_mock.return_value = True
-        acquire_mock.side_effect = self._get_acquire_side_effect(self.task)
-
-        self.service._check_inspect_wait_timeouts(self.context)
-
-        self._assert_get_nodeinfo_args(get_nodeinfo_mock)
-        mapped_mock.assert_called_once_with(self.service,
-                                            self.node.uuid, self.node.driver,
-                                            self.node.conductor_group)
-        acquire_mock.assert_called_once_with(self.context, self.node.uuid,
-                                             purpose=mock.ANY)
-        self.task.process_event.assert_called_with(
-            'fail', callback=mock.ANY, call_args=mock.ANY,
-            err_handler=mock.ANY, target_state=None)
-
-    def test__check_inspect_timeouts_acquire_node_disappears(self,
-                                                             get_nodeinfo_mock,
-                                                             mapped_mock,
-                                                             acquire_mock):
-        get_nodeinfo_mock.return_value = self._get_nodeinfo_list_response()
-        mapped_mock.return_value = True
-        acquire_mock.side_effect = exception.NodeNotFound(node='fake')
-
-        # Exception eaten
-        self.service._check_inspect_wait_timeouts(self.context)
-
-        self._assert_get_nodeinfo_args(get_nodeinfo_mock)
-        mapped_mock.assert_called_once_with(self.service,
-                                            self.node.uuid,
-                                            self.node.driver,
-                                            self.node.conductor_group)
-        acquire_mock.assert_called_once_with(self.context,
-                                             self.node.uuid,
-                                             purpose=mock.ANY)
-        self.assertFalse(self.task.process_event.called)
-
-    def test__check_inspect_timeouts_acquire_node_locked(self,
-                                                         get_nodeinfo_mock,
-                                                         mapped_mock,
-                                                         acquire_mock):
-        get_nodeinfo_mock.return_value = self._get_nodeinfo_list_response()
-        mapped_mock.return_value = True
-        acquire_mock.side_effect = exception.NodeLocked(node='fake',
-                                                        host='fake')
-
-        # Exception eaten
-        self.service._check_inspect_wait_timeouts(self.context)
-
-        self._assert_get_nodeinfo_args(get_nodeinfo_mock)
-        mapped_mock.assert_called_once_with(self.service,
-                                            self.node.uuid,
-                                            self.node.driver,
-                                            self.node.conductor_group)
-        acquire_mock.assert_called_once_with(self.context,
-                                             self.node.uuid,
-                                             purpose=mock.ANY)
-        self.assertFalse(self.task.process_event.called)
-
-    def test__check_inspect_timeouts_no_acquire_after_lock(self,
-                                                           get_nodeinfo_mock,
-                                                           mapped_mock,
-                                                           acquire_mock):
-        task = self._create_task(
-            node_attrs=dict(provision_state=states.AVAILABLE,
-                            uuid=self.node.uuid))
-        get_nodeinfo_mock.return_value = self._get_nodeinfo_list_response()
-        mapped_mock.return_value = True
-        acquire_mock.side_effect = self._get_acquire_side_effect(task)
-
-        self.service._check_inspect_wait_timeouts(self.context)
-
-        self._assert_get_nodeinfo_args(get_nodeinfo_mock)
-        mapped_mock.assert_called_once_with(self.service,
-                                            self.node.uuid,
-                                            self.node.driver,
-                                            self.node.conductor_group)
-        acquire_mock.assert_called_once_with(self.context,
-                                             self.node.uuid,
-                                             purpose=mock.ANY)
-        self.assertFalse(task.process_event.called)
-
-    def test__check_inspect_timeouts_to_maintenance_after_lock(
-            self, get_nodeinfo_mock, mapped_mock, acquire_mock):
-        task = self._create_task(
-            node_attrs=dict(provision_state=states.INSPECTWAIT,
-                            target_provision_state=states.MANAGEABLE,
-                            maintenance=True,
-                            uuid=self.node.uuid))
-        get_nodeinfo_mock.return_value = (
-            self._get_nodeinfo_list_response([task.node, self.node2]))
-        mapped_mock.return_value = True
-        acquire_mock.side_effect = (
-            self._get_acquire_side_effect([task, self.task2]))
-
-        self.service._check_inspect_wait_timeouts(self.context)
-
-        self._assert_get_nodeinfo_args(get_nodeinfo_mock)
-        self.assertEqual([mock.call(self.service,
-                                    self.node.uuid, task.node.driver,
-                                    task.node.conductor_group),
-                          mock.call(self.service,
-                                    self.node2.uuid, self.node2.driver,
-                                    self.node2.conductor_group)],
-                         mapped_mock.call_args_list)
-        self.assertEqual([mock.call(self.context, self.node.uuid,
-                                    purpose=mock.ANY),
-                          mock.call(self.context, self.node2.uuid,
-                                    purpose=mock.ANY)],
-                         acquire_mock.call_args_list)
-        # First node skipped
-        self.assertFalse(task.process_event.called)
-        # Second node spawned
-        self.task2.process_event.assert_called_with(
-            'fail', callback=mock.ANY, call_args=mock.ANY,
-            err_handler=mock.ANY, target_state=None)
-
-    def test__check_inspect_timeouts_exiting_no_worker_avail(
-            self, get_nodeinfo_mock, mapped_mock, acquire_mock):
-        get_nodeinfo_mock.return_value = (
-            self._get_nodeinfo_list_response([self.node, self.node2]))
-        mapped_mock.return_value = True
-        acquire_mock.side_effect = self._get_acquire_side_effect(
-            [(self.task, exception.NoFreeConductorWorker()), self.task2])
-
-        # Exception should be nuked
-        self.service._check_inspect_wait_timeouts(self.context)
-
-        self._assert_get_nodeinfo_args(get_nodeinfo_mock)
-        # mapped should be only called for the first node as we should
-        # have exited the loop early due to NoFreeConductorWorker
-        mapped_mock.assert_called_once_with(self.service,
-                                            self.node.uuid,
-                                            self.node.driver,
-                                            self.node.conductor_group)
-        acquire_mock.assert_called_once_with(self.context,
-                                             self.node.uuid,
-                                             purpose=mock.ANY)
-        self.task.process_event.assert_called_with(
-            'fail', callback=mock.ANY, call_args=mock.ANY,
-            err_handler=mock.ANY, target_state=None)
-
-    def test__check_inspect_timeouts_exit_with_other_exception(
-            self, get_nodeinfo_mock, mapped_mock, acquire_mock):
-        get_nodeinfo_mock.return_value = (
-            self._get_nodeinfo_list_response([self.node, self.node2]))
-        mapped_mock.return_value = True
-        acquire_mock.side_effect = self._get_acquire_side_effect(
-            [(self.task, exception.IronicException('foo')), self.task2])
-
-        # Should re-raise
-        self.assertRaises(exception.IronicException,
-                          self.service._check_inspect_wait_timeouts,
-                          self.context)
-
-        self._assert_get_nodeinfo_args(get_nodeinfo_mock)
-        # mapped should be only called for the first node as we should
-        # have exited the loop early due to unknown exception
-        mapped_mock.assert_called_once_with(self.service,
-                                            self.node.uuid,
-                                            self.node.driver,
-                                            self.node.conductor_group)
-        acquire_mock.assert_called_once_with(self.context,
-                                             self.node.uuid,
-                                             purpose=mock.ANY)
-        self.task.process_event.assert_called_with(
-            'fail', callback=mock.ANY, call_args=mock.ANY,
-            err_handler=mock.ANY, target_state=None)
-
-    def test__check_inspect_timeouts_worker_limit(self, get_nodeinfo_mock,
-                                                  mapped_mock, acquire_mock):
-        self.config(periodic_max_workers=2, group='conductor')
-
-        # Use the same nodes/tasks to make life easier in the tests
-        # here
-
-        get_nodeinfo_mock.return_value = (
-            self._get_nodeinfo_list_response([self.node] * 3))
-        mapped_mock.return_value = True
-        acquire_mock.side_effect = (
-            self._get_acquire_side_effect([self.task] * 3))
-
-        self.service._check_inspect_wait_timeouts(self.context)
-
-        # Should only have ran 2.
-        self.assertEqual([mock.call(self.service,
-                                    self.node.uuid, self.node.driver,
-                                    self.node.conductor_group)] * 2,
-                         mapped_mock.call_args_list)
-        self.assertEqual([mock.call(self.context, self.node.uuid,
-                                    purpose=mock.ANY)] * 2,
-                         acquire_mock.call_args_list)
-        process_event_call = mock.call('fail', callback=mock.ANY,
-                                       call_args=mock.ANY,
-                                       err_handler=mock.ANY,
-                                       target_state=None)
-        self.assertEqual([process_event_call] * 2,
-                         self.task.process_event.call_args_list)
-
-
 @mgr_utils.mock_record_keepalive
 class DestroyPortTestCase(mgr_utils.ServiceSetUpMixin, db_base.DbTestCase):
     def test_destroy_port(self):
@@ -9988,6 +9747,49 @@ class ConcurrentActionLimitTestCase(mgr_utils.ServiceSetUpMixin,
         CONF.set_override('conductor_group', 'group-b', group='conductor')
         self.service._concurrent_action_limit('cleaning')
 
+    def test_concurrent_action_limit_cached_count(self):
+        CONF.set_override('action_count_cache_ttl', 10, group='conductor')
+        self.node1.provision_state = states.DEPLOYING
+        self.node1.save()
+        CONF.set_override('max_concurrent_deploy', 6, group='conductor')
+        count = self.dbapi.count_nodes_in_provision_state
+        with mock.patch.object(self.dbapi, 'count_nodes_in_provision_state',
+                               autospec=True, side_effect=count) as mock_count:
+            # Counted once, then the accepted requests are added to the
+            # cached count while at least half of the slots are free.
+            self.service._concurrent_action_limit('provisioning')
+            self.service._concurrent_action_limit('provisioning')
+            mock_count.assert_called_once_with(
+                [states.DEPLOYING, states.DEPLOYWAIT], conductor_group=None)
+            # Closer to the limit the nodes are counted again.
+            self.service._concurrent_action_limit('provisioning')
+            self.assertEqual(2, mock_count.call_count)
+            # The nodes are counted again before rejecting a request.
+            CONF.set_override('max_concurrent_deploy', 3, group='conductor')
+            self.node2.provision_state = states.DEPLOYWAIT
+            self.node2.save()
+            self.node3.provision_state = states.DEPLOYWAIT
+            self.node3.save()
+            self.assertRaises(
+                exception.ConcurrentActionLimit,
+                self.service._concurrent_action_limit,
+                'provisioning')
+            self.assertEqual(3, mock_count.call_count)
+            # A recount below the limit accepts the request.
+            self.node3.provision_state = states.ACTIVE
+            self.node3.save()
+            self.service._concurrent_action_limit('provisioning')
+            self.assertEqual(4, mock_count.call_count)
+
+    def test_concurrent_action_limit_cache_disabled(self):
+        CONF.set_override('action_count_cache_ttl', 0, group='conductor')
+        with mock.patch.object(self.dbapi, 'count_nodes_in_provision_state',
+                               autospec=True, return_value=0) as mock_count:
+            self.service._concurrent_action_limit('cleaning')
+            self.service._concurrent_action_limit('unprovisioning')
+        self.assertEqual(2, mock_count.call_count)
+        self.assertEqual({}, conductor_utils._ACTION_COUNTS)
+
 
 @mgr_utils.mock_record_keepalive
 class ContinueInspectionTestCase(mgr_utils.ServiceSetUpMixin,
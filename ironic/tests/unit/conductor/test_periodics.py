@@ -133,6 +133,25 @@ class NodePeriodicTestCase(db_base.DbTestCase):
         # 1 node not found, 1 locked
         self.assertEqual(2, mock_log.call_count)
 
+    @mock.patch.object(periodics.METRICS, 'send_gauge', autospec=True)
+    def test_simple_metrics(self, mock_gauge, mock_iter_nodes):
+        node2 = obj_utils.create_test_node(self.context,
+                                           uuid=uuidutils.generate_uuid(),
+                                           reservation='host0')
+        mock_iter_nodes.return_value = iter([
+            (uuidutils.generate_uuid(), 'driver1', ''),
+            (self.uuid, 'driver2', 'group'),
+            (node2.uuid, 'driver3', 'group'),
+        ])
+
+        self.service.simple(self.ctx)
+
+        mock_gauge.assert_has_calls([
+            mock.call('PeriodicTestService.simple.NodesScanned', 3),
+            mock.call('PeriodicTestService.simple.NodesActedOn', 1),
+            mock.call('PeriodicTestService.simple.NodesLocked', 1),
+        ])
+
     def test_exclusive(self, mock_iter_nodes):
         mock_iter_nodes.return_value = iter([
             (uuidutils.generate_uuid(), 'driver1', ''),
@@ -173,6 +192,22 @@ class NodePeriodicTestCase(db_base.DbTestCase):
                                                 filters=None, fields=())
         self.assertEqual([self.uuid] * 3, self.service.nodes)
 
+    @mock.patch.object(periodics.METRICS, 'send_gauge', autospec=True)
+    @mock.patch.object(task_manager, 'acquire', autospec=True)
+    def test_limit_metrics(self, mock_acquire, mock_gauge, mock_iter_nodes):
+        mock_iter_nodes.return_value = iter([
+            (self.uuid, 'driver1', ''),
+        ] * 10)
+        mock_acquire.return_value.__enter__.return_value.node.uuid = self.uuid
+
+        self.service.limit(self.ctx)
+
+        mock_gauge.assert_has_calls([
+            mock.call('PeriodicTestService.limit.NodesScanned', 3),
+            mock.call('PeriodicTestService.limit.NodesActedOn', 3),
+            mock.call('PeriodicTestService.limit.NodesLocked', 0),
+        ])
+
     @mock.patch.object(task_manager, 'acquire', autospec=True)
     def test_stop(self, mock_acquire, mock_iter_nodes):
         mock_iter_nodes.return_value = iter([
@@ -242,3 +277,48 @@ class NodePeriodicTestCase(db_base.DbTestCase):
         # ...while the subclass-bound periodic processes it.
         sub_iface.simple(self.service, self.context)
         self.assertEqual([self.uuid], sub_iface.nodes)
+
+
+@mock.patch.object(periodics.time, 'monotonic', autospec=True)
+@mock.patch.object(periodics, 'METRICS', autospec=True)
+class InstrumentTestCase(db_base.DbTestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        @periodics.periodic(spacing=60)
+        def task(arg):
+            self.calls.append(arg)
+
+        self.calls = []
+        self.task = periodics.instrument('Owner.task', task)
+
+    def test_instrument(self, mock_metrics, mock_monotonic):
+        self.assertTrue(self.task._is_periodic)
+        self.assertEqual(60, self.task._periodic_spacing)
+
+        mock_monotonic.side_effect = [100, 110]
+        self.task('first')
+        self.assertEqual(['first'], self.calls)
+        mock_metrics.send_timer.assert_called_once_with(
+            'Owner.task.RunTime', 10000)
+        mock_metrics.send_counter.assert_not_called()
+
+        # Started 5 seconds late and overran the spacing
+        mock_monotonic.side_effect = [165, 235]
+        mock_metrics.reset_mock()
+        self.task('second')
+        self.assertEqual(['first', 'second'], self.calls)
+        mock_metrics.send_timer.assert_has_calls([
+            mock.call('Owner.task.StartDelay', 5000),
+            mock.call('Owner.task.RunTime', 70000),
+        ])
+        mock_metrics.send_counter.assert_called_once_with(
+            'Owner.task.Overrun', 1)
+
+    def test_instrument_failure(self, mock_metrics, mock_monotonic):
+        self.calls = None  # make the task fail
+        mock_monotonic.side_effect = [100, 101]
+        self.assertRaises(AttributeError, self.task, 'first')
+        mock_metrics.send_timer.assert_called_once_with(
+            'Owner.task.RunTime', 1000)
@@ -228,6 +228,49 @@ class RPCAPITestCase(db_base.DbTestCase):
         rpcapi = conductor_rpcapi.ConductorAPI(topic='fake-topic')
         self.assertRaises(exception.TemporaryFailure, rpcapi.get_random_topic)
 
+    def test_get_random_topic_cached(self):
+        CONF.set_override('host', 'fake-host')
+        self.dbapi.register_conductor({'hostname': 'fake-host', 'drivers': []})
+
+        rpcapi = conductor_rpcapi.ConductorAPI(topic='fake-topic')
+        with mock.patch.object(
+                self.dbapi, 'get_active_conductor_topology',
+                wraps=self.dbapi.get_active_conductor_topology
+        ) as mock_topology:
+            for _ in range(3):
+                self.assertEqual('fake-topic.fake-host',
+                                 rpcapi.get_random_topic())
+            mock_topology.assert_called_once_with()
+
+    def test_get_random_topic_new_conductor(self):
+        CONF.set_override('host', 'fake-host')
+
+        rpcapi = conductor_rpcapi.ConductorAPI(topic='fake-topic')
+        self.assertRaises(exception.TemporaryFailure, rpcapi.get_random_topic)
+        self.dbapi.register_conductor({'hostname': 'fake-host', 'drivers': []})
+        self.assertEqual('fake-topic.fake-host', rpcapi.get_random_topic())
+
+    def test_get_topic_for_driver_cached(self):
+        CONF.set_override('host', 'fake-host')
+        c = self.dbapi.register_conductor({
+            'hostname': 'fake-host',
+            'drivers': [],
+        })
+        self.dbapi.register_conductor_hardware_interfaces(
+            c.id,
+            [{'hardware_type': 'fake-driver', 'interface_type': 'deploy',
+              'interface_name': 'direct', 'default': True}]
+        )
+        rpcapi = conductor_rpcapi.ConductorAPI(topic='fake-topic')
+        with mock.patch.object(
+                self.dbapi, 'get_active_conductor_topology',
+                wraps=self.dbapi.get_active_conductor_topology
+        ) as mock_topology:
+            for _ in range(3):
+                self.assertEqual('fake-topic.fake-host',
+                                 rpcapi.get_topic_for_driver('fake-driver'))
+            mock_topology.assert_called_once_with()
+
     def _test_can_send_create_port(self, can_send):
         rpcapi = conductor_rpcapi.ConductorAPI(topic='fake-topic')
         with mock.patch.object(rpcapi.client,
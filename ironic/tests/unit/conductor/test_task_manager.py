@@ -193,6 +193,45 @@ class TaskManagerTestCase(db_base.DbTestCase):
         reserve_mock.assert_has_calls(expected_calls)
         self.assertEqual(2, reserve_mock.call_count)
 
+    @mock.patch.object(task_manager, 'METRICS', autospec=True)
+    def test_excl_lock_metrics(
+            self, mock_metrics, get_voltgt_mock, get_volconn_mock,
+            get_portgroups_mock, get_ports_mock, build_driver_mock,
+            reserve_mock, release_mock, node_get_mock):
+        self.config(node_locked_retry_attempts=3, group='conductor')
+        reserve_mock.side_effect = [
+            exception.NodeLocked(node='foo', host='foo'),
+            exception.NodeLocked(node='foo', host='foo'),
+            self.node]
+
+        with task_manager.TaskManager(self.context, 'fake-node-id'):
+            pass
+
+        mock_metrics.send_timer.assert_called_once_with(
+            'TaskManager.LockWait', mock.ANY)
+        mock_metrics.send_counter.assert_called_once_with(
+            'TaskManager.LockRetries', 2)
+
+    @mock.patch.object(task_manager, 'METRICS', autospec=True)
+    def test_excl_lock_metrics_failed(
+            self, mock_metrics, get_voltgt_mock, get_volconn_mock,
+            get_portgroups_mock, get_ports_mock, build_driver_mock,
+            reserve_mock, release_mock, node_get_mock):
+        self.config(node_locked_retry_attempts=2, group='conductor')
+        reserve_mock.side_effect = exception.NodeLocked(node='foo',
+                                                        host='foo')
+
+        self.assertRaises(exception.NodeLocked,
+                          task_manager.TaskManager,
+                          self.context, 'fake-node-id')
+
+        mock_metrics.send_timer.assert_called_once_with(
+            'TaskManager.LockWait', mock.ANY)
+        mock_metrics.send_counter.assert_has_calls([
+            mock.call('TaskManager.LockFailed', 1),
+            mock.call('TaskManager.LockRetries', 1),
+        ])
+
     def test_excl_lock_exception_no_retries(
             self, get_voltgt_mock, get_volconn_mock, get_portgroups_mock,
             get_ports_mock, build_driver_mock,
@@ -18,6 +18,7 @@ from unittest import mock
 
 from oslo_config import cfg
 from oslo_context import context as oslo_context
+from oslo_db import exception as db_exception
 from oslo_utils import timeutils
 from oslo_utils import uuidutils
 
@@ -2705,6 +2706,48 @@ class FastTrackTestCase(db_base.DbTestCase):
             self.assertTrue(conductor_utils.is_fast_track(task))
 
 
+class AgentHeartbeatRecordTestCase(db_base.DbTestCase):
+
+    def setUp(self):
+        super(AgentHeartbeatRecordTestCase, self).setUp()
+        self.node = obj_utils.create_test_node(
+            self.context, driver='fake-hardware',
+            driver_internal_info={'agent_url': 'a_url'})
+
+    def test_record_and_flush(self):
+        conductor_utils.record_agent_heartbeat(self.node)
+        self.node.refresh()
+        self.assertNotIn('agent_last_heartbeat',
+                         self.node.driver_internal_info)
+
+        conductor_utils.flush_agent_heartbeats()
+        self.node.refresh()
+        self.assertTrue(conductor_utils.agent_is_alive(self.node))
+        self.assertEqual({}, conductor_utils._PENDING_AGENT_HEARTBEATS)
+
+    def test_record_immediately(self):
+        self.config(agent_heartbeat_flush_interval=0, group='conductor')
+        conductor_utils.record_agent_heartbeat(self.node)
+        self.node.refresh()
+        self.assertTrue(conductor_utils.agent_is_alive(self.node))
+        self.assertEqual({}, conductor_utils._PENDING_AGENT_HEARTBEATS)
+
+    def test_flush_nothing_pending(self):
+        with mock.patch.object(self.dbapi, 'update_agent_heartbeats',
+                               autospec=True) as mock_update:
+            conductor_utils.flush_agent_heartbeats()
+            self.assertFalse(mock_update.called)
+
+    def test_flush_failure_keeps_heartbeats(self):
+        conductor_utils.record_agent_heartbeat(self.node)
+        with mock.patch.object(self.dbapi, 'update_agent_heartbeats',
+                               autospec=True) as mock_update:
+            mock_update.side_effect = exception.IronicException('boom')
+            self.assertRaises(exception.IronicException,
+                              conductor_utils.flush_agent_heartbeats)
+        self.assertIn(self.node.id, conductor_utils._PENDING_AGENT_HEARTBEATS)
+
+
 class GetNodeNextStepsTestCase(db_base.DbTestCase):
     def setUp(self):
         super(GetNodeNextStepsTestCase, self).setUp()
@@ -3286,6 +3329,70 @@ class NodeHistoryRecordTestCase(db_base.DbTestCase):
         entry = entries[0]
         self.assertEqual(short_event, entry['event'])
 
+    def test_record_node_history_buffered(self):
+        self.config(node_history_flush_interval=60, group='conductor')
+        conductor_utils.node_history_record(self.node, event='meow')
+        conductor_utils.node_history_record(self.node, event='purr',
+                                            error=True)
+        self.assertEqual([], objects.NodeHistory.list_by_node_id(
+            self.context, self.node.id))
+
+        conductor_utils.flush_node_history()
+        entries = objects.NodeHistory.list_by_node_id(self.context,
+                                                      self.node.id)
+        self.assertEqual(['meow', 'purr'], [e['event'] for e in entries])
+        self.assertEqual(['INFO', 'ERROR'], [e['severity'] for e in entries])
+        self.assertEqual(CONF.host, entries[0]['conductor'])
+        self.assertEqual([], conductor_utils._PENDING_NODE_HISTORY)
+
+    @mock.patch.object(conductor_utils, '_NODE_HISTORY_BUFFER_SIZE', 2)
+    def test_record_node_history_buffer_full(self):
+        self.config(node_history_flush_interval=60, group='conductor')
+        conductor_utils.node_history_record(self.node, event='meow')
+        self.assertEqual(1, len(conductor_utils._PENDING_NODE_HISTORY))
+        conductor_utils.node_history_record(self.node, event='purr')
+        self.assertEqual([], conductor_utils._PENDING_NODE_HISTORY)
+        entries = objects.NodeHistory.list_by_node_id(self.context,
+                                                      self.node.id)
+        self.assertEqual(2, len(entries))
+
+    def test_flush_node_history_nothing_pending(self):
+        with mock.patch.object(self.dbapi, 'create_node_history_records',
+                               autospec=True) as mock_create:
+            conductor_utils.flush_node_history()
+        mock_create.assert_not_called()
+
+    def test_flush_node_history_failure_requeues(self):
+        self.config(node_history_flush_interval=60, group='conductor')
+        conductor_utils.node_history_record(self.node, event='meow')
+        with mock.patch.object(self.dbapi, 'create_node_history_records',
+                               autospec=True) as mock_create:
+            mock_create.side_effect = db_exception.DBConnectionError()
+            self.assertRaises(db_exception.DBConnectionError,
+                              conductor_utils.flush_node_history)
+        self.assertEqual(1, len(conductor_utils._PENDING_NODE_HISTORY))
+
+    def test_flush_node_history_deleted_node(self):
+        self.config(node_history_flush_interval=60, group='conductor')
+        conductor_utils.node_history_record(self.node, event='meow')
+        conductor_utils._PENDING_NODE_HISTORY.append(
+            dict(conductor_utils._PENDING_NODE_HISTORY[0], node_id=42))
+        real_create = self.dbapi.create_node_history_records
+
+        def _create(records):
+            if any(r['node_id'] == 42 for r in records):
+                raise db_exception.DBReferenceError(
+                    'node_history', 'fk', 'node_id', 'nodes')
+            return real_create(records)
+
+        with mock.patch.object(self.dbapi, 'create_node_history_records',
+                               autospec=True, side_effect=_create):
+            conductor_utils.flush_node_history()
+        entries = objects.NodeHistory.list_by_node_id(self.context,
+                                                      self.node.id)
+        self.assertEqual(['meow'], [e['event'] for e in entries])
+        self.assertEqual([], conductor_utils._PENDING_NODE_HISTORY)
+
 
     @mock.patch('oslo_utils.timeutils.utcnow', autospec=True)
     def test_record_node_history_with_state_fields(self, mock_utcnow):
@@ -11,10 +11,10 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-import json
 import os
 import socket
 import tempfile
+import threading
 import time
 from unittest import mock
 import yaml
@@ -109,6 +109,37 @@ class TestSystemdConsoleContainer(base.TestCase):
         self.assertRaisesRegex(exception.ConsoleContainerError, 'ouch',
                                self.provider._reload)
 
+    @mock.patch.object(utils, 'execute', autospec=True)
+    def test__reload_coalesced(self, mock_exec):
+        reloading = threading.Event()
+        release = threading.Event()
+
+        def _execute(*args):
+            reloading.set()
+            release.wait(10)
+            return None, None
+
+        mock_exec.side_effect = _execute
+        threads = [threading.Thread(target=self.provider._reload)]
+        threads[0].start()
+        self.assertTrue(reloading.wait(10))
+        # These calls arrive during the first reload, and are served by
+        # a single reload after it
+        threads += [threading.Thread(target=self.provider._reload)
+                    for i in range(3)]
+        for thread in threads[1:]:
+            thread.start()
+        for i in range(1000):
+            if self.provider._reload_requests == 4:
+                break
+            time.sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join(10)
+
+        self.assertEqual(2, mock_exec.call_count)
+        self.assertEqual(4, self.provider._reloaded)
+
     @mock.patch.object(utils, 'execute', autospec=True)
     def test__start(self, mock_exec):
 
@@ -663,72 +694,29 @@ spec:
         )
 
     @mock.patch.object(utils, "execute", autospec=True)
-    @mock.patch.object(time, "sleep", autospec=True)
-    def test__wait_for_pod_ready(self, mock_sleep, mock_exec):
-        pod_ready_status = {
-            "status": {"conditions": [{"type": "Ready", "status": "True"}]}
-        }
-        mock_exec.return_value = (json.dumps(pod_ready_status), "")
+    def test__wait_for_pod_ready(self, mock_exec):
+        mock_exec.return_value = ("pod/test-pod condition met", "")
 
         self.provider._wait_for_pod_ready("test-pod", "test-namespace")
 
         mock_exec.assert_called_once_with(
             "kubectl",
-            "get",
-            "pod",
-            "test-pod",
+            "wait",
+            "pod/test-pod",
             "-n",
             "test-namespace",
-            "-o",
-            "json",
+            "--for=condition=Ready",
+            "--timeout=120s",
         )
-        mock_sleep.assert_not_called()
 
     @mock.patch.object(utils, "execute", autospec=True)
-    @mock.patch.object(time, "sleep", autospec=True)
-    @mock.patch.object(time, "time", autospec=True, side_effect=[1, 2, 3, 4])
-    def test__wait_for_pod_ready_polling(
-        self, mock_time, mock_sleep, mock_exec
-    ):
-        pod_not_ready_status = {
-            "status": {"conditions": [{"type": "Ready", "status": "False"}]}
-        }
-        pod_ready_status = {
-            "status": {"conditions": [{"type": "Ready", "status": "True"}]}
-        }
-        mock_exec.side_effect = [
-            (json.dumps(pod_not_ready_status), ""),
-            (json.dumps(pod_ready_status), ""),
-        ]
-
-        self.provider._wait_for_pod_ready("test-pod", "test-namespace")
-
-        self.assertEqual(2, mock_exec.call_count)
-        mock_sleep.assert_called_once_with(kubernetes.POD_READY_POLL_INTERVAL)
-
-    @mock.patch.object(time, "time", autospec=True, side_effect=[0, 121])
-    @mock.patch.object(utils, "execute", autospec=True)
-    def test__wait_for_pod_ready_timeout(self, mock_exec, mock_time):
-        pod_not_ready_status = {
-            "status": {"conditions": [{"type": "Ready", "status": "False"}]}
-        }
-        mock_exec.return_value = (json.dumps(pod_not_ready_status), "")
-
-        self.assertRaisesRegex(
-            exception.ConsoleContainerError,
-            "did not become ready",
-            self.provider._wait_for_pod_ready,
-            "test-pod",
-            "test-namespace",
+    def test__wait_for_pod_ready_timeout(self, mock_exec):
+        mock_exec.side_effect = processutils.ProcessExecutionError(
+            stderr="timed out waiting for the condition on pods/test-pod"
         )
-
-    @mock.patch.object(time, "time", autospec=True, side_effect=[0, 121])
-    @mock.patch.object(utils, "execute", autospec=True)
-    def test__wait_for_pod_ready_exec_error(self, mock_exec, mock_time):
-        mock_exec.side_effect = processutils.ProcessExecutionError()
         self.assertRaisesRegex(
             exception.ConsoleContainerError,
-            "did not become ready",
+            "did not become ready in 120s",
             self.provider._wait_for_pod_ready,
             "test-pod",
             "test-namespace",
@@ -1577,6 +1577,23 @@ class MigrationCheckersMixin(object):
         self.assertIsInstance(fw_information.c.serial_number.type,
                               sqlalchemy.types.String)
 
+    def _check_3d8a5f0c1b7e(self, engine, data):
+        nodes = db_utils.get_table(engine, 'nodes')
+        col_names = [column.name for column in nodes.c]
+        self.assertIn('agent_last_heartbeat', col_names)
+        self.assertIsInstance(nodes.c.agent_last_heartbeat.type,
+                              sqlalchemy.types.DateTime)
+
+    def _check_5c1e7a9d3f42(self, engine, data):
+        nodes = db_utils.get_table(engine, 'nodes')
+        col_names = [column.name for column in nodes.c]
+        self.assertIn('provision_deadline', col_names)
+        self.assertIsInstance(nodes.c.provision_deadline.type,
+                              sqlalchemy.types.DateTime)
+        indexes = [index['name'] for index in
+                   sqlalchemy.inspect(engine).get_indexes('nodes')]
+        self.assertIn('provision_deadline_idx', indexes)
+
     def test_upgrade_twice(self):
         with patch_with_engine(self.engine):
             self.migration_api.upgrade('31baaf680d2b')
@@ -434,6 +434,32 @@ class DbConductorTestCase(base.DbTestCase):
         mock_utcnow.return_value = time_ + datetime.timedelta(seconds=61)
         self.assertEqual([c.hostname], self.dbapi.get_online_conductors())
 
+    @mock.patch.object(common_utils, 'is_ironic_using_sqlite', autospec=True)
+    @mock.patch.object(timeutils, 'utcnow', autospec=True)
+    def test_get_active_conductor_topology(self, mock_utcnow, mock_is_sqlite):
+        mock_is_sqlite.return_value = False
+        self.config(heartbeat_timeout=60, group='conductor')
+        time_ = datetime.datetime(2000, 1, 1, 0, 0)
+
+        mock_utcnow.return_value = time_
+        self._create_test_cdr(id=1, hostname='host1',
+                              hardware_types=['ht1', 'ht2'])
+        self._create_test_cdr(id=2, hostname='host2',
+                              conductor_group='group1',
+                              hardware_types=['ht1'])
+        self._create_test_cdr(id=3, hostname='host3')
+
+        mock_utcnow.return_value = time_ + datetime.timedelta(seconds=30)
+        self.assertEqual(
+            sorted([('host1', '', 'ht1'), ('host1', '', 'ht2'),
+                    ('host2', 'group1', 'ht1'), ('host3', '', None)],
+                   key=str),
+            sorted(self.dbapi.get_active_conductor_topology(), key=str))
+
+        # 61 seconds passed since last heartbeat, all conductors are dead
+        mock_utcnow.return_value = time_ + datetime.timedelta(seconds=61)
+        self.assertEqual([], self.dbapi.get_active_conductor_topology())
+
     @mock.patch.object(timeutils, 'utcnow', autospec=True)
     def test_list_hardware_type_interfaces(self, mock_utcnow):
         self.config(heartbeat_timeout=60, group='conductor')
@@ -10,6 +10,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import datetime
+
 from oslo_utils import uuidutils
 
 from ironic.common import exception
@@ -100,3 +102,71 @@ class DBNodeHistoryTestCase(base.DbTestCase):
             project='test-project')
         res = self.dbapi.get_node_history_by_uuid(history.uuid)
         self.assertEqual('test-project', res.project)
+
+    def test_create_node_history_records(self):
+        self.dbapi.create_node_history_records([
+            {'node_id': self.node.id, 'event': 'meow', 'severity': 'INFO'},
+            {'node_id': self.node.id, 'event': 'purr', 'severity': 'INFO',
+             'uuid': 'a3bd4c8d-5b9c-4d39-8c3d-0dbeb7b2f9a4'},
+        ])
+        res = self.dbapi.get_node_history_by_node_id(self.node.id)
+        self.assertEqual(['Something bad happened but fear not', 'meow',
+                          'purr'], [r.event for r in res])
+        self.assertTrue(uuidutils.is_uuid_like(res[1].uuid))
+        self.assertIsNotNone(res[1].created_at)
+        self.assertEqual('a3bd4c8d-5b9c-4d39-8c3d-0dbeb7b2f9a4', res[2].uuid)
+
+    def test_create_node_history_records_empty(self):
+        self.dbapi.create_node_history_records([])
+
+
+class DBNodeHistoryPurgeTestCase(base.DbTestCase):
+
+    def setUp(self):
+        super(DBNodeHistoryPurgeTestCase, self).setUp()
+        self.config(node_history_max_entries=2, group='conductor')
+        self.conductor = db_utils.create_test_conductor(id=1)
+        db_utils.create_test_conductor(id=2, hostname='another-conductor')
+        self.node = db_utils.create_test_node(conductor_affinity=1)
+        self.other = db_utils.create_test_node(
+            uuid=uuidutils.generate_uuid(), conductor_affinity=1)
+        self.foreign = db_utils.create_test_node(
+            uuid=uuidutils.generate_uuid(), conductor_affinity=2)
+        now = datetime.datetime.now()
+        self.history = {}
+        for node in (self.node, self.other, self.foreign):
+            self.history[node.id] = [
+                db_utils.create_test_history(
+                    uuid=uuidutils.generate_uuid(), node_id=node.id,
+                    created_at=now - datetime.timedelta(days=4 - i,
+                                                        hours=12)).id
+                for i in range(4)]
+
+    def test_query_for_purge(self):
+        res = self.dbapi.query_node_history_records_for_purge(1)
+        self.assertEqual({self.node.id: self.history[self.node.id][:2],
+                          self.other.id: self.history[self.other.id][:2]},
+                         res)
+
+    def test_query_for_purge_limit(self):
+        res = self.dbapi.query_node_history_records_for_purge(1, limit=3)
+        self.assertEqual({self.node.id: self.history[self.node.id][:2],
+                          self.other.id: self.history[self.other.id][:1]},
+                         res)
+
+    def test_query_for_purge_minimum_days(self):
+        # Only the two records older than 3 days are considered, and both
+        # fit in the maximum number of entries.
+        self.config(node_history_minimum_days=3, group='conductor')
+        self.assertEqual(
+            {}, self.dbapi.query_node_history_records_for_purge(1))
+        self.config(node_history_max_entries=1, group='conductor')
+        res = self.dbapi.query_node_history_records_for_purge(1)
+        self.assertEqual({self.node.id: self.history[self.node.id][:1],
+                          self.other.id: self.history[self.other.id][:1]},
+                         res)
+
+    def test_query_for_purge_nothing_to_do(self):
+        self.config(node_history_max_entries=4, group='conductor')
+        self.assertEqual(
+            {}, self.dbapi.query_node_history_records_for_purge(1))
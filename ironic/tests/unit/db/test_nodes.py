@@ -151,6 +151,32 @@ class DbNodeTestCase(base.DbTestCase):
         self.assertEqual(extras, dict((r[0], r[1]) for r in res))
         self.assertEqual(uuids, dict((r[0], r[2]) for r in res))
 
+    def test_iter_nodeinfo(self):
+        uuids = []
+        for i in range(1, 6):
+            node = utils.create_test_node(uuid=uuidutils.generate_uuid(),
+                                          maintenance=(i == 3))
+            uuids.append(node.uuid)
+        with mock.patch.object(dbapi, '_session_for_read',
+                               wraps=dbapi._session_for_read) as mock_read:
+            res = self.dbapi.iter_nodeinfo(columns=['uuid'], batch_size=2)
+            self.assertEqual((uuids[0],), next(res))
+            self.assertEqual(1, mock_read.call_count)
+            self.assertEqual([(u,) for u in uuids[1:]], list(res))
+            self.assertEqual(3, mock_read.call_count)
+
+        res = self.dbapi.iter_nodeinfo(columns=['id', 'uuid'],
+                                       filters={'maintenance': False},
+                                       batch_size=2)
+        self.assertEqual([u for i, u in enumerate(uuids) if i != 2],
+                         [r[1] for r in res])
+
+    def test_iter_nodeinfo_defaults(self):
+        node_ids = [utils.create_test_node(uuid=uuidutils.generate_uuid()).id
+                    for _i in range(3)]
+        self.assertEqual([(i,) for i in node_ids],
+                         list(self.dbapi.iter_nodeinfo()))
+
     def test_get_nodeinfo_list_with_filters(self):
         node1 = utils.create_test_node(
             driver='driver-one',
@@ -270,6 +296,36 @@ class DbNodeTestCase(base.DbTestCase):
             filters={'provision_state_in': [states.ACTIVE, states.DEPLOYING]})
         self.assertEqual([node1.id], [r[0] for r in res])
 
+    @mock.patch.object(timeutils, 'utcnow', autospec=True)
+    def test_get_nodeinfo_list_provision_deadline(self, mock_utcnow):
+        self.config(deploy_callback_timeout=600, group='conductor')
+        past = datetime.datetime(2000, 1, 1, 0, 0)
+        mock_utcnow.return_value = past
+
+        node1 = utils.create_test_node(uuid=uuidutils.generate_uuid(),
+                                       provision_state=states.DEPLOYWAIT)
+        self.dbapi.update_node(node1.id,
+                               {'provision_state': states.DEPLOYWAIT})
+        mock_utcnow.return_value = past + datetime.timedelta(minutes=5)
+        node2 = utils.create_test_node(uuid=uuidutils.generate_uuid(),
+                                       provision_state=states.DEPLOYWAIT)
+        self.dbapi.update_node(node2.id,
+                               {'provision_state': states.DEPLOYWAIT})
+        # Nodes that are not waiting for a callback have no deadline
+        node3 = utils.create_test_node(uuid=uuidutils.generate_uuid())
+        self.dbapi.update_node(node3.id, {'provision_state': states.ACTIVE})
+
+        mock_utcnow.return_value = past + datetime.timedelta(minutes=12)
+        res = self.dbapi.get_nodeinfo_list(
+            filters={'provision_deadline_passed': True})
+        self.assertEqual([node1.id], [r[0] for r in res])
+
+        mock_utcnow.return_value = past + datetime.timedelta(minutes=20)
+        res = self.dbapi.get_nodeinfo_list(
+            filters={'provision_deadline_passed': True},
+            sort_key='provision_deadline', sort_dir='asc')
+        self.assertEqual([node1.id, node2.id], [r[0] for r in res])
+
     @mock.patch.object(timeutils, 'utcnow', autospec=True)
     def test_get_nodeinfo_list_inspection(self, mock_utcnow):
         past = datetime.datetime(2000, 1, 1, 0, 0)
@@ -335,6 +391,28 @@ class DbNodeTestCase(base.DbTestCase):
             self.assertEqual([], r.tags)
             self.assertEqual(2, len(r.traits))
 
+    def test_get_node_list_filter_by_traits(self):
+        node1 = utils.create_test_node(uuid=uuidutils.generate_uuid())
+        self.dbapi.set_node_traits(node1.id, ['trait1', 'trait2'], '1.35')
+        node2 = utils.create_test_node(uuid=uuidutils.generate_uuid())
+        self.dbapi.set_node_traits(node2.id, ['trait1', 'trait3'], '1.35')
+        utils.create_test_node(uuid=uuidutils.generate_uuid())
+
+        res = self.dbapi.get_node_list(filters={'traits': ['trait1']})
+        self.assertCountEqual([node1.id, node2.id], [r.id for r in res])
+
+        res = self.dbapi.get_node_list(
+            filters={'traits': ['trait1', 'trait2']})
+        self.assertEqual([node1.id], [r.id for r in res])
+
+        res = self.dbapi.get_nodeinfo_list(
+            columns=['uuid'], filters={'traits': ['trait2', 'trait3']})
+        self.assertEqual([], res)
+
+        res = self.dbapi.get_nodeinfo_list(
+            columns=['id'], filters={'traits': ['trait3']})
+        self.assertEqual([(node2.id,)], res)
+
     def test_get_node_list_with_filters(self):
         ch1 = utils.create_test_chassis(uuid=uuidutils.generate_uuid())
         ch2 = utils.create_test_chassis(uuid=uuidutils.generate_uuid())
@@ -939,6 +1017,46 @@ class DbNodeTestCase(base.DbTestCase):
         self.assertEqual(mocked_time,
                          timeutils.normalize_time(res['provision_updated_at']))
 
+    @mock.patch.object(timeutils, 'utcnow', autospec=True)
+    def test_update_node_provision_deadline(self, mock_utcnow):
+        self.config(clean_callback_timeout=100, group='conductor')
+        mocked_time = datetime.datetime(2000, 1, 1, 0, 0)
+        mock_utcnow.return_value = mocked_time
+        node = utils.create_test_node()
+        res = self.dbapi.update_node(node.id,
+                                     {'provision_state': states.CLEANWAIT})
+        self.assertEqual(mocked_time + datetime.timedelta(seconds=100),
+                         res['provision_deadline'])
+        # Other updates do not change the deadline
+        res = self.dbapi.update_node(node.id, {'extra': {'foo': 'bar'}})
+        self.assertEqual(mocked_time + datetime.timedelta(seconds=100),
+                         res['provision_deadline'])
+        # Leaving the state clears it
+        res = self.dbapi.update_node(node.id,
+                                     {'provision_state': states.CLEANING})
+        self.assertIsNone(res['provision_deadline'])
+
+    def test_update_node_provision_deadline_disabled(self):
+        self.config(clean_callback_timeout=0, group='conductor')
+        node = utils.create_test_node()
+        res = self.dbapi.update_node(node.id,
+                                     {'provision_state': states.CLEANWAIT})
+        self.assertIsNone(res['provision_deadline'])
+
+    @mock.patch.object(timeutils, 'utcnow', autospec=True)
+    def test_update_node_provision_deadline_inspectwait(self, mock_utcnow):
+        self.config(inspect_wait_timeout=100, group='conductor')
+        started = datetime.datetime(2000, 1, 1, 0, 0)
+        mock_utcnow.return_value = started
+        node = utils.create_test_node()
+        self.dbapi.update_node(node.id, {'provision_state': states.INSPECTING})
+        mock_utcnow.return_value = started + datetime.timedelta(seconds=30)
+        res = self.dbapi.update_node(node.id,
+                                     {'provision_state': states.INSPECTWAIT})
+        # Inspection times out relative to its start
+        self.assertEqual(started + datetime.timedelta(seconds=100),
+                         res['provision_deadline'])
+
     def test_update_node_name_duplicate(self):
         node1 = utils.create_test_node(uuid=uuidutils.generate_uuid(),
                                        name='spam')
@@ -1173,11 +1291,143 @@ class DbNodeTestCase(base.DbTestCase):
         self.assertEqual(test_time,
                          timeutils.normalize_time(node.provision_updated_at))
 
+    @mock.patch.object(timeutils, 'utcnow', autospec=True)
+    def test_touch_node_provisioning_extends_deadline(self, mock_utcnow):
+        self.config(deploy_callback_timeout=100, group='conductor')
+        self.config(inspect_wait_timeout=100, group='conductor')
+        test_time = datetime.datetime(2000, 1, 1, 0, 0)
+        mock_utcnow.return_value = test_time
+        node1 = utils.create_test_node(uuid=uuidutils.generate_uuid())
+        self.dbapi.update_node(node1.id,
+                               {'provision_state': states.DEPLOYWAIT})
+        node2 = utils.create_test_node(uuid=uuidutils.generate_uuid())
+        self.dbapi.update_node(node2.id,
+                               {'provision_state': states.INSPECTING})
+        self.dbapi.update_node(node2.id,
+                               {'provision_state': states.INSPECTWAIT})
+
+        later = test_time + datetime.timedelta(seconds=50)
+        mock_utcnow.return_value = later
+        self.dbapi.touch_node_provisioning(node1.id)
+        self.dbapi.touch_node_provisioning(node2.id)
+        node1 = self.dbapi.get_node_by_id(node1.id)
+        node2 = self.dbapi.get_node_by_id(node2.id)
+        self.assertEqual(later + datetime.timedelta(seconds=100),
+                         node1.provision_deadline)
+        # Inspection is not extended by progress reports
+        self.assertEqual(test_time + datetime.timedelta(seconds=100),
+                         node2.provision_deadline)
+
+    def test_update_provision_deadlines_backfill(self):
+        self.config(deploy_callback_timeout=100, group='conductor')
+        updated_at = datetime.datetime(2000, 1, 1, 0, 0)
+        node1 = utils.create_test_node(uuid=uuidutils.generate_uuid(),
+                                       provision_state=states.DEPLOYWAIT,
+                                       provision_updated_at=updated_at)
+        node2 = utils.create_test_node(uuid=uuidutils.generate_uuid(),
+                                       provision_state=states.ACTIVE,
+                                       provision_updated_at=updated_at)
+        node3 = utils.create_test_node(uuid=uuidutils.generate_uuid(),
+                                       provision_state=states.DEPLOYWAIT,
+                                       provision_updated_at=updated_at)
+        # Nodes which started waiting before deadlines were recorded
+        node1 = self.dbapi.update_node(node1.id, {'provision_deadline': None})
+        node3 = self.dbapi.update_node(node3.id, {'provision_deadline': None})
+        node_ids = [node1.id, node2.id]
+
+        self.assertEqual(1, self.dbapi.update_provision_deadlines(node_ids))
+        result = self.dbapi.get_node_by_id(node1.id)
+        node2 = self.dbapi.get_node_by_id(node2.id)
+        self.assertEqual(updated_at + datetime.timedelta(seconds=100),
+                         result.provision_deadline)
+        self.assertEqual(node1.updated_at, result.updated_at)
+        self.assertIsNone(node2.provision_deadline)
+        # Nodes which are not requested are left alone
+        self.assertIsNone(
+            self.dbapi.get_node_by_id(node3.id).provision_deadline)
+        # Nothing left to do
+        self.assertEqual(0, self.dbapi.update_provision_deadlines(node_ids))
+
+    @mock.patch.object(dbapi, '_PROVISION_DEADLINES_CHUNK_SIZE', 2)
+    def test_update_provision_deadlines_chunked(self):
+        self.config(deploy_callback_timeout=100, group='conductor')
+        updated_at = datetime.datetime(2000, 1, 1, 0, 0)
+        node_ids = []
+        for _ in range(5):
+            node = utils.create_test_node(uuid=uuidutils.generate_uuid(),
+                                          provision_state=states.DEPLOYWAIT,
+                                          provision_updated_at=updated_at)
+            self.dbapi.update_node(node.id, {'provision_deadline': None})
+            node_ids.append(node.id)
+
+        self.assertEqual(5, self.dbapi.update_provision_deadlines(node_ids))
+        for node_id in node_ids:
+            self.assertEqual(
+                updated_at + datetime.timedelta(seconds=100),
+                self.dbapi.get_node_by_id(node_id).provision_deadline)
+
+    def test_update_provision_deadlines_timeout_changed(self):
+        self.config(deploy_callback_timeout=100, group='conductor')
+        self.config(clean_callback_timeout=100, group='conductor')
+        self.config(rescue_callback_timeout=0, group='conductor')
+        updated_at = datetime.datetime(2000, 1, 1, 0, 0)
+        deploying = utils.create_test_node(uuid=uuidutils.generate_uuid(),
+                                           provision_state=states.DEPLOYWAIT,
+                                           provision_updated_at=updated_at)
+        cleaning = utils.create_test_node(uuid=uuidutils.generate_uuid(),
+                                          provision_state=states.CLEANWAIT,
+                                          provision_updated_at=updated_at)
+        rescuing = utils.create_test_node(uuid=uuidutils.generate_uuid(),
+                                          provision_state=states.RESCUEWAIT,
+                                          provision_updated_at=updated_at)
+        self.assertIsNone(rescuing.provision_deadline)
+
+        # The timeouts are changed, e.g. before a conductor restart
+        self.config(deploy_callback_timeout=500, group='conductor')
+        self.config(clean_callback_timeout=0, group='conductor')
+        self.config(rescue_callback_timeout=200, group='conductor')
+
+        node_ids = [deploying.id, cleaning.id, rescuing.id]
+        self.assertEqual(3, self.dbapi.update_provision_deadlines(node_ids))
+        deploying = self.dbapi.get_node_by_id(deploying.id)
+        cleaning = self.dbapi.get_node_by_id(cleaning.id)
+        rescuing = self.dbapi.get_node_by_id(rescuing.id)
+        self.assertEqual(updated_at + datetime.timedelta(seconds=500),
+                         deploying.provision_deadline)
+        self.assertIsNone(cleaning.provision_deadline)
+        self.assertEqual(updated_at + datetime.timedelta(seconds=200),
+                         rescuing.provision_deadline)
+        self.assertEqual(0, self.dbapi.update_provision_deadlines(node_ids))
+
     def test_touch_node_provisioning_not_found(self):
         self.assertRaises(
             exception.NodeNotFound,
             self.dbapi.touch_node_provisioning, uuidutils.generate_uuid())
 
+    def test_update_agent_heartbeats(self):
+        node1 = utils.create_test_node(uuid=uuidutils.generate_uuid())
+        node2 = utils.create_test_node(uuid=uuidutils.generate_uuid())
+        test_time = datetime.datetime(2000, 1, 1, 0, 0)
+        self.dbapi.update_agent_heartbeats({node1.id: test_time,
+                                            # Deleted nodes are ignored
+                                            node2.id + 1: test_time})
+        node1 = self.dbapi.get_node_by_id(node1.id)
+        node2 = self.dbapi.get_node_by_id(node2.id)
+        self.assertEqual(test_time, node1.agent_last_heartbeat)
+        self.assertIsNone(node1.updated_at)
+        self.assertIsNone(node2.agent_last_heartbeat)
+
+    def test_get_node_list_driver_internal_info_loads_heartbeat(self):
+        node = utils.create_test_node()
+        test_time = datetime.datetime(2000, 1, 1, 0, 0)
+        self.dbapi.update_agent_heartbeats({node.id: test_time})
+        res = self.dbapi.get_node_list(
+            fields=['uuid', 'driver_internal_info'])
+        self.assertEqual(test_time, res[0].agent_last_heartbeat)
+
+    def test_update_agent_heartbeats_empty(self):
+        self.dbapi.update_agent_heartbeats({})
+
     def test_get_node_by_port_addresses(self):
         wrong_node = utils.create_test_node(
             driver='driver-one',
@@ -1200,6 +1450,23 @@ class DbNodeTestCase(base.DbTestCase):
         self.assertEqual(node.uuid, res.uuid)
         self.assertEqual([], res.traits)
 
+    def test_get_node_by_port_addresses_fields(self):
+        node = utils.create_test_node(
+            driver='driver-two',
+            uuid=uuidutils.generate_uuid(),
+            driver_info={'fast_track': True})
+        utils.create_test_port(uuid=uuidutils.generate_uuid(),
+                               node_id=node.id, address='52:54:00:cf:2d:41')
+
+        res = self.dbapi.get_node_by_port_addresses(
+            ['52:54:00:cf:2d:41'],
+            fields=['id', 'uuid', 'version', 'provision_state',
+                    'driver_info'])
+        self.assertEqual(node.uuid, res.uuid)
+        self.assertEqual({'fast_track': True}, res.driver_info)
+        self.assertNotIn('instance_info', res.__dict__)
+        self.assertNotIn('traits', res.__dict__)
+
     def test_get_node_by_port_addresses_not_found(self):
         node = utils.create_test_node(
             driver='driver',
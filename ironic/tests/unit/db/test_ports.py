@@ -15,9 +15,13 @@
 
 """Tests for manipulating Ports via the DB API"""
 
+from unittest import mock
+
+from oslo_db import exception as db_exc
 from oslo_utils import uuidutils
 
 from ironic.common import exception
+from ironic.db.sqlalchemy import api as dbapi
 from ironic.tests.unit.db import base
 from ironic.tests.unit.db import utils as db_utils
 
@@ -311,6 +315,77 @@ class DbPortTestCase(base.DbTestCase):
                           self.dbapi.update_port, port2.id,
                           {'address': address1})
 
+    def test_reconcile_node_ports(self):
+        port2 = db_utils.create_test_port(uuid=uuidutils.generate_uuid(),
+                                          node_id=self.node.id,
+                                          address='aa:bb:cc:11:22:33')
+        other_node = db_utils.create_test_node(uuid=uuidutils.generate_uuid())
+        db_utils.create_test_port(uuid=uuidutils.generate_uuid(),
+                                  node_id=other_node.id,
+                                  address='aa:bb:cc:11:22:44')
+
+        used = self.dbapi.reconcile_node_ports(
+            self.node.id,
+            ports_to_create=[
+                {'address': 'aa:bb:cc:11:22:55', 'node_id': self.node.id},
+                {'address': 'aa:bb:cc:11:22:44', 'node_id': self.node.id}],
+            ports_to_update={self.port.id: {'pxe_enabled': False}},
+            ports_to_delete=[port2.id])
+
+        self.assertEqual(['aa:bb:cc:11:22:44'], used)
+        ports = {port.address: port
+                 for port in self.dbapi.get_ports_by_node_id(self.node.id)}
+        self.assertEqual({self.port.address, 'aa:bb:cc:11:22:55'},
+                         set(ports))
+        self.assertFalse(ports[self.port.address].pxe_enabled)
+        self.assertTrue(
+            uuidutils.is_uuid_like(ports['aa:bb:cc:11:22:55'].uuid))
+
+    def test_reconcile_node_ports_concurrent_duplicate(self):
+        port2 = db_utils.create_test_port(uuid=uuidutils.generate_uuid(),
+                                          node_id=self.node.id,
+                                          address='aa:bb:cc:11:22:33')
+        other_node = db_utils.create_test_node(uuid=uuidutils.generate_uuid())
+        orig = dbapi.Connection._reconcile_node_ports
+
+        def _reconcile(conn, node_id, ports_to_create, *args):
+            if ports_to_create:
+                # Another node gets a port with one of the addresses after
+                # they were checked.
+                db_utils.create_test_port(uuid=uuidutils.generate_uuid(),
+                                          node_id=other_node.id,
+                                          address='aa:bb:cc:11:22:44')
+                raise db_exc.DBDuplicateEntry(columns=['address'])
+            return orig(conn, node_id, ports_to_create, *args)
+
+        with mock.patch.object(dbapi.Connection, '_reconcile_node_ports',
+                               autospec=True, side_effect=_reconcile):
+            used = self.dbapi.reconcile_node_ports(
+                self.node.id,
+                ports_to_create=[
+                    {'address': 'aa:bb:cc:11:22:55', 'node_id': self.node.id},
+                    {'address': 'aa:bb:cc:11:22:44', 'node_id': self.node.id}],
+                ports_to_update={self.port.id: {'pxe_enabled': False}},
+                ports_to_delete=[port2.id])
+
+        self.assertEqual(['aa:bb:cc:11:22:44'], used)
+        ports = {port.address: port
+                 for port in self.dbapi.get_ports_by_node_id(self.node.id)}
+        self.assertEqual({self.port.address, 'aa:bb:cc:11:22:55'},
+                         set(ports))
+        self.assertFalse(ports[self.port.address].pxe_enabled)
+
+    def test_reconcile_node_ports_uuid(self):
+        self.assertRaises(exception.InvalidParameterValue,
+                          self.dbapi.reconcile_node_ports, self.node.id,
+                          ports_to_update={self.port.id: {'uuid': ''}})
+
+    def test_reconcile_node_ports_node_not_found(self):
+        self.assertRaises(exception.NodeNotFound,
+                          self.dbapi.reconcile_node_ports, 123456789,
+                          ports_to_delete=[self.port.id])
+        self.dbapi.get_port_by_id(self.port.id)
+
     def test_create_port_duplicated_address(self):
         self.assertRaises(exception.MACAlreadyExists,
                           db_utils.create_test_port,
@@ -22,6 +22,7 @@ from ironic.conductor import steps
 from ironic.conductor import task_manager
 from ironic.conductor import utils
 from ironic.drivers.modules.ansible import deploy as ansible_deploy
+from ironic.drivers.modules.ansible import executor as ansible_executor
 from ironic.drivers.modules import deploy_utils
 from ironic.drivers.modules import fake
 from ironic.drivers.modules.network import flat as flat_network
@@ -240,6 +241,38 @@ class TestAnsibleMethods(AnsibleDeployTestCaseBase):
             '/path/to/playbooks/inventory', '-e', '{"ironic": {"foo": "bar"}}',
             '--private-key=/path/to/key')
 
+    @mock.patch.object(com_utils, 'execute', return_value=('out', 'err'),
+                       autospec=True)
+    def test__run_playbook_batched(self, execute_mock):
+        self.config(group='ansible', playbooks_path='/path/to/playbooks')
+        self.config(group='ansible', config_file_path='/path/to/config')
+        self.config(group='ansible', batch_window=0.01, control_persist=60)
+        self.config(debug=False)
+        extra_vars = ansible_deploy._prepare_extra_vars(
+            [(self.node.uuid, '192.0.2.1', 'test', {})],
+            variables={'foo': 'bar'})
+
+        with mock.patch.object(ansible_executor, 'run', autospec=True,
+                               side_effect=ansible_executor.run) as run_mock:
+            result = ansible_deploy._run_playbook(self.node, 'deploy',
+                                                  extra_vars, '/path/to/key',
+                                                  tags=['spam'])
+
+        self.assertEqual(('out', 'err'), result)
+        run_mock.assert_called_once_with(
+            ('/path/to/playbooks/deploy', '/path/to/playbooks/inventory',
+             '/path/to/key', ('spam',), (), None, '{"foo": "bar"}'),
+            extra_vars['nodes'], mock.ANY)
+        execute_mock.assert_called_once_with(
+            'env', 'ANSIBLE_CONFIG=/path/to/config',
+            'ANSIBLE_SSH_ARGS=-C -o ControlMaster=auto -o ControlPersist=60s',
+            'ANSIBLE_STDOUT_CALLBACK=json',
+            'ansible-playbook', '/path/to/playbooks/deploy', '-i',
+            '/path/to/playbooks/inventory', '-e', mock.ANY,
+            '--tags=spam', '--private-key=/path/to/key')
+        self.assertEqual({'ironic': extra_vars},
+                         json.loads(execute_mock.call_args[0][9]))
+
     def test__parse_partitioning_info_root_msdos(self):
         self.config(default_boot_mode='bios', group='deploy')
         expected_info = {
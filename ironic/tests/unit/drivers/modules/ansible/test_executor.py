@@ -0,0 +1,163 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+import time
+from unittest import mock
+
+from oslo_concurrency import processutils
+
+from ironic.common import exception
+from ironic.drivers.modules.ansible import executor
+from ironic.tests import base
+
+
+NODE1 = {'name': 'node1', 'ip': '192.0.2.1', 'user': 'ansible', 'extra': {}}
+NODE2 = {'name': 'node2', 'ip': '192.0.2.2', 'user': 'ansible', 'extra': {}}
+
+
+def _json_output(failed=(), unreachable=(), ok=('node1', 'node2')):
+    hosts = {}
+    stats = {'conductor': {'ok': 1, 'failures': 0, 'unreachable': 0}}
+    for name in ok:
+        hosts[name] = {'changed': False}
+        stats[name] = {'ok': 2, 'failures': 0, 'unreachable': 0}
+    for name in failed:
+        hosts[name] = {'failed': True, 'msg': 'disk on fire'}
+        stats[name] = {'ok': 1, 'failures': 1, 'unreachable': 0}
+    for name in unreachable:
+        hosts[name] = {'unreachable': True, 'msg': 'no route to host'}
+        stats[name] = {'ok': 0, 'failures': 0, 'unreachable': 1}
+    return json.dumps({
+        'plays': [{'tasks': [{'task': {'name': 'write image'},
+                              'hosts': hosts}]}],
+        'stats': stats,
+    })
+
+
+class AnsibleExecutorTestCase(base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.config(batch_window=10, batch_max_nodes=2, group='ansible')
+        self.execute = mock.Mock(return_value=(_json_output(), ''))
+        self.addCleanup(executor._BATCHES.clear)
+
+    def _run_in_thread(self, key, nodes):
+        results = []
+
+        def _run():
+            try:
+                results.append(executor.run(key, nodes, self.execute))
+            except Exception as e:
+                results.append(e)
+
+        thread = threading.Thread(target=_run)
+        thread.start()
+        # Wait for the thread to open the batch
+        for _i in range(100):
+            if key in executor._BATCHES:
+                break
+            time.sleep(0.01)
+        return thread, results
+
+    def test_run_single(self):
+        self.config(batch_window=0.01, group='ansible')
+        result = executor.run('key', [NODE1], self.execute)
+        self.assertEqual((_json_output(), ''), result)
+        self.execute.assert_called_once_with([NODE1])
+        self.assertEqual({}, executor._BATCHES)
+
+    def test_run_batched(self):
+        thread, results = self._run_in_thread('key', [NODE1])
+        result = executor.run('key', [NODE2], self.execute)
+        thread.join()
+        self.execute.assert_called_once_with([NODE1, NODE2])
+        self.assertEqual([result], results)
+        self.assertEqual({}, executor._BATCHES)
+
+    def test_run_different_keys(self):
+        self.config(batch_window=0.01, group='ansible')
+        thread, results = self._run_in_thread('key1', [NODE1])
+        executor.run('key2', [NODE2], self.execute)
+        thread.join()
+        self.execute.assert_has_calls([mock.call([NODE1]),
+                                       mock.call([NODE2])], any_order=True)
+
+    def test_run_batch_full(self):
+        self.config(batch_max_nodes=1, group='ansible')
+        executor.run('key', [NODE1], self.execute)
+        executor.run('key', [NODE2], self.execute)
+        self.execute.assert_has_calls([mock.call([NODE1]),
+                                       mock.call([NODE2])])
+
+    def test_run_failure_mapped_to_node(self):
+        self.execute.side_effect = processutils.ProcessExecutionError(
+            stdout=_json_output(failed=['node1'], ok=['node2']),
+            stderr='', exit_code=2)
+        thread, results = self._run_in_thread('key', [NODE1])
+        out, err = executor.run('key', [NODE2], self.execute)
+        thread.join()
+        self.assertIsInstance(results[0], exception.InstanceDeployFailure)
+        self.assertIn('Task "write image" failed: disk on fire',
+                      str(results[0]))
+        self.assertEqual(_json_output(failed=['node1'], ok=['node2']), out)
+
+    def test_run_unreachable(self):
+        self.execute.side_effect = processutils.ProcessExecutionError(
+            stdout=_json_output(unreachable=['node2'], ok=['node1']),
+            stderr='', exit_code=4)
+        thread, results = self._run_in_thread('key', [NODE1])
+        exc = self.assertRaises(exception.InstanceDeployFailure,
+                                executor.run, 'key', [NODE2], self.execute)
+        thread.join()
+        self.assertIn('no route to host', str(exc))
+        self.assertIsInstance(results[0], tuple)
+
+    def test_run_failure_without_output(self):
+        self.execute.side_effect = processutils.ProcessExecutionError(
+            stdout='', stderr='', description='VIKINGS!')
+        thread, results = self._run_in_thread('key', [NODE1])
+        exc = self.assertRaises(exception.InstanceDeployFailure,
+                                executor.run, 'key', [NODE2], self.execute)
+        thread.join()
+        self.assertIn('VIKINGS!', str(exc))
+        self.assertIsInstance(results[0], exception.InstanceDeployFailure)
+
+    def test_run_node_missing_from_output(self):
+        self.execute.side_effect = processutils.ProcessExecutionError(
+            stdout=_json_output(ok=['node1']), stderr='', exit_code=2)
+        self.config(batch_window=0.01, group='ansible')
+        exc = self.assertRaises(exception.InstanceDeployFailure,
+                                executor.run, 'key', [NODE1, NODE2],
+                                self.execute)
+        self.assertIn('did not complete', str(exc))
+
+    def test_environment(self):
+        self.assertEqual({}, executor.environment())
+        self.assertEqual({'ANSIBLE_STDOUT_CALLBACK': 'json'},
+                         executor.environment(batched=True))
+
+    def test_environment_persistence(self):
+        self.config(tempdir='/tmp/ironic')
+        self.config(control_persist=300, fact_cache_timeout=600,
+                    group='ansible')
+        self.assertEqual(
+            {'ANSIBLE_SSH_ARGS':
+                '-C -o ControlMaster=auto -o ControlPersist=300s',
+             'ANSIBLE_GATHERING': 'smart',
+             'ANSIBLE_CACHE_PLUGIN': 'jsonfile',
+             'ANSIBLE_CACHE_PLUGIN_CONNECTION':
+                '/tmp/ironic/ironic-ansible-facts',
+             'ANSIBLE_CACHE_PLUGIN_TIMEOUT': '600'},
+            executor.environment())
@@ -560,7 +560,8 @@ class DracRedfishRAIDTestCase(test_utils.BaseDracTest):
         self.node.driver_internal_info = driver_internal_info
         self.node.save()
         mock_manager = mock.Mock()
-        node_list = [(self.node.uuid, 'idrac', '', driver_internal_info)]
+        node_list = [(self.node.uuid, 'idrac', '', driver_internal_info,
+                      self.node.driver_info)]
         mock_manager.iter_nodes.return_value = node_list
         task = mock.Mock(node=self.node,
                          driver=mock.Mock(raid=self.raid))
@@ -579,7 +580,8 @@ class DracRedfishRAIDTestCase(test_utils.BaseDracTest):
         self.node.driver_internal_info = driver_internal_info
         self.node.save()
         mock_manager = mock.Mock()
-        node_list = [(self.node.uuid, 'idrac', '', driver_internal_info)]
+        node_list = [(self.node.uuid, 'idrac', '', driver_internal_info,
+                      self.node.driver_info)]
         mock_manager.iter_nodes.return_value = node_list
         task = mock.Mock(node=self.node,
                          driver=mock.Mock(raid=self.raid))
@@ -591,8 +593,11 @@ class DracRedfishRAIDTestCase(test_utils.BaseDracTest):
 
         self.raid._check_raid_tasks_status.assert_not_called()
 
+    @mock.patch.object(drac_utils, 'get_jobs', autospec=True,
+                       return_value={})
     @mock.patch.object(redfish_utils, 'get_task_monitor', autospec=True)
-    def test__check_raid_tasks_status(self, mock_get_task_monitor):
+    def test__check_raid_tasks_status(self, mock_get_task_monitor,
+                                      mock_get_jobs):
         driver_internal_info = {
             'raid_task_monitor_uris': '/TaskService/123'}
         self.node.driver_internal_info = driver_internal_info
@@ -622,9 +627,11 @@ class DracRedfishRAIDTestCase(test_utils.BaseDracTest):
                 task.node.driver_internal_info.get('raid_task_monitor_uris'))
             self.raid._set_failed.assert_not_called()
 
+    @mock.patch.object(drac_utils, 'get_jobs', autospec=True,
+                       return_value={})
     @mock.patch.object(redfish_utils, 'get_task_monitor', autospec=True)
     def test__check_raid_tasks_status_task_still_processing(
-            self, mock_get_task_monitor):
+            self, mock_get_task_monitor, mock_get_jobs):
         driver_internal_info = {
             'raid_task_monitor_uris': '/TaskService/123'}
         self.node.driver_internal_info = driver_internal_info
@@ -661,8 +668,11 @@ class DracRedfishRAIDTestCase(test_utils.BaseDracTest):
                 task.node.driver_internal_info.get('raid_task_monitor_uris'))
             self.raid._set_failed.assert_not_called()
 
+    @mock.patch.object(drac_utils, 'get_jobs', autospec=True,
+                       return_value={})
     @mock.patch.object(redfish_utils, 'get_task_monitor', autospec=True)
-    def test__check_raid_tasks_status_task_failed(self, mock_get_task_monitor):
+    def test__check_raid_tasks_status_task_failed(self, mock_get_task_monitor,
+                                                  mock_get_jobs):
         driver_internal_info = {
             'raid_task_monitor_uris': '/TaskService/123'}
         self.node.driver_internal_info = driver_internal_info
@@ -697,9 +707,11 @@ class DracRedfishRAIDTestCase(test_utils.BaseDracTest):
 
     @mock.patch.object(drac_raid.DracRedfishRAID,
                        '_convert_controller_to_raid_mode', autospec=True)
+    @mock.patch.object(drac_utils, 'get_jobs', autospec=True,
+                       return_value={})
     @mock.patch.object(redfish_utils, 'get_task_monitor', autospec=True)
     def test__check_raid_tasks_status_convert_controller(
-            self, mock_get_task_monitor, mock_convert):
+            self, mock_get_task_monitor, mock_get_jobs, mock_convert):
         driver_internal_info = {
             'raid_task_monitor_uris': '/TaskService/1',
             'raid_config_substep': 'clear_foreign_config'}
@@ -730,6 +742,96 @@ class DracRedfishRAIDTestCase(test_utils.BaseDracTest):
             self.assertIsNone(
                 task.node.driver_internal_info.get('raid_config_substep'))
 
+    @mock.patch.object(task_manager, 'acquire', autospec=True)
+    def test__query_raid_tasks_status_backing_off(self, mock_acquire):
+        driver_internal_info = {'raid_task_monitor_uris': ['/TaskService/123']}
+        mock_manager = mock.Mock()
+        node_list = [(self.node.uuid, 'idrac', '', driver_internal_info,
+                      self.node.driver_info)]
+        mock_manager.iter_nodes.return_value = node_list
+
+        with mock.patch.object(drac_utils, 'job_check_due', autospec=True,
+                               return_value=False) as mock_due:
+            self.raid._query_raid_tasks_status(mock_manager, self.context)
+
+        mock_due.assert_called_once_with(mock.ANY)
+        mock_acquire.assert_not_called()
+
+    def _check_with_jobs(self, jobs, task_mon_uris, shared=True):
+        self.node.set_driver_internal_info('raid_task_monitor_uris',
+                                           task_mon_uris)
+        self.node.save()
+        self.raid._set_success = mock.Mock()
+        self.raid._set_failed = mock.Mock()
+
+        with mock.patch.object(drac_utils, 'get_jobs', autospec=True,
+                               return_value=jobs) as mock_get_jobs, \
+                mock.patch.object(redfish_utils, 'get_task_monitor',
+                                  autospec=True) as mock_get_task_monitor:
+            with task_manager.acquire(self.context, self.node.uuid,
+                                      shared=shared) as task:
+                self.raid._check_raid_tasks_status(task, task_mon_uris)
+                mock_get_jobs.assert_called_once_with(
+                    task, [uri.rsplit('/', 1)[-1] for uri in task_mon_uris])
+                mock_get_task_monitor.assert_not_called()
+                return task
+
+    def test__check_raid_tasks_status_job_queue(self):
+        job = mock.Mock(is_finished=True, is_failed=False)
+        task = self._check_with_jobs({'JID_1': job},
+                                     ['/TaskService/Tasks/JID_1'])
+
+        self.assertFalse(task.shared)
+        self.raid._set_success.assert_called_once_with(task)
+        self.raid._set_failed.assert_not_called()
+        self.node.refresh()
+        self.assertIsNone(
+            self.node.driver_internal_info.get('raid_task_monitor_uris'))
+
+    def test__check_raid_tasks_status_job_queue_failed(self):
+        jobs = {'JID_1': mock.Mock(is_finished=True, is_failed=True,
+                                   message='Controller on fire'),
+                'JID_2': mock.Mock(is_finished=False)}
+        task = self._check_with_jobs(
+            jobs, ['/TaskService/Tasks/JID_1', '/TaskService/Tasks/JID_2'])
+
+        self.raid._set_success.assert_not_called()
+        self.raid._set_failed.assert_called_once_with(task, mock.ANY,
+                                                      mock.ANY)
+        self.assertIn('Controller on fire',
+                      self.raid._set_failed.call_args[0][2])
+
+    def test__check_raid_tasks_status_job_queue_running(self):
+        jobs = {'JID_1': mock.Mock(is_finished=True, is_failed=False),
+                'JID_2': mock.Mock(is_finished=False)}
+        task = self._check_with_jobs(
+            jobs, ['/TaskService/Tasks/JID_1', '/TaskService/Tasks/JID_2'])
+
+        self.assertFalse(task.shared)
+        self.raid._set_success.assert_not_called()
+        self.raid._set_failed.assert_not_called()
+        self.node.refresh()
+        self.assertEqual(
+            ['/TaskService/Tasks/JID_2'],
+            self.node.driver_internal_info['raid_task_monitor_uris'])
+
+    def test__check_raid_tasks_status_job_queue_nothing_finished(self):
+        jobs = {'JID_1': mock.Mock(is_finished=False)}
+        task = self._check_with_jobs(jobs, ['/TaskService/Tasks/JID_1'])
+
+        # The node is not locked until one of the jobs finishes
+        self.assertTrue(task.shared)
+        self.raid._set_success.assert_not_called()
+        self.raid._set_failed.assert_not_called()
+
+    @mock.patch.object(drac_utils, 'get_jobs', autospec=True)
+    def test__get_raid_jobs_no_job_queue(self, mock_get_jobs):
+        mock_get_jobs.side_effect = sushy.exceptions.OEMExtensionNotFoundError(
+            resource='Manager', name='Dell')
+        with task_manager.acquire(self.context, self.node.uuid) as task:
+            self.assertEqual({}, self.raid._get_raid_jobs(
+                task, ['/TaskService/Tasks/JID_1']))
+
     @mock.patch.object(manager_utils, 'notify_conductor_resume_deploy',
                        autospec=True)
     @mock.patch.object(manager_utils, 'notify_conductor_resume_clean',
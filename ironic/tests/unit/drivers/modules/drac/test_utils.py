@@ -14,6 +14,7 @@
 
 from unittest import mock
 
+from oslo_utils import uuidutils
 import sushy
 
 from ironic.common import exception
@@ -99,3 +100,160 @@ class DracUtilsOemManagerTestCase(test_utils.BaseDracTest):
                 task,
                 'test method',
                 lambda m: m.test_method())
+
+
+@mock.patch.object(drac_utils.time, 'monotonic', autospec=True)
+@mock.patch.object(redfish_utils, 'get_system', autospec=True)
+class DracUtilsJobQueueTestCase(test_utils.BaseDracTest):
+
+    def setUp(self):
+        super().setUp()
+        self.node = obj_utils.create_test_node(self.context,
+                                               driver='idrac',
+                                               driver_info=INFO_DICT)
+        self.config(job_status_max_interval=600, group='drac')
+        self.job = mock.Mock(identity='JID_1', job_state='Running',
+                             percent_complete=10)
+        self.other_job = mock.Mock(identity='JID_2', job_state='Completed',
+                                   percent_complete=100)
+        self.collection = mock.Mock()
+        self.collection.get_jobs.return_value = [self.job, self.other_job]
+        self.manager = mock.Mock()
+        self.manager.get_oem_extension.return_value.job_collection = (
+            self.collection)
+
+    def _get_jobs(self, job_ids=('JID_1',), node=None):
+        with task_manager.acquire(self.context,
+                                  (node or self.node).uuid) as task:
+            return drac_utils.get_jobs(task, list(job_ids))
+
+    def test_get_jobs(self, mock_get_system, mock_monotonic):
+        mock_get_system.return_value.managers = [self.manager]
+        mock_monotonic.return_value = 1000
+
+        self.assertEqual({'JID_1': self.job}, self._get_jobs())
+        self.collection.get_jobs.assert_called_once_with()
+        self.manager.get_oem_extension.assert_called_once_with('Dell')
+
+        # Read again after a while, the job collection is reused
+        mock_monotonic.return_value = 1120
+        self.assertEqual({'JID_1': self.job, 'JID_2': self.other_job},
+                         self._get_jobs(['JID_1', 'JID_2', 'JID_3']))
+        self.assertEqual(2, self.collection.get_jobs.call_count)
+        mock_get_system.assert_called_once_with(mock.ANY)
+
+    def test_get_jobs_shared_by_bmc(self, mock_get_system, mock_monotonic):
+        mock_get_system.return_value.managers = [self.manager]
+        mock_monotonic.return_value = 1000
+        other_node = obj_utils.create_test_node(
+            self.context, driver='idrac', driver_info=INFO_DICT,
+            uuid=uuidutils.generate_uuid())
+
+        self._get_jobs()
+        mock_monotonic.return_value = 1002
+        self.assertEqual({'JID_2': self.other_job},
+                         self._get_jobs(['JID_2'], node=other_node))
+        self.collection.get_jobs.assert_called_once_with()
+
+    def test_get_jobs_no_managers(self, mock_get_system, mock_monotonic):
+        mock_get_system.return_value.managers = []
+        self.assertRaises(exception.RedfishError, self._get_jobs)
+
+    def test_get_jobs_error(self, mock_get_system, mock_monotonic):
+        mock_get_system.return_value.managers = [self.manager]
+        mock_monotonic.return_value = 1000
+        self.collection.get_jobs.side_effect = [
+            sushy.exceptions.ConnectionError(url='url', error='boom'),
+            [self.job]]
+
+        self.assertRaises(sushy.exceptions.ConnectionError, self._get_jobs)
+        self.assertEqual({'JID_1': self.job}, self._get_jobs())
+        # The job collection is looked up again after an error
+        self.assertEqual(2, mock_get_system.call_count)
+
+    def test_job_check_due_backoff(self, mock_get_system, mock_monotonic):
+        mock_get_system.return_value.managers = [self.manager]
+        mock_monotonic.return_value = 1000
+        self.assertTrue(drac_utils.job_check_due(self.node))
+
+        self._get_jobs()
+        self.assertTrue(drac_utils.job_check_due(self.node))
+
+        # No progress: wait twice as long before the next check
+        mock_monotonic.return_value = 1120
+        self._get_jobs()
+        mock_monotonic.return_value = 1240
+        self.assertFalse(drac_utils.job_check_due(self.node))
+        mock_monotonic.return_value = 1360
+        self.assertTrue(drac_utils.job_check_due(self.node))
+
+        self._get_jobs()
+        mock_monotonic.return_value = 1700
+        self.assertFalse(drac_utils.job_check_due(self.node))
+
+        # Up to the maximum interval
+        mock_monotonic.return_value = 1800
+        self._get_jobs()
+        mock_monotonic.return_value = 2300
+        self.assertFalse(drac_utils.job_check_due(self.node))
+        mock_monotonic.return_value = 2340
+        self.assertTrue(drac_utils.job_check_due(self.node))
+
+        # Progress resets the interval
+        self.job.percent_complete = 50
+        self._get_jobs()
+        self.assertTrue(drac_utils.job_check_due(self.node))
+
+    def test_job_check_due_default_max_interval(self, mock_get_system,
+                                                mock_monotonic):
+        self.config(job_status_max_interval=None, group='drac')
+        self.config(query_raid_config_job_status_interval=120, group='drac')
+        mock_get_system.return_value.managers = [self.manager]
+
+        def _run_periodic(now):
+            mock_monotonic.return_value = now
+            if drac_utils.job_check_due(self.node):
+                return self._get_jobs()['JID_1'].job_state
+
+        # No progress for a long time, the interval reaches its maximum
+        checked = [_run_periodic(now) for now in range(1000, 3000, 120)]
+        self.assertIn(None, checked[-2:])
+
+        # The finished job is noticed at most one periodic interval later
+        # than without the back off.
+        self.job.job_state = 'Completed'
+        self.assertIn('Completed', [_run_periodic(3000),
+                                    _run_periodic(3120)])
+
+    def test_job_check_due_no_backoff(self, mock_get_system, mock_monotonic):
+        self.config(job_status_max_interval=0, group='drac')
+        mock_get_system.return_value.managers = [self.manager]
+        mock_monotonic.return_value = 1000
+        self._get_jobs()
+        mock_monotonic.return_value = 1120
+        self._get_jobs()
+        self.assertTrue(drac_utils.job_check_due(self.node))
+
+    def test_job_queues_idle_removed(self, mock_get_system, mock_monotonic):
+        mock_get_system.return_value.managers = [self.manager]
+        other_node = obj_utils.create_test_node(
+            self.context, driver='idrac', uuid=uuidutils.generate_uuid(),
+            driver_info=dict(INFO_DICT, redfish_address='5.6.7.8'))
+
+        mock_monotonic.return_value = 1000
+        self._get_jobs()
+        mock_monotonic.return_value = 2000
+        self._get_jobs(node=other_node)
+        self.assertEqual(2, len(drac_utils._JOB_QUEUES))
+
+        # Not checked for longer than twice the maximum interval
+        mock_monotonic.return_value = 2300
+        self._get_jobs(node=other_node)
+        self.assertEqual(['5.6.7.8'], list(drac_utils._JOB_QUEUES))
+        self.assertTrue(drac_utils.job_check_due(self.node))
+
+    def test_job_id_from_task_monitor(self, mock_get_system,
+                                      mock_monotonic):
+        self.assertEqual('JID_123', drac_utils.job_id_from_task_monitor(
+            '/redfish/v1/TaskService/TaskMonitors/JID_123'))
+        self.assertEqual('', drac_utils.job_id_from_task_monitor(None))
@@ -10,12 +10,17 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import binascii
 from unittest import mock
 
+from construct import core
+
 from ironic.conductor import task_manager
 from ironic.conf import CONF
 from ironic.drivers.modules.inspector.hooks import parse_lldp as hook
 from ironic.drivers.modules.inspector import lldp_parsers as nv
+from ironic.drivers.modules.inspector import lldp_tlvs as tlv
+from ironic.tests import base
 from ironic.tests.unit.db import base as db_base
 from ironic.tests.unit.objects import utils as obj_utils
 
@@ -451,3 +456,92 @@ class ParseLLDPTestCase(db_base.DbTestCase):
                                           self.plugin_data)
             self.assertEqual(self.expected, self.plugin_data['parsed_lldp'])
             self.assertEqual(1, mock_log.call_count)
+
+    def test_parsed_tlvs_cached(self):
+        tlvs = [
+            [1, "04112233aabbcc"],  # ChassisId
+            [2, "07373334"],  # PortId
+            [127, "0080c203006507766c616e313031"],  # dot1 VlanName
+        ]
+        expected = {
+            nv.LLDP_CHASSIS_ID_NM: "11:22:33:aa:bb:cc",
+            nv.LLDP_PORT_ID_NM: "734",
+            nv.LLDP_PORT_VLANS_NM: [{'name': 'vlan101', 'id': 101}],
+        }
+        parse_hook = hook.ParseLLDPHook()
+        with mock.patch.object(nv.LLDPBasicMgmtParser, 'parse_tlv',
+                               autospec=True,
+                               side_effect=nv.LLDPBasicMgmtParser.parse_tlv
+                               ) as mock_parse:
+            first = parse_hook._parse_lldp_tlvs(tlvs, self.node.uuid)
+            self.assertEqual(3, mock_parse.call_count)
+            first[nv.LLDP_PORT_VLANS_NM].append('modified')
+
+            second = parse_hook._parse_lldp_tlvs(tlvs, self.node.uuid)
+            self.assertEqual(3, mock_parse.call_count)
+            self.assertEqual(expected, second)
+
+            # Different TLVs are parsed again
+            parse_hook._parse_lldp_tlvs(tlvs[:2], self.node.uuid)
+            self.assertEqual(5, mock_parse.call_count)
+
+    @mock.patch.object(nv.LOG, 'warning', autospec=True)
+    def test_invalid_tlvs_not_cached(self, mock_log):
+        tlvs = [[1, "04112233aabbcc"], [5, "ff"]]
+        parse_hook = hook.ParseLLDPHook()
+        for _i in range(2):
+            nv_dict = parse_hook._parse_lldp_tlvs(tlvs, self.node.uuid)
+            self.assertEqual({nv.LLDP_CHASSIS_ID_NM: "11:22:33:aa:bb:cc"},
+                             nv_dict)
+        self.assertEqual(2, mock_log.call_count)
+        self.assertEqual({}, hook._PARSED_TLVS)
+
+
+class FastDecodersTestCase(base.TestCase):
+
+    def _assert_same(self, definition, value):
+        data = binascii.unhexlify(value)
+        expected = definition.parse(data)
+        with mock.patch.object(definition, 'parse', autospec=True) as parse:
+            result = tlv.parse(definition, memoryview(data))
+            parse.assert_not_called()
+        self.assertEqual(expected, result)
+        self.assertIsInstance(result, core.Container)
+        return result
+
+    def test_matches_construct(self):
+        for definition, value in [
+                (tlv.ChassisId, "04112233aabbcc"),
+                (tlv.ChassisId, "0773776974636831"),
+                (tlv.PortId, "03112233aabbcc"),
+                (tlv.PortId, "0545746865726e6574312f31"),
+                (tlv.PortDesc, "706f72742033"),
+                (tlv.SysName, "737730312d646973742d31622d623132"),
+                (tlv.SysDesc, ""),
+                (tlv.OrgSpecific, "0080c2010066"),
+                (tlv.Dot1_UntaggedVlanId, "0066"),
+                (tlv.Dot1_MgmtVlanId, "0058"),
+                (tlv.Dot1_VlanName, "006507766c616e313031"),
+                (tlv.Dot1_VlanName, "006508766c616e31303100"),
+                (tlv.Dot1_LinkAggregationId, "0300000002"),
+                (tlv.Dot1_LinkAggregationId, "0100000002"),
+                (tlv.Dot3_MTU, "05ea")]:
+            self._assert_same(definition, value)
+
+    def test_subtype(self):
+        result = self._assert_same(tlv.PortId, "03112233aabbcc")
+        self.assertEqual('mac_address', result.subtype)
+        self.assertEqual(3, int(result.subtype))
+
+    def test_fallback(self):
+        for definition, value in [
+                (tlv.ChassisId, "0501c0000201"),  # IANA address
+                (tlv.ChassisId, "0801"),  # unknown subtype
+                (tlv.PortId, "03112233"),  # truncated MAC
+                (tlv.Dot1_VlanName, "006507"),  # truncated name
+                (tlv.Dot3_MTU, "05")]:  # truncated int
+            data = binascii.unhexlify(value)
+            with mock.patch.object(definition, 'parse', autospec=True,
+                                   return_value='parsed') as parse:
+                self.assertEqual('parsed', tlv.parse(definition, data))
+                parse.assert_called_once_with(data)
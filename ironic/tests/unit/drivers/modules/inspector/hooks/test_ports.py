@@ -10,6 +10,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from unittest import mock
+
 from oslo_utils import uuidutils
 
 from ironic.conductor import task_manager
@@ -62,6 +64,37 @@ class AddPortsTestCase(db_base.DbTestCase):
             {mac: False for mac in self.macs})
 
 
+    def test_address_used_by_other_node(self):
+        other_node = obj_utils.create_test_node(
+            self.context, uuid=uuidutils.generate_uuid())
+        obj_utils.create_test_port(self.context, node_id=other_node.id,
+                                   address=_PXE_INTERFACE)
+        with task_manager.acquire(self.context, self.node.id) as task:
+            ports_hook.add_ports(task, self.interfaces)
+        ports = objects.Port.list_by_node_id(self.context, self.node.id)
+        self.assertEqual(self.macs - {_PXE_INTERFACE},
+                         {port.address for port in ports})
+
+    def test_hook_single_transaction(self):
+        obj_utils.create_test_port(self.context,
+                                   node_id=self.node.id,
+                                   address='00:11:00:11:00:11')
+        CONF.set_override('keep_ports', 'present', group='inspector')
+        plugin_data = {'valid_interfaces': self.interfaces,
+                       'all_interfaces': self.interfaces,
+                       'macs': self.macs}
+        with mock.patch.object(
+                objects.Port, 'reconcile_node_ports', autospec=True,
+                side_effect=objects.Port.reconcile_node_ports) as mock_rec:
+            with task_manager.acquire(self.context, self.node.id) as task:
+                ports_hook.PortsHook()(task, {}, plugin_data)
+        mock_rec.assert_called_once_with(
+            self.context, self.node.id, create=mock.ANY, update=[],
+            destroy=[mock.ANY])
+        ports = objects.Port.list_by_node_id(self.context, self.node.id)
+        self.assertEqual(self.macs, {port.address for port in ports})
+
+
 class UpdatePortsTestCase(db_base.DbTestCase):
     def setUp(self):
         super().setUp()
@@ -10,7 +10,6 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import inspect
 from unittest import mock
 
 from oslo_config import cfg
@@ -1016,14 +1015,18 @@ class IronicNetworkingNetworkActionsTestCase(
 
     def _expected_update_call(self, description, mode, native_vlan,
                               allowed_vlans=None, default_vlan=None):
-        signature = inspect.signature(networking_api.update_port)
-        expected_kwargs = {'allowed_vlans': allowed_vlans}
-        if 'lag_name' in signature.parameters:
-            expected_kwargs['lag_name'] = None
-        if 'default_vlan' in signature.parameters:
-            expected_kwargs['default_vlan'] = default_vlan
-        return (mock.ANY, '00:11:22:33:44:55', 'GigE1/0/1', description,
-                mode, native_vlan), expected_kwargs
+        change = {'action': 'update', 'switch_id': '00:11:22:33:44:55',
+                  'port_name': 'GigE1/0/1', 'description': description,
+                  'mode': mode, 'native_vlan': native_vlan,
+                  'allowed_vlans': allowed_vlans, 'lag_name': None,
+                  'default_vlan': default_vlan}
+        return (mock.ANY, [change]), {}
+
+    def _expected_reset_call(self, native_vlan, default_vlan=None):
+        change = {'action': 'reset', 'switch_id': '00:11:22:33:44:55',
+                  'port_name': 'GigE1/0/1', 'native_vlan': native_vlan,
+                  'allowed_vlans': None, 'default_vlan': default_vlan}
+        return mock.ANY, [change]
 
     def _prepare_task(self, provision_state):
         self.node.provision_state = provision_state
@@ -1043,9 +1046,9 @@ class IronicNetworkingNetworkActionsTestCase(
                           network_type, config_value=None):
         if config_value is not None:
             self._configure_driver_info(network_type, config_value)
-        with mock.patch.object(networking_api, 'update_port',
+        with mock.patch.object(networking_api, 'update_ports',
                                autospec=True) as update_mock:
-            update_mock.return_value = {'status': 'updated'}
+            update_mock.return_value = [{'status': 'configured'}]
             with self._prepare_task(provision_state) as task:
                 getattr(self.interface, method_name)(task)
         update_mock.assert_called()
@@ -1055,9 +1058,9 @@ class IronicNetworkingNetworkActionsTestCase(
                              network_type, config_value=None):
         if config_value is not None:
             self._configure_driver_info(network_type, config_value)
-        with mock.patch.object(networking_api, 'reset_port',
+        with mock.patch.object(networking_api, 'update_ports',
                                autospec=True) as reset_mock:
-            reset_mock.return_value = {'status': 'reset'}
+            reset_mock.return_value = [{'status': 'reset'}]
             with self._prepare_task(provision_state) as task:
                 getattr(self.interface, method_name)(task)
         reset_mock.assert_called()
@@ -1076,8 +1079,7 @@ class IronicNetworkingNetworkActionsTestCase(
             'remove_provisioning_network', states.DEPLOYING,
             'provisioning', 'access/native_vlan=200')
         mock_call.assert_called_with(
-            mock.ANY, '00:11:22:33:44:55', 'GigE1/0/1', 200,
-            allowed_vlans=None, default_vlan=None)
+            *self._expected_reset_call(200))
 
     def test_add_provisioning_network_with_idle(self):
         CONF.set_override('idle_network', 'access/native_vlan=1',
@@ -1097,8 +1099,7 @@ class IronicNetworkingNetworkActionsTestCase(
             'remove_provisioning_network', states.DEPLOYING,
             'provisioning', 'access/native_vlan=200')
         mock_call.assert_called_with(
-            mock.ANY, '00:11:22:33:44:55', 'GigE1/0/1', 200,
-            allowed_vlans=None, default_vlan=1)
+            *self._expected_reset_call(200, default_vlan=1))
 
     def test_add_cleaning_network_without_config(self):
         mock_call = self._test_add_network('add_cleaning_network',
@@ -1111,8 +1112,7 @@ class IronicNetworkingNetworkActionsTestCase(
         mock_call = self._test_remove_network('remove_cleaning_network',
                                               states.CLEANING, 'cleaning')
         mock_call.assert_called_with(
-            mock.ANY, '00:11:22:33:44:55', 'GigE1/0/1', 100,
-            allowed_vlans=None, default_vlan=None)
+            *self._expected_reset_call(100))
 
     def test_add_rescuing_network_with_config(self):
         mock_call = self._test_add_network(
@@ -1127,8 +1127,7 @@ class IronicNetworkingNetworkActionsTestCase(
             'remove_rescuing_network', states.RESCUING,
             'rescuing', 'access/native_vlan=333')
         mock_call.assert_called_with(
-            mock.ANY, '00:11:22:33:44:55', 'GigE1/0/1', 333,
-            allowed_vlans=None, default_vlan=None)
+            *self._expected_reset_call(333))
 
     def test_add_inspection_network_without_config(self):
         mock_call = self._test_add_network('add_inspection_network',
@@ -1142,8 +1141,7 @@ class IronicNetworkingNetworkActionsTestCase(
                                               states.INSPECTING,
                                               'inspection')
         mock_call.assert_called_with(
-            mock.ANY, '00:11:22:33:44:55', 'GigE1/0/1', 100,
-            allowed_vlans=None, default_vlan=None)
+            *self._expected_reset_call(100))
 
     def test_add_servicing_network_with_config(self):
         mock_call = self._test_add_network(
@@ -1158,31 +1156,65 @@ class IronicNetworkingNetworkActionsTestCase(
             'remove_servicing_network', states.SERVICING,
             'servicing', 'access/native_vlan=444')
         mock_call.assert_called_with(
-            mock.ANY, '00:11:22:33:44:55', 'GigE1/0/1', 444,
-            allowed_vlans=None, default_vlan=None)
+            *self._expected_reset_call(444))
 
     def test_configure_tenant_networks(self):
-        with mock.patch.object(networking_api, 'update_port',
+        with mock.patch.object(networking_api, 'update_ports',
                                autospec=True) as update_mock:
-            update_mock.return_value = {'status': 'updated'}
+            update_mock.return_value = [{'status': 'configured'}]
             with task_manager.acquire(self.context, self.node.uuid) as task:
                 task.ports = [self.port]
                 self.interface.configure_tenant_networks(task)
-        update_mock.assert_called_with(
-            self.context, '00:11:22:33:44:55', 'GigE1/0/1',
-            f'Ironic Port {self.port.uuid}', 'access', 100,
-            allowed_vlans=None, lag_name=None, default_vlan=None)
+        expected_args, _kwargs = self._expected_update_call(
+            f'Ironic Port {self.port.uuid}', 'access', 100)
+        update_mock.assert_called_once_with(self.context, *expected_args[1:])
+
+    def test_configure_tenant_networks_single_call(self):
+        port2 = self._create_test_port(
+            local_link_connection={'switch_id': '00:11:22:33:44:55',
+                                   'port_id': 'GigE1/0/2'},
+            extra={'switchport': {'mode': 'access', 'native_vlan': 100}})
+        with mock.patch.object(networking_api, 'update_ports',
+                               autospec=True) as update_mock:
+            update_mock.return_value = [{'status': 'configured'}] * 2
+            with task_manager.acquire(self.context, self.node.uuid) as task:
+                task.ports = [self.port, port2]
+                self.interface.configure_tenant_networks(task)
+        update_mock.assert_called_once_with(self.context, mock.ANY)
+        self.assertEqual(['GigE1/0/1', 'GigE1/0/2'],
+                         [change['port_name']
+                          for change in update_mock.call_args[0][1]])
+
+    def test_configure_tenant_networks_port_failed(self):
+        with mock.patch.object(networking_api, 'update_ports',
+                               autospec=True) as update_mock:
+            update_mock.return_value = [{'status': 'failed',
+                                         'error': 'boom'}]
+            with task_manager.acquire(self.context, self.node.uuid) as task:
+                task.ports = [self.port]
+                self.assertRaisesRegex(
+                    exception.NetworkError, self.port.uuid,
+                    self.interface.configure_tenant_networks, task)
 
     def test_unconfigure_tenant_networks(self):
-        with mock.patch.object(networking_api, 'reset_port',
+        with mock.patch.object(networking_api, 'update_ports',
                                autospec=True) as reset_mock:
-            reset_mock.return_value = {'status': 'reset'}
+            reset_mock.return_value = [{'status': 'reset'}]
             with task_manager.acquire(self.context, self.node.uuid) as task:
                 task.ports = [self.port]
                 self.interface.unconfigure_tenant_networks(task)
-        reset_mock.assert_called_with(
-            self.context, '00:11:22:33:44:55', 'GigE1/0/1', 100,
-            allowed_vlans=None, default_vlan=None)
+        reset_mock.assert_called_once_with(
+            self.context, *self._expected_reset_call(100)[1:])
+
+    def test_unconfigure_tenant_networks_batch_failed(self):
+        with mock.patch.object(networking_api, 'update_ports',
+                               autospec=True) as reset_mock:
+            reset_mock.side_effect = exception.NetworkError('boom')
+            with task_manager.acquire(self.context, self.node.uuid) as task:
+                task.ports = [self.port]
+                self.assertRaisesRegex(
+                    exception.NetworkError, self.port.uuid,
+                    self.interface.unconfigure_tenant_networks, task)
 
     def test_validate_rescue_success(self):
         with self._prepare_task(states.RESCUING) as task:
@@ -621,7 +621,7 @@ class RedfishVirtualMediaBootTestCase(db_base.DbTestCase):
             }
 
             mock_prepare_deploy_iso.assert_called_once_with(
-                task, expected_params, 'deploy', {})
+                task, expected_params, 'deploy', {}, shared=False)
 
             mock_node_set_boot_device.assert_called_once_with(
                 task, boot_devices.CDROM, False)
@@ -679,7 +679,7 @@ class RedfishVirtualMediaBootTestCase(db_base.DbTestCase):
             }
 
             mock_prepare_deploy_iso.assert_called_once_with(
-                task, expected_params, 'deploy', {})
+                task, expected_params, 'deploy', {}, shared=False)
 
             mock_node_set_boot_device.assert_called_once_with(
                 task, boot_devices.CDROM, False)
@@ -761,7 +761,7 @@ class RedfishVirtualMediaBootTestCase(db_base.DbTestCase):
             }
 
             mock_prepare_deploy_iso.assert_called_once_with(
-                task, expected_params, 'deploy', d_info)
+                task, expected_params, 'deploy', d_info, shared=False)
 
             mock_node_set_boot_device.assert_called_once_with(
                 task, boot_devices.CDROM, False)
@@ -843,13 +843,66 @@ class RedfishVirtualMediaBootTestCase(db_base.DbTestCase):
             }
 
             mock_prepare_deploy_iso.assert_called_once_with(
-                task, expected_params, 'deploy', d_info)
+                task, expected_params, 'deploy', d_info, shared=False)
 
             mock_node_set_boot_device.assert_called_once_with(
                 task, boot_devices.CDROM, False)
 
             mock_boot_mode_utils.sync_boot_mode.assert_called_once_with(task)
 
+    @mock.patch.object(redfish_boot.manager_utils, 'node_set_boot_device',
+                       autospec=True)
+    @mock.patch.object(image_utils, 'prepare_floppy_image', autospec=True)
+    @mock.patch.object(image_utils, 'prepare_deploy_iso', autospec=True)
+    @mock.patch.object(redfish_boot, '_has_vmedia_device', autospec=True)
+    @mock.patch.object(redfish_boot, '_eject_vmedia', autospec=True)
+    @mock.patch.object(redfish_boot, '_insert_vmedia', autospec=True)
+    @mock.patch.object(redfish_boot, '_select_transport_protocol',
+                       autospec=True)
+    @mock.patch.object(redfish_boot, '_detect_supported_transport_protocols',
+                       autospec=True)
+    @mock.patch.object(redfish_boot, '_parse_driver_info', autospec=True)
+    @mock.patch.object(redfish_boot.manager_utils, 'node_power_action',
+                       autospec=True)
+    @mock.patch.object(redfish_boot, 'boot_mode_utils', autospec=True)
+    @mock.patch.object(redfish_utils, 'get_system', autospec=True)
+    def test_prepare_ramdisk_with_usb_shared_iso(
+            self, mock_system, mock_boot_mode_utils, mock_node_power_action,
+            mock__parse_driver_info, mock_detect_protocols,
+            mock_select_protocol, mock__insert_vmedia, mock__eject_vmedia,
+            mock__has_vmedia_device, mock_prepare_deploy_iso,
+            mock_prepare_floppy_image, mock_node_set_boot_device):
+        self.config(shared_deploy_iso=True, group='redfish')
+        mock_detect_protocols.return_value = ['HTTP']
+        mock_select_protocol.return_value = 'HTTP'
+        with task_manager.acquire(self.context, self.node.uuid,
+                                  shared=False) as task:
+            task.node.provision_state = states.DEPLOYING
+            d_info = {'config_via_removable': True}
+            mock__parse_driver_info.return_value = d_info
+            mock__has_vmedia_device.return_value = sushy.VIRTUAL_MEDIA_USBSTICK
+            mock_prepare_floppy_image.return_value = 'floppy-image-url'
+            mock_prepare_deploy_iso.return_value = 'cd-image-url'
+
+            task.driver.boot.prepare_ramdisk(task, {})
+
+            expected_params = {
+                'boot_method': 'vmedia',
+                'ipa-debug': '1',
+                'ipa-agent-token': mock.ANY,
+            }
+            mock_prepare_floppy_image.assert_called_once_with(
+                task, params=expected_params)
+            mock_prepare_deploy_iso.assert_called_once_with(
+                task, expected_params, 'deploy', d_info, shared=True)
+
+            # No removable device to pass the configuration
+            mock_prepare_deploy_iso.reset_mock()
+            mock__has_vmedia_device.return_value = None
+            task.driver.boot.prepare_ramdisk(task, {})
+            mock_prepare_deploy_iso.assert_called_once_with(
+                task, expected_params, 'deploy', d_info, shared=False)
+
     @mock.patch.object(redfish_boot.manager_utils, 'node_set_boot_device',
                        autospec=True)
     @mock.patch.object(image_utils, 'prepare_deploy_iso', autospec=True)
@@ -899,7 +952,7 @@ class RedfishVirtualMediaBootTestCase(db_base.DbTestCase):
             }
 
             mock_prepare_deploy_iso.assert_called_once_with(
-                task, expected_params, 'deploy', {})
+                task, expected_params, 'deploy', {}, shared=False)
 
             mock_node_set_boot_device.assert_called_once_with(
                 task, boot_devices.CDROM, False)
@@ -1015,7 +1068,7 @@ class RedfishVirtualMediaBootTestCase(db_base.DbTestCase):
             }
 
             mock_prepare_deploy_iso.assert_called_once_with(
-                task, expected_params, 'deploy', {})
+                task, expected_params, 'deploy', {}, shared=False)
 
             mock_node_set_boot_device.assert_called_once_with(
                 task, boot_devices.CDROM, False)
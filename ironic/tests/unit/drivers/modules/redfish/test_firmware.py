@@ -1255,8 +1255,8 @@ class RedfishFirmwareTestCase(db_base.DbTestCase):
         from ironic.drivers.modules.drac import firmware as drac_fw
         manager_mock = mock.Mock()
         oem_mock = manager_mock.get_oem_extension.return_value
-        oem_mock.job_collection.get_unfinished_jobs.return_value = [
-            'JID_839968767020']
+        oem_mock.job_collection.get_jobs.return_value = [
+            mock.Mock(identity='JID_839968767020', is_finished=False)]
         get_system_mock.return_value.managers = [manager_mock]
 
         current_update = {
@@ -1277,7 +1277,8 @@ class RedfishFirmwareTestCase(db_base.DbTestCase):
         from ironic.drivers.modules.drac import firmware as drac_fw
         manager_mock = mock.Mock()
         oem_mock = manager_mock.get_oem_extension.return_value
-        oem_mock.job_collection.get_unfinished_jobs.return_value = []
+        oem_mock.job_collection.get_jobs.return_value = [
+            mock.Mock(identity='JID_839968767020', is_finished=True)]
         get_system_mock.return_value.managers = [manager_mock]
 
         current_update = {
@@ -666,6 +666,41 @@ class GenericSwitchDriverTestCase(base.TestCase):
             'Ethernet1/2', 1, trunk_details=None, default_vlan=None)
 
 
+    def test_port_session_looks_up_switch_once(self):
+        """Test the switch device is reused within a port session."""
+        switch = self._create_switch_mock('switch1')
+        self.mock_devices['switch1'] = switch
+        driver = gs.GenericSwitchDriver()
+
+        with driver.port_session('switch1'):
+            driver.update_port('switch1', 'Ethernet1/1', 'desc', 'access',
+                               100)
+            driver.reset_port('switch1', 'Ethernet1/2', native_vlan=100)
+
+        self.mock_get_switch_device.assert_called_once_with(
+            driver._devices, switch_info='switch1',
+            ngs_mac_address='switch1')
+        switch.plug_port_to_network.assert_called_once_with(
+            'Ethernet1/1', 100, trunk_details=None, default_vlan=None)
+        switch.delete_port.assert_called_once_with(
+            'Ethernet1/2', 100, trunk_details=None, default_vlan=None)
+        self.assertEqual({}, driver._session_switches)
+
+        # Outside of the session the switch is looked up again
+        driver.reset_port('switch1', 'Ethernet1/2', native_vlan=100)
+        self.assertEqual(2, self.mock_get_switch_device.call_count)
+
+    def test_port_session_switch_not_found(self):
+        """Test a port session on an unknown switch."""
+        driver = gs.GenericSwitchDriver()
+
+        def _session():
+            with driver.port_session('unknown'):
+                pass
+
+        self.assertRaises(SwitchNotFound, _session)
+        self.assertEqual({}, driver._session_switches)
+
 class GenericSwitchTranslatorTestCase(base.TestCase):
     """Test cases for GenericSwitchTranslator class."""
 
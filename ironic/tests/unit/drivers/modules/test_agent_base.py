@@ -514,6 +514,64 @@ class HeartbeatMixinTest(AgentDeployMixinBaseTest):
                 self.assertEqual(provision_state, task.node.provision_state)
             self.assertFalse(log_mock.called)
 
+    @mock.patch.object(manager_utils, 'record_agent_heartbeat', autospec=True)
+    def test_heartbeat_records_liveness_only(self, record_mock):
+        info = self.node.driver_internal_info
+        info['agent_url'] = 'http://127.0.0.1:8080'
+        info['agent_version'] = '3.2.0'
+        self.node.driver_internal_info = info
+        self.node.provision_state = states.CLEANING
+        self.node.save()
+        with task_manager.acquire(
+                self.context, self.node.uuid, shared=True) as task:
+            with mock.patch.object(task.node, 'save',
+                                   autospec=True) as save_mock:
+                self.deploy.heartbeat(task, 'http://127.0.0.1:8080', '3.2.0')
+                self.assertFalse(save_mock.called)
+            self.assertTrue(task.shared)
+            record_mock.assert_called_once_with(task.node)
+
+    @mock.patch.object(manager_utils, 'record_agent_heartbeat', autospec=True)
+    def test_heartbeat_records_agent_version_change(self, record_mock):
+        info = self.node.driver_internal_info
+        info['agent_url'] = 'http://127.0.0.1:8080'
+        info['agent_version'] = '3.1.0'
+        self.node.driver_internal_info = info
+        self.node.provision_state = states.CLEANING
+        self.node.save()
+        with task_manager.acquire(
+                self.context, self.node.uuid, shared=True) as task:
+            self.deploy.heartbeat(task, 'http://127.0.0.1:8080', '3.2.0')
+            self.assertFalse(task.shared)
+        self.node.refresh()
+        self.assertEqual('3.2.0',
+                         self.node.driver_internal_info['agent_version'])
+        self.assertIsNotNone(
+            self.node.driver_internal_info['agent_last_heartbeat'])
+        self.assertFalse(record_mock.called)
+
+    @mock.patch.object(manager_utils, 'record_agent_heartbeat', autospec=True)
+    @mock.patch.object(agent_base.HeartbeatMixin,
+                       'process_next_step', autospec=True)
+    def test_heartbeat_polling_unchanged_agent(self, next_step_mock,
+                                               record_mock):
+        self.node.provision_state = states.DEPLOYWAIT
+        info = self.node.driver_internal_info
+        info['agent_cached_deploy_steps'] = ['step1']
+        info['deployment_polling'] = True
+        info['agent_url'] = 'url'
+        info['agent_version'] = '3.2.0'
+        self.node.driver_internal_info = info
+        self.node.save()
+        with task_manager.acquire(self.context, self.node.uuid,
+                                  shared=True) as task:
+            self.deploy.heartbeat(task, 'url', '3.2.0')
+            self.assertFalse(task.shared)
+            record_mock.assert_called_once_with(task.node)
+            self.assertNotIn('agent_last_heartbeat',
+                             task.node.driver_internal_info)
+            self.assertFalse(next_step_mock.called)
+
     def test_heartbeat_records_fast_track(self):
         self.config(fast_track=True, group='deploy')
         for provision_state in [states.ENROLL, states.MANAGEABLE,
@@ -441,6 +441,100 @@ class RedfishImageUtilsTestCase(db_base.DbTestCase):
 
             mock_unpublish.assert_called_once_with(mock.ANY, object_name)
 
+    def _create_boot_iso(self, context, output_filename, *args, **kwargs):
+        with open(output_filename, 'w') as fp:
+            fp.write('iso')
+
+    @mock.patch.object(utils, 'execute', autospec=True)
+    @mock.patch.object(images, 'create_boot_iso', autospec=True)
+    def test__prepare_shared_iso_image(self, mock_create_boot_iso,
+                                       mock_execute):
+        http_root = tempfile.mkdtemp()
+        self.addCleanup(utils.rmtree_without_raise, http_root)
+        self.config(http_root=http_root, http_url='http://10.0.0.1',
+                    group='deploy')
+        self.config(tempdir=http_root)
+        mock_create_boot_iso.side_effect = self._create_boot_iso
+        node2 = obj_utils.create_test_node(
+            self.context, driver='redfish', driver_info=INFO_DICT,
+            uuid=uuidutils.generate_uuid(), provision_state=states.DEPLOYING)
+
+        urls = []
+        for node in (self.node, node2):
+            with task_manager.acquire(self.context, node.uuid,
+                                      shared=True) as task:
+                urls.append(image_utils._prepare_shared_iso_image(
+                    task, 'http://kernel/img', 'http://ramdisk/img',
+                    bootloader_href='http://bootloader/img'))
+
+        self.assertEqual(urls[0], urls[1])
+        file_name = os.path.basename(urls[0])
+        self.assertTrue(file_name.startswith('shared-boot-'))
+        self.assertEqual('http://10.0.0.1/redfish/%s' % file_name, urls[0])
+        self.assertTrue(os.path.exists(
+            os.path.join(http_root, 'redfish', file_name)))
+        mock_create_boot_iso.assert_called_once_with(
+            mock.ANY, mock.ANY, 'http://kernel/img', 'http://ramdisk/img',
+            esp_image_href='http://bootloader/img', kernel_cmd_line=mock.ANY,
+            boot_mode='uefi', inject_files={}, publisher_id=mock.ANY)
+        kernel_cmd_line = str(
+            mock_create_boot_iso.call_args[1]['kernel_cmd_line'])
+        self.assertIn('boot_method=vmedia', kernel_cmd_line)
+        self.assertNotIn('ipa-agent-token', kernel_cmd_line)
+
+        # A different ramdisk results in a different ISO
+        with task_manager.acquire(self.context, node2.uuid,
+                                  shared=True) as task:
+            url = image_utils._prepare_shared_iso_image(
+                task, 'http://kernel/img', 'http://ramdisk/img2',
+                bootloader_href='http://bootloader/img')
+        self.assertNotEqual(urls[0], url)
+        self.assertEqual(2, mock_create_boot_iso.call_count)
+
+        # An outdated ISO is built again, very old ISOs are removed
+        old_path = os.path.join(http_root, 'redfish', os.path.basename(url))
+        os.utime(old_path, (0, 0))
+        path = os.path.join(http_root, 'redfish', file_name)
+        mtime = os.path.getmtime(path) - 3601
+        os.utime(path, (mtime, mtime))
+        with task_manager.acquire(self.context, self.node.uuid,
+                                  shared=True) as task:
+            url = image_utils._prepare_shared_iso_image(
+                task, 'http://kernel/img', 'http://ramdisk/img',
+                bootloader_href='http://bootloader/img')
+        self.assertEqual(urls[0], url)
+        self.assertEqual(3, mock_create_boot_iso.call_count)
+        self.assertTrue(os.path.exists(path))
+        self.assertFalse(os.path.exists(old_path))
+
+    @mock.patch.object(images, 'create_boot_iso', autospec=True)
+    def test__prepare_shared_iso_image_swift(self, mock_create_boot_iso):
+        self.config(use_swift=True, group='redfish')
+        with task_manager.acquire(self.context, self.node.uuid,
+                                  shared=True) as task:
+            self.assertIsNone(image_utils._prepare_shared_iso_image(
+                task, 'http://kernel/img', 'http://ramdisk/img'))
+        mock_create_boot_iso.assert_not_called()
+
+    def test__shared_iso_digest_inject_files(self):
+        with tempfile.NamedTemporaryFile() as ca_file:
+            ca_file.write(b'cert1')
+            ca_file.flush()
+            digest1 = image_utils._shared_iso_digest(
+                'kernel', 'ramdisk', None, 'uefi', 'nofb',
+                {ca_file.name: 'ironic.crt'})
+            self.assertEqual(digest1, image_utils._shared_iso_digest(
+                'kernel', 'ramdisk', None, 'uefi', 'nofb',
+                {ca_file.name: 'ironic.crt'}))
+            ca_file.write(b'cert2')
+            ca_file.flush()
+            self.assertNotEqual(digest1, image_utils._shared_iso_digest(
+                'kernel', 'ramdisk', None, 'uefi', 'nofb',
+                {ca_file.name: 'ironic.crt'}))
+        self.assertNotEqual(digest1, image_utils._shared_iso_digest(
+            'kernel', 'ramdisk', None, 'bios', 'nofb',
+            {b'cert1': 'ironic.crt'}))
+
     @mock.patch.object(uuidutils, 'generate_uuid', autospec=True)
     @mock.patch.object(image_utils.ImageHandler, 'publish_image',
                        autospec=True)
@@ -1252,6 +1346,62 @@ class RedfishImageUtilsTestCase(db_base.DbTestCase):
                 task, 'kernel', 'ramdisk', bootloader_href=None,
                 params={}, inject_files=expected_files, base_iso=None)
 
+    @mock.patch.object(image_utils, '_prepare_shared_iso_image',
+                       autospec=True)
+    @mock.patch.object(image_utils, '_prepare_iso_image', autospec=True)
+    def test_prepare_deploy_iso_shared(self, mock__prepare_iso_image,
+                                       mock__prepare_shared_iso_image):
+        mock__prepare_shared_iso_image.return_value = 'shared-url'
+        with task_manager.acquire(self.context, self.node.uuid,
+                                  shared=True) as task:
+            d_info = {
+                'deploy_kernel': 'kernel',
+                'deploy_ramdisk': 'ramdisk',
+                'bootloader': 'bootloader'
+            }
+            task.node.driver_info.update(d_info)
+
+            result = image_utils.prepare_deploy_iso(task, {}, 'deploy',
+                                                    d_info, shared=True)
+
+            self.assertEqual('shared-url', result)
+            mock__prepare_shared_iso_image.assert_called_once_with(
+                task, 'kernel', 'ramdisk', bootloader_href='bootloader',
+                inject_files={})
+            mock__prepare_iso_image.assert_not_called()
+
+            # Falls back to a node-specific ISO if sharing is not possible
+            mock__prepare_shared_iso_image.return_value = None
+            result = image_utils.prepare_deploy_iso(task, {}, 'deploy',
+                                                    d_info, shared=True)
+            self.assertEqual(mock__prepare_iso_image.return_value, result)
+            mock__prepare_iso_image.assert_called_once_with(
+                task, 'kernel', 'ramdisk', bootloader_href='bootloader',
+                params={}, inject_files={}, base_iso=None)
+
+    @mock.patch.object(image_utils, '_prepare_shared_iso_image',
+                       autospec=True)
+    @mock.patch.object(image_utils, '_prepare_iso_image', autospec=True)
+    def test_prepare_deploy_iso_shared_network_data(
+            self, mock__prepare_iso_image, mock__prepare_shared_iso_image):
+        with task_manager.acquire(self.context, self.node.uuid,
+                                  shared=True) as task:
+            d_info = {
+                'deploy_kernel': 'kernel',
+                'deploy_ramdisk': 'ramdisk'
+            }
+            task.node.driver_info.update(d_info)
+            task.driver.network.get_node_network_data = mock.MagicMock(
+                return_value={'a': ['b']})
+
+            image_utils.prepare_deploy_iso(task, {}, 'deploy', d_info,
+                                           shared=True)
+
+            mock__prepare_shared_iso_image.assert_not_called()
+            mock__prepare_iso_image.assert_called_once_with(
+                task, 'kernel', 'ramdisk', bootloader_href=None,
+                params={}, inject_files=mock.ANY, base_iso=None)
+
     @mock.patch.object(image_utils, '_prepare_iso_image', autospec=True)
     def test_prepare_deploy_iso_network_data_skipped_for_inspection(
             self, mock__prepare_iso_image):
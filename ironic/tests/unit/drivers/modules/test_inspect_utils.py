@@ -560,7 +560,8 @@ class RunInspectionHooksTestCase(db_base.DbTestCase):
         self.task = mock.Mock(spec=task_manager.TaskManager, node=self.node)
         self.hooks = [
             mock.Mock(name=str(i),
-                      obj=mock.MagicMock(spec=hooks_base.InspectionHook))
+                      obj=mock.MagicMock(spec=hooks_base.InspectionHook,
+                                         uses_port_changes=False))
             for i in range(2)
         ]
         self.on_error_plugin_data = mock.MagicMock()
@@ -579,6 +580,62 @@ class RunInspectionHooksTestCase(db_base.DbTestCase):
 
         self.on_error_plugin_data.assert_not_called()
 
+    def test_port_changes_applied_once(self):
+        self.task.context = self.context
+
+        def _add_port(address):
+            def _hook(task, inventory, plugin_data):
+                with hooks_base.port_changes(task) as ports:
+                    ports.create(address=address)
+            return _hook
+
+        def _check_ports(task, inventory, plugin_data):
+            # Hooks not using the port changes see the ports in the database
+            ports = objects.Port.list_by_node_id(self.context, self.node.id)
+            self.assertEqual({'11:11:11:11:11:11', '22:22:22:22:22:22'},
+                             {port.address for port in ports})
+
+        hooks = [
+            mock.Mock(obj=mock.Mock(side_effect=_add_port(address),
+                                    uses_port_changes=True))
+            for address in ('11:11:11:11:11:11', '22:22:22:22:22:22')
+        ] + [mock.Mock(obj=mock.Mock(side_effect=_check_ports,
+                                     uses_port_changes=False))]
+
+        with mock.patch.object(
+                objects.Port, 'reconcile_node_ports', autospec=True,
+                side_effect=objects.Port.reconcile_node_ports) as mock_rec:
+            utils.run_inspection_hooks(self.task, self.inventory,
+                                       self.plugin_data, hooks, None)
+
+        mock_rec.assert_called_once_with(
+            self.context, self.node.id, create=mock.ANY, update=[],
+            destroy=[])
+        hooks[2].obj.assert_called_once_with(
+            self.task, self.inventory, self.plugin_data)
+
+    def test_port_changes_discarded_on_failure(self):
+        self.task.context = self.context
+
+        def _add_port(task, inventory, plugin_data):
+            with hooks_base.port_changes(task) as ports:
+                ports.create(address='11:11:11:11:11:11')
+
+        hooks = [
+            mock.Mock(obj=mock.Mock(side_effect=_add_port,
+                                    uses_port_changes=True)),
+            mock.Mock(obj=mock.Mock(side_effect=RuntimeError('boom'),
+                                    uses_port_changes=True)),
+        ]
+
+        self.assertRaises(exception.HardwareInspectionFailure,
+                          utils.run_inspection_hooks, self.task,
+                          self.inventory, self.plugin_data, hooks, None)
+
+        # The port created by the first hook of the group is not saved
+        self.assertEqual(
+            [], objects.Port.list_by_node_id(self.context, self.node.id))
+
     def test_pre_hook_on_error_callback(self):
         failing_pre_hook = mock.MagicMock(spec=hooks_base.InspectionHook)
         failing_pre_hook.preprocess.side_effect = (
@@ -86,6 +86,20 @@ class NetworkingApiTestCase(unittest.TestCase):
             )
             self.assertIs(result, api_mock.reset_port.return_value)
 
+    def test_update_ports_delegates_to_rpc(self):
+        api_mock = mock.Mock()
+        with mock.patch.object(
+            api, "get_networking_api", return_value=api_mock,
+            autospec=True
+        ):
+            context = object()
+            changes = [{"action": "reset", "switch_id": "switch1",
+                        "port_name": "eth1"}]
+            result = api.update_ports(context, changes)
+
+            api_mock.update_ports.assert_called_once_with(context, changes)
+            self.assertIs(result, api_mock.update_ports.return_value)
+
     def test_update_lag_delegates_to_rpc(self):
         api_mock = mock.Mock()
         with mock.patch.object(
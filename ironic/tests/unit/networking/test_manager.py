@@ -12,12 +12,14 @@
 
 """Unit tests for networking manager."""
 
+import contextlib
 import unittest.mock as mock
 
 from oslo_config import cfg
 import oslo_messaging as messaging
 
 from ironic.common import exception
+from ironic.drivers.modules.switch.base import NoOpSwitchDriver
 from ironic.drivers.modules.switch.base import SwitchDriverException
 from ironic.drivers.modules.switch.base import SwitchMethodNotImplemented
 from ironic.networking import manager
@@ -499,6 +501,23 @@ class TestNetworkingManager(test_base.TestCase):
             "test-switch",
         )
 
+    def test_get_switch_driver_cached(self):
+        """Test the driver found for a switch is cached."""
+        mock_factory = mock.Mock()
+        mock_factory.names = ["driver1"]
+        mock_driver = mock.Mock()
+        mock_driver.is_switch_configured.return_value = True
+        mock_factory.get_driver.return_value = mock_driver
+        self.manager._switch_driver_factory = mock_factory
+
+        self.assertEqual(mock_driver,
+                         self.manager._get_switch_driver("switch1"))
+        self.assertEqual(mock_driver,
+                         self.manager._get_switch_driver("switch1"))
+
+        mock_factory.get_driver.assert_called_once_with("driver1")
+        mock_driver.is_switch_configured.assert_called_once_with("switch1")
+
 
 class TestNetworkingManagerAdditionalMethods(test_base.TestCase):
     """Additional test cases for NetworkingManager methods."""
@@ -1234,3 +1253,122 @@ class TestNetworkingManagerGetSwitches(test_base.TestCase):
         mock_driver1.get_switch_ids.assert_called_once()
         mock_driver1.get_switch_info.assert_called_once()
         mock_driver2.get_switch_ids.assert_called_once()
+
+
+class TestNetworkingManagerUpdatePorts(test_base.TestCase):
+    """Test cases for the update_ports batch method."""
+
+    def setUp(self):
+        super(TestNetworkingManagerUpdatePorts, self).setUp()
+        self.context = mock.Mock()
+        self.manager = manager.NetworkingManager(
+            host="test-host", topic="test-topic"
+        )
+        self.driver = NoOpSwitchDriver()
+        self.sessions = []
+        mock_factory = mock.Mock()
+        mock_factory.names = ["noop"]
+        mock_factory.get_driver.return_value = self.driver
+        self.manager._switch_driver_factory = mock_factory
+
+    def _record_session(self, driver, switch_id):
+        self.sessions.append(switch_id)
+        return contextlib.nullcontext()
+
+    @mock.patch.object(NoOpSwitchDriver, "reset_port", autospec=True)
+    @mock.patch.object(NoOpSwitchDriver, "update_port", autospec=True)
+    def test_update_ports_grouped_by_switch(self, mock_update, mock_reset):
+        changes = [
+            {"action": "update", "switch_id": "switch-01",
+             "port_name": "port-01", "description": "Port 1",
+             "mode": "trunk", "native_vlan": 100,
+             "allowed_vlans": [101, 102]},
+            {"action": "reset", "switch_id": "switch-02",
+             "port_name": "port-02", "native_vlan": 100,
+             "default_vlan": 1},
+            {"action": "update", "switch_id": "switch-01",
+             "port_name": "port-03", "mode": "access",
+             "native_vlan": 200},
+        ]
+        with mock.patch.object(NoOpSwitchDriver, "port_session",
+                               autospec=True,
+                               side_effect=self._record_session):
+            result = self.manager.update_ports(self.context, changes)
+
+        # One session per switch, in the order the switches first appear
+        self.assertEqual(["switch-01", "switch-02"], self.sessions)
+        self.assertEqual(
+            [mock.call(self.driver, "switch-01", "port-01", "Port 1",
+                       "trunk", 100, allowed_vlans=[101, 102],
+                       default_vlan=None, lag_name=None),
+             mock.call(self.driver, "switch-01", "port-03", None,
+                       "access", 200, allowed_vlans=None,
+                       default_vlan=None, lag_name=None)],
+            mock_update.call_args_list)
+        mock_reset.assert_called_once_with(
+            self.driver, "switch-02", "port-02", 100, allowed_vlans=None,
+            default_vlan=1)
+        self.assertEqual(["configured", "reset", "configured"],
+                         [r["status"] for r in result])
+        self.assertEqual(["port-01", "port-02", "port-03"],
+                         [r["port_name"] for r in result])
+        # The switch drivers were resolved once per switch
+        self.assertEqual(2, self.manager._switch_driver_factory
+                         .get_driver.call_count)
+
+    @mock.patch.object(NoOpSwitchDriver, "update_port", autospec=True)
+    def test_update_ports_invalid_change(self, mock_update):
+        changes = [
+            {"action": "update", "switch_id": "switch-01",
+             "port_name": "port-01", "mode": "access", "native_vlan": 100},
+            {"action": "update", "switch_id": "switch-01",
+             "port_name": "port-02", "mode": "access", "native_vlan": 5000},
+        ]
+        exc = self.assertRaises(
+            messaging.rpc.ExpectedException,
+            self.manager.update_ports,
+            self.context,
+            changes,
+        )
+        self.assertEqual(exception.InvalidParameterValue, exc.exc_info[0])
+        mock_update.assert_not_called()
+
+    def test_update_ports_unknown_action(self):
+        changes = [{"action": "delete", "switch_id": "switch-01",
+                    "port_name": "port-01"}]
+        exc = self.assertRaises(
+            messaging.rpc.ExpectedException,
+            self.manager.update_ports,
+            self.context,
+            changes,
+        )
+        self.assertEqual(exception.InvalidParameterValue, exc.exc_info[0])
+
+    @mock.patch.object(NoOpSwitchDriver, "reset_port", autospec=True)
+    def test_update_ports_change_failure(self, mock_reset):
+        mock_reset.side_effect = [SwitchDriverException("boom"), None]
+        changes = [
+            {"action": "reset", "switch_id": "switch-01",
+             "port_name": "port-01", "native_vlan": 100},
+            {"action": "reset", "switch_id": "switch-01",
+             "port_name": "port-02", "native_vlan": 100},
+        ]
+        result = self.manager.update_ports(self.context, changes)
+
+        self.assertEqual(2, mock_reset.call_count)
+        self.assertEqual("failed", result[0]["status"])
+        self.assertIn("boom", result[0]["error"])
+        self.assertEqual("reset", result[1]["status"])
+
+    @mock.patch.object(NoOpSwitchDriver, "port_session", autospec=True)
+    def test_update_ports_session_failure(self, mock_session):
+        mock_session.return_value.__exit__.side_effect = (
+            SwitchDriverException("commit failed"))
+        changes = [
+            {"action": "reset", "switch_id": "switch-01",
+             "port_name": "port-01", "native_vlan": 100},
+        ]
+        result = self.manager.update_ports(self.context, changes)
+
+        self.assertEqual("failed", result[0]["status"])
+        self.assertIn("commit failed", result[0]["error"])
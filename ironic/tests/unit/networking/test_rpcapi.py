@@ -306,6 +306,58 @@ class TestNetworkingAPI(test_base.TestCase):
         )
         self.assertEqual({"status": "reset"}, result)
 
+    @mock.patch.object(rpcapi.NetworkingAPI, "_prepare_call", autospec=True)
+    def test_update_ports_success(self, mock_prepare):
+        """Test successful update_ports call."""
+        mock_cctxt = mock.Mock()
+        mock_prepare.return_value = mock_cctxt
+        mock_cctxt.call.return_value = [{"status": "reset"}]
+        changes = [{"action": "reset", "switch_id": "switch-01",
+                    "port_name": "port-01", "native_vlan": 100}]
+
+        result = self.api.update_ports(self.context, changes)
+
+        mock_prepare.assert_called_once_with(
+            self.api, topic=None, version="1.1"
+        )
+        mock_cctxt.call.assert_called_once_with(
+            self.context, "update_ports", port_changes=changes
+        )
+        self.assertEqual([{"status": "reset"}], result)
+
+    @mock.patch.object(rpcapi.NetworkingAPI, "reset_port", autospec=True)
+    @mock.patch.object(rpcapi.NetworkingAPI, "update_port", autospec=True)
+    @mock.patch.object(rpcapi.NetworkingAPI, "_prepare_call", autospec=True)
+    def test_update_ports_pinned(self, mock_prepare, mock_update,
+                                 mock_reset):
+        """Test update_ports falls back to one call per port when pinned."""
+        self.api.client = mock.Mock()
+        self.api.client.can_send_version.return_value = False
+        mock_update.return_value = {"status": "configured"}
+        mock_reset.side_effect = exception.NetworkError("boom")
+        changes = [{"action": "update", "switch_id": "switch-01",
+                    "port_name": "port-01", "description": "desc",
+                    "mode": "access", "native_vlan": 100},
+                   {"action": "reset", "switch_id": "switch-01",
+                    "port_name": "port-02", "native_vlan": 100}]
+
+        result = self.api.update_ports(self.context, changes)
+
+        self.assertFalse(mock_prepare.called)
+        self.api.client.can_send_version.assert_called_once_with("1.1")
+        mock_update.assert_called_once_with(
+            self.api, self.context, topic=None, switch_id="switch-01",
+            port_name="port-01", description="desc", mode="access",
+            native_vlan=100)
+        mock_reset.assert_called_once_with(
+            self.api, self.context, topic=None, switch_id="switch-01",
+            port_name="port-02", native_vlan=100)
+        self.assertEqual(
+            [{"status": "configured"},
+             {"switch_id": "switch-01", "port_name": "port-02",
+              "status": "failed", "error": "boom"}],
+            result)
+
     @mock.patch.object(rpcapi.NetworkingAPI, "_prepare_call", autospec=True)
     def test_get_switches_success(self, mock_prepare):
         """Test successful get_switches call."""
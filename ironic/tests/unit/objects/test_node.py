@@ -14,6 +14,7 @@
 #    under the License.
 
 import datetime
+import itertools
 from unittest import mock
 
 from oslo_serialization import jsonutils
@@ -24,6 +25,7 @@ from ironic.common import context
 from ironic.common import exception
 from ironic.db.sqlalchemy.api import Connection as db_conn
 from ironic import objects
+from ironic.objects import base as objects_base
 from ironic.objects import node as node_objects
 from ironic.tests.unit.db import base as db_base
 from ironic.tests.unit.db import utils as db_utils
@@ -187,6 +189,21 @@ class TestNodeObject(db_base.DbTestCase, obj_utils.SchemasTestMixIn):
             mock_get_node.assert_called_once_with(['aa:bb:cc:dd:ee:ff'])
             self.assertEqual(self.context, node._context)
 
+    def test_get_lookup_info_by_port_addresses(self):
+        with mock.patch.object(self.dbapi, 'get_node_by_port_addresses',
+                               autospec=True) as mock_get_node:
+            mock_get_node.return_value = self.fake_node
+
+            node = objects.Node.get_lookup_info_by_port_addresses(
+                self.context, ['aa:bb:cc:dd:ee:ff'])
+
+            mock_get_node.assert_called_once_with(
+                ['aa:bb:cc:dd:ee:ff'],
+                fields=objects.Node.LOOKUP_FIELDS)
+            self.assertEqual(self.context, node._context)
+            self.assertEqual(self.fake_node['uuid'], node.uuid)
+            self.assertFalse(node.obj_attr_is_set('instance_info'))
+
     def test_save(self):
         uuid = self.fake_node['uuid']
         test_time = datetime.datetime(2000, 1, 1, 0, 0)
@@ -377,6 +394,29 @@ class TestNodeObject(db_base.DbTestCase, obj_utils.SchemasTestMixIn):
             self.assertEqual(expected, mock_get_node.call_args_list)
             self.assertEqual(self.context, n._context)
 
+    def test_get_merges_agent_last_heartbeat(self):
+        uuid = self.fake_node['uuid']
+        heartbeat = datetime.datetime(2000, 1, 1, 0, 0)
+        for recorded, expected in [(None, '2000-01-01T00:00:00'),
+                                   ('1999-12-31T23:59:00',
+                                    '2000-01-01T00:00:00'),
+                                   ('2000-01-01T00:01:00',
+                                    '2000-01-01T00:01:00')]:
+            dii = {'agent_url': 'a_url'}
+            if recorded:
+                dii['agent_last_heartbeat'] = recorded
+            db_node = dict(self.fake_node, driver_internal_info=dii,
+                           agent_last_heartbeat=heartbeat)
+            with mock.patch.object(self.dbapi, 'get_node_by_uuid',
+                                   autospec=True) as mock_get_node:
+                mock_get_node.return_value = db_node
+                n = objects.Node.get(self.context, uuid)
+            self.assertEqual(
+                expected, n.driver_internal_info['agent_last_heartbeat'])
+            self.assertEqual({}, n.obj_get_changes())
+            # The DB entity itself is not modified
+            self.assertEqual(recorded, dii.get('agent_last_heartbeat'))
+
     def test_save_after_refresh(self):
         # Ensure that it's possible to do object.save() after object.refresh()
         db_node = db_utils.create_test_node()
@@ -459,6 +499,63 @@ class TestNodeObject(db_base.DbTestCase, obj_utils.SchemasTestMixIn):
             self.assertIsInstance(nodes[0].traits, objects.TraitList)
             self.assertIn('traits', nodes[0])
 
+    def test_list_projections(self):
+        node = obj_utils.create_test_node(
+            self.context, uuid=uuidutils.generate_uuid(),
+            provision_updated_at=datetime.datetime(2000, 1, 1, 0, 0),
+            driver_internal_info={'agent_url': 'http://1.2.3.4:9999'},
+            instance_info=None)
+        heartbeat = datetime.datetime(2000, 1, 2, 0, 0)
+        self.dbapi.update_agent_heartbeats({node.id: heartbeat})
+        fields = ['uuid', 'name', 'provision_state', 'provision_updated_at',
+                  'driver_internal_info', 'instance_info', 'maintenance']
+
+        projections = objects.Node.list_projections(self.context, fields)
+        expected = objects.Node.list(self.context, fields=fields)
+        self.assertThat(projections, matchers.HasLength(1))
+        projection = projections[0]
+        for field in projection.fields:
+            self.assertEqual(getattr(expected[0], field),
+                             getattr(projection, field), field)
+        self.assertEqual(heartbeat.isoformat(),
+                         projection.driver_internal_info[
+                             'agent_last_heartbeat'])
+        self.assertEqual({}, projection.instance_info)
+        self.assertIsNotNone(projection.provision_updated_at.tzinfo)
+        self.assertEqual(node.uuid, projection['uuid'])
+        self.assertNotIn('extra', projection.fields)
+        self.assertRaises(AttributeError, setattr, projection, 'name', 'foo')
+
+    def test_list_projections_type_cache_bounded(self):
+        objects_base._projection_type.cache_clear()
+        names = ['uuid', 'name', 'driver', 'owner', 'lessee', 'maintenance']
+        # Every order of the requested fields is a distinct type
+        for fields in itertools.permutations(names, 4):
+            objects_base._projection_type(objects.Node, fields)
+        self.assertEqual(
+            128, objects_base._projection_type.cache_info().currsize)
+
+    def test_list_projections_old_version(self):
+        fake_node = db_utils.get_test_node(version='1.43')
+        columns = ['id', 'uuid', 'version', 'updated_at', 'created_at',
+                   'owner', 'lessee', 'driver', 'conductor_group']
+        with mock.patch.object(self.dbapi, 'get_nodeinfo_list',
+                               autospec=True) as mock_get_list:
+            mock_get_list.return_value = [tuple(fake_node[c]
+                                                for c in columns)]
+            with mock.patch.object(
+                    node_objects.Node, 'convert_to_version', autospec=True,
+                    side_effect=node_objects.Node.convert_to_version
+            ) as mock_convert:
+                projections = objects.Node.list_projections(
+                    self.context, ['uuid'], filters={'maintenance': False})
+        self.assertEqual(fake_node['uuid'], projections[0].uuid)
+        mock_convert.assert_called_once_with(
+            mock.ANY, objects.Node.VERSION, remove_unavailable_fields=False)
+        mock_get_list.assert_called_once_with(
+            columns=columns, filters={'maintenance': False}, limit=None,
+            marker=None, sort_key=None, sort_dir=None)
+
     def test_reserve(self):
         with mock.patch.object(self.dbapi, 'reserve_node',
                                autospec=True) as mock_reserve:
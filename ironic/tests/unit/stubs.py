@@ -13,6 +13,8 @@
 #    under the License.
 
 
+import collections
+
 from openstack.connection import exceptions as openstack_exc
 from oslo_utils import uuidutils
 
@@ -117,6 +119,71 @@ class FakeNeutronPort(dict):
             raise AttributeError(key)
 
 
+class StubNeutronClient(object):
+    """An in-memory neutron client for the port binding workflow.
+
+    Created ports become ``ACTIVE`` once they have been listed
+    ``polls_until_active`` times, unless their MAC address is in
+    ``binding_failed_macs``. The number of calls of every method is recorded
+    in ``calls``.
+    """
+
+    def __init__(self, polls_until_active=1, binding_failed_macs=(),
+                 agents=None):
+        self.polls_until_active = polls_until_active
+        self.binding_failed_macs = set(binding_failed_macs)
+        self.agents_alive = agents or {}
+        self.calls = collections.Counter()
+        self._ports = {}
+        self._polls = collections.Counter()
+
+    def _create(self, attrs):
+        port = FakeNeutronPort(id=uuidutils.generate_uuid(), status='DOWN',
+                               **attrs)
+        self._ports[port.id] = port
+        return port
+
+    def create_port(self, **attrs):
+        self.calls['create_port'] += 1
+        return self._create(attrs)
+
+    def create_ports(self, data):
+        self.calls['create_ports'] += 1
+        return [self._create(attrs) for attrs in data]
+
+    def update_port(self, port_id, **attrs):
+        self.calls['update_port'] += 1
+        port = self.get_port(port_id)
+        port.update(attrs)
+        return port
+
+    def get_port(self, port_id):
+        try:
+            return self._ports[port_id]
+        except KeyError:
+            raise openstack_exc.NotFoundException(port_id)
+
+    def ports(self, **filters):
+        self.calls['ports'] += 1
+        port_ids = filters.get('id', list(self._ports))
+        for port_id in port_ids:
+            port = self._ports.get(port_id)
+            if port is None:
+                continue
+            self._polls[port_id] += 1
+            if port.mac_address in self.binding_failed_macs:
+                port['binding:vif_type'] = 'binding_failed'
+            elif self._polls[port_id] >= self.polls_until_active:
+                port.status = 'ACTIVE'
+            yield port
+
+    def agents(self, **filters):
+        self.calls['agents'] += 1
+        host = filters.get('host')
+        if host in self.agents_alive:
+            yield FakeNeutronAgent(host=host, alive=self.agents_alive[host])
+
+
 class FakeNeutronSubnet(dict):
     def __init__(self, **attrs):
         SUBNET_ATTRS = ['id',
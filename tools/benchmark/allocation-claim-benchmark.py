@@ -0,0 +1,122 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Compare burst node reservation strategies used by allocations.
+
+Simulates ``CONCURRENCY`` allocations starting at the same time, all picking
+from the same list of available nodes, and reports how long it takes for all
+of them to get a node and how many lock collisions happened on the way.
+
+Nodes are only reserved and released again under a dedicated tag, they are
+not allocated. Still, do not run this against a production database.
+"""
+
+import concurrent.futures
+import random
+import sys
+import time
+
+from ironic.common import exception
+from ironic.common import service
+from ironic.common import states
+from ironic.conf import CONF  # noqa To Load Configuration
+from ironic.db import api as db_api
+
+
+CONCURRENCY = 50
+PAGE_SIZE = 50
+TAG = 'allocation-claim-benchmark'
+
+
+def _add_a_line():
+    print('------------------------------------------------------------')
+
+
+def _candidates(dbapi):
+    rows = dbapi.get_nodeinfo_list(
+        columns=['uuid'],
+        filters={'provision_state': states.AVAILABLE,
+                 'associated': False,
+                 'reserved': False,
+                 'maintenance': False})
+    return [row[0] for row in rows]
+
+
+def _reserve_one_by_one(dbapi, node_ids):
+    """The historical approach: try to lock nodes in a random order."""
+    node_ids = list(node_ids)
+    random.shuffle(node_ids)
+    collisions = 0
+    for node_id in node_ids:
+        try:
+            dbapi.reserve_node(TAG, node_id)
+        except exception.NodeLocked:
+            collisions += 1
+            continue
+        return node_id, collisions
+    return None, collisions
+
+
+def _reserve_from_pages(dbapi, node_ids):
+    """The current approach: skip locked nodes a page at a time."""
+    node_ids = list(node_ids)
+    random.shuffle(node_ids)
+    collisions = 0
+    for offset in range(0, len(node_ids), PAGE_SIZE):
+        page = node_ids[offset:offset + PAGE_SIZE]
+        unreserved = {row[0] for row in dbapi.get_nodeinfo_list(
+            columns=['uuid'], filters={'reserved': False, 'uuid_in': page})}
+        for node_id in page:
+            if node_id not in unreserved:
+                continue
+            try:
+                dbapi.reserve_node(TAG, node_id)
+            except exception.NodeLocked:
+                collisions += 1
+                continue
+            return node_id, collisions
+    return None, collisions
+
+
+def _run(name, func, dbapi, node_ids):
+    print('Phase - %s' % name)
+    _add_a_line()
+    start = time.time()
+    with concurrent.futures.ThreadPoolExecutor(CONCURRENCY) as executor:
+        results = list(executor.map(lambda _i: func(dbapi, node_ids),
+                                    range(CONCURRENCY)))
+    delta = time.time() - start
+    reserved = [node_id for node_id, _c in results if node_id is not None]
+    collisions = sum(c for _n, c in results)
+    print('%d of %d allocations reserved a node in %.3f seconds, '
+          '%d lock collisions.\n' % (len(reserved), CONCURRENCY, delta,
+                                     collisions))
+    for node_id in reserved:
+        dbapi.release_node(TAG, node_id)
+
+
+def main():
+    service.prepare_command()
+    CONF.set_override('debug', False)
+    dbapi = db_api.get_instance()
+    node_ids = _candidates(dbapi)
+    print('Found %d available and unreserved nodes.\n' % len(node_ids))
+    if not node_ids:
+        return 1
+    _run('Reserve nodes one by one', _reserve_one_by_one, dbapi, node_ids)
+    _run('Reserve nodes skipping locked pages', _reserve_from_pages, dbapi,
+         node_ids)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Measure the cost of building drivers when acquiring nodes.
+
+Builds drivers for ``ACQUIRES`` tasks spread over ``NODES`` generated nodes
+of the ``fake-hardware`` type with a few interface combinations, the way
+``task_manager.acquire`` does, once validating the composition on every call
+and once with the cached compositions. Locking and loading the node is not
+included, so neither a database nor a running conductor is needed.
+"""
+
+import random
+import sys
+import time
+import types
+
+from oslo_utils import uuidutils
+
+from ironic.common import driver_factory
+from ironic.conf import CONF  # noqa To Load Configuration
+from ironic import objects
+
+
+NODES = 100
+ACQUIRES = 10000
+COMBINATIONS = [
+    {'bios_interface': 'fake', 'raid_interface': 'fake'},
+    {'bios_interface': 'no-bios', 'raid_interface': 'fake'},
+    {'bios_interface': 'fake', 'raid_interface': 'no-raid'},
+]
+
+
+def _add_a_line():
+    print('------------------------------------------------------------')
+
+
+def _task(index):
+    interfaces = COMBINATIONS[index % len(COMBINATIONS)]
+    node = objects.Node(uuid=uuidutils.generate_uuid(), driver='fake-hardware',
+                        instance_info={}, **interfaces)
+    # Calculate the remaining interfaces like the API does on creation
+    driver_factory.check_and_update_node_interfaces(node)
+    node.obj_reset_changes()
+    return types.SimpleNamespace(node=node)
+
+
+def _uncached(task):
+    driver_factory._COMPOSITIONS.clear()
+    return driver_factory.build_driver_for_task(task)
+
+
+def _run(name, func, tasks):
+    print('Phase - %s' % name)
+    _add_a_line()
+    start = time.time()
+    for _i in range(ACQUIRES):
+        func(random.choice(tasks))
+    delta = time.time() - start
+    print('Built %d drivers in %.3f seconds, %.2f us per driver.\n'
+          % (ACQUIRES, delta, delta * 10 ** 6 / ACQUIRES))
+
+
+def main():
+    CONF([], project='ironic')
+    CONF.set_override('enabled_hardware_types', ['fake-hardware'])
+    for iface in ('boot', 'deploy', 'management', 'power'):
+        CONF.set_override('enabled_%s_interfaces' % iface, ['fake'])
+    for iface in ('bios', 'console', 'firmware', 'inspect', 'raid', 'rescue',
+                  'vendor'):
+        CONF.set_override('enabled_%s_interfaces' % iface,
+                          ['fake', 'no-%s' % iface])
+    CONF.set_override('enabled_network_interfaces', ['noop'])
+    CONF.set_override('enabled_storage_interfaces', ['noop'])
+    objects.register_all()
+    tasks = [_task(i) for i in range(NODES)]
+
+    _run('Validate the composition on every acquire', _uncached, tasks)
+    _run('Use the cached compositions', driver_factory.build_driver_for_task,
+         tasks)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,115 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Measure the cost of routing driver-scoped API requests to conductors.
+
+Registers ``CONDUCTORS`` fake conductors supporting ``HARDWARE_TYPES``
+hardware types each and routes ``REQUESTS`` requests the way the driver
+API does (driver properties, vendor passthru, RAID properties), once by
+loading the conductors from the database on every request and once using
+the cached conductor topology.
+
+The fake conductors are unregistered at the end, but real conductors and
+API services could route requests to them while the benchmark runs. Do
+not run this against a production database.
+"""
+
+import random
+import sys
+import time
+
+from ironic.common import hash_ring
+from ironic.common import service
+from ironic.conductor import rpcapi
+from ironic.conf import CONF  # noqa To Load Configuration
+from ironic.db import api as db_api
+
+
+CONDUCTORS = 20
+HARDWARE_TYPES = 10
+REQUESTS = 500
+PREFIX = 'driver-routing-benchmark'
+
+
+def _add_a_line():
+    print('------------------------------------------------------------')
+
+
+def _register(dbapi):
+    hardware_types = ['%s-%d' % (PREFIX, i) for i in range(HARDWARE_TYPES)]
+    conductors = []
+    for i in range(CONDUCTORS):
+        hostname = '%s-%d' % (PREFIX, i)
+        conductor = dbapi.register_conductor(
+            {'hostname': hostname, 'drivers': [],
+             'conductor_group': 'group%d' % (i % 4)},
+            update_existing=True)
+        dbapi.unregister_conductor_hardware_interfaces(conductor.id)
+        dbapi.register_conductor_hardware_interfaces(
+            conductor.id,
+            [{'hardware_type': hw_type, 'interface_type': 'deploy',
+              'interface_name': 'direct', 'default': True}
+             for hw_type in hardware_types])
+        conductors.append(conductor)
+    return conductors, hardware_types
+
+
+def _unregister(dbapi, conductors):
+    for conductor in conductors:
+        dbapi.unregister_conductor_hardware_interfaces(conductor.id)
+        dbapi.delete_conductor(conductor.hostname)
+
+
+def _uncached(dbapi, api, driver_name):
+    """The historical approach: load the conductors on every request."""
+    ring = hash_ring.HashRingManager(use_groups=False, cache=False).get_ring(
+        driver_name, '')
+    random.choice(list(ring.nodes))
+    random.choice(dbapi.get_online_conductors())
+
+
+def _cached(dbapi, api, driver_name):
+    api.get_topic_for_driver(driver_name)
+    api.get_random_topic()
+
+
+def _run(name, func, dbapi, api, hardware_types):
+    print('Phase - %s' % name)
+    _add_a_line()
+    start = time.time()
+    for _i in range(REQUESTS):
+        func(dbapi, api, random.choice(hardware_types))
+    delta = time.time() - start
+    print('Routed %d requests in %.3f seconds, %.3f ms per request.\n'
+          % (REQUESTS, delta, delta * 1000 / REQUESTS))
+
+
+def main():
+    service.prepare_command()
+    CONF.set_override('debug', False)
+    CONF.set_override('rpc_transport', 'none')
+    dbapi = db_api.get_instance()
+    conductors, hardware_types = _register(dbapi)
+    try:
+        api = rpcapi.ConductorAPI()
+        _run('Load conductors on every request', _uncached, dbapi, api,
+             hardware_types)
+        hash_ring.HashRingManager.reset()
+        _run('Use the cached conductor topology', _cached, dbapi, api,
+             hardware_types)
+    finally:
+        _unregister(dbapi, conductors)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
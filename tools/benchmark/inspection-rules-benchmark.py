@@ -0,0 +1,145 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Measure the cost of evaluating inspection rules.
+
+Applies ``RULES`` synthetic rules to ``NODES`` generated inventories, once
+compiling every rule on each evaluation and once with a compiled plan as
+used by the conductor. Only plugin data is modified by the rule actions, so
+neither a database nor a running conductor is needed.
+"""
+
+import random
+import sys
+import time
+import types
+
+from oslo_utils import uuidutils
+
+from ironic.common.inspection_rules import engine
+from ironic.conf import CONF  # noqa To Load Configuration
+
+
+RULES = 500
+NODES = 200
+
+
+def _add_a_line():
+    print('------------------------------------------------------------')
+
+
+def _inventory(index):
+    return {
+        'cpu': {'count': random.choice([16, 32, 64, 128]),
+                'architecture': random.choice(['x86_64', 'aarch64'])},
+        'memory': {'physical_mb': random.choice([65536, 262144, 524288])},
+        'interfaces': [
+            {'name': 'eth%d' % i,
+             'mac_address': '52:54:00:%02x:%02x:%02x' % (
+                 index % 256, i, random.randint(0, 255)),
+             'ipv4_address': '10.%d.%d.%d' % (i, index % 256,
+                                              random.randint(1, 254))}
+            for i in range(4)],
+        'disks': [{'name': '/dev/sd%s' % chr(ord('a') + i),
+                   'size': random.choice([480, 960, 1920]) * 10 ** 9,
+                   'model': random.choice(['SSD-A', 'SSD-B', 'HDD-C'])}
+                  for i in range(6)],
+        'bmc_address': '192.168.%d.%d' % (index // 256, index % 256),
+        'system_vendor': {'manufacturer': random.choice(['Dell', 'HPE',
+                                                         'Lenovo']),
+                          'product_name': 'server-%d' % (index % 8)},
+    }
+
+
+def _rule(index):
+    conditions = [
+        {'op': 'eq',
+         'args': {'values': ['{inventory[cpu][architecture]}',
+                             random.choice(['x86_64', 'aarch64'])]}},
+        {'op': 'matches',
+         'args': {'value': '{inventory[system_vendor][manufacturer]}',
+                  'regex': random.choice(['Dell', 'HPE', 'Lenovo'])}},
+    ]
+    if index % 5 == 0:
+        conditions.append(
+            {'op': 'in-net',
+             'args': {'address': '{inventory[bmc_address]}',
+                      'subnet': '{item}'},
+             'loop': ['10.0.0.0/8', '172.16.0.0/12', '192.168.0.0/16'],
+             'multiple': 'any'})
+    actions = [
+        {'op': 'set-plugin-data',
+         'args': {'path': 'rule-%d' % index,
+                  'value': {'bmc': '{inventory[bmc_address]}',
+                            'memory': '{inventory[memory][physical_mb]}',
+                            'source': 'benchmark'}}},
+        {'op': 'extend-plugin-data',
+         'args': {'path': 'matched', 'value': 'rule-%d' % index}},
+    ]
+    return {'uuid': uuidutils.generate_uuid(),
+            'priority': random.randint(0, 9999),
+            'sensitive': False,
+            'conditions': conditions,
+            'actions': actions}
+
+
+def _task(index):
+    node = types.SimpleNamespace(uuid=uuidutils.generate_uuid(),
+                                 driver='ipmi', name='node-%d' % index)
+    return types.SimpleNamespace(node=node, context=None)
+
+
+def _evaluate(rules, tasks, inventories):
+    matched = 0
+    for task, inventory in zip(tasks, inventories):
+        plugin_data = {}
+        for rule in rules:
+            result = engine._check_rule(task, rule, inventory, plugin_data)
+            if result is None:
+                continue
+            matched += 1
+            engine.apply_actions(task, rule, *result)
+    return matched
+
+
+def _run(name, rules, tasks, inventories):
+    print('Phase - %s' % name)
+    _add_a_line()
+    start = time.time()
+    matched = _evaluate(rules, tasks, inventories)
+    delta = time.time() - start
+    print('Applied %d rules to %d nodes in %.3f seconds, %.2f ms per node, '
+          '%d rules matched.\n' % (len(rules), len(tasks), delta,
+                                   delta * 1000 / len(tasks), matched))
+
+
+def main():
+    CONF([], project='ironic')
+    CONF.set_override('mask_secrets', 'never', group='inspection_rules')
+    random.seed(42)
+    rules = sorted((_rule(i) for i in range(RULES)),
+                   key=lambda rule: rule['priority'], reverse=True)
+    tasks = [_task(i) for i in range(NODES)]
+    inventories = [_inventory(i) for i in range(NODES)]
+
+    _run('Compile rules on every evaluation', rules, tasks, inventories)
+
+    start = time.time()
+    plan = [engine.compile_rule(rule) for rule in rules]
+    print('Compiled %d rules in %.3f seconds.\n' % (len(plan),
+                                                    time.time() - start))
+    _run('Evaluate the compiled plan', plan, tasks, inventories)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
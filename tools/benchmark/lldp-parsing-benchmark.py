@@ -0,0 +1,113 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Measure the cost of parsing the LLDP data reported by inspection.
+
+Generates LLDP TLVs for ``NODES`` nodes with ``INTERFACES`` interfaces each,
+the way a top of rack switch would report them, and parses them the way the
+``parse-lldp`` inspection hook does: once decoding every TLV with construct,
+once with the direct decoders for the common TLVs, and once more when the
+same nodes are inspected again and the parsed TLVs are cached. Neither a
+database nor a running conductor is needed.
+"""
+
+import sys
+import time
+from unittest import mock
+
+from ironic.conf import CONF  # noqa To Load Configuration
+from ironic.drivers.modules.inspector.hooks import parse_lldp
+from ironic.drivers.modules.inspector import lldp_tlvs
+
+
+NODES = 1000
+INTERFACES = 4
+
+
+def _add_a_line():
+    print('------------------------------------------------------------')
+
+
+def _hex(value):
+    return value.encode().hex()
+
+
+def _tlvs(node, interface):
+    switch = node // 40
+    port = 'Ethernet1/%d' % (node % 40 * INTERFACES + interface + 1)
+    return [
+        [1, '04' + '52540000%04x' % switch],  # ChassisId
+        [2, '05' + _hex(port)],  # PortId
+        [3, '0078'],  # TTL
+        [4, _hex('server %d port %d' % (node, interface))],  # PortDesc
+        [5, _hex('tor-%d.example.com' % switch)],  # SysName
+        [6, _hex('Network OS, version 10.2(4) build date 2024-01-01')],
+        [7, '00140014'],  # SysCapabilities
+        [8, '0501c000020f020000000000'],  # MgmtAddress
+        [127, '00120f0405ea'],  # dot3 MTU
+        [127, '00120f030300000002'],  # dot3 LinkAggregation
+        [127, '0080c2010066'],  # dot1 PortVlan
+        [127, '0080c2060058'],  # dot1 MgmtVID
+        [127, '0080c203006507766c616e313031'],  # dot1 VlanName
+        [127, '0080c203006607766c616e313032'],  # dot1 VlanName
+        [0, ''],
+    ]
+
+
+def _parse_all(hook, corpus):
+    for node_uuid, interfaces in corpus:
+        for tlvs in interfaces:
+            hook._parse_lldp_tlvs(tlvs, node_uuid)
+
+
+def _uncached(hook, corpus):
+    for node_uuid, interfaces in corpus:
+        for tlvs in interfaces:
+            parse_lldp._PARSED_TLVS.clear()
+            hook._parse_lldp_tlvs(tlvs, node_uuid)
+
+
+def _construct(hook, corpus):
+    """The historical approach: decode every TLV with construct."""
+    with mock.patch.object(lldp_tlvs, '_FAST_DECODERS', {}):
+        _uncached(hook, corpus)
+
+
+def _run(name, func, hook, corpus):
+    print('Phase - %s' % name)
+    _add_a_line()
+    start = time.time()
+    func(hook, corpus)
+    delta = time.time() - start
+    interfaces = len(corpus) * INTERFACES
+    print('Parsed LLDP data of %d interfaces of %d nodes in %.3f seconds, '
+          '%.1f us per interface.\n' % (interfaces, len(corpus), delta,
+                                        delta * 10 ** 6 / interfaces))
+
+
+def main():
+    CONF([], project='ironic')
+    corpus = [('node-%d' % node,
+               [_tlvs(node, interface) for interface in range(INTERFACES)])
+              for node in range(NODES)]
+    hook = parse_lldp.ParseLLDPHook()
+
+    _run('Decode every TLV with construct', _construct, hook, corpus)
+    _run('Decode the common TLVs directly', _uncached, hook, corpus)
+    _parse_all(hook, corpus)
+    _run('Inspect the same nodes again using the cached TLVs', _parse_all,
+         hook, corpus)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Measure the cost of turning node rows into objects for listings.
+
+Converts ``NODES`` generated node rows with the fields requested by the
+Compute service when it synchronizes its resources, once into versioned
+Node objects the way ``Node.list`` does and once into the read-only
+projections of ``Node.list_projections``. The rows are generated in memory,
+so neither a database nor a running conductor is needed.
+"""
+
+import datetime
+import sys
+import time
+
+from oslo_utils import uuidutils
+
+from ironic.common import states
+from ironic.conf import CONF  # noqa To Load Configuration
+from ironic import objects
+
+
+NODES = 10000
+FIELDS = ['uuid', 'power_state', 'target_power_state', 'provision_state',
+          'target_provision_state', 'last_error', 'maintenance',
+          'properties', 'instance_uuid', 'resource_class', 'instance_info',
+          'driver_info', 'provision_updated_at']
+
+
+def _add_a_line():
+    print('------------------------------------------------------------')
+
+
+def _row(index, columns):
+    values = {
+        'id': index,
+        'uuid': uuidutils.generate_uuid(),
+        'version': objects.Node.VERSION,
+        'created_at': datetime.datetime(2024, 1, 1),
+        'updated_at': datetime.datetime(2024, 1, 2),
+        'provision_updated_at': datetime.datetime(2024, 1, 2),
+        'owner': 'project%d' % (index % 10),
+        'lessee': None,
+        'driver': 'ipmi',
+        'conductor_group': '',
+        'power_state': states.POWER_ON,
+        'target_power_state': None,
+        'provision_state': states.ACTIVE,
+        'target_provision_state': None,
+        'last_error': None,
+        'maintenance': False,
+        'properties': {'cpus': 64, 'memory_mb': 262144, 'local_gb': 1024,
+                       'cpu_arch': 'x86_64', 'capabilities': 'boot_mode:uefi'},
+        'instance_uuid': uuidutils.generate_uuid(),
+        'resource_class': 'baremetal',
+        'instance_info': {'image_source': 'http://192.0.2.1/image.qcow2',
+                          'root_gb': 100},
+        'driver_info': {'ipmi_address': '192.0.2.%d' % (index % 250),
+                        'ipmi_username': 'admin',
+                        'ipmi_password': 'password'},
+    }
+    return tuple(values[c] for c in columns)
+
+
+def _objects(columns, rows):
+    """The historical approach: build a versioned object for every row."""
+    return objects.Node._from_db_object_list(
+        None, [dict(zip(columns, row)) for row in rows], columns)
+
+
+def _projections(columns, rows):
+    return objects.Node._projections_from_db_rows(None, rows, columns)
+
+
+def _run(name, func, columns, rows):
+    print('Phase - %s' % name)
+    _add_a_line()
+    start = time.time()
+    func(columns, rows)
+    delta = time.time() - start
+    print('Converted %d nodes in %.3f seconds, %.1f us per node.\n'
+          % (len(rows), delta, delta * 10 ** 6 / len(rows)))
+
+
+def main():
+    CONF([], project='ironic')
+    objects.register_all()
+    columns = list(dict.fromkeys(objects.Node._get_list_fields(FIELDS)))
+    rows = [_row(i, columns) for i in range(NODES)]
+
+    _run('Build versioned objects', _objects, columns, rows)
+    _run('Build read-only projections', _projections, columns, rows)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
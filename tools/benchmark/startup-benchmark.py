@@ -0,0 +1,139 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Measure the startup cost of the ironic services.
+
+Imports the ``ironic-conductor``, ``ironic-api`` and ``ironic`` (single
+process) commands ``RUNS`` times each in a new interpreter with
+``python -X importtime`` and reports the median import time together with
+the packages that took the longest to import. Then loads the enabled
+hardware types and interfaces the way the conductor does on start up, using
+the configuration files passed on the command line, e.g.::
+
+    python tools/benchmark/startup-benchmark.py \\
+        --config-file /etc/ironic/ironic.conf
+
+Neither a database nor a running service is needed.
+"""
+
+import collections
+import statistics
+import subprocess
+import sys
+
+
+RUNS = 5
+TOP_PACKAGES = 8
+
+COMMANDS = [
+    ('ironic-conductor', 'ironic.command.conductor'),
+    ('ironic-api', 'ironic.command.api'),
+    ('ironic', 'ironic.command.singleprocess'),
+]
+
+# Runs in a new interpreter, so that nothing is imported yet.
+DRIVER_LOADING = """
+import sys
+import time
+
+import ironic.command.conductor  # noqa
+from ironic.common import driver_factory
+from ironic.conf import CONF
+
+CONF(sys.argv[1:], project='ironic')
+start = time.time()
+hardware_types = driver_factory.hardware_types()
+loaded = time.time()
+interfaces = driver_factory.all_interfaces()
+for hw_type in hardware_types.values():
+    driver_factory.enabled_supported_interfaces(hw_type)
+done = time.time()
+print('%f %f %d %d' % (loaded - start, done - loaded, len(hardware_types),
+                       sum(len(ifaces) for ifaces in interfaces.values())))
+"""
+
+
+def _add_a_line():
+    print('------------------------------------------------------------')
+
+
+def _import_times(module):
+    """Import a module in a new interpreter.
+
+    :returns: a tuple of the cumulative import time of the module and a
+        dictionary mapping top level packages to their own import times, in
+        microseconds.
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c',
+                             'import %s' % module],
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE,
+                            check=True, text=True)
+    total = 0
+    packages = collections.Counter()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        try:
+            self_us, cumulative_us, name = line[12:].split('|')
+            self_us = int(self_us)
+        except ValueError:
+            continue  # the header
+        name = name.strip()
+        packages[name.split('.')[0]] += self_us
+        if name == module:
+            total = int(cumulative_us)
+    return total, packages
+
+
+def _run_imports(name, module):
+    print('Phase - Import %s (%s)' % (name, module))
+    _add_a_line()
+    totals = []
+    for _i in range(RUNS):
+        total, packages = _import_times(module)
+        totals.append(total)
+    print('Imported in %.3f seconds (median of %d runs, min %.3f, '
+          'max %.3f).' % (statistics.median(totals) / 10 ** 6, RUNS,
+                          min(totals) / 10 ** 6, max(totals) / 10 ** 6))
+    print('Slowest packages to import:')
+    for package, self_us in packages.most_common(TOP_PACKAGES):
+        print('  %-30s %.3f seconds' % (package, self_us / 10 ** 6))
+    print()
+
+
+def _run_driver_loading(args):
+    print('Phase - Load the enabled hardware types and interfaces')
+    _add_a_line()
+    result = subprocess.run([sys.executable, '-c', DRIVER_LOADING] + args,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            text=True)
+    if result.returncode:
+        print('Loading the drivers failed, check the configuration:')
+        print(result.stderr.strip().splitlines()[-1])
+        return
+    hw_time, iface_time, hw_count, iface_count = (
+        result.stdout.strip().splitlines()[-1].split())
+    print('Loaded %s hardware types in %.3f seconds and validated %s '
+          'interfaces in %.3f seconds.\n' % (hw_count, float(hw_time),
+                                             iface_count, float(iface_time)))
+
+
+def main():
+    for name, module in COMMANDS:
+        _run_imports(name, module)
+    _run_driver_loading(sys.argv[1:])
+
+
+if __name__ == '__main__':
+    sys.exit(main())
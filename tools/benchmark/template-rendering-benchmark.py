@@ -0,0 +1,100 @@
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Measure the cost of rendering per-node boot configuration templates.
+
+Renders the configured PXE, iPXE and grub templates for ``NODES`` generated
+nodes the way ``pxe_utils.build_pxe_config`` does, once compiling the
+templates on every render and once with the cached compiled templates. The
+results are not written anywhere, so neither a database nor a running
+conductor is needed.
+"""
+
+import sys
+import time
+
+from oslo_utils import uuidutils
+
+from ironic.common import utils
+from ironic.conf import CONF  # noqa To Load Configuration
+
+
+NODES = 10000
+
+
+def _add_a_line():
+    print('------------------------------------------------------------')
+
+
+def _pxe_options(index):
+    node_uuid = uuidutils.generate_uuid()
+    http_url = 'http://192.0.2.1:8080/%s' % node_uuid
+    return {
+        'deployment_aki_path': '%s/deploy_kernel' % http_url,
+        'deployment_ari_path': '%s/deploy_ramdisk' % http_url,
+        'aki_path': '%s/kernel' % http_url,
+        'ari_path': '%s/ramdisk' % http_url,
+        'pxe_append_params': 'nofb nomodeset vga=normal ipa-node=%d' % index,
+        'tftp_server': '192.0.2.1',
+        'ipxe_timeout': index % 2 * 60,
+        'linux_cmd': 'linux',
+        'initrd_cmd': 'initrd',
+    }
+
+
+def _render_all(templates, options):
+    for template, root_tag, disk_ident in templates:
+        utils.render_template(template,
+                              {'pxe_options': options,
+                               'ROOT': root_tag,
+                               'DISK_IDENTIFIER': disk_ident})
+
+
+def _uncached(templates, options):
+    """The historical approach: compile the templates on every render."""
+    utils._get_template_environment.cache_clear()
+    _render_all(templates, options)
+
+
+def _run(name, func, templates, all_options):
+    print('Phase - %s' % name)
+    _add_a_line()
+    start = time.time()
+    for options in all_options:
+        func(templates, options)
+    delta = time.time() - start
+    renders = len(all_options) * len(templates)
+    print('Rendered %d templates for %d nodes in %.3f seconds, %.1f us per '
+          'template.\n' % (renders, len(all_options), delta,
+                           delta * 10 ** 6 / renders))
+
+
+def main():
+    CONF([], project='ironic')
+    templates = [
+        (CONF.pxe.pxe_config_template, '{{ ROOT }}', '{{ DISK_IDENTIFIER }}'),
+        (CONF.pxe.ipxe_config_template, '{{ ROOT }}',
+         '{{ DISK_IDENTIFIER }}'),
+        (CONF.pxe.uefi_pxe_config_template, '(( ROOT ))',
+         '(( DISK_IDENTIFIER ))'),
+    ]
+    all_options = [_pxe_options(i) for i in range(NODES)]
+
+    _run('Compile templates on every render', _uncached, templates,
+         all_options)
+    _run('Use the cached compiled templates', _render_all, templates,
+         all_options)
+
+
+if __name__ == '__main__':
+    sys.exit(main())